@@ -0,0 +1,14 @@
+"""Timing benchmarks for evid's hot paths.
+
+Usage (from the repository root):
+
+    uv run python -m benchmarks                         # all cases, 200 docs
+    uv run python -m benchmarks --docs 1000 -k gather -k fulltext
+    uv run python -m benchmarks --json base.json        # save a baseline
+    uv run python -m benchmarks --compare base.json     # exit 1 on regression
+
+Every run builds a synthetic set (:mod:`benchmarks.corpus`) in a temporary
+directory, so numbers are comparable between checkouts on the same machine.
+Vector cases use a deterministic hashing embedder in place of the model:
+they time chunking, Chroma and evid's own code, not the transformer.
+"""
@@ -0,0 +1,139 @@
+"""Run the benchmark cases and report (or compare) their timings."""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.cases import CASES, Context, Skip
+from benchmarks.corpus import make_corpus
+
+
+def _time(fn, repeat: int) -> list[float]:
+    fn()  # warm-up: lazy imports, caches, page cache
+    runs = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - t0)
+    return runs
+
+
+def _selected(patterns: list[str] | None) -> list[str]:
+    if not patterns:
+        return list(CASES)
+    return [name for name in CASES if any(p in name for p in patterns)]
+
+
+def run(args: argparse.Namespace, data_dir: Path) -> dict:
+    t0 = time.perf_counter()
+    set_dir = make_corpus(data_dir, args.docs, args.pages, args.seed)
+    print(
+        f"corpus: {args.docs} docs, {time.perf_counter() - t0:.1f}s to generate",
+        file=sys.stderr,
+    )
+    scratch = data_dir / "scratch"
+    scratch.mkdir()
+    ctx = Context(data_dir, set_dir, scratch, args.seed)
+
+    results: dict[str, dict] = {}
+    for name in _selected(args.filter):
+        try:
+            # Commands print their own summaries; keep them out of the report.
+            with contextlib.redirect_stdout(io.StringIO()):
+                runs = _time(CASES[name](ctx), args.repeat)
+        except Skip as exc:
+            results[name] = {"skipped": str(exc)}
+            continue
+        results[name] = {
+            "min": min(runs),
+            "median": statistics.median(runs),
+            "runs": len(runs),
+        }
+        print(f"  {name:<28} {results[name]['median'] * 1e3:9.1f} ms", file=sys.stderr)
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "docs": args.docs,
+        "pages": args.pages,
+        "seed": args.seed,
+        "results": results,
+    }
+
+
+def report(results: dict, baseline: dict | None, tolerance: float) -> list[str]:
+    """Print the results table; return the names of regressed cases."""
+    base = (baseline or {}).get("results", {})
+    regressed = []
+    header = f"{'case':<28} {'median ms':>10} {'min ms':>9}"
+    print(header + (f" {'baseline':>9} {'ratio':>6}" if baseline else ""))
+    for name, r in results["results"].items():
+        if "skipped" in r:
+            print(f"{name:<28} skipped: {r['skipped']}")
+            continue
+        line = f"{name:<28} {r['median'] * 1e3:>10.1f} {r['min'] * 1e3:>9.1f}"
+        b = base.get(name, {})
+        if "median" in b:
+            ratio = r["median"] / b["median"]
+            flag = ""
+            if ratio > 1 + tolerance:
+                regressed.append(name)
+                flag = "  REGRESSION"
+            line += f" {b['median'] * 1e3:>9.1f} {ratio:>6.2f}{flag}"
+        print(line)
+    return regressed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--docs", type=int, default=200, help="documents in the set")
+    parser.add_argument("--pages", type=int, default=8, help="mean pages per doc")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case")
+    parser.add_argument(
+        "-k", "--filter", action="append", help="run cases whose name contains this"
+    )
+    parser.add_argument("--list", action="store_true", help="list cases and exit")
+    parser.add_argument("--json", type=Path, help="write results to this file")
+    parser.add_argument("--compare", type=Path, help="baseline results (--json)")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="median slowdown vs. baseline counted as a regression (default 0.25)",
+    )
+    args = parser.parse_args()
+
+    if args.list:
+        print("\n".join(CASES))
+        return
+    logging.basicConfig(level=logging.ERROR)
+
+    with tempfile.TemporaryDirectory(prefix="evid-bench-") as tmp:
+        results = run(args, Path(tmp))
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    baseline = None
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if baseline.get("docs") != args.docs:
+            print(
+                f"warning: baseline was run with {baseline.get('docs')} docs",
+                file=sys.stderr,
+            )
+    if report(results, baseline, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
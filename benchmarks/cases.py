@@ -0,0 +1,378 @@
+"""Benchmark cases.
+
+A case is a function registered with :func:`case` that takes the
+:class:`Context`, does its setup and returns the zero-argument callable to
+time. Setup cost is not measured. A case that cannot run here raises
+:class:`Skip` from its setup.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import random
+import re
+import shutil
+import zlib
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from benchmarks.corpus import make_pdf, raw_page
+
+CASES: dict[str, Callable[[Context], Callable[[], object]]] = {}
+
+
+class Skip(Exception):  # noqa: N818
+    """Raised by a case's setup when it cannot run in this environment."""
+
+
+@dataclass
+class Context:
+    data_dir: Path
+    set_dir: Path
+    scratch: Path
+    seed: int = 0
+    _cache: dict = field(default_factory=dict)
+
+    @property
+    def slug(self) -> str:
+        return self.set_dir.name
+
+    def texts(self) -> list[str]:
+        """Every document's ``label.typ``, in directory order."""
+        if "texts" not in self._cache:
+            self._cache["texts"] = [
+                (d / "label.typ").read_text(encoding="utf-8")
+                for d in sorted((self.set_dir / "docs").iterdir())
+            ]
+        return self._cache["texts"]
+
+    def pdf(self) -> Path:
+        if "pdf" not in self._cache:
+            self._cache["pdf"] = make_pdf(self.scratch / "sample.pdf", seed=self.seed)
+        return self._cache["pdf"]
+
+    def evidence_set(self):
+        from evid.services.set_manager import SetManager
+
+        return SetManager(self.data_dir).load_set(self.slug)
+
+
+def case(name: str):
+    def register(fn):
+        CASES[name] = fn
+        return fn
+
+    return register
+
+
+# ── ingest ────────────────────────────────────────────────────────────────────
+
+
+@case("ingest.pdf_metadata")
+def _pdf_metadata(ctx: Context):
+    from evid.core.pdf_metadata import extract_pdf_metadata
+
+    pdf = ctx.pdf()
+    return lambda: extract_pdf_metadata(pdf, pdf.name)
+
+
+@case("ingest.pdf_to_typst")
+def _pdf_to_typst(ctx: Context):
+    from evid.core.typst_generation import textpdf_to_typst
+
+    pdf = ctx.pdf()
+    out = ctx.scratch / "sample.typ"
+    return lambda: textpdf_to_typst(pdf, out)
+
+
+@case("ingest.json_to_bib")
+def _json_to_bib(ctx: Context):
+    from evid.core.bibtex_utils import json_to_bib
+
+    docs = [
+        d
+        for d in sorted((ctx.set_dir / "docs").iterdir())
+        if (d / "label.json").read_text(encoding="utf-8") != "[]"
+    ][:50]
+
+    def run():
+        for doc in docs:
+            json_to_bib(doc / "label.json", ctx.scratch / "label.bib", True)
+
+    return run
+
+
+@case("ingest.labels_parse")
+def _labels_parse(ctx: Context):
+    from evid.core.labtyp import parse_labels
+
+    texts = ctx.texts()
+    return lambda: [parse_labels(t).items() for t in texts]
+
+
+@case("ingest.labels_reparse")
+def _labels_reparse(ctx: Context):
+    """Re-parse the longest document after a one-label edit, like a save."""
+    from evid.core.labtyp import parse_labels
+
+    text = max(ctx.texts(), key=len)
+    previous = parse_labels(text)
+    at = text.rindex('#lab("')
+    edited = text[:at] + '#lab("edit", "x", "")\n' + text[at:]
+    return lambda: parse_labels(edited, previous).items()
+
+
+@case("ingest.document")
+def _ingest_document(ctx: Context):
+    """The whole DocIngester pipeline minus the vector index (and typst query,
+    when typst is not installed)."""
+    from evid.services.doc_ingester import DocIngester
+    from evid.services.set_manager import SetManager
+
+    manager = SetManager(ctx.data_dir)
+    target = manager.create_set(f"{ctx.slug}-ingest")
+    ingester = DocIngester(progress=lambda *_: None)
+    pdf = ctx.pdf()
+
+    def run():
+        doc = ingester.ingest(pdf, target, do_index=False)
+        shutil.rmtree(doc.path)
+
+    return run
+
+
+# ── text processing ───────────────────────────────────────────────────────────
+
+
+@case("text.clean_for_typst")
+def _clean(ctx: Context):
+    from evid.core.text_cleaning import clean_text_for_typst
+
+    rng = random.Random(ctx.seed)
+    pages = [raw_page(rng) for _ in range(200)]
+    return lambda: [clean_text_for_typst(p) for p in pages]
+
+
+@case("text.chunk")
+def _chunk(ctx: Context):
+    from evid.vec.chunking import chunk_text
+
+    texts = ctx.texts()
+    return lambda: [chunk_text(t) for t in texts]
+
+
+@case("text.chunk_budget")
+def _chunk_budget(ctx: Context):
+    from evid.vec.chunking import chunk_text
+
+    texts = ctx.texts()
+    return lambda: [chunk_text(t, 120, 16) for t in texts]
+
+
+# ── search ────────────────────────────────────────────────────────────────────
+
+
+@case("search.fulltext_literal")
+def _fulltext_literal(ctx: Context):
+    from evid.core.fulltext import search_fulltext
+
+    # A phrase from the last document: the scan has to reach it.
+    words = ctx.texts()[-1].split()
+    phrase = " ".join(words[len(words) // 2 : len(words) // 2 + 4])
+    return lambda: search_fulltext(ctx.set_dir, phrase, n=10)
+
+
+@case("search.fulltext_regex")
+def _fulltext_regex(ctx: Context):
+    from evid.core.fulltext import search_fulltext
+
+    pattern = r"\b(?:appeal|klage)\w*\s+\w+\s+(?:court|nævnet|ankestyrelsen)"
+    return lambda: search_fulltext(ctx.set_dir, pattern, regex=True, n=200)
+
+
+@case("search.meta")
+def _meta(ctx: Context):
+    from evid.core.doc_loader import search_meta_documents
+
+    return lambda: search_meta_documents(ctx.set_dir, "ombudsmand|privacy")
+
+
+@case("tags.list")
+def _tags(ctx: Context):
+    from evid.cli.tags import list_tags
+
+    return lambda: list_tags(ctx.data_dir, ctx.slug)
+
+
+# ── gather ────────────────────────────────────────────────────────────────────
+
+
+def _gather(fmt: str):
+    def setup(ctx: Context):
+        from evid.core.gather import gather_dataset
+
+        if fmt == "typ" and shutil.which("typst") is None:
+            raise Skip("typst not installed")
+        out = ctx.scratch / f"gathered.{fmt}"
+        return lambda: gather_dataset(ctx.data_dir, ctx.slug, out, regen=False)
+
+    return setup
+
+
+for _fmt in ("bib", "md", "json", "jsonl", "yaml", "typ"):
+    case(f"gather.{_fmt}")(_gather(_fmt))
+
+
+# ── quotes ────────────────────────────────────────────────────────────────────
+
+
+def _candidates(text: str, rng: random.Random, n: int = 10) -> list[str]:
+    """Passages from *text* with a few characters mangled, like LLM quotes."""
+    out = []
+    for _ in range(n):
+        start = rng.randrange(0, max(1, len(text) - 400))
+        chars = list(text[start : start + rng.randint(120, 300)])
+        for _ in range(len(chars) // 40):
+            chars[rng.randrange(len(chars))] = rng.choice("aeiou ")
+        out.append(re.sub(r"\s+", " ", "".join(chars)))
+    return out
+
+
+@case("quote.fuzzy_locate")
+def _fuzzy(ctx: Context):
+    from evid.core.quote_match import fuzzy_locate
+
+    text = max(ctx.texts(), key=len)
+    candidates = _candidates(text, random.Random(ctx.seed))
+    return lambda: [fuzzy_locate(c, text) for c in candidates]
+
+
+@case("quote.fuzzy_locate_indexed")
+def _fuzzy_indexed(ctx: Context):
+    from evid.core.quote_match import QuoteIndex, fuzzy_locate
+
+    text = max(ctx.texts(), key=len)
+    candidates = _candidates(text, random.Random(ctx.seed))
+
+    def run():
+        index = QuoteIndex(text)
+        return [fuzzy_locate(c, text, index=index) for c in candidates]
+
+    return run
+
+
+# ── vector store ──────────────────────────────────────────────────────────────
+
+
+class HashEmbedder:
+    """Deterministic stand-in for a sentence-transformers model.
+
+    Hashes words into a fixed number of buckets, so texts sharing words get
+    similar vectors; queries return sensible neighbours at no model cost.
+    """
+
+    max_seq_length = 512
+    tokenizer = None
+    dim = 384
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dim
+
+    def encode(self, texts, batch_size=32, **_kw):
+        import numpy as np
+
+        single = isinstance(texts, str)
+        rows = [texts] if single else texts
+        out = np.zeros((len(rows), self.dim), dtype="float32")
+        for i, text in enumerate(rows):
+            for word in text.lower().split():
+                out[i, zlib.crc32(word.encode()) % self.dim] += 1.0
+        out /= np.maximum(np.linalg.norm(out, axis=1, keepdims=True), 1e-9)
+        return out[0] if single else out
+
+
+@contextlib.contextmanager
+def stub_embedder() -> Iterator[None]:
+    """Route evid's embedding calls to :class:`HashEmbedder`."""
+    from evid.vec import embeddings
+
+    saved = embeddings._load_model, embeddings._loaded_name
+    model = HashEmbedder()
+    embeddings._load_model = lambda: model
+    embeddings._loaded_name = "bench-hash"
+    try:
+        yield
+    finally:
+        embeddings._load_model, embeddings._loaded_name = saved
+
+
+def _vec_setup(ctx: Context):
+    try:
+        import chromadb  # noqa: F401
+    except ImportError as exc:
+        raise Skip("chromadb not installed") from exc
+    from evid.services.vec_service import VecService
+
+    return VecService(), ctx.evidence_set()
+
+
+def _documents(ctx: Context):
+    from evid.services.vec_service import VecService
+
+    return [
+        (VecService._load_document(d, d.name), (d / "label.typ").read_text("utf-8"))
+        for d in sorted((ctx.set_dir / "docs").iterdir())
+    ]
+
+
+@case("vec.index")
+def _vec_index(ctx: Context):
+    svc, evidence_set = _vec_setup(ctx)
+    docs = _documents(ctx)[:50]
+
+    def run():
+        with stub_embedder():
+            for doc, text in docs:
+                svc.index_document(doc, text, evidence_set)
+
+    return run
+
+
+def _ensure_indexed(ctx: Context, svc, evidence_set) -> None:
+    with stub_embedder():
+        if not svc.query(evidence_set, "warm-up", n_results=1):
+            for doc, text in _documents(ctx):
+                svc.index_document(doc, text, evidence_set)
+
+
+def _queries(ctx: Context, n: int = 20) -> list[str]:
+    rng = random.Random(ctx.seed)
+    words = ctx.texts()[0].split()
+    return [" ".join(rng.sample(words, 6)) for _ in range(n)]
+
+
+@case("vec.query")
+def _vec_query(ctx: Context):
+    svc, evidence_set = _vec_setup(ctx)
+    _ensure_indexed(ctx, svc, evidence_set)
+    queries = _queries(ctx)
+
+    def run():
+        with stub_embedder():
+            return [svc.query(evidence_set, q, n_results=10) for q in queries]
+
+    return run
+
+
+@case("vec.query_many")
+def _vec_query_many(ctx: Context):
+    svc, evidence_set = _vec_setup(ctx)
+    _ensure_indexed(ctx, svc, evidence_set)
+    queries = _queries(ctx)
+
+    def run():
+        with stub_embedder():
+            return svc.query_many(evidence_set, queries, n_results=10)
+
+    return run
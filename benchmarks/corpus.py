@@ -0,0 +1,217 @@
+"""Synthetic evidence sets for the benchmarks.
+
+:func:`make_corpus` writes a data directory with one set of *n_docs*
+documents laid out as evid writes them — ``info.yml``, ``evid_meta.yml``,
+``label.typ`` with page markers and ``#lab`` snippets, and the ``label.json``
+/ ``label.bib`` that ``typst query`` would produce from it — so the hot paths
+can be timed without PDFs, typst or a real embedding model. Output is fully
+determined by the seed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+from pathlib import Path
+
+import yaml
+
+WORDS = (
+    "kommunen afgørelse borgeren klage ankestyrelsen frist aktindsigt sagen "
+    "forvaltningsloven partshøring begrundelse hjælp merudgifter anbringelse "
+    "barnet forældremyndighed samtykke udbetaling boligstøtte pension skolen "
+    "fravær handleplan arbejdsgiveren sygedagpenge lægen vurdering nævnet "
+    "court appeal tenant lease notice contract damages liability evidence "
+    "witness statement hearing judgment ruling deadline procurement audit "
+    "committee report emissions shipping patients surgery opinion data "
+    "processing purpose consent authority decision review record minutes "
+    "the of and to in that for with was is on by as which under after before"
+).split()
+TAGS = (
+    "jura",
+    "klage",
+    "anbringelse",
+    "pension",
+    "miljø",
+    "procurement",
+    "health",
+    "privacy",
+    "appeal",
+    "housing",
+)
+AUTHORS = (
+    "Ankestyrelsen",
+    "Københavns Kommune",
+    "Folketingets Ombudsmand",
+    "High Court",
+    "Data Protection Authority",
+    "Audit Office",
+)
+
+
+def sentence(rng: random.Random) -> str:
+    words = rng.choices(WORDS, k=rng.randint(8, 24))
+    words[0] = words[0].capitalize()
+    return " ".join(words) + rng.choice(".....?!")
+
+
+def paragraph(rng: random.Random) -> str:
+    return " ".join(sentence(rng) for _ in range(rng.randint(2, 7)))
+
+
+def raw_page(rng: random.Random, lines: int = 40) -> str:
+    """PDF-extracted looking text: hard wraps, hyphenation and a split URL."""
+    text = " ".join(paragraph(rng) for _ in range(4))
+    words, out, line = text.split(), [], ""
+    for word in words:
+        if len(line) + len(word) > 70:
+            if rng.random() < 0.1 and len(word) > 6:
+                cut = len(word) // 2
+                out.append(f"{line} {word[:cut]}-")
+                line = word[cut:]
+                continue
+            out.append(line)
+            line = word
+        else:
+            line = f"{line} {word}".strip()
+    out.append(line)
+    out.insert(rng.randrange(len(out)), "See https://example.org/evid/docs/")
+    out.insert(rng.randrange(len(out)), "case-files/2024/report.pdf for details.")
+    return "\n".join(out[:lines])
+
+
+def _typ_escape(s: str) -> str:
+    return s.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _document(rng: random.Random, title: str, pages: int) -> tuple[str, list[dict]]:
+    """``label.typ`` text and the ``typst query <lab>`` items it yields."""
+    body: list[str] = []
+    labels: list[dict] = []
+    for page in range(1, pages + 1):
+        body.append(f"#mset(values: (opage: {page}))\n== Page {page}\n")
+        for _ in range(rng.randint(3, 6)):
+            para = paragraph(rng)
+            if rng.random() < 0.15:
+                key = f"lab{len(labels) + 1}"
+                note = rng.choice(("", "", sentence(rng)))
+                body.append(
+                    f'#lab("{key}", "{_typ_escape(para)}", "{_typ_escape(note)}")\n'
+                )
+                labels.append(
+                    {
+                        "func": "metadata",
+                        "value": {
+                            "key": key,
+                            "text": para,
+                            "note": note,
+                            "opage": page,
+                            "title": title,
+                            "date": "DATE",
+                        },
+                        "label": "<lab>",
+                    }
+                )
+            else:
+                body.append(para + "\n")
+    head = (
+        '#import "@preview/labtyp:0.1.0": lablist, lab, mset\n\n'
+        f'#mset(values: (\n  title: "{_typ_escape(title)}",\n  date: "DATE"))\n\n'
+        f"= {title}\n\n"
+    )
+    return head + "\n".join(body) + "\n= List of Labels\n#lablist()\n", labels
+
+
+def _bib(prefix: str, info: dict, labels: list[dict]) -> str:
+    """``label.bib`` in the shape ``json_to_bib`` writes."""
+    main = (
+        f"@article{{ {prefix}:main  ,\n    title = {{{info['title']}}},\n"
+        f"    author = {{{info['authors']}}},\n    date = {{{info['dates']}}},\n"
+        f"    url = {{{info['url']}}},\n    }}"
+    )
+    entries = [main]
+    for item in labels:
+        v = item["value"]
+        entries.append(
+            f"@article{{ {prefix}:{v['key']}  ,\n    title = {{{v['text']}}},\n"
+            f"    journal = {{{info['title']}}},\n    author = {{{info['authors']}}},\n"
+            f"    pages = {{{v['opage']}}},\n    url = {{{info['url']}}},\n    }}"
+        )
+    return "\n".join(entries) + "\n"
+
+
+def make_corpus(
+    data_dir: Path,
+    n_docs: int = 200,
+    pages: int = 8,
+    seed: int = 0,
+    slug: str = "bench",
+) -> Path:
+    """Write a set of *n_docs* synthetic documents; return the set directory.
+
+    Page counts vary around *pages*; roughly one document in ten is five times
+    longer, like the long case records real sets contain.
+    """
+    rng = random.Random(seed)
+    set_dir = data_dir / "sets" / slug
+    (set_dir / "docs").mkdir(parents=True, exist_ok=True)
+    (set_dir / "vecdb").mkdir(exist_ok=True)
+    (set_dir / "set.yml").write_text(
+        yaml.safe_dump(
+            {
+                "name": slug,
+                "slug": slug,
+                "type": "normal",
+                "created": "2024-01-01T00:00:00+00:00",
+                "description": "synthetic benchmark corpus",
+            }
+        ),
+        encoding="utf-8",
+    )
+    for i in range(n_docs):
+        uuid = hashlib.sha256(f"{seed}:{i}".encode()).hexdigest()[:32]
+        title = " ".join(rng.choices(WORDS, k=rng.randint(3, 8))).capitalize()
+        n_pages = max(1, int(rng.gauss(pages, pages / 3)))
+        if rng.random() < 0.1:
+            n_pages *= 5
+        info = {
+            "original_name": "original.pdf",
+            "uuid": uuid,
+            "time_added": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "dates": f"{rng.randint(1990, 2024)}-{rng.randint(1, 12):02d}-01",
+            "title": title,
+            "authors": rng.choice(AUTHORS),
+            "tags": ",".join(sorted(rng.sample(TAGS, rng.randint(0, 3)))),
+            "label": title,
+            "url": f"https://example.org/doc/{uuid[:8]}",
+        }
+        typ, labels = _document(rng, title, n_pages)
+        doc = set_dir / "docs" / uuid
+        doc.mkdir(exist_ok=True)
+        (doc / "info.yml").write_text(
+            yaml.safe_dump(info, allow_unicode=True), encoding="utf-8"
+        )
+        (doc / "evid_meta.yml").write_text(
+            yaml.safe_dump({"notes": "", "indexed": False}), encoding="utf-8"
+        )
+        (doc / "label.typ").write_text(typ, encoding="utf-8")
+        (doc / "label.json").write_text(json.dumps(labels), encoding="utf-8")
+        (doc / "label.bib").write_text(_bib(uuid[:4], info, labels), encoding="utf-8")
+    return set_dir
+
+
+def make_pdf(path: Path, pages: int = 8, seed: int = 0) -> Path:
+    """Write a text PDF of *pages* pages (for the ingest stages)."""
+    import pymupdf
+
+    rng = random.Random(seed)
+    pdf = pymupdf.open()
+    for _ in range(pages):
+        page = pdf.new_page()
+        box = pymupdf.Rect(50, 50, page.rect.width - 50, page.rect.height - 50)
+        page.insert_textbox(box, raw_page(rng), fontsize=9)
+    pdf.set_metadata({"title": "Synthetic benchmark document", "author": AUTHORS[0]})
+    pdf.save(path)
+    pdf.close()
+    return path
@@ -0,0 +1,235 @@
+"""Recall against query latency for HNSW settings of a set collection.
+
+Usage (from the repository root):
+
+    uv run python -m benchmarks.hnsw                              # synthetic fixture
+    uv run python -m benchmarks.hnsw --chunks 200000 --m 16,32 --ef-search 50,100,200
+    uv run python -m benchmarks.hnsw --vecdb ~/.local/share/evid/sets/x/vecdb
+
+For every pair of ``M`` and ``ef_construction`` a cosine-space collection is built
+the way :func:`evid.vec.db.open_collection` builds one. Then, for every
+``ef_search``, held-out queries are run one at a time. Recall@k is measured
+against exact (brute-force) neighbours. The fixture is clustered unit
+vectors, seeded so runs are comparable. ``--vecdb`` samples the stored
+embeddings of a real set instead; its queries are chunks left out of the
+index. Put the chosen values in ``evid.yml`` as ``hnsw_max_neighbors``,
+``hnsw_ef_construction`` and ``hnsw_ef_search``.
+
+The same data is then put in the NumPy backend (:mod:`evid.vec.npstore`):
+once searched exactly, and once through an IVF index for every ``--nprobe``
+(``vector_ivf_nprobe``). ``--nprobe ''`` skips the IVF rows, ``--m ''`` the
+HNSW ones.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+
+def _ints(value: str) -> list[int]:
+    return [int(v) for v in value.split(",") if v]
+
+
+def synthetic(n: int, dim: int, seed: int, spread: float = 2.5) -> np.ndarray:
+    """*n* unit vectors in overlapping clusters of about 50, like chunks of
+    related text; a larger *spread* makes neighbours harder to find."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(max(1, n // 50), dim))
+    vectors = centers[rng.integers(len(centers), size=n)]
+    vectors += rng.normal(scale=spread, size=(n, dim))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors.astype("float32")
+
+
+def from_vecdb(path: Path, n: int, seed: int) -> np.ndarray:
+    """Up to *n* stored embeddings sampled from a set's ``docs`` collection."""
+    from evid.vec.db import COLLECTION, get_client
+
+    collection = get_client(str(path)).get_collection(COLLECTION)
+    total = collection.count()
+    rng = np.random.default_rng(seed)
+    offsets = sorted(rng.choice(total, size=min(n, total), replace=False))
+    rows = []
+    for start in range(0, total, 5000):
+        wanted = [o - start for o in offsets if start <= o < start + 5000]
+        if wanted:
+            got = collection.get(include=["embeddings"], limit=5000, offset=start)
+            rows.append(np.asarray(got["embeddings"], dtype="float32")[wanted])
+    vectors = np.concatenate(rows)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def exact_neighbours(data: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    out = []
+    for start in range(0, len(queries), 256):
+        scores = queries[start : start + 256] @ data.T
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        out.append(top)
+    return np.concatenate(out)
+
+
+def build(path: Path, data: np.ndarray, config) -> float:
+    """Index *data* in a new collection at *path*; return the seconds taken."""
+    from evid.vec.db import get_client, open_collection
+
+    collection = open_collection(get_client(str(path)), config)
+    t0 = time.perf_counter()
+    for start in range(0, len(data), 5000):
+        batch = data[start : start + 5000]
+        collection.add(
+            ids=[str(i) for i in range(start, start + len(batch))], embeddings=batch
+        )
+    return time.perf_counter() - t0
+
+
+def build_numpy(path: Path, data: np.ndarray, config) -> float:
+    """Store *data* in a :class:`NumpyStore` at *path*; return the seconds taken.
+
+    With ``vector_ivf_min_rows`` set, the store is compacted at the end so the
+    IVF index covers every row.
+    """
+    from evid.vec.npstore import NumpyStore
+
+    store = NumpyStore(path, config=config)
+    t0 = time.perf_counter()
+    for start in range(0, len(data), 5000):
+        batch = data[start : start + 5000]
+        store.add(
+            ids=[str(i) for i in range(start, start + len(batch))], embeddings=batch
+        )
+    if config.vector_ivf_min_rows:
+        store.compact()
+    return time.perf_counter() - t0
+
+
+def reopen(path: Path, config):
+    """The collection at *path* with *config*'s ``ef_search`` in effect.
+
+    Chroma reads ``ef_search`` when it loads the index, so the process's
+    cached clients are dropped after changing it.
+    """
+    from chromadb.api.client import SharedSystemClient
+    from evid.vec.db import get_client, open_collection
+
+    open_collection(get_client(str(path)), config)
+    SharedSystemClient.clear_system_cache()
+    return open_collection(get_client(str(path)), config)
+
+
+def measure(collection, queries: np.ndarray, truth: np.ndarray, k: int) -> dict:
+    latencies, hits = [], 0
+    for query, expected in zip(queries, truth, strict=True):
+        t0 = time.perf_counter()
+        got = collection.query(query_embeddings=[query], n_results=k, include=[])
+        latencies.append(time.perf_counter() - t0)
+        hits += len(set(map(int, got["ids"][0])) & set(expected.tolist()))
+    latencies.sort()
+    return {
+        "recall": hits / (k * len(queries)),
+        "p50_ms": statistics.median(latencies) * 1e3,
+        "p95_ms": latencies[int(0.95 * (len(latencies) - 1))] * 1e3,
+    }
+
+
+def run_numpy(tmp: Path, data, queries, truth, args) -> list[dict]:
+    """Exact and IVF search in the NumPy backend, one row per ``nprobe``."""
+    from evid.config import EvidConfig
+    from evid.vec.npstore import NumpyStore
+
+    print(
+        f"\n{'numpy':>6} {'nprobe':>6} {'build s':>8} "
+        f"{'recall@' + str(args.k):>9} {'p50 ms':>7} {'p95 ms':>7}"
+    )
+    variants = [("exact", [0], EvidConfig(vector_ivf_min_rows=0))]
+    if args.nprobe:
+        variants.append(("ivf", args.nprobe, EvidConfig(vector_ivf_min_rows=1)))
+    rows = []
+    for name, nprobes, built_with in variants:
+        path = tmp / f"numpy-{name}"
+        seconds = build_numpy(path, data, built_with)
+        for nprobe in nprobes:
+            config = built_with.model_copy(update={"vector_ivf_nprobe": nprobe})
+            row = {"backend": f"numpy-{name}", "nprobe": nprobe, "build_s": seconds}
+            row |= measure(NumpyStore(path, config=config), queries, truth, args.k)
+            rows.append(row)
+            print(
+                f"{name:>6} {nprobe or '-':>6} {seconds:>8.1f} "
+                f"{row['recall']:>9.3f} {row['p50_ms']:>7.2f} {row['p95_ms']:>7.2f}"
+            )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.hnsw",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--chunks", type=int, default=20000, help="indexed vectors")
+    parser.add_argument("--dim", type=int, default=384, help="synthetic dimension")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("-k", type=int, default=10, help="neighbours per query")
+    parser.add_argument("--m", type=_ints, default=[8, 16, 32])
+    parser.add_argument("--ef-construction", type=_ints, default=[100, 200])
+    parser.add_argument("--ef-search", type=_ints, default=[16, 32, 64, 100, 200])
+    parser.add_argument("--nprobe", type=_ints, default=[8, 16, 32, 64])
+    parser.add_argument(
+        "--spread", type=float, default=2.5, help="synthetic cluster spread"
+    )
+    parser.add_argument("--vecdb", type=Path, help="sample a set's embeddings")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, help="write results to this file")
+    args = parser.parse_args()
+
+    n = args.chunks + args.queries
+    if args.vecdb:
+        vectors = from_vecdb(args.vecdb, n, args.seed)
+    else:
+        vectors = synthetic(n, args.dim, args.seed, args.spread)
+    data, queries = vectors[: -args.queries], vectors[-args.queries :]
+    truth = exact_neighbours(data, queries, args.k)
+    print(
+        f"{len(data)} vectors of dim {data.shape[1]}, {len(queries)} queries",
+        file=sys.stderr,
+    )
+
+    from evid.config import EvidConfig
+
+    rows = []
+    print(
+        f"{'M':>4} {'ef_c':>5} {'ef_s':>5} {'build s':>8} "
+        f"{'recall@' + str(args.k):>9} {'p50 ms':>7} {'p95 ms':>7}"
+    )
+    with tempfile.TemporaryDirectory(prefix="evid-hnsw-") as tmp:
+        for m in args.m:
+            for ef_c in args.ef_construction:
+                path = Path(tmp) / f"m{m}-ef{ef_c}"
+                config = EvidConfig(hnsw_max_neighbors=m, hnsw_ef_construction=ef_c)
+                seconds = build(path, data, config)
+                for ef_s in args.ef_search:
+                    config = config.model_copy(update={"hnsw_ef_search": ef_s})
+                    collection = reopen(path, config)
+                    row = {"m": m, "ef_construction": ef_c, "ef_search": ef_s}
+                    row |= {"build_s": seconds}
+                    row |= measure(collection, queries, truth, args.k)
+                    rows.append(row)
+                    print(
+                        f"{m:>4} {ef_c:>5} {ef_s:>5} {seconds:>8.1f} "
+                        f"{row['recall']:>9.3f} {row['p50_ms']:>7.2f} "
+                        f"{row['p95_ms']:>7.2f}"
+                    )
+        rows += run_numpy(Path(tmp), data, queries, truth, args)
+    if args.json:
+        args.json.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,22 +18,7 @@ from evid.cli.dataset import (
     set_dir,
     track_dataset,
 )
-from evid.cli.evidence import (
-    add_evidence,
-    get_evidence_list,
-    label_evidence,
-    select_evidence,
-)
-from evid.cli.tags import assign_tag, list_tags, remove_tag, show_tag
-from evid.core.bibtex import generate_bibtex
-from evid.core.gather import gather_dataset
 from evid.core.models import ConfigModel
-from evid.core.quote_extract import (
-    candidates_from_search,
-    extract_quotes,
-    load_quotes_json,
-)
-from evid.core.rebut_doc import rebut_doc
 from evid.models import Document
 
 # Logging is configured centrally in evid.logging_config (called from main()).
@@ -153,6 +138,47 @@ def _print_meta_results(
         console.print(table)
 
 
+def _print_similar_results(
+    results: list,
+    fmt: str,
+    doc_uuid: str,
+    dataset: str,
+) -> None:
+    if not results:
+        print(f"No documents similar to {doc_uuid}.")
+        return
+    if fmt == "json":
+        data = [
+            {
+                "rank": i + 1,
+                "score": round(score, 4),
+                "label": doc.label,
+                "uuid": doc.uuid,
+                "tags": doc.tags,
+                "source_url": doc.source_url,
+            }
+            for i, (doc, score) in enumerate(results)
+        ]
+        print(json.dumps(data, ensure_ascii=False, indent=2))
+    elif fmt == "md":
+        print(f"## Similar to `{doc_uuid[:8]}\u2026` \u2014 {dataset}\n")
+        for i, (doc, score) in enumerate(results, 1):
+            short = doc.uuid[:8] + "\u2026" + doc.uuid[-8:]
+            print(f"{i}. **{doc.label}** `score: {score:.3f}` `{short}`")
+    else:
+        console = Console()
+        table = Table(title=f"Similar to {doc_uuid[:8]}\u2026 \u2014 {dataset}")
+        table.add_column("#", justify="right", style="dim", width=3)
+        table.add_column("Score", justify="right", width=7)
+        table.add_column("Label", ratio=4)
+        table.add_column("UUID", width=20)
+        table.add_column("Tags")
+        for i, (doc, score) in enumerate(results, 1):
+            short = doc.uuid[:16] + "\u2026"
+            table.add_row(str(i), f"{score:.3f}", doc.label, short, ", ".join(doc.tags))
+        console.print(table)
+
+
 def _print_text_results(
     hits: list,
     fmt: str,
@@ -226,8 +252,11 @@ def gather_callback(
     include_keys: bool = False,
     since: str = None,
     until: str = None,
+    jobs: int = 1,
 ):
     """Gather all BibTeX from a dataset into a single output file."""
+    from evid.core.gather import gather_dataset
+
     dataset = _resolve_dataset(dataset, "Select dataset to gather", allow_create=False)
     if not output:
         sys.exit("--output / -o is required.")
@@ -239,6 +268,7 @@ def gather_callback(
         include_keys=include_keys,
         since=since,
         until=until,
+        jobs=jobs,
     )
 
 
@@ -254,12 +284,17 @@ def add_callback(
     no_index: bool = False,
 ):
     """Add a document to a dataset."""
+    from evid.cli.evidence import add_evidence
+
     dataset = _resolve_dataset(dataset, "Select dataset for adding document")
     add_evidence(DIRECTORY, dataset, source, label, autolabel, no_index=no_index)
 
 
 def bibtex_callback(db: str = None, dataset: str = None, uuid: str = None):
     """Generate BibTeX for a document."""
+    from evid.cli.evidence import select_evidence
+    from evid.core.bibtex import generate_bibtex
+
     dataset = _resolve_dataset(
         dataset, "Select dataset for BibTeX generation", allow_create=False
     )
@@ -273,6 +308,7 @@ def bibtex_callback(db: str = None, dataset: str = None, uuid: str = None):
 
 def _search_candidates(dataset: str, uuid: str, query: str, n: int):
     """Seed quote candidates from a vector search restricted to one document."""
+    from evid.core.quote_extract import candidates_from_search
     from evid.services.set_manager import SetManager
     from evid.services.vec_service import VecService
 
@@ -306,6 +342,9 @@ def quote_callback(
     Only the verbatim, rapidfuzz-verified output is written as Hayagriva. Prints
     citation keys only — never quote text.
     """
+    from evid.cli.evidence import select_evidence
+    from evid.core.quote_extract import extract_quotes, load_quotes_json
+
     dataset = _resolve_dataset(dataset, "Select dataset to quote", allow_create=False)
     if bool(from_path) == bool(from_search):
         sys.exit(
@@ -365,6 +404,86 @@ def quote_callback(
             print(f"  cite as @{r.key}")
 
 
+def set_quote_callback(
+    db: str = None,
+    dataset: str = None,
+    *,
+    from_path: str = None,
+    from_search: str = None,
+    n: int = 5,
+    min_ratio: float = 0.78,
+    refresh: bool = False,
+    jobs: int = 0,
+):
+    """Machine-extract verbatim quotes for many documents of a set in one run.
+
+    Candidates come from a JSON file mapping document UUIDs to candidate lists
+    (``--from``) or from one vector search over the whole set (``--from-search``,
+    top-``n`` chunks per matching document). Documents are quoted in parallel;
+    each ``machine.hayagriva`` is written once. Prints citation keys only.
+    """
+    from evid.core.quote_extract import (
+        candidates_by_document,
+        extract_quotes_batch,
+        load_batch_quotes_json,
+    )
+
+    dataset = _resolve_dataset(dataset, "Select dataset to quote", allow_create=False)
+    if bool(from_path) == bool(from_search):
+        sys.exit("Provide exactly one of --from (batch JSON) or --from-search <query>.")
+
+    if from_search:
+        from evid.services.set_manager import SetManager
+        from evid.services.vec_service import VecService
+
+        try:
+            evidence_set = SetManager(DIRECTORY).load_set(dataset)
+            results = VecService().query(evidence_set, from_search, n_results=n * 20)
+        except FileNotFoundError:
+            sys.exit(f"Dataset '{dataset}' not found.")
+        except Exception as exc:
+            sys.exit(f"Vector search failed: {exc}")
+        by_uuid = candidates_by_document(results, n)
+        if not by_uuid:
+            sys.exit(f"Vector search for '{from_search}' returned no chunks.")
+        print(f'Seeding candidates from vector search: "{from_search}"')
+    else:
+        try:
+            by_uuid = load_batch_quotes_json(Path(from_path).expanduser())
+        except (ValueError, OSError) as exc:
+            sys.exit(f"Could not load quotes JSON: {exc}")
+        if not by_uuid:
+            sys.exit(f"No candidates found in {from_path}.")
+
+    root = docs_dir(DIRECTORY, dataset)
+    missing = [u for u in by_uuid if not (root / u).is_dir()]
+    if missing:
+        sys.exit(f"Unknown document(s) in {dataset}: {', '.join(missing)}")
+
+    outcomes = extract_quotes_batch(
+        {root / u: c for u, c in by_uuid.items()},
+        min_ratio=min_ratio,
+        refresh=refresh,
+        jobs=jobs or None,
+    )
+
+    console = Console()
+    table = Table(title=f"quote: {dataset}", show_header=True)
+    table.add_column("Document")
+    table.add_column("Matched", justify="right")
+    table.add_column("Keys")
+    n_matched = 0
+    for doc_dir, outcome in outcomes.items():
+        if isinstance(outcome, Exception):
+            table.add_row(doc_dir.name, "—", f"failed: {outcome}")
+            continue
+        keys = [r.key for r in outcome if r.matched]
+        n_matched += len(keys)
+        table.add_row(doc_dir.name, f"{len(keys)}/{len(outcome)}", " ".join(keys))
+    console.print(table)
+    print(f"\n{n_matched} quotes added across {len(outcomes)} document(s)")
+
+
 def label_callback(
     db: str = None,
     dataset: str = None,
@@ -372,12 +491,17 @@ def label_callback(
     filename: str = "label.typ",
 ):
     """Open a document in the labeler."""
+    from evid.cli.evidence import label_evidence
+
     dataset = _resolve_dataset(dataset, "Select dataset to label", allow_create=False)
     label_evidence(DIRECTORY, dataset, uuid, filename)
 
 
 def rebut_callback(db: str = None, dataset: str = None, uuid: str = None):
     """Generate a rebuttal document."""
+    from evid.cli.evidence import select_evidence
+    from evid.core.rebut_doc import rebut_doc
+
     dataset = _resolve_dataset(
         dataset, "Select dataset for rebuttal", allow_create=False
     )
@@ -399,6 +523,8 @@ def list_docs_callback(
     format: str = "table",
 ):
     """List documents in a dataset."""
+    from evid.cli.evidence import get_evidence_list
+
     dataset = _resolve_dataset(dataset, "Select dataset to list", allow_create=False)
     documents = get_evidence_list(DIRECTORY, dataset)
     if not documents:
@@ -427,6 +553,8 @@ def list_docs_callback(
 
 def tag_list_callback(db: str = None, dataset: str = None, format: str = "table"):
     """List all tags with doc and snippet counts."""
+    from evid.cli.tags import list_tags
+
     tags = list_tags(DIRECTORY, dataset or None)
     if not tags:
         print("No tags found.")
@@ -434,7 +562,7 @@ def tag_list_callback(db: str = None, dataset: str = None, format: str = "table"
     if format == "json":
         print(json.dumps(tags, ensure_ascii=False, indent=2))
     elif format == "md":
-        title = f"## Tags{' \u2014 ' + dataset if dataset else ''}\n"
+        title = "## Tags" + (f" \u2014 {dataset}" if dataset else "") + "\n"
         print(title)
         for tag, counts in sorted(tags.items(), key=lambda x: (-x[1]["docs"], x[0])):
             print(f"- **{tag}** ({counts['docs']} docs, {counts['snippets']} snippets)")
@@ -456,6 +584,8 @@ def tag_show_callback(
     format: str = "table",
 ):
     """Show all docs carrying a given tag."""
+    from evid.cli.tags import show_tag
+
     if not tag:
         sys.exit("TAG argument is required.")
     docs = show_tag(DIRECTORY, tag, dataset or None)
@@ -488,6 +618,8 @@ def tag_show_callback(
 
 def tag_assign_callback(db: str = None, uuid: str = None, tag: str = None):
     """Add a tag to a document by UUID."""
+    from evid.cli.tags import assign_tag
+
     if not uuid or not tag:
         sys.exit("Both UUID and TAG arguments are required.")
     ok, msg = assign_tag(DIRECTORY, uuid, tag)
@@ -499,6 +631,8 @@ def tag_assign_callback(db: str = None, uuid: str = None, tag: str = None):
 
 def tag_remove_callback(db: str = None, tag: str = None, dataset: str = None):
     """Remove a tag from all documents that carry it."""
+    from evid.cli.tags import remove_tag
+
     if not tag:
         sys.exit("TAG argument is required.")
     ok, msg = remove_tag(DIRECTORY, tag, dataset=dataset)
@@ -545,6 +679,45 @@ def search_vec_callback(
     _print_vec_results(results, fmt=format, query=query, dataset=dataset, n=n)
 
 
+def search_similar_callback(
+    db: str = None,
+    uuid: str = None,
+    dataset: str = None,
+    n: int = 10,
+    format: str = "table",
+):
+    """List the documents most like one document (UUID or unique prefix)."""
+    if not uuid:
+        sys.exit("UUID argument is required.")
+    dataset = _resolve_dataset(dataset, "Select dataset to search", allow_create=False)
+
+    from evid.services.set_manager import SetManager
+    from evid.services.vec_service import VecService
+
+    try:
+        evidence_set = SetManager(DIRECTORY).load_set(dataset)
+    except FileNotFoundError:
+        sys.exit(f"Dataset '{dataset}' not found.")
+
+    docs_dir = evidence_set.path / "docs"
+    needle = uuid.strip().lower()
+    matches = [d.name for d in docs_dir.iterdir() if d.name.startswith(needle)]
+    if len(matches) != 1:
+        sys.exit(
+            f"UUID prefix '{uuid}' is ambiguous — be more specific."
+            if matches
+            else f"No document matching '{uuid}' in '{dataset}'."
+        )
+    try:
+        results = VecService().similar(evidence_set, matches[0], n_results=n)
+    except KeyError:
+        sys.exit(f"Document {matches[0]} is not indexed; run `evid set reindex`.")
+    except Exception as exc:
+        sys.exit(f"Similarity search failed: {exc}")
+
+    _print_similar_results(results, fmt=format, doc_uuid=matches[0], dataset=dataset)
+
+
 def search_meta_callback(
     db: str = None,
     pattern: str = None,
@@ -610,16 +783,204 @@ def reindex_callback(db: str = None, dataset: str = None):
     except FileNotFoundError:
         sys.exit(f"Dataset '{dataset}' not found.")
 
+    from evid.services.index_queue import DEFAULT_BATCH_SIZE
+
     ingester = DocIngester(vec_service=VecService())
     docs_dir = evidence_set.path / "docs"
     doc_dirs = sorted(d for d in docs_dir.iterdir() if d.is_dir())
     ok = 0
-    for doc_dir in doc_dirs:
-        if ingester.index_existing(doc_dir, evidence_set):
-            ok += 1
+    # Batches share one warm indexer process, one embed call and one write.
+    for start in range(0, len(doc_dirs), DEFAULT_BATCH_SIZE):
+        batch = doc_dirs[start : start + DEFAULT_BATCH_SIZE]
+        ok += sum(ingester.index_existing_many(batch, evidence_set))
     print(f"Reindexed {ok}/{len(doc_dirs)} document(s) in '{dataset}'.")
 
 
+def migrate_index_callback(db: str = None, dataset: str = None):
+    """Rebuild a set's vector index with the configured HNSW settings.
+
+    Copies the stored vectors into a cosine-space collection built with the
+    hnsw_* values from evid.yml. Nothing is re-embedded; sets already built
+    with those values are left alone.
+    """
+    dataset = _resolve_dataset(dataset, "Select dataset to migrate", allow_create=False)
+
+    from evid.services.set_manager import SetManager
+    from evid.services.vec_service import VecService
+    from evid.vec.db import hnsw_configuration
+
+    try:
+        evidence_set = SetManager(DIRECTORY).load_set(dataset)
+    except FileNotFoundError:
+        sys.exit(f"Dataset '{dataset}' not found.")
+
+    svc = VecService()
+    if svc.backend(evidence_set) == "numpy":
+        print(f"'{dataset}' uses the numpy vector backend; it has no HNSW index.")
+        return
+    if not svc.needs_migration(evidence_set):
+        print(f"Vector index of '{dataset}' already uses {hnsw_configuration()}.")
+        return
+    n = svc.migrate(
+        evidence_set,
+        progress=lambda done, total: print(f"  {done}/{total}", end="\r"),
+    )
+    print(f"Migrated {n} vector(s) in '{dataset}' to {hnsw_configuration()}.")
+
+
+def convert_index_callback(
+    db: str = None, dataset: str = None, backend: str = None, dtype: str = "float32"
+):
+    """Move a set's vector index to the chroma or numpy backend.
+
+    The stored vectors are copied, not re-embedded. The numpy backend keeps a
+    memory-mapped matrix searched exactly (or through an IVF index for large
+    sets) and never loads Chroma; it suits small and read-only sets.
+    """
+    dataset = _resolve_dataset(dataset, "Select dataset to convert", allow_create=False)
+
+    from evid.services.set_manager import SetManager
+    from evid.services.vec_service import VecService
+
+    try:
+        evidence_set = SetManager(DIRECTORY).load_set(dataset)
+    except FileNotFoundError:
+        sys.exit(f"Dataset '{dataset}' not found.")
+
+    svc = VecService()
+    if svc.backend(evidence_set) == backend:
+        print(f"'{dataset}' already uses the {backend} vector backend.")
+        return
+    n = svc.convert(
+        evidence_set,
+        backend,
+        dtype=dtype,
+        progress=lambda done, total: print(f"  {done}/{total}", end="\r"),
+    )
+    print(f"Converted {n} vector(s) in '{dataset}' to the {backend} backend.")
+
+
+def export_index_callback(
+    db: str = None, dataset: str = None, output: str = None, dtype: str = "float32"
+):
+    """Write a set's vector index to a portable snapshot file.
+
+    The snapshot holds chunk ids, texts, metadata and embeddings, stamped with
+    the embedding model and chunker version; `evid set import-index` loads it
+    on another machine without re-embedding.
+    """
+    dataset = _resolve_dataset(dataset, "Select dataset to export", allow_create=False)
+
+    from evid.services.set_manager import SetManager
+    from evid.services.vec_service import VecService
+
+    try:
+        evidence_set = SetManager(DIRECTORY).load_set(dataset)
+    except FileNotFoundError:
+        sys.exit(f"Dataset '{dataset}' not found.")
+
+    out = Path(output).expanduser()
+    n = VecService().export_index(
+        evidence_set,
+        out,
+        dtype=dtype,
+        progress=lambda done, total: print(f"  {done}/{total}", end="\r"),
+    )
+    print(f"Exported {n} vector(s) from '{dataset}' to {out}.")
+
+
+def import_index_callback(db: str = None, dataset: str = None, input_path: str = None):
+    """Load a vector-index snapshot into a set.
+
+    Chunks of documents the set has are replaced by the snapshot's and the
+    documents are marked indexed; chunks of other documents are skipped. The
+    snapshot must come from the active embedding model.
+    """
+    dataset = _resolve_dataset(
+        dataset, "Select dataset to import into", allow_create=False
+    )
+
+    from evid.services.set_manager import SetManager
+    from evid.services.vec_service import VecService
+
+    try:
+        evidence_set = SetManager(DIRECTORY).load_set(dataset)
+    except FileNotFoundError:
+        sys.exit(f"Dataset '{dataset}' not found.")
+
+    path = Path(input_path).expanduser()
+    if not path.is_file():
+        sys.exit(f"Snapshot '{path}' not found.")
+    try:
+        counts = VecService().import_index(
+            evidence_set,
+            path,
+            progress=lambda done, total: print(f"  {done}/{total}", end="\r"),
+        )
+    except ValueError as exc:
+        sys.exit(str(exc))
+    n_docs = sum(1 for d in (evidence_set.path / "docs").iterdir() if d.is_dir())
+    print(
+        f"Imported {sum(counts.values())} vector(s) for {len(counts)}/{n_docs} "
+        f"document(s) into '{dataset}'."
+    )
+
+
+def vacuum_callback(
+    db: str = None,
+    dataset: str = None,
+    dry_run: bool = False,
+    compact: bool = False,
+    no_compact: bool = False,
+):
+    """Reconcile a set's vector index with its documents on disk.
+
+    Deletes the chunks of documents whose directory is gone, sets each
+    document's 'indexed' flag to whether it has chunks, and compacts the
+    store once deleted records take up a tenth of it (or as told by
+    --compact / --no-compact).
+    """
+    dataset = _resolve_dataset(dataset, "Select dataset to vacuum", allow_create=False)
+    if compact and no_compact:
+        sys.exit("--compact and --no-compact exclude each other.")
+
+    from evid.services.set_manager import SetManager
+    from evid.services.vec_service import VecService
+
+    try:
+        evidence_set = SetManager(DIRECTORY).load_set(dataset)
+    except FileNotFoundError:
+        sys.exit(f"Dataset '{dataset}' not found.")
+
+    force = None  # compact if worth it
+    if compact or no_compact:
+        force = compact
+    report = VecService().vacuum(
+        evidence_set,
+        dry_run=dry_run,
+        compact=force,
+        progress=lambda done, total: print(f"  compacting {done}/{total}", end="\r"),
+    )
+    verb = "would be" if dry_run else "were"
+    print(f"'{dataset}': {report.chunks} chunk(s) in the vector index.")
+    print(
+        f"  {report.orphan_chunks} chunk(s) of {len(report.orphan_docs)} "
+        f"document(s) no longer on disk {verb} deleted."
+    )
+    for doc_uuid in report.orphan_docs:
+        print(f"    {doc_uuid}")
+    if report.flagged_indexed or report.flagged_unindexed:
+        print(
+            f"  'indexed' flags {verb} repaired: {len(report.flagged_indexed)} "
+            f"set, {len(report.flagged_unindexed)} cleared (run `evid set reindex` "
+            "for the cleared ones)."
+        )
+    if report.dead_fraction is not None:
+        print(f"  Deleted records take up {report.dead_fraction:.0%} of the store.")
+    if report.compacted:
+        print(f"  Compacted: {report.bytes_freed / 1e6:.1f} MB freed.")
+
+
 def mcp_callback(db: str = None, dataset: str = None):
     """Run the evid MCP server (stdio) — a warm query session for agents.
 
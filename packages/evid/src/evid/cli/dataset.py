@@ -7,11 +7,6 @@ from pathlib import Path
 from rich.console import Console
 from rich.table import Table
 
-try:
-    from git import InvalidGitRepositoryError, Repo
-except ImportError:
-    Repo = None
-
 from evid.services.set_manager import SetManager
 
 logger = logging.getLogger(__name__)
@@ -144,7 +139,9 @@ def create_dataset(directory: Path, name: str) -> str:
 
 def track_dataset(directory: Path, dataset: str = None) -> None:
     """Initialize a Git repository in the specified dataset with a .gitignore."""
-    if not Repo:
+    try:
+        from git import InvalidGitRepositoryError, Repo
+    except ImportError:
         logger.warning("GitPython not installed. Cannot track dataset.")
         print("GitPython is not installed. Please install it to use Git tracking.")
         return
@@ -10,22 +10,13 @@ from io import BytesIO
 from pathlib import Path
 from urllib.parse import unquote
 
-import arrow
-import requests
 import yaml
 from rich.console import Console
 from rich.table import Table
 
+from evid import tracing
 from evid.cli.dataset import docs_dir
-from evid.core.label import create_label  # Moved to new file
 from evid.core.models import InfoModel  # Added for validation
-from evid.core.pdf_metadata import extract_html_date, extract_pdf_metadata
-from evid.core.typst_generation import (
-    _BROWSER_HEADERS,
-    decoded_response_text,
-    web_to_pdf,
-)
-from evid.utils.text import normalize_text
 
 # Logging is configured centrally in evid.logging_config (called from main()).
 logger = logging.getLogger(__name__)
@@ -49,6 +40,20 @@ def add_evidence(
     no_index: bool = False,
 ) -> None:
     """Add a PDF or text content to the specified dataset."""
+    # Fetching, PDF parsing and labelling pull in heavy dependencies; import
+    # them here so listing documents stays fast.
+    import arrow
+    import requests
+
+    from evid.core.label import create_label
+    from evid.core.pdf_metadata import extract_html_date, extract_pdf_metadata
+    from evid.core.typst_generation import (
+        _BROWSER_HEADERS,
+        decoded_response_text,
+        web_to_pdf,
+    )
+    from evid.utils.text import normalize_text
+
     is_url = source.startswith(("http://", "https://"))
     file_name = None
     is_pdf = False
@@ -59,7 +64,8 @@ def add_evidence(
 
     if is_url:
         try:
-            response = requests.get(source, timeout=15, headers=_BROWSER_HEADERS)
+            with tracing.span("ingest.fetch"):
+                response = requests.get(source, timeout=15, headers=_BROWSER_HEADERS)
             response.raise_for_status()
             content_type = response.headers.get("Content-Type", "")
             # Decode percent-encoding so non-ASCII filenames (e.g. Danish
@@ -121,7 +127,8 @@ def add_evidence(
         if is_url:
             pdf_file.seek(0)
         pdf_source = pdf_file if is_url else pdf_file
-        title, authors, date = extract_pdf_metadata(pdf_source, file_name)
+        with tracing.span("ingest.metadata"):
+            title, authors, date = extract_pdf_metadata(pdf_source, file_name)
     else:
         title = normalize_text(Path(file_name).stem)
         authors = ""
@@ -188,10 +195,11 @@ def add_evidence(
     typ_path = unique_dir / "label.typ"
     try:
         Path("static").mkdir(exist_ok=True)
-        if is_pdf:
-            textpdf_to_typst(target_path, typ_path)
-        else:
-            text_to_typst(target_path, typ_path)
+        with tracing.span("ingest.typst_text"):
+            if is_pdf:
+                textpdf_to_typst(target_path, typ_path)
+            else:
+                text_to_typst(target_path, typ_path)
         logger.info("Generated label.typ for %s", unique_id.hex)
     except Exception as e:
         logger.warning("label.typ generation failed for %s: %s", unique_id.hex, e)
@@ -207,9 +215,10 @@ def add_evidence(
             from evid.services.vec_service import VecService
 
             evidence_set = SetManager(directory).load_set(dataset)
-            DocIngester(vec_service=VecService()).index_existing(
-                unique_dir, evidence_set
-            )
+            with tracing.span("ingest.index"):
+                DocIngester(vec_service=VecService()).index_existing(
+                    unique_dir, evidence_set
+                )
             logger.info("Indexed %s into vector store", unique_id.hex)
         except Exception as e:
             logger.warning(
@@ -299,6 +308,7 @@ def label_evidence(
 ) -> None:
     """Label a document in the specified dataset."""
     from evid.cli.dataset import select_dataset
+    from evid.core.label import create_label
 
     if not dataset:
         dataset = select_dataset(
@@ -1,6 +1,7 @@
 """Main CLI entry point."""
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
@@ -9,19 +10,25 @@ from treeparse import argument, cli, command, group, option
 from evid.cli.callbacks import (
     add_callback,
     bibtex_callback,
+    convert_index_callback,
     create_callback,
+    export_index_callback,
     gather_callback,
     gui_callback,
+    import_index_callback,
     label_callback,
     list_datasets_callback,
     list_docs_callback,
     mcp_callback,
+    migrate_index_callback,
     quote_callback,
     rebut_callback,
     reindex_callback,
     search_meta_callback,
+    search_similar_callback,
     search_text_callback,
     search_vec_callback,
+    set_quote_callback,
     show_callback,
     tag_assign_callback,
     tag_list_callback,
@@ -29,6 +36,7 @@ from evid.cli.callbacks import (
     tag_show_callback,
     track_callback,
     update_callback,
+    vacuum_callback,
 )
 from evid.config import EvidConfig
 
@@ -47,15 +55,22 @@ _DATASET_OPTION = option(
 
 
 def main():
-    # Parse --db / --verbose manually before treeparse sees argv
+    # Parse --db / --verbose / --profile / --trace-file manually before
+    # treeparse sees argv
     parser = argparse.ArgumentParser(add_help=False)
     parser.add_argument("-d", "--db", default=None)
     parser.add_argument("-v", "--verbose", action="store_true")
+    parser.add_argument("--profile", action="store_true")
+    parser.add_argument("--trace-file", default=os.environ.get("EVID_TRACE_FILE"))
     args, unknown = parser.parse_known_args()
 
     from evid.logging_config import configure_logging
 
     configure_logging(verbose=args.verbose)
+    if args.profile or args.trace_file:
+        from evid import tracing
+
+        tracing.enable(args.trace_file)
 
     import evid.cli.callbacks
 
@@ -63,13 +78,19 @@ def main():
     evid.cli.callbacks.DIRECTORY = (
         Path(args.db).expanduser()
         if args.db is not None
-        else EvidConfig.load().data_dir
+        else EvidConfig.cached().data_dir
     )
     sys.argv = [sys.argv[0], *unknown]
 
     # With no subcommand, treeparse prints root help (it finds no `func`).
     # The GUI stays reachable via the explicit `evid gui` subcommand.
-    app.run()
+    try:
+        app.run()
+    finally:
+        if args.profile:
+            from evid import tracing
+
+            tracing.print_report()
 
 
 # ── root ───────────────────────────────────────────────────────────────────────
@@ -85,7 +106,7 @@ app = cli(
         option(
             flags=["-d", "--db"],
             arg_type=str,
-            default=str(EvidConfig.load().data_dir),
+            default=str(EvidConfig.cached().data_dir),
             help="Data directory (default: ~/.local/share/evid)",
         ),
     ],
@@ -142,17 +163,172 @@ set_group.commands.append(
     )
 )
 
+set_group.commands.append(
+    command(
+        name="migrate-index",
+        help="Rebuild a set's vector index with the configured HNSW settings "
+        "(cosine space; no re-embedding)",
+        callback=migrate_index_callback,
+        options=[_DATASET_OPTION],
+    )
+)
+
+set_group.commands.append(
+    command(
+        name="convert-index",
+        help="Move a set's vectors to another backend: chroma (HNSW) or numpy "
+        "(memory-mapped, exact search; no re-embedding)",
+        callback=convert_index_callback,
+        options=[
+            _DATASET_OPTION,
+            option(
+                flags=["-b", "--backend"],
+                arg_type=str,
+                required=True,
+                choices=["chroma", "numpy"],
+                help="Target backend: chroma or numpy",
+            ),
+            option(
+                flags=["--dtype"],
+                arg_type=str,
+                default="float32",
+                choices=["float32", "float16"],
+                help="Element type of a numpy index: float32, or float16 for "
+                "half the size and slower queries",
+            ),
+        ],
+    )
+)
+
+set_group.commands.append(
+    command(
+        name="export-index",
+        help="Write a set's chunks and embeddings to a portable snapshot (.npz)",
+        callback=export_index_callback,
+        options=[
+            _DATASET_OPTION,
+            option(
+                flags=["-o", "--output"],
+                dest="output",
+                arg_type=str,
+                required=True,
+                help="Snapshot file; name it vecindex.npz inside an evid dataset "
+                "directory to have `import_evid_dir` pick it up",
+            ),
+            option(
+                flags=["--dtype"],
+                arg_type=str,
+                default="float32",
+                choices=["float32", "float16"],
+                help="Element type of the stored embeddings",
+            ),
+        ],
+    )
+)
+
+set_group.commands.append(
+    command(
+        name="import-index",
+        help="Load vectors from a snapshot into a set (no re-embedding; the "
+        "embedding model must match)",
+        callback=import_index_callback,
+        options=[
+            _DATASET_OPTION,
+            option(
+                flags=["-i", "--input"],
+                dest="input_path",
+                arg_type=str,
+                required=True,
+                help="Snapshot file written by `evid set export-index`",
+            ),
+        ],
+    )
+)
+
+set_group.commands.append(
+    command(
+        name="vacuum",
+        help="Delete vectors of documents no longer on disk, repair 'indexed' "
+        "flags and compact the vector store",
+        callback=vacuum_callback,
+        options=[
+            _DATASET_OPTION,
+            option(
+                flags=["--dry-run"],
+                flag=True,
+                help="Only report what would be deleted, repaired and compacted",
+            ),
+            option(
+                flags=["--compact"],
+                flag=True,
+                help="Compact even if few deleted records take up space",
+            ),
+            option(
+                flags=["--no-compact"],
+                flag=True,
+                help="Never compact (compaction rewrites the whole index)",
+            ),
+        ],
+    )
+)
+
+set_group.commands.append(
+    command(
+        name="quote",
+        help="Machine-extract verbatim quotes for many docs at once (parallel)",
+        callback=set_quote_callback,
+        options=[
+            _DATASET_OPTION,
+            option(
+                flags=["--from"],
+                dest="from_path",
+                arg_type=str,
+                help='Batch JSON {"<uuid>": [{"candidate": ...}, ...]} (non-citable input)',
+            ),
+            option(
+                flags=["--from-search"],
+                dest="from_search",
+                arg_type=str,
+                help="Seed candidates from one vector search over the whole set",
+            ),
+            option(
+                flags=["-n", "--n"],
+                arg_type=int,
+                default=5,
+                help="With --from-search: top chunks per document to use as candidates",
+            ),
+            option(
+                flags=["--min-ratio"],
+                arg_type=float,
+                default=0.78,
+                help="Fuzzy match threshold (0-1)",
+            ),
+            option(
+                flags=["--refresh"],
+                flag=True,
+                help="Re-extract each cached text.txt before matching",
+            ),
+            option(
+                flags=["-j", "--jobs"],
+                arg_type=int,
+                default=0,
+                help="Worker processes (default: one per CPU)",
+            ),
+        ],
+    )
+)
+
 set_group.commands.append(
     command(
         name="gather",
-        help="Export gathered BibTeX / Markdown / JSON / Hayagriva from a set",
+        help="Export gathered BibTeX / Markdown / JSON(L) / Hayagriva from a set",
         callback=gather_callback,
         arguments=[argument(name="dataset", arg_type=str)],
         options=[
             option(
                 flags=["-o", "--output"],
                 arg_type=str,
-                help="[required] Output file (.bib, .typ, .md, .json, .yaml, or .yml)",
+                help="[required] Output file (.bib, .typ, .md, .json, .jsonl, .yaml, or .yml)",
             ),
             option(
                 flags=["--no-regen"],
@@ -174,6 +350,12 @@ set_group.commands.append(
                 arg_type=str,
                 help="Only docs added on/before this date (defaults to today)",
             ),
+            option(
+                flags=["-j", "--jobs"],
+                arg_type=int,
+                default=1,
+                help="Worker processes preparing document sections (0: one per CPU)",
+            ),
         ],
     )
 )
@@ -415,6 +597,25 @@ search_group.commands.append(
     )
 )
 
+search_group.commands.append(
+    command(
+        name="similar",
+        help="Documents most like a given document (document-level vectors)",
+        callback=search_similar_callback,
+        arguments=[argument(name="uuid", arg_type=str)],
+        options=[
+            _DATASET_OPTION,
+            option(
+                flags=["-n", "--n"],
+                arg_type=int,
+                default=10,
+                help="Number of results",
+            ),
+            _FORMAT_OPTION,
+        ],
+    )
+)
+
 # ── config ─────────────────────────────────────────────────────────────────────
 
 config_group = group(name="config", help="Configuration")
@@ -5,7 +5,6 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-import bibtexparser as btp
 import yaml
 
 from evid.core.models import InfoModel
@@ -68,6 +67,8 @@ def _count_snippets(uuid_dir: Path) -> int:
     bib_file = uuid_dir / "label.bib"
     if not bib_file.exists():
         return 0
+    import bibtexparser as btp
+
     try:
         db = btp.loads(bib_file.read_text(encoding="utf-8"))
         return sum(
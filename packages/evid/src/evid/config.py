@@ -1,12 +1,37 @@
-"""evid configuration — reads/writes ~/.local/share/evid/evid.yml."""
+"""evid configuration — reads/writes ~/.local/share/evid/evid.yml.
+
+``EvidConfig.load()`` reads and validates the YAML file every time. Hot paths
+(embedding calls, every query in the MCP server and GUI) use
+``EvidConfig.cached()`` instead: one process-wide instance, re-read only when
+the config file's mtime or size changes, or after ``reload_config()``.
+"""
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 
 import yaml
 from pydantic import BaseModel, Field
 
+# config path -> ((mtime_ns, size) or None if absent, config)
+_CACHE: dict[Path, tuple[tuple[int, int] | None, EvidConfig]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def reload_config() -> None:
+    """Drop cached configs so the next ``EvidConfig.cached()`` re-reads them."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
 
 class EvidConfig(BaseModel):
     data_dir: Path = Field(
@@ -18,12 +43,67 @@ class EvidConfig(BaseModel):
     # (strong on Danish) and 384-dim like the old all-MiniLM-L6-v2. Override
     # here or with the EVID_EMBEDDING_MODEL env var, then `evid set reindex`.
     embedding_model: str = "intfloat/multilingual-e5-small"
+    # How the embedding model runs: torch, torch-int8, onnx or onnx-int8 (see
+    # evid.vec.embeddings). Override with EVID_EMBEDDING_BACKEND; no reindex.
+    embedding_backend: str = "torch"
+    # Padded tokens per embedding call. Chunks are batched by length under this
+    # budget, which also bounds peak memory while indexing large documents.
+    embed_token_budget: int = 16384
+    # Tokens of trailing context repeated at the start of the next chunk when a
+    # long passage is split to fit the model's window (0 = no overlap).
+    chunk_overlap_tokens: int = 0
+    # Warm indexer processes for background indexing. Each holds its own copy
+    # of the embedding model; sets index in parallel up to this many at once.
+    index_workers: int = 2
+    # How labels are read from label.typ: "native" parses the #lab/#mset subset
+    # in-process (falling back to typst query for anything else); "typst"
+    # always runs typst query.
+    label_parser: str = "native"
+    # HNSW index of each set's (cosine-space) vector collection. M and
+    # ef_construction trade build time and memory for recall and are fixed when
+    # a collection is built: `evid set migrate-index` rebuilds a set with new
+    # values. ef_search trades query latency for recall; it needs no rebuild
+    # and applies once evid (GUI, MCP server) is restarted.
+    # `python -m benchmarks.hnsw` measures the trade-off.
+    hnsw_max_neighbors: int = 16
+    hnsw_ef_construction: int = 100
+    hnsw_ef_search: int = 100
+    # Vector backend for sets without an index yet: "chroma" (HNSW) or
+    # "numpy" (a memory-mapped matrix searched exactly; no Chroma process
+    # state, for small and read-only sets). Existing sets keep theirs until
+    # `evid set convert-index`. NumPy sets of vector_ivf_min_rows chunks or
+    # more (0 = never) get an IVF index searched over vector_ivf_nprobe lists.
+    vector_backend: str = "chroma"
+    vector_ivf_min_rows: int = 100_000
+    vector_ivf_nprobe: int = 32
 
-    @classmethod
-    def load(cls, path: Path | None = None) -> EvidConfig:
+    @staticmethod
+    def _config_path(path: Path | None = None) -> Path:
         new_path = Path.home() / ".local" / "share" / "evid" / "evid.yml"
         legacy_path = Path.home() / ".local" / "share" / "evidmgr" / "evidmgr.yml"
-        config_path = path or (new_path if new_path.exists() else legacy_path)
+        return path or (new_path if new_path.exists() else legacy_path)
+
+    @classmethod
+    def cached(cls, path: Path | None = None) -> EvidConfig:
+        """Shared ``load()`` result, re-read when the config file changes.
+
+        The instance is shared process-wide: treat it as read-only and use
+        ``load()`` for a copy you mean to modify.
+        """
+        config_path = cls._config_path(path)
+        key = _stat_key(config_path)
+        with _CACHE_LOCK:
+            hit = _CACHE.get(config_path)
+            if hit is not None and hit[0] == key:
+                return hit[1]
+        config = cls.load(config_path)
+        with _CACHE_LOCK:
+            _CACHE[config_path] = (key, config)
+        return config
+
+    @classmethod
+    def load(cls, path: Path | None = None) -> EvidConfig:
+        config_path = cls._config_path(path)
         if config_path.exists():
             with config_path.open("r", encoding="utf-8") as f:
                 data = yaml.safe_load(f) or {}
@@ -49,7 +129,19 @@ class EvidConfig(BaseModel):
                     "editor": self.editor,
                     "default_language": self.default_language,
                     "embedding_model": self.embedding_model,
+                    "embedding_backend": self.embedding_backend,
+                    "embed_token_budget": self.embed_token_budget,
+                    "chunk_overlap_tokens": self.chunk_overlap_tokens,
+                    "index_workers": self.index_workers,
+                    "label_parser": self.label_parser,
+                    "hnsw_max_neighbors": self.hnsw_max_neighbors,
+                    "hnsw_ef_construction": self.hnsw_ef_construction,
+                    "hnsw_ef_search": self.hnsw_ef_search,
+                    "vector_backend": self.vector_backend,
+                    "vector_ivf_min_rows": self.vector_ivf_min_rows,
+                    "vector_ivf_nprobe": self.vector_ivf_nprobe,
                 },
                 f,
                 allow_unicode=True,
             )
+        reload_config()
@@ -0,0 +1,192 @@
+"""Find the structurally broken BibTeX entries, in one pass.
+
+Typst reads a bibliography with hayagriva, which stops at the first entry it
+cannot parse. Rather than compiling, reading the error and compiling again,
+``gather`` checks the whole file up front with :func:`find_invalid` and
+comments out entries no BibTeX reader could take:
+
+* entries whose braces or quotes do not balance (including ``@comment``
+  blocks bibtexparser wraps around text it could not parse itself),
+* malformed fields (no ``=``, no value, missing commas),
+* keys that are empty or contain whitespace or delimiter characters,
+* repeated keys (every occurrence after the first).
+
+What hayagriva makes of field values (dates, abbreviations) is left to the
+compile: entries Typst rejects for those are found by bisection in
+:mod:`evid.core.gather`. :func:`block_type` lets it keep ``@string`` and
+``@preamble`` blocks in every probe.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+_ENTRY_START = re.compile(r"^[ \t]*@[ \t]*(\w+)[ \t]*[{(]", re.MULTILINE)
+_BAD_KEY_CHARS = re.compile(r"[\s{}(),=\"#%'~\\]")
+_FIELD_NAME = re.compile(r"[^\s=,{}\"#]+")
+_BARE_WORD = re.compile(r"[A-Za-z0-9_:.+-]+")
+MACRO_TYPES = frozenset({"string", "preamble"})
+
+
+@dataclass
+class BibEntry:
+    """One ``@type{...}`` block: its span in the file and what is wrong with it."""
+
+    start: int
+    end: int
+    type: str
+    key: str = ""
+    problem: str = ""
+
+
+class _Malformed(ValueError):  # noqa: N818
+    pass
+
+
+def _is_comment_line(text: str, pos: int) -> bool:
+    line_start = text.rfind("\n", 0, pos) + 1
+    return text[line_start:pos].lstrip().startswith("%")
+
+
+def _group(text: str, pos: int, close: str) -> int:
+    """*pos* is just inside an opening delimiter; return the index after *close*."""
+    depth = 0
+    i = pos
+    while i < len(text):
+        c = text[i]
+        if c == "\\":
+            i += 2
+            continue
+        if c == "{":
+            depth += 1
+        elif c == "}":
+            if depth == 0:
+                if close == "}":
+                    return i + 1
+                raise _Malformed("unterminated quote")
+            depth -= 1
+        elif c == close and depth == 0:
+            return i + 1
+        i += 1
+    raise _Malformed("unbalanced braces" if close == "}" else "unterminated quote")
+
+
+def _skip_ws(text: str, pos: int) -> int:
+    while pos < len(text) and text[pos].isspace():
+        pos += 1
+    return pos
+
+
+def _value(text: str, pos: int) -> int:
+    """Skip ``{..}``, ``".."`` or a bare word, joined with ``#``."""
+    while True:
+        pos = _skip_ws(text, pos)
+        c = text[pos : pos + 1]
+        if c == "{":
+            end = _group(text, pos + 1, "}")
+        elif c == '"':
+            end = _group(text, pos + 1, '"')
+        else:
+            m = _BARE_WORD.match(text, pos)
+            if m is None:
+                raise _Malformed(f"missing value at {text[pos : pos + 20]!r}")
+            end = m.end()
+        pos = _skip_ws(text, end)
+        if not text.startswith("#", pos):
+            return pos
+        pos += 1
+
+
+def _parse_entry(text: str, body: int, entry: BibEntry) -> int:
+    """Check the entry whose body starts at *body*; return its end offset."""
+    close = "}" if text[body - 1] == "{" else ")"
+    if entry.type == "comment" or entry.type in MACRO_TYPES:
+        return _group(text, body, close)
+
+    comma = text.find(",", body)
+    brace = text.find(close, body)
+    key_end = comma if comma >= 0 and (brace < 0 or comma < brace) else brace
+    if key_end < 0:
+        raise _Malformed("entry is not closed")
+    entry.key = text[body:key_end].strip()
+    pos = key_end
+    while True:
+        pos = _skip_ws(text, pos)
+        if pos >= len(text):
+            raise _Malformed("unbalanced braces: entry is not closed")
+        if text.startswith(close, pos):
+            return pos + 1
+        if not text.startswith(",", pos):
+            raise _Malformed(f"expected ',' at {text[pos : pos + 20]!r}")
+        pos = _skip_ws(text, pos + 1)
+        if text.startswith(close, pos):
+            return pos + 1
+        m = _FIELD_NAME.match(text, pos)
+        if m is None:
+            raise _Malformed(f"bad field name at {text[pos : pos + 20]!r}")
+        name = m.group().lower()
+        pos = _skip_ws(text, m.end())
+        if not text.startswith("=", pos):
+            raise _Malformed(f"expected '=' after {name!r}")
+        pos = _value(text, pos + 1)
+
+
+def split_entries(text: str) -> list[tuple[int, int]]:
+    """``(start, end)`` of each ``@`` block outside ``%`` comments.
+
+    A block ends where the next one starts, so an entry with unbalanced braces
+    does not take the rest of the file with it.
+    """
+    starts = [
+        m.start()
+        for m in _ENTRY_START.finditer(text)
+        if not _is_comment_line(text, m.start())
+    ]
+    return list(zip(starts, [*starts[1:], len(text)], strict=True))
+
+
+def block_type(text: str, start: int) -> str:
+    """Lower-cased type of the ``@`` block starting at *start*."""
+    return _ENTRY_START.match(text, start).group(1).lower()
+
+
+def find_invalid(text: str) -> list[BibEntry]:
+    """Every structurally broken entry of *text*, in file order."""
+    bad: list[BibEntry] = []
+    seen: set[str] = set()
+    for start, limit in split_entries(text):
+        chunk = text[start:limit]
+        m = _ENTRY_START.match(chunk)
+        entry = BibEntry(start, limit, m.group(1).lower())
+        try:
+            end = _parse_entry(chunk, m.end(), entry)
+        except _Malformed as e:
+            entry.problem = str(e)
+        else:
+            entry.end = start + end
+            if entry.type != "comment" and entry.type not in MACRO_TYPES:
+                if not entry.key or _BAD_KEY_CHARS.search(entry.key):
+                    entry.problem = f"invalid key {entry.key!r}"
+                elif entry.key in seen:
+                    entry.problem = f"duplicate key {entry.key!r}"
+                seen.add(entry.key)
+        if entry.problem:
+            bad.append(entry)
+    return bad
+
+
+def comment_out(text: str, spans: list[tuple[int, int]]) -> str:
+    """Prefix every line of each ``(start, end)`` span of *text* with ``% ``."""
+    out = []
+    pos = 0
+    for start, end in sorted(spans):
+        out.append(text[pos:start])
+        block = text[start:end]
+        trailing = block[len(block.rstrip("\n")) :]
+        out.append(
+            "\n".join(f"% {line}" for line in block.rstrip("\n").split("\n")) + trailing
+        )
+        pos = end
+    out.append(text[pos:])
+    return "".join(out)
@@ -1,19 +1,79 @@
 """Handle BibTeX generation."""
 
+import json
 import logging
 import os
 import subprocess
 from pathlib import Path
 
+from evid import tracing
 from evid.core.bibtex_utils import json_to_bib
 
 logger = logging.getLogger(__name__)
 
 
+def _native_labels(typ_file: Path, json_file: Path) -> bool:
+    """Write ``label.json`` with the in-process parser; False if it can't."""
+    from evid.config import EvidConfig
+    from evid.core.labtyp import UnsupportedLabtyp, extract_labels
+
+    if EvidConfig.cached().label_parser != "native":
+        return False
+    try:
+        with tracing.span("labtyp.parse"):
+            items = extract_labels(typ_file)
+    except UnsupportedLabtyp as e:
+        logger.info(f"Using typst query for {typ_file}: {e}")
+        return False
+    json_file.write_text(
+        json.dumps(items, indent=2, ensure_ascii=False), encoding="utf-8"
+    )
+    return True
+
+
+def _typst_query_labels(typ_file: Path, json_file: Path) -> str:
+    """Write ``label.json`` with ``typst query``; return an error message or ""."""
+    tracing.count("subprocesses")
+    with (
+        open(json_file, "w", encoding="utf-8") as json_out,
+        tracing.span("typst.query"),
+    ):
+        result = subprocess.run(
+            [
+                "typst",
+                "query",
+                str(typ_file),
+                "<lab>",
+                "--package-path",
+                os.path.expanduser("~/.cache/typst"),
+            ],
+            stdout=json_out,
+            stderr=subprocess.PIPE,
+            check=False,
+        )
+
+    # print the command in pastable form for debugging in shell
+    cmd_for_shell = " ".join([f'"{arg}"' if " " in arg else arg for arg in result.args])
+    logger.info(f"Running command: {cmd_for_shell} > {json_file}")
+    stderr_output = result.stderr.decode("utf-8")
+    if stderr_output:
+        logger.info(f"Stderr: {stderr_output}")
+    if result.returncode != 0:
+        if "text is not locatable" in stderr_output:
+            logger.warning(f"Ignoring non-fatal Typst query error: {stderr_output}")
+        else:
+            return f"Error running typst query on {typ_file}: Command returned non-zero exit status {result.returncode}.\nStderr: {stderr_output}"
+    return ""
+
+
 def generate_bib_from_typ(
     typ_file: Path, exclude_note: bool = True
 ) -> tuple[bool, str]:
-    """Generate BibTeX from a single Typst file. Return (success, message)."""
+    """Generate BibTeX from a single Typst file. Return (success, message).
+
+    Labels are read in-process when the file sticks to the ``#lab``/``#mset``
+    subset (see :mod:`evid.core.labtyp`), otherwise with ``typst query``.
+    """
     if not typ_file.exists():
         return False, f"Typst file '{typ_file}' does not exist."
     if not typ_file.stat().st_size:
@@ -21,37 +81,13 @@ def generate_bib_from_typ(
     json_file = typ_file.parent / "label.json"
     bib_file = typ_file.parent / "label.bib"
     try:
-        with open(json_file, "w", encoding="utf-8") as json_out:
-            result = subprocess.run(
-                [
-                    "typst",
-                    "query",
-                    str(typ_file),
-                    "<lab>",
-                    "--package-path",
-                    os.path.expanduser("~/.cache/typst"),
-                ],
-                stdout=json_out,
-                stderr=subprocess.PIPE,
-                check=False,
-            )
-
-        # print the command in pastable form for debugging in shell
-        cmd_for_shell = " ".join(
-            [f'"{arg}"' if " " in arg else arg for arg in result.args]
-        )
-        logger.info(f"Running command: {cmd_for_shell} > {json_file}")
-        stderr_output = result.stderr.decode("utf-8")
-        if stderr_output:
-            logger.info(f"Stderr: {stderr_output}")
-        if result.returncode != 0:
-            if "text is not locatable" in stderr_output:
-                logger.warning(f"Ignoring non-fatal Typst query error: {stderr_output}")
-            else:
-                error_msg = f"Error running typst query on {typ_file}: Command returned non-zero exit status {result.returncode}.\nStderr: {stderr_output}"
+        if not _native_labels(typ_file, json_file):
+            error_msg = _typst_query_labels(typ_file, json_file)
+            if error_msg:
                 return False, error_msg
         try:
-            json_to_bib(json_file, bib_file, exclude_note=exclude_note)
+            with tracing.span("bib.json_to_bib"):
+                json_to_bib(json_file, bib_file, exclude_note=exclude_note)
             logger.info(f"Generated BibTeX file: {bib_file}")
             return True, ""
         except Exception as e:
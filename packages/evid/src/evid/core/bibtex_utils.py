@@ -1,12 +1,14 @@
 """BibTeX utility functions for evid."""
 
+import functools
 import json
 import logging
+import math
 import re
+from datetime import date
 from pathlib import Path
 
 import demoji
-import pandas as pd
 import yaml
 
 from evid.core.models import InfoModel
@@ -42,9 +44,28 @@ def remove_backslash_substrings(s):
         return ""
 
 
+@functools.cache
+def _emoji_chars() -> frozenset[str] | None:
+    """Non-ASCII characters occurring in any emoji demoji knows, or None."""
+    codes = getattr(demoji, "_CODE_TO_DESC", None)
+    if not codes:
+        return None
+    chars = {ch for code in codes for ch in code if not ch.isascii()}
+    return frozenset(chars | {"\ufe0e", "\ufe0f"})
+
+
 def emojis_to_text(s):
-    # Replace all emojis in the content
-    return demoji.replace(s, "(emoji)")
+    # Replace all emojis in the content. demoji's pattern is slow, so only run
+    # it on lines holding a character some emoji is made of.
+    chars = _emoji_chars()
+    if chars is None:
+        return demoji.replace(s, "(emoji)")
+    if chars.isdisjoint(s):
+        return s
+    return "\n".join(
+        line if chars.isdisjoint(line) else demoji.replace(line, "(emoji)")
+        for line in s.split("\n")
+    )
 
 
 def bib_escape(s: str) -> str:
@@ -52,188 +73,157 @@ def bib_escape(s: str) -> str:
     return s.replace("\\", "\\\\").replace('"', '\\"')
 
 
-def load_uuid_prefix(file_path: Path) -> str:
+def load_info(file_path: Path) -> dict:
+    """Validated ``info.yml`` next to *file_path*; ``{}`` if missing or invalid."""
     info_file = file_path.with_name("info.yml")
-    if info_file.exists():
-        with info_file.open("r") as info_file:
-            info_data = yaml.safe_load(info_file)
-            # Validate with Pydantic
-            try:
-                validated_info = InfoModel(**info_data)
-                info_data = validated_info.model_dump()
-            except ValueError as e:
-                logger.warning(f"Validation error for {info_file}: {e}")
-                return ""
-            if "uuid" in info_data:
-                return info_data["uuid"][:4]
-    return ""
+    if not info_file.exists():
+        return {}
+    with info_file.open("r", encoding="utf-8") as f:
+        info_data = yaml.safe_load(f)
+    # Validate with Pydantic
+    try:
+        return InfoModel(**info_data).model_dump()
+    except ValueError as e:
+        logger.warning(f"Validation error for {info_file}: {e}")
+        return {}
+
+
+def load_uuid_prefix(file_path: Path) -> str:
+    return load_info(file_path).get("uuid", "")[:4]
 
 
 def load_url(file_path: Path) -> str:
-    info_file = file_path.with_name("info.yml")
-    if info_file.exists():
-        with info_file.open("r") as info_file:
-            info_data = yaml.safe_load(info_file)
-            # Validate with Pydantic
-            try:
-                validated_info = InfoModel(**info_data)
-                info_data = validated_info.model_dump()
-            except ValueError as e:
-                logger.warning(f"Validation error for {info_file}: {e}")
-                return ""
-            if "url" in info_data:
-                return str(info_data["url"])
-    return ""
+    return str(load_info(file_path).get("url", ""))
 
 
 def load_authors(file_path: Path) -> str:
     """Load authors from info.yml."""
-    info_file = file_path.with_name("info.yml")
-    if info_file.exists():
-        with info_file.open("r") as info_file:
-            info_data = yaml.safe_load(info_file)
-            # Validate with Pydantic
-            try:
-                validated_info = InfoModel(**info_data)
-                info_data = validated_info.model_dump()
-            except ValueError as e:
-                logger.warning(f"Validation error for {info_file}: {e}")
-                return ""
-            if "authors" in info_data:
-                return str(info_data["authors"])
-    return ""
+    return str(load_info(file_path).get("authors", ""))
 
 
 def load_title(file_path: Path) -> str:
-    info_file = file_path.with_name("info.yml")
-    if info_file.exists():
-        with info_file.open("r") as info_file:
-            info_data = yaml.safe_load(info_file)
-            # Validate with Pydantic
-            try:
-                validated_info = InfoModel(**info_data)
-                info_data = validated_info.model_dump()
-            except ValueError as e:
-                logger.warning(f"Validation error for {info_file}: {e}")
-                return ""
-            if "title" in info_data:
-                return str(info_data["title"])
-    return ""
+    return str(load_info(file_path).get("title", ""))
 
 
 def load_dates(file_path: Path) -> str:
-    info_file = file_path.with_name("info.yml")
-    if info_file.exists():
-        with info_file.open("r") as info_file:
-            info_data = yaml.safe_load(info_file)
-            # Validate with Pydantic
+    return str(load_info(file_path).get("dates", ""))
+
+
+def _is_null(value) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _format_dates(values: list) -> list[str]:
+    """Format label dates as ``YYYY-MM-DD``, ``""`` where they do not parse.
+
+    Labels carry either an ISO date or the ``DATE`` placeholder, which parse
+    the same whatever format pandas would infer; anything else is handed to
+    ``pandas.to_datetime`` so the output stays what it has always been.
+    """
+    out = []
+    for value in values:
+        if _is_null(value) or value in ("", "DATE"):
+            out.append("")
+        elif isinstance(value, str) and _ISO_DATE.fullmatch(value):
             try:
-                validated_info = InfoModel(**info_data)
-                info_data = validated_info.model_dump()
-            except ValueError as e:
-                logger.warning(f"Validation error for {info_file}: {e}")
-                return ""
-            if "dates" in info_data:
-                return str(info_data["dates"])
-    return ""
+                out.append(date.fromisoformat(value).isoformat())
+            except ValueError:
+                out.append("")
+        else:
+            return _format_dates_pandas(values)
+    return out
+
+
+def _format_dates_pandas(values: list) -> list[str]:
+    import pandas as pd
+
+    parsed = pd.to_datetime(pd.Series(values), dayfirst=False, errors="coerce")
+    return ["" if pd.isnull(d) else d.strftime("%Y-%m-%d") for d in parsed]
+
+
+def _clean_title(s) -> str:
+    return replace_underscores(
+        replace_multiple_spaces(
+            remove_curly_brace_content(remove_backslash_substrings(s))
+        )
+    )
 
 
 def json_to_bib(json_file: Path, output_file: Path, exclude_note: bool):
+    """Write ``label.bib`` for the ``#lab`` entries in ``label.json``.
+
+    One ``@article`` for the document (from ``info.yml``, read once) followed by
+    one per label, written in a single pass.
+    """
     try:
-        with open(json_file) as f:
+        with open(json_file, encoding="utf-8") as f:
             data = json.load(f)
         if not data:
             raise ValueError("JSON data is empty")
-        df = pd.DataFrame([item["value"] for item in data])
-        if df.empty:
+        rows = [item["value"] for item in data]
+        if not any(rows):
             raise ValueError("DataFrame is empty")
-        if "key" not in df.columns:
+        if not any("key" in row for row in rows):
             raise KeyError("'key' column missing in JSON data")
-        df = df.rename(columns={"key": "label", "text": "quote"})
-        df["date"] = pd.to_datetime(
-            df.get("date", pd.Series([pd.NaT] * len(df))),
-            dayfirst=False,
-            errors="coerce",
-        )
-        uuid_prefix = load_uuid_prefix(json_file)
-        df["latex_label"] = [f"{uuid_prefix}:{label.strip()}" for label in df["label"]]
-        with open(output_file, "w", encoding="utf-8") as bibtex_file:
-            # Write main document entry first
-            main_lines = [f"@article{{ {uuid_prefix}:main  ,"]
+        info = load_info(json_file)
+        uuid_prefix = info.get("uuid", "")[:4]
+        author_value = str(info.get("authors", ""))
+        url_value = str(info.get("url", ""))
+        dates = _format_dates([row.get("date") for row in rows])
+
+        # Main document entry first
+        lines = [f"@article{{ {uuid_prefix}:main  ,"]
+        title_value = _clean_title(str(info.get("title", "")))
+        if title_value:
+            lines.append(f"    title = {{{title_value}}},")
+        if author_value:
+            lines.append(f"    author = {{{author_value}}},")
+        date_value = str(info.get("dates", ""))
+        if date_value:
+            lines.append(f"    date = {{{date_value}}},")
+        if url_value:
+            lines.append(f"    url = {{{url_value}}},")
+        lines.append("    }")
+
+        # Snippet entries
+        note_key = "nonote" if exclude_note else "note"
+        for row, date_value in zip(rows, dates, strict=True):
+            lines.append(f"@article{{ {uuid_prefix}:{row.get('key').strip()}  ,")
+
+            note_value = row.get("note")
+            if note_value and not _is_null(note_value):
+                lines.append(f"    {note_key} = {{{note_value}}},")
+
             title_value = replace_underscores(
-                replace_multiple_spaces(
-                    remove_curly_brace_content(
-                        remove_backslash_substrings(load_title(json_file))
-                    )
-                )
+                replace_multiple_spaces(remove_backslash_substrings(row.get("text")))
             )
             if title_value:
-                main_lines.append(f"    title = {{{title_value}}},")
-            author_value = load_authors(json_file)
+                lines.append(f"    title = {{{title_value}}},")
+
+            journal_value = _clean_title(row.get("title"))
+            if journal_value and journal_value != "NAME":
+                lines.append(f"    journal = {{{journal_value}}},")
+
             if author_value:
-                main_lines.append(f"    author = {{{author_value}}},")
-            date_value = load_dates(json_file)
+                lines.append(f"    author = {{{author_value}}},")
+
             if date_value:
-                main_lines.append(f"    date = {{{date_value}}},")
-            url_value = load_url(json_file)
+                lines.append(f"    date = {{{date_value}}},")
+
+            opage = row.get("opage")
+            pages_value = "" if _is_null(opage) else int(opage)
+            if pages_value:
+                lines.append(f"    pages = {{{pages_value}}},")
+
             if url_value:
-                main_lines.append(f"    url = {{{url_value}}},")
-            main_lines.append("    }")
-            bibtex_file.write(emojis_to_text("\n".join(main_lines)) + "\n")
-
-            # Write snippet entries
-            for _index, row in df.iterrows():
-                entry_lines = [f"@article{{ {row['latex_label']}  ,"]
-
-                note_value = row.get("note", "")
-                if note_value:
-                    note_key = "nonote" if exclude_note else "note"
-                    entry_lines.append(f"    {note_key} = {{{note_value}}},")
-
-                title_value = replace_underscores(
-                    replace_multiple_spaces(
-                        remove_backslash_substrings(row.get("quote", ""))
-                    )
-                )
-                if title_value:
-                    entry_lines.append(f"    title = {{{title_value}}},")
-
-                journal_value = replace_underscores(
-                    replace_multiple_spaces(
-                        remove_curly_brace_content(
-                            remove_backslash_substrings(row.get("title", ""))
-                        )
-                    )
-                )
-                if journal_value and journal_value != "NAME":
-                    entry_lines.append(f"    journal = {{{journal_value}}},")
-
-                author_value = load_authors(json_file)
-                if author_value:
-                    entry_lines.append(f"    author = {{{author_value}}},")
-
-                date_value = (
-                    row["date"].strftime("%Y-%m-%d")
-                    if not pd.isnull(row["date"])
-                    else ""
-                )
-                if date_value:
-                    entry_lines.append(f"    date = {{{date_value}}},")
-
-                pages_value = (
-                    int(row.get("opage", ""))
-                    if "opage" in row and not pd.isnull(row.get("opage", ""))
-                    else ""
-                )
-                if pages_value:
-                    entry_lines.append(f"    pages = {{{pages_value}}},")
-
-                url_value = load_url(json_file)
-                if url_value:
-                    entry_lines.append(f"    url = {{{url_value}}},")
-
-                entry_lines.append("    }")
-                bibtex_entry = "\n".join(entry_lines)
-                bibtex_file.write(emojis_to_text(bibtex_entry) + "\n")
+                lines.append(f"    url = {{{url_value}}},")
+
+            lines.append("    }")
+
+        with open(output_file, "w", encoding="utf-8") as bibtex_file:
+            bibtex_file.write(emojis_to_text("\n".join(lines)) + "\n")
     except Exception as e:
         raise ValueError(f"Error processing JSON: {e}")
@@ -9,12 +9,14 @@ from pathlib import Path
 
 import yaml
 
+from evid import tracing
 from evid.core.models import InfoModel
 from evid.models import Document
 
 logger = logging.getLogger(__name__)
 
 
+@tracing.traced("search.meta")
 def search_meta_documents(
     evidence_set_path: Path,
     pattern: str = "",
@@ -36,6 +38,7 @@ def search_meta_documents(
         try:
             with info_path.open(encoding="utf-8") as f:
                 raw = yaml.safe_load(f) or {}
+            tracing.count("files_read")
             info = InfoModel(**raw)
         except Exception:
             logger.debug("Skipping bad info.yml in %s", doc_dir.name, exc_info=True)
@@ -8,6 +8,8 @@ from typing import Any
 
 import yaml
 
+from evid.core.generation import bump_doc_generation
+
 logger = logging.getLogger(__name__)
 
 META_LEGACY = "evidmgr_meta.yml"
@@ -60,4 +62,5 @@ def write_meta(doc_dir: Path, meta: dict[str, Any]) -> Path:
             legacy.unlink()
         except OSError:
             logger.warning("Could not remove legacy meta file %s", legacy)
+    bump_doc_generation(doc_dir)
     return path
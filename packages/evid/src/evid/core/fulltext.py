@@ -19,6 +19,7 @@ Documents without a ``label.typ`` are skipped; the count is logged.
 
 from __future__ import annotations
 
+import bisect
 import logging
 import re
 import shutil
@@ -28,6 +29,8 @@ from pathlib import Path
 
 import yaml
 
+from evid import tracing
+
 logger = logging.getLogger(__name__)
 
 # Marker lines emitted per page by ``textpdf_to_typst`` (typst_generation.py).
@@ -66,19 +69,29 @@ def _context(text: str, start: int, end: int, ctx: int) -> str:
     return (lead + text[a:b] + trail).replace("\n", " ").strip()
 
 
-def _page_for_typ_offset(text: str, offset: int) -> int:
+def _page_markers(text: str) -> tuple[list[int], list[int]]:
+    """Offsets and page numbers of the ``== Page N`` marker lines in *text*."""
+    starts: list[int] = []
+    pages: list[int] = []
+    for m in _PAGE_RX.finditer(text):
+        starts.append(m.start())
+        pages.append(int(m.group(1)))
+    return starts, pages
+
+
+def _page_for_typ_offset(
+    text: str, offset: int, markers: tuple[list[int], list[int]] | None = None
+) -> int:
     """Map a char offset in a ``label.typ`` to its 1-based page number.
 
     Uses the ``== Page N`` marker lines; returns the page of the last marker at
-    or before *offset*, defaulting to 1 when no marker precedes it.
+    or before *offset*, defaulting to 1 when no marker precedes it. Pass
+    *markers* from :func:`_page_markers` to look up many offsets in one text
+    without rescanning it each time.
     """
-    page = 1
-    for m in _PAGE_RX.finditer(text):
-        if m.start() <= offset:
-            page = int(m.group(1))
-        else:
-            break
-    return page
+    starts, pages = markers or _page_markers(text)
+    i = bisect.bisect_right(starts, offset)
+    return pages[i - 1] if i else 1
 
 
 def _grepper() -> str | None:
@@ -126,8 +139,10 @@ def _candidate_dirs(set_path: Path, query: str) -> list[Path] | None:
         cmd += ["--no-ignore", "-g", "label.typ", str(docs_dir)]
     else:  # ugrep / ug
         cmd += ["-r", "--include=label.typ", str(docs_dir)]
+    tracing.count("subprocesses")
     try:
-        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        with tracing.span("search.fulltext.grep"):
+            proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
     except OSError:
         logger.exception("Grepper %s failed to launch; using Python fallback", binary)
         return None
@@ -162,6 +177,7 @@ def _literal_search(
         except OSError:
             logger.debug("Could not read %s", typ, exc_info=True)
             continue
+        tracing.count("files_read")
         idx = text.casefold().find(needle)
         if idx < 0:
             continue
@@ -198,13 +214,16 @@ def _regex_search(
         except OSError:
             logger.debug("Could not read %s", typ, exc_info=True)
             continue
+        tracing.count("files_read")
         label = _doc_label(doc_dir)
+        markers = None
         for m in rx.finditer(text):
+            markers = markers or _page_markers(text)
             hits.append(
                 TextHit(
                     uuid=doc_dir.name,
                     label=label,
-                    page=_page_for_typ_offset(text, m.start()),
+                    page=_page_for_typ_offset(text, m.start(), markers),
                     snippet=_context(text, m.start(), m.end(), context),
                     char_start=m.start(),
                     score=None,
@@ -228,6 +247,7 @@ def search_fulltext(
     ``regex=True`` returns up to *n* regex matches (document then offset order);
     otherwise a case-insensitive substring match, one hit per document, up to *n*.
     """
-    if regex:
-        return _regex_search(set_path, query, n=n, context=context)
-    return _literal_search(set_path, query, n=n, context=context)
+    with tracing.span("search.fulltext", regex=regex):
+        if regex:
+            return _regex_search(set_path, query, n=n, context=context)
+        return _literal_search(set_path, query, n=n, context=context)
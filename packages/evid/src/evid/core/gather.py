@@ -2,10 +2,14 @@
 
 import datetime
 import logging
+import os
 import re
 import subprocess
 import sys
+from collections import Counter
+from collections.abc import Iterable, Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 
 import bibtexparser as btp
@@ -14,6 +18,7 @@ from bibtexparser.bwriter import BibTexWriter
 from rich.console import Console
 from rich.table import Table
 
+from evid import tracing
 from evid.core.bibtex import generate_bib_from_typ
 from evid.core.models import InfoModel
 
@@ -77,6 +82,13 @@ def _names_in_range(
     return keep
 
 
+_BIB_FORMATS = (".bib", ".typ")
+# Written one document at a time; nothing holds the whole export in memory.
+_STREAMED_FORMATS = (".md", ".json", ".jsonl", ".yaml", ".yml")
+_MD_SPOOL_CHARS = 8 * 1024 * 1024
+
+
+@tracing.traced("gather")
 def gather_dataset(
     directory: Path,
     dataset: str,
@@ -85,6 +97,7 @@ def gather_dataset(
     include_keys: bool = False,
     since: str | None = None,
     until: str | None = None,
+    jobs: int = 1,
 ) -> None:
     """Gather all BibTeX from a dataset into a single output file.
 
@@ -95,14 +108,26 @@ def gather_dataset(
         include_keys: When True, emit ``###`` sub-headings with the user-defined
                label key name for each snippet.  Off by default to avoid
                influencing downstream LLMs with key name choices.
+        jobs: Worker processes preparing per-document sections (0: one per
+               CPU).  Sections are written in document order either way.
 
     Output format is inferred from the file extension:
       .bib         — combined, deduplicated BibTeX
       .typ         — Typst bibliography document + .bib; attempts typst compile
       .md          — Markdown report listing all entries
       .json        — JSON keyed by UUID
+      .jsonl       — JSON lines, one document per line (``uuid`` field added)
       .yaml / .yml — Hayagriva YAML bibliography (Typst-native)
+
+    All formats but .bib and .typ are streamed: each document's section is
+    written as soon as it is prepared.
     """
+    suffix = output.suffix.lower()
+    if suffix not in _BIB_FORMATS + _STREAMED_FORMATS:
+        sys.exit(
+            f"Unsupported output format '{suffix}'. "
+            "Use .bib, .typ, .md, .json, .jsonl, .yaml, or .yml."
+        )
     dataset_dir = directory / "sets" / dataset / "docs"
     if not dataset_dir.is_dir():
         sys.exit(f"Dataset docs directory '{dataset_dir}' does not exist.")
@@ -117,10 +142,12 @@ def gather_dataset(
         if not keep:
             sys.exit("No documents added in the given date range.")
 
-    if regen:
-        bib_texts, errors = _collect_bibs_regen(dataset_dir, keep)
-    else:
-        bib_texts, errors = _collect_bibs_existing(dataset_dir, keep)
+    with tracing.span("gather.collect", regen=regen):
+        if regen:
+            bib_files, errors = _collect_bibs_regen(dataset_dir, keep)
+        else:
+            bib_files, errors = _collect_bibs_existing(dataset_dir, keep)
+        tracing.count("files_read", len(bib_files))
 
     if errors:
         for err in errors:
@@ -128,68 +155,106 @@ def gather_dataset(
 
     # Machine quotes (machine.hayagriva, written by `evid doc quote`) are merged
     # in alongside the manual #lab snippets — and may be the only content present.
-    machine_entries = _collect_machine_hayagriva(dataset_dir, keep)
+    # Markdown and JSON read them per document instead.
+    uuid_dirs = _doc_dirs(dataset_dir, keep)
+    machine_entries: dict[str, dict] = {}
+    if suffix in (*_BIB_FORMATS, ".yaml", ".yml"):
+        with tracing.span("gather.collect_machine"):
+            machine_entries = _collect_machine_hayagriva(dataset_dir, keep)
+        has_machine = bool(machine_entries)
+    else:
+        has_machine = any((d / "machine.hayagriva").exists() for d in uuid_dirs)
 
-    if not bib_texts and not machine_entries:
+    if not bib_files and not has_machine:
         sys.exit(f"No BibTeX content collected from dataset '{dataset}'.")
 
-    combined = "\n".join(bib_texts)
-    fixed = _fix_duplicate_keys(combined)
-
-    suffix = output.suffix.lower()
-    if suffix in (".bib", ".typ"):
-        fixed = _merge_machine_bibtex(combined, machine_entries)
+    from functools import partial
 
-    if suffix == ".bib":
+    stats: Counter = Counter()
+    prepare = partial(_prepare_doc, suffix=suffix, include_keys=include_keys)
+    with tracing.span("gather.write", format=suffix, jobs=jobs):
+        sections = _map_ordered(prepare, uuid_dirs, jobs)
+        if suffix in _BIB_FORMATS:
+            combined = "\n".join(f.read_text(encoding="utf-8") for f in bib_files)
+            _write_bib(output, _merge_machine_bibtex(combined, machine_entries))
+            for _ in _tally(sections, stats):  # summary counts only
+                pass
+        else:
+            with output.open("w", encoding="utf-8") as fh:
+                payloads = _tally(sections, stats)
+                if suffix == ".md":
+                    _write_markdown(fh, payloads, dataset)
+                elif suffix == ".json":
+                    _write_json(fh, payloads)
+                elif suffix == ".jsonl":
+                    _write_jsonl(fh, payloads)
+                else:
+                    _write_hayagriva(fh, payloads, machine_entries)
+
+    _print_gather_stats(dataset, output, errors, stats)
+
+
+def _write_bib(output: Path, fixed: str) -> None:
+    """Write deduplicated BibTeX to a .bib, or to a .typ's .bib and compile it."""
+    if output.suffix.lower() == ".bib":
         output.write_text(fixed, encoding="utf-8")
-    elif suffix == ".typ":
-        bib_file = output.with_suffix(".bib")
-        bib_file.write_text(fixed, encoding="utf-8")
-        typ_content = _TYPST_BIBLIO_TEMPLATE.replace("BIBNAME", bib_file.name)
-        output.write_text(typ_content, encoding="utf-8")
-        ok = _compile_with_fix(output, bib_file)
-        if not ok:
-            logger.error(
-                "Typst compile finished with unresolved errors. "
-                "Check %s for commented-out entries.",
-                bib_file,
-            )
-    elif suffix == ".md":
-        md = _dataset_to_markdown(
-            dataset_dir, dataset, include_keys=include_keys, keep=keep
-        )
-        output.write_text(md, encoding="utf-8")
-    elif suffix == ".json":
-        import json
-
-        data = _dataset_to_json(dataset_dir, keep=keep)
-        output.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
+        return
+    bib_file = output.with_suffix(".bib")
+    bib_file.write_text(_drop_invalid_entries(fixed), encoding="utf-8")
+    typ_content = _TYPST_BIBLIO_TEMPLATE.replace("BIBNAME", bib_file.name)
+    output.write_text(typ_content, encoding="utf-8")
+    ok = _compile_with_fix(output, bib_file)
+    if not ok:
+        logger.error(
+            "Typst compile finished with unresolved errors. "
+            "Check %s for commented-out entries.",
+            bib_file,
         )
-    elif suffix in (".yaml", ".yml"):
-        manual = _bib_to_hayagriva(fixed)
-        output.write_text(
-            manual + _machine_hayagriva_block(manual, machine_entries),
-            encoding="utf-8",
-        )
-    else:
-        sys.exit(
-            f"Unsupported output format '{suffix}'. "
-            "Use .bib, .typ, .md, .json, .yaml, or .yml."
-        )
-
-    _print_gather_stats(dataset_dir, dataset, output, errors, keep)
 
 
-def _collect_bibs_regen(
-    dataset_dir: Path, keep: set[str] | None = None
-) -> tuple[list[str], list[str]]:
-    """Re-run typst query on every label.typ in parallel, then collect bibs."""
-    uuid_dirs = [
+def _doc_dirs(dataset_dir: Path, keep: set[str] | None = None) -> list[Path]:
+    """UUID dirs of the dataset in sorted order, restricted to *keep*."""
+    return [
         d
         for d in sorted(dataset_dir.iterdir())
         if d.is_dir() and (keep is None or d.name in keep)
     ]
+
+
+def _map_ordered(fn, items: list, jobs: int = 1) -> Iterator:
+    """Yield ``fn(item)`` for each of *items*, in order.
+
+    With more than one job the calls run in worker processes; at most
+    ``2 * jobs`` results are held ahead of the consumer, so memory stays
+    bounded however many items there are.
+    """
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(items) or 1))
+    if jobs == 1:
+        yield from map(fn, items)
+        return
+
+    import multiprocessing as mp
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(jobs, mp_context=mp.get_context("spawn")) as pool:
+        pending: deque = deque()
+        for item in items:
+            pending.append(pool.submit(fn, item))
+            if len(pending) >= 2 * jobs:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _collect_bibs_regen(
+    dataset_dir: Path, keep: set[str] | None = None
+) -> tuple[list[Path], list[str]]:
+    """Re-run typst query on every stale label.typ in parallel.
+
+    Returns the label.bib files to gather, in sorted order, and any errors.
+    """
+    uuid_dirs = _doc_dirs(dataset_dir, keep)
     typ_files = [d / "label.typ" for d in uuid_dirs if (d / "label.typ").exists()]
 
     if not typ_files:
@@ -215,14 +280,14 @@ def _collect_bibs_regen(
             except Exception as exc:
                 results[typ_file] = (False, str(exc))
 
-    bib_texts: list[str] = []
+    bib_files: list[Path] = []
     errors: list[str] = []
     for typ_file in typ_files:  # iterate in original sorted order
         success, msg = results[typ_file]
         if success:
             bib_file = typ_file.parent / "label.bib"
             if bib_file.exists():
-                bib_texts.append(bib_file.read_text(encoding="utf-8"))
+                bib_files.append(bib_file)
             else:
                 errors.append(
                     f"label.bib missing after successful generation in {typ_file.parent}"
@@ -230,28 +295,22 @@ def _collect_bibs_regen(
         else:
             errors.append(msg)
 
-    return bib_texts, errors
+    return bib_files, errors
 
 
 def _collect_bibs_existing(
     dataset_dir: Path, keep: set[str] | None = None
-) -> tuple[list[str], list[str]]:
+) -> tuple[list[Path], list[str]]:
     """Collect existing label.bib files without re-running typst."""
-    bib_texts: list[str] = []
-    errors: list[str] = []
-
-    for uuid_dir in sorted(dataset_dir.iterdir()):
-        if not uuid_dir.is_dir():
-            continue
-        if keep is not None and uuid_dir.name not in keep:
-            continue
+    bib_files: list[Path] = []
+    for uuid_dir in _doc_dirs(dataset_dir, keep):
         bib_file = uuid_dir / "label.bib"
         if not bib_file.exists():
             logger.debug(f"Skipping {uuid_dir.name}: no label.bib")
             continue
-        bib_texts.append(bib_file.read_text(encoding="utf-8"))
+        bib_files.append(bib_file)
 
-    return bib_texts, errors
+    return bib_files, []
 
 
 def _load_machine_entries(uuid_dir: Path) -> dict[str, dict]:
@@ -288,39 +347,19 @@ def _collect_machine_hayagriva(
     return merged
 
 
-def _machine_hayagriva_block(manual_yaml: str, entries: dict[str, dict]) -> str:
+def _machine_hayagriva_block(manual_keys: set[str], entries: dict[str, dict]) -> str:
     """Serialise machine entries not already present in the manual Hayagriva.
 
     Skips keys already emitted by the manual ``label.bib`` pipeline (notably a
     shared ``<prefix>:main``) so the merged YAML has no duplicate keys, while
     preserving machine-only fields like ``serial-number`` and ``page``.
     """
-    if not entries:
-        return ""
-    try:
-        manual_keys = set(yaml.safe_load(manual_yaml) or {})
-    except Exception:
-        manual_keys = set()
-
-    from evid import __version__ as _evid_version
-
-    gen_date = datetime.date.today().isoformat()
-    chunks: list[str] = []
-    for key, item in entries.items():
-        if key in manual_keys:
-            continue
-        wm = f"# generated-by: evid v{_evid_version} · {gen_date}"
-        url = item.get("url") if isinstance(item, dict) else None
-        if url:
-            wm += f" · {url}"
-        chunks.append(
-            wm
-            + "\n"
-            + yaml.safe_dump(
-                {key: item}, allow_unicode=True, sort_keys=False, width=1000
-            )
-        )
-    return "".join(chunks)
+    stamp = _hayagriva_stamp()
+    return "".join(
+        _hayagriva_chunk(key, item, stamp)
+        for key, item in entries.items()
+        if key not in manual_keys
+    )
 
 
 def _machine_to_bibtex(entries: dict[str, dict]) -> str:
@@ -386,34 +425,108 @@ def _fix_duplicate_keys(bib_text: str) -> str:
     return writer.write(db)
 
 
-def _compile_with_fix(typ_file: Path, bib_file: Path, max_retries: int = 30) -> bool:
-    """Try typst compile; on each failure comment out the offending BibTeX entry."""
-    for attempt in range(max_retries):
-        result = subprocess.run(
-            ["typst", "compile", str(typ_file)],
+def _drop_invalid_entries(bib_text: str) -> str:
+    """Comment out every structurally broken entry, found in a single pass."""
+    from evid.core.bib_validate import comment_out, find_invalid
+
+    with tracing.span("gather.validate_bib"):
+        bad = find_invalid(bib_text)
+    for entry in bad:
+        logger.warning(
+            f"Commented out BibTeX entry '{entry.key or entry.type}': {entry.problem}"
+        )
+    return comment_out(bib_text, [(e.start, e.end) for e in bad]) if bad else bib_text
+
+
+def _typst_compile(typ_file: Path, output: Path | None = None):
+    tracing.count("subprocesses")
+    with tracing.span("gather.typst_compile"):
+        return subprocess.run(
+            ["typst", "compile", str(typ_file), *([str(output)] if output else [])],
             capture_output=True,
             text=True,
             cwd=typ_file.parent,
         )
+
+
+def _bisect_bad_entries(typ_file: Path, bib_text: str) -> list[tuple[int, int]]:
+    """Spans of the entries that make the bibliography fail to compile.
+
+    Compiles halves of the entry list in a scratch directory and recurses into
+    the failing ones: about ``2 * k * log2(n)`` compiles for *k* bad entries out
+    of *n*. ``@string`` and ``@preamble`` blocks go into every probe, so the
+    entries using them compile. Returns ``[]`` if no subset of entries can be
+    blamed (the failure is elsewhere, or only arises from a combination of
+    entries).
+    """
+    import tempfile
+
+    from evid.core.bib_validate import MACRO_TYPES, block_type, split_entries
+
+    macros, spans = [], []
+    for span in split_entries(bib_text):
+        (macros if block_type(bib_text, span[0]) in MACRO_TYPES else spans).append(span)
+    with tempfile.TemporaryDirectory(dir=typ_file.parent) as tmp:
+        probe_typ = Path(tmp) / "probe.typ"
+        probe_bib = Path(tmp) / "probe.bib"
+        probe_typ.write_text(
+            _TYPST_BIBLIO_TEMPLATE.replace("BIBNAME", probe_bib.name), encoding="utf-8"
+        )
+
+        def compiles(subset: list[tuple[int, int]]) -> bool:
+            probe_bib.write_text(
+                "".join(bib_text[a:b] for a, b in sorted(macros + subset)),
+                encoding="utf-8",
+            )
+            result = _typst_compile(probe_typ, Path(tmp) / "probe.pdf")
+            return result.returncode == 0
+
+        def bad(subset: list[tuple[int, int]]) -> list[tuple[int, int]]:
+            if compiles(subset):
+                return []
+            if len(subset) == 1:
+                return subset
+            mid = len(subset) // 2
+            return bad(subset[:mid]) + bad(subset[mid:])
+
+        with tracing.span("gather.bisect_bib", entries=len(spans)):
+            found = bad(spans) if spans else []
+    return [] if len(found) == len(spans) else found
+
+
+def _compile_with_fix(typ_file: Path, bib_file: Path, max_retries: int = 30) -> bool:
+    """Compile *typ_file*; on failure comment out the BibTeX entries to blame.
+
+    Structurally broken entries are dropped before this by
+    :func:`_drop_invalid_entries`, so one compile usually suffices. When Typst
+    still fails, the offending key is read from stderr if it names one; otherwise the
+    bad entries are found by bisection.
+    """
+    from evid.core.bib_validate import comment_out
+
+    for attempt in range(max_retries):
+        result = _typst_compile(typ_file)
         if result.returncode == 0:
             return True
         stderr = result.stderr
         logger.debug(f"Compile attempt {attempt + 1} failed:\n{stderr}")
         key = _extract_offending_key(stderr)
-        if not key:
-            logger.error(
-                f"Typst compile failed and no offending key could be identified.\n{stderr}"
+        if key and _comment_out_entry(bib_file, key):
+            logger.warning(
+                f"Commented out problematic BibTeX entry '{key}'; retrying compile."
             )
-            return False
-        found = _comment_out_entry(bib_file, key)
-        if not found:
+            continue
+        bib_text = bib_file.read_text(encoding="utf-8")
+        spans = _bisect_bad_entries(typ_file, bib_text)
+        if not spans:
             logger.error(
-                f"Could not locate entry '{key}' in {bib_file} to comment out.\n{stderr}"
+                f"Typst compile failed and no offending entry could be identified.\n{stderr}"
             )
             return False
-        logger.warning(
-            f"Commented out problematic BibTeX entry '{key}'; retrying compile."
-        )
+        for start, end in spans:
+            header = bib_text[start:end].split("\n", 1)[0]
+            logger.warning(f"Commented out BibTeX entry that breaks compile: {header}")
+        bib_file.write_text(comment_out(bib_text, spans), encoding="utf-8")
     logger.error(f"Compile still failing after {max_retries} retries.")
     return False
 
@@ -469,278 +582,302 @@ def _comment_out_entry(bib_file: Path, key: str) -> bool:
     return True
 
 
+@dataclass
+class _DocSection:
+    """One document's share of a gather, prepared (possibly) in a worker.
+
+    The counts feed the summary table; *payload* is what the format's writer
+    needs, or None when the document contributes nothing to it.
+    """
+
+    has_info: bool = False
+    has_bib: bool = False
+    n_snippets: int = 0
+    n_machine: int = 0
+    payload: object = None
+
+
+def _prepare_doc(
+    uuid_dir: Path, suffix: str, include_keys: bool = False
+) -> _DocSection:
+    """Read one document's info.yml, label.bib and machine quotes for *suffix*.
+
+    Payloads: ``.md`` the document's Markdown section; ``.json`` / ``.jsonl`` a
+    ``(uuid, record)`` pair; ``.yaml`` / ``.yml`` the ``(key, item)`` Hayagriva
+    entries of its label.bib.  Other formats get the counts only.
+    """
+    section = _DocSection(
+        has_info=(uuid_dir / "info.yml").exists(),
+        has_bib=(uuid_dir / "label.bib").exists(),
+    )
+    entries = _read_bib_entries(uuid_dir) if section.has_bib else []
+    machine = _load_machine_entries(uuid_dir)
+    snippets = [
+        (e["ID"], e.get("pages", ""), e.get("title", ""))
+        for e in entries
+        if _label_of(e["ID"]) != "main"
+    ]
+    section.n_snippets = len(snippets)
+    for key, item in machine.items():
+        if key.endswith(":main"):
+            continue
+        section.n_machine += 1
+        if isinstance(item, dict):
+            snippets.append(
+                (key, str(item.get("page-range", "")), str(item.get("title", "")))
+            )
+
+    if suffix in (".yaml", ".yml"):
+        section.payload = [(e["ID"], _hayagriva_item(e)) for e in entries]
+    elif suffix in (".md", ".json", ".jsonl") and section.has_info:
+        info = _read_info(uuid_dir)
+        if info is None:
+            return section
+        if suffix == ".md":
+            section.payload = (
+                _markdown_section(info, snippets, include_keys),
+                len(snippets),
+            )
+        else:
+            section.payload = (
+                info.uuid,
+                {
+                    "url": info.url,
+                    "title": info.title,
+                    "author": info.authors,
+                    "date": info.dates,
+                    "tags": info.tags,
+                    "snippets": {
+                        key: {"pageno": page, "text": text}
+                        for key, page, text in snippets
+                    },
+                },
+            )
+    return section
+
+
+def _tally(sections: Iterable[_DocSection], stats: Counter) -> Iterator:
+    """Add each section's counts to *stats* and yield its payload, if any."""
+    for section in sections:
+        stats["docs"] += section.has_info
+        stats["with_bib"] += section.has_bib
+        stats["snippets"] += section.n_snippets
+        stats["machine"] += section.n_machine
+        if section.payload is not None:
+            yield section.payload
+
+
+def _label_of(key: str) -> str:
+    return key.split(":", 1)[1] if ":" in key else key
+
+
+def _read_info(uuid_dir: Path) -> InfoModel | None:
+    try:
+        with (uuid_dir / "info.yml").open(encoding="utf-8") as fh:
+            raw = yaml.safe_load(fh)
+        return InfoModel(**raw)
+    except Exception as exc:
+        logger.warning("Skipping %s: %s", uuid_dir, exc)
+        return None
+
+
+def _read_bib_entries(uuid_dir: Path) -> list[dict]:
+    try:
+        return btp.loads((uuid_dir / "label.bib").read_text(encoding="utf-8")).entries
+    except Exception as exc:
+        logger.warning("Could not parse label.bib in %s: %s", uuid_dir.name, exc)
+        return []
+
+
 def _print_gather_stats(
-    dataset_dir: Path,
-    dataset: str,
-    output: Path,
-    errors: list[str],
-    keep: set[str] | None = None,
+    dataset: str, output: Path, errors: list[str], stats: Counter
 ) -> None:
     """Print a Rich summary table after gather completes."""
-    uuid_dirs = [
-        d
-        for d in sorted(dataset_dir.iterdir())
-        if d.is_dir() and (keep is None or d.name in keep)
-    ]
-    n_docs = sum(1 for d in uuid_dirs if (d / "info.yml").exists())
-    n_with_bib = sum(1 for d in uuid_dirs if (d / "label.bib").exists())
-    n_snippets = 0
-    n_machine = 0
-    for d in uuid_dirs:
-        bib_file = d / "label.bib"
-        if bib_file.exists():
-            try:
-                db = btp.loads(bib_file.read_text(encoding="utf-8"))
-                n_snippets += sum(
-                    1
-                    for e in db.entries
-                    if (e["ID"].split(":", 1)[1] if ":" in e["ID"] else e["ID"])
-                    != "main"
-                )
-            except Exception:
-                pass
-        n_machine += sum(1 for k in _load_machine_entries(d) if not k.endswith(":main"))
-
     console = Console()
     table = Table(title=f"gather: {dataset}", show_header=True)
     table.add_column("", style="dim")
     table.add_column("")
     table.add_row("Output", str(output))
-    table.add_row("Documents", str(n_docs))
-    table.add_row("With snippets", str(n_with_bib))
-    table.add_row("Snippets", str(n_snippets))
-    if n_machine:
-        table.add_row("Machine quotes", str(n_machine))
+    table.add_row("Documents", str(stats["docs"]))
+    table.add_row("With snippets", str(stats["with_bib"]))
+    table.add_row("Snippets", str(stats["snippets"]))
+    if stats["machine"]:
+        table.add_row("Machine quotes", str(stats["machine"]))
     if errors:
         table.add_row("Warnings", str(len(errors)), end_section=True)
     console.print(table)
 
 
-def _dataset_to_markdown(
-    dataset_dir: Path,
-    dataset: str,
-    include_keys: bool = False,
-    keep: set[str] | None = None,
+def _markdown_section(
+    info: InfoModel, snippets: list[tuple[str, str, str]], include_keys: bool = False
 ) -> str:
-    """Build a Markdown report by reading info.yml and label.bib from each UUID dir.
+    """One document's ``##`` section of the Markdown report.
 
-    Every UUID dir with a valid info.yml appears as a ``##`` section regardless
-    of whether a label.bib exists.  Snippet bullets are only emitted when a
-    label.bib is present.
+    Every document with a valid info.yml gets a section, with a bullet per
+    label.bib or machine snippet.
     """
-    uuid_dirs = sorted(d for d in dataset_dir.iterdir() if d.is_dir())
-
-    docs: list[tuple[InfoModel, list[tuple[str, str, str]]]] = []
-    for uuid_dir in uuid_dirs:
-        if keep is not None and uuid_dir.name not in keep:
-            continue
-        info_file = uuid_dir / "info.yml"
-        if not info_file.exists():
-            logger.debug("Skipping %s: no info.yml", uuid_dir.name)
-            continue
-        try:
-            with info_file.open(encoding="utf-8") as fh:
-                raw = yaml.safe_load(fh)
-            info = InfoModel(**raw)
-        except Exception as exc:
-            logger.warning("Skipping %s: %s", uuid_dir, exc)
-            continue
-
-        snippets: list[tuple[str, str, str]] = []  # (label, page, text)
-        bib_file = uuid_dir / "label.bib"
-        if bib_file.exists():
-            try:
-                db = btp.loads(bib_file.read_text(encoding="utf-8"))
-                for entry in db.entries:
-                    key = entry["ID"]
-                    label = key.split(":", 1)[1] if ":" in key else key
-                    if label == "main":
-                        continue
-                    snippets.append(
-                        (label, entry.get("pages", ""), entry.get("title", ""))
-                    )
-            except Exception as exc:
-                logger.warning(
-                    "Could not parse label.bib in %s: %s", uuid_dir.name, exc
-                )
-
-        for key, item in _load_machine_entries(uuid_dir).items():
-            if key.endswith(":main") or not isinstance(item, dict):
-                continue
-            label = key.split(":", 1)[1] if ":" in key else key
-            snippets.append(
-                (label, str(item.get("page-range", "")), str(item.get("title", "")))
-            )
+    lines = [f"## {info.title}\n"]
+    if info.authors:
+        lines.append(f"- **Author**: {info.authors}")
+    if info.dates:
+        lines.append(f"- **Date**: {info.dates}")
+    if info.url:
+        lines.append(f"- **URL**: {info.url}")
+    lines.append("")
+
+    for key, page, text in snippets:
+        if include_keys:
+            lines.append(f"  ### {_label_of(key)}")
+        page_prefix = f"p. {page}: " if page else ""
+        indented = text.replace("\n", "\n    ")
+        lines.append(f"  - {page_prefix}{indented}")
+        lines.append("")
+    return "\n".join(lines)
 
-        docs.append((info, snippets))
 
-    n_snippets = sum(len(s) for _, s in docs)
-    today = datetime.date.today().isoformat()
+def _write_markdown(fh, sections: Iterable[tuple[str, int]], dataset: str) -> None:
+    """Write the Markdown report, one document section at a time.
 
-    lines = [
-        f"# Label extraction: {dataset}\n",
-        f"- **Date**: {today}",
-        f"- **Documents**: {len(docs)}",
-        f"- **Snippets**: {n_snippets}",
-        "",
-    ]
+    The header holds the totals, so sections are spooled (to a temporary file
+    once they outgrow memory) and copied in after it.
+    """
+    import shutil
+    import tempfile
+
+    n_docs = n_snippets = 0
+    with tempfile.SpooledTemporaryFile(
+        _MD_SPOOL_CHARS, mode="w+", encoding="utf-8"
+    ) as body:
+        for section, count in sections:
+            body.write("\n" + section)
+            n_docs += 1
+            n_snippets += count
+        header = [
+            f"# Label extraction: {dataset}\n",
+            f"- **Date**: {datetime.date.today().isoformat()}",
+            f"- **Documents**: {n_docs}",
+            f"- **Snippets**: {n_snippets}",
+            "",
+        ]
+        fh.write("\n".join(header))
+        body.seek(0)
+        shutil.copyfileobj(body, fh)
+
+
+def _write_json(fh, records: Iterable[tuple[str, dict]]) -> None:
+    """Write ``{uuid: record}`` as indented JSON, one record at a time.
+
+    The output is what ``json.dumps(..., indent=2)`` gives for the whole
+    mapping.  A uuid seen before is skipped with a warning.
+    """
+    import json
 
-    for info, snippets in docs:
-        lines.append(f"## {info.title}\n")
-        if info.authors:
-            lines.append(f"- **Author**: {info.authors}")
-        if info.dates:
-            lines.append(f"- **Date**: {info.dates}")
-        if info.url:
-            lines.append(f"- **URL**: {info.url}")
-        lines.append("")
+    seen: set[str] = set()
+    for uuid, record in records:
+        if uuid in seen:
+            logger.warning(f"Skipping duplicate uuid {uuid} in JSON export")
+            continue
+        body = json.dumps(record, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+        sep = ",\n  " if seen else "{\n  "
+        fh.write(f"{sep}{json.dumps(uuid, ensure_ascii=False)}: {body}")
+        seen.add(uuid)
+    fh.write("\n}" if seen else "{}")
 
-        for label, page, text in snippets:
-            if include_keys:
-                lines.append(f"  ### {label}")
-            page_prefix = f"p. {page}: " if page else ""
-            indented = text.replace("\n", "\n    ")
-            lines.append(f"  - {page_prefix}{indented}")
-            lines.append("")
 
-    return "\n".join(lines)
+def _write_jsonl(fh, records: Iterable[tuple[str, dict]]) -> None:
+    """Write one JSON object per line: the JSON export's record plus ``uuid``."""
+    import json
 
+    for uuid, record in records:
+        fh.write(json.dumps({"uuid": uuid, **record}, ensure_ascii=False) + "\n")
 
-def _dataset_to_json(dataset_dir: Path, keep: set[str] | None = None) -> dict:
-    """Build a JSON-serialisable dict keyed by UUID.
 
-    Structure::
+def _write_hayagriva(
+    fh, docs: Iterable[list[tuple[str, dict]]], machine_entries: dict[str, dict]
+) -> None:
+    """Write the Hayagriva bibliography one document at a time.
 
-        {
-            "<uuid>": {
-                "url": "...",
-                "title": "...",
-                "author": "...",
-                "snippets": {
-                    "<bib_key>": {"pageno": "5", "text": "..."},
-                    ...
-                }
-            },
-            ...
-        }
+    Repeated keys get ``_2``, ``_3``… in gather order, as in the BibTeX export;
+    each document's entries are sorted by key.  Machine quotes not already
+    present follow the manual entries.
     """
-    result: dict = {}
-    for uuid_dir in sorted(d for d in dataset_dir.iterdir() if d.is_dir()):
-        if keep is not None and uuid_dir.name not in keep:
-            continue
-        info_file = uuid_dir / "info.yml"
-        if not info_file.exists():
-            logger.debug("Skipping %s: no info.yml", uuid_dir.name)
-            continue
-        try:
-            with info_file.open(encoding="utf-8") as fh:
-                raw = yaml.safe_load(fh)
-            info = InfoModel(**raw)
-        except Exception as exc:
-            logger.warning("Skipping %s: %s", uuid_dir, exc)
-            continue
+    stamp = _hayagriva_stamp()
+    seen: dict[str, int] = {}
+    written: set[str] = set()
+    for entries in docs:
+        renamed = []
+        for key, item in entries:
+            if key in seen:
+                seen[key] += 1
+                renamed.append((f"{key}_{seen[key]}", item))
+            else:
+                seen[key] = 1
+                renamed.append((key, item))
+        for key, item in sorted(renamed, key=lambda e: e[0]):
+            written.add(key)
+            fh.write(_hayagriva_chunk(key, item, stamp))
+    fh.write(_machine_hayagriva_block(written, machine_entries))
 
-        snippets: dict = {}
-        bib_file = uuid_dir / "label.bib"
-        if bib_file.exists():
-            try:
-                db = btp.loads(bib_file.read_text(encoding="utf-8"))
-                for entry in db.entries:
-                    key = entry["ID"]
-                    label = key.split(":", 1)[1] if ":" in key else key
-                    if label == "main":
-                        continue
-                    snippets[key] = {
-                        "pageno": entry.get("pages", ""),
-                        "text": entry.get("title", ""),
-                    }
-            except Exception as exc:
-                logger.warning(
-                    "Could not parse label.bib in %s: %s", uuid_dir.name, exc
-                )
 
-        for key, item in _load_machine_entries(uuid_dir).items():
-            if key.endswith(":main") or not isinstance(item, dict):
-                continue
-            snippets[key] = {
-                "pageno": str(item.get("page-range", "")),
-                "text": str(item.get("title", "")),
-            }
-
-        result[info.uuid] = {
-            "url": info.url,
-            "title": info.title,
-            "author": info.authors,
-            "date": info.dates,
-            "tags": info.tags,
-            "snippets": snippets,
-        }
-    return result
-
-
-def _bib_to_hayagriva(bib_text: str) -> str:
-    """Convert combined BibTeX into a Hayagriva YAML bibliography.
+def _hayagriva_item(entry: dict) -> dict:
+    """Convert one BibTeX ``@article`` entry into a Hayagriva item.
 
     Hayagriva is Typst's native bibliography format: a mapping keyed by
-    citation key.  Each ``@article`` entry becomes one Hayagriva entry with
-    kebab-case fields.  The snippet ``journal`` field (the containing document
-    title) is emitted as a ``parent`` relation.
+    citation key, with kebab-case fields.  The snippet ``journal`` field (the
+    containing document title) is emitted as a ``parent`` relation.
     """
-    db = btp.loads(bib_text)
 
     def _flat(value: str) -> str:
         """Collapse newlines and whitespace runs so scalars stay single-line."""
         return " ".join(value.split())
 
-    out: dict[str, dict] = {}
-    for entry in db.entries:
-        key = entry["ID"]
-        item: dict = {"type": "article"}
-
-        title = _flat(entry.get("title", ""))
-        if title:
-            item["title"] = title
-        author = _flat(entry.get("author", ""))
-        if author:
-            item["author"] = author
-        date = entry.get("date", "")
-        if date:
-            item["date"] = date
-        url = entry.get("url", "")
-        if url:
-            item["url"] = url
-        pages = entry.get("pages", "")
-        if pages:
-            item["page-range"] = pages
-        journal = _flat(entry.get("journal", ""))
-        if journal:
-            item["parent"] = {"type": "article", "title": journal}
-        note = _flat(entry.get("note", ""))
-        if note:
-            item["note"] = note
-
-        out[key] = item
-
-    # Stamp each entry with a provenance watermark comment so a reader can see
-    # which tool produced it and from where. The comment is inert YAML (ignored
-    # on load); an entry with no watermark was not emitted by a tool.
+    item: dict = {"type": "article"}
+    title = _flat(entry.get("title", ""))
+    if title:
+        item["title"] = title
+    author = _flat(entry.get("author", ""))
+    if author:
+        item["author"] = author
+    date = entry.get("date", "")
+    if date:
+        item["date"] = date
+    url = entry.get("url", "")
+    if url:
+        item["url"] = url
+    pages = entry.get("pages", "")
+    if pages:
+        item["page-range"] = pages
+    journal = _flat(entry.get("journal", ""))
+    if journal:
+        item["parent"] = {"type": "article", "title": journal}
+    note = _flat(entry.get("note", ""))
+    if note:
+        item["note"] = note
+    return item
+
+
+def _hayagriva_stamp() -> str:
     from evid import __version__ as _evid_version
 
-    gen_date = datetime.date.today().isoformat()
-    chunks: list[str] = []
-    for key, item in out.items():
-        wm = f"# generated-by: evid v{_evid_version} · {gen_date}"
-        url = item.get("url")
-        if url:
-            wm += f" · {url}"
-        chunks.append(
-            wm
-            + "\n"
-            + yaml.safe_dump(
-                {key: item}, allow_unicode=True, sort_keys=False, width=1000
-            )
-        )
-    return "".join(chunks)
+    return (
+        f"# generated-by: evid v{_evid_version} · {datetime.date.today().isoformat()}"
+    )
+
+
+def _hayagriva_chunk(key: str, item: dict, stamp: str) -> str:
+    """Serialise one entry, preceded by its provenance watermark.
+
+    The watermark comment shows which tool produced the entry and from where.
+    It is inert YAML (ignored on load); an entry with no watermark was not
+    emitted by a tool.
+    """
+    url = item.get("url") if isinstance(item, dict) else None
+    wm = f"{stamp} · {url}" if url else stamp
+    return (
+        wm
+        + "\n"
+        + yaml.safe_dump({key: item}, allow_unicode=True, sort_keys=False, width=1000)
+    )
 
 
 def _bib_to_markdown(
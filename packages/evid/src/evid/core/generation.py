@@ -0,0 +1,72 @@
+"""Per-set generation counter for cache invalidation.
+
+Long-lived readers (the MCP server) cache query results per set. Every evid
+write that changes what a query can return — indexing, removing a document from
+the vector store, new or re-tagged documents, metadata edits — bumps a counter
+in ``<set>/.generation``; readers fold :func:`set_generation` into their cache
+keys so a write from any process (GUI, CLI, indexer) invalidates them.
+
+Adding or deleting a document directory also changes ``docs/``'s mtime, which
+is part of the generation too, so deletions done by hand are picked up without
+an explicit bump.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+GENERATION_FILE = ".generation"
+
+
+def _read_counter(path: Path) -> int:
+    try:
+        return int(path.read_text(encoding="utf-8").strip() or 0)
+    except (OSError, ValueError):
+        return 0
+
+
+def bump_generation(set_dir: Path) -> int:
+    """Increment *set_dir*'s generation counter and return the new value.
+
+    Never raises: a failed bump is logged, not allowed to break the write that
+    triggered it. Concurrent bumps may collapse into one increment, but the
+    file's mtime still moves, which :func:`set_generation` also reports.
+    """
+    path = set_dir / GENERATION_FILE
+    value = _read_counter(path) + 1
+    tmp = path.with_name(f"{GENERATION_FILE}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(str(value), encoding="utf-8")
+        tmp.replace(path)
+    except OSError:
+        logger.debug("Could not bump generation in %s", set_dir, exc_info=True)
+    return value
+
+
+def bump_doc_generation(doc_dir: Path) -> None:
+    """Bump the generation of the set that contains *doc_dir*, if any."""
+    docs = doc_dir.parent
+    if docs.name == "docs" and (docs.parent / "set.yml").exists():
+        bump_generation(docs.parent)
+
+
+def set_generation(set_dir: Path) -> tuple[int, int, int]:
+    """Current generation of *set_dir* as a hashable cache-key component.
+
+    ``(counter, counter mtime_ns, docs/ mtime_ns)`` — two ``stat`` calls and a
+    tiny read, cheap enough to check on every request.
+    """
+    path = set_dir / GENERATION_FILE
+    try:
+        counter_mtime = path.stat().st_mtime_ns
+    except OSError:
+        counter_mtime = 0
+    try:
+        docs_mtime = (set_dir / "docs").stat().st_mtime_ns
+    except OSError:
+        docs_mtime = 0
+    return _read_counter(path), counter_mtime, docs_mtime
@@ -38,13 +38,13 @@ def create_label(
 
         # Open the editor
         logger.info(
-            f"Opening editor '{EvidConfig.load().editor}' with file: {label_file}"
+            f"Opening editor '{EvidConfig.cached().editor}' with file: {label_file}"
         )
         try:
-            subprocess.run([EvidConfig.load().editor, str(label_file)], check=True)
+            subprocess.run([EvidConfig.cached().editor, str(label_file)], check=True)
         except FileNotFoundError:
             logger.error(
-                f"The configured editor '{EvidConfig.load().editor}' not found. Please ensure it is in your PATH."
+                f"The configured editor '{EvidConfig.cached().editor}' not found. Please ensure it is in your PATH."
             )
             return  # Exit early if editor fails to open
         except subprocess.SubprocessError as e:
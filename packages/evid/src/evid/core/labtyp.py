@@ -0,0 +1,406 @@
+"""In-process extraction of labtyp labels from ``label.typ``.
+
+``typst query label.typ "<lab>"`` compiles the whole document (and resolves
+the labtyp package) just to list its ``#lab`` calls. The files evid writes
+and people edit use a small subset of Typst, which this module reads
+directly::
+
+    #mset(values: (title: "…", date: "…"))   // merged into the label state
+    #lab("key", "text", "note")               // one label, with the state
+
+:func:`parse_labels` returns the same items ``typst query`` writes to
+``label.json``. Comments, escapes and raw text are skipped like Typst does.
+Anything outside the subset that could define or emit labels (``#let``,
+``#include``, code blocks, other imports, non-literal arguments) raises
+:class:`UnsupportedLabtyp`; callers then fall back to ``typst query``.
+
+Re-parsing after an edit is incremental: scanning restarts at the last line
+start before the first changed character and stops once it is back in step
+with the previous parse after the last one, so saving a label in a long
+document costs roughly the size of the edit. :func:`extract_labels` keeps
+the previous parse of recently read files for this.
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+LABTYP_PACKAGE = "@preview/labtyp:"
+
+# Directives that may run code we do not model; hitting one means fallback.
+_UNSUPPORTED = frozenset(
+    {"let", "include", "for", "while", "if", "context", "eval", "show", "return"}
+)
+_MARKUP = re.compile(r"[#/\\`\n]")
+_IDENT = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*")
+_NUMBER = re.compile(r"-?\d+(\.\d+)?(e-?\d+)?")
+_COMMENT_DELIM = re.compile(r"/\*|\*/")
+_STRING_RUN = re.compile(r'[^"\\]+')
+_UNICODE_ESCAPE = re.compile(r"u\{([0-9A-Fa-f]+)\}")
+_BACKTICKS = re.compile(r"`+")
+_STRING_ESCAPES = {"\\": "\\", '"': '"', "n": "\n", "r": "\r", "t": "\t"}
+_CACHE_SIZE = 32
+
+
+class UnsupportedLabtyp(ValueError):  # noqa: N818
+    """The document uses Typst beyond what this parser understands."""
+
+
+@dataclass
+class LabelParse:
+    """Result of parsing one ``label.typ``, reusable for the next re-parse."""
+
+    text: str
+    # (position, "mset", values) or (position, "lab", (key, text, note))
+    events: list[tuple[int, str, object]] = field(default_factory=list)
+    # line starts where the scanner is at top level (not in a call or comment)
+    checkpoints: list[int] = field(default_factory=list)
+    # characters scanned to produce this parse (the whole text when not incremental)
+    scanned: int = 0
+
+    def items(self) -> list[dict]:
+        """The labels as ``typst query`` items, in document order."""
+        state: dict = {}
+        items = []
+        for _pos, kind, payload in self.events:
+            if kind == "mset":
+                state = {**state, **payload}
+            else:
+                key, text, note = payload
+                value = {"key": key, "text": text, "note": note, **state}
+                items.append({"func": "metadata", "value": value, "label": "<lab>"})
+        return items
+
+
+# ── scanner ───────────────────────────────────────────────────────────────────
+
+
+def _line_end(text: str, pos: int) -> int:
+    end = text.find("\n", pos)
+    return len(text) if end < 0 else end
+
+
+def _skip_block_comment(text: str, pos: int) -> int:
+    """*pos* is just past ``/*``; return the position after the closing ``*/``."""
+    depth = 1
+    while depth:
+        m = _COMMENT_DELIM.search(text, pos)
+        if m is None:
+            return len(text)
+        depth += 1 if m.group() == "/*" else -1
+        pos = m.end()
+    return pos
+
+
+def _skip_raw(text: str, pos: int) -> int:
+    """*pos* is at a backtick; return the position after the raw text."""
+    ticks = _BACKTICKS.match(text, pos).group()
+    n = len(ticks)
+    if n == 2:
+        return pos + 2  # empty raw
+    end = text.find(ticks, pos + n)
+    if end < 0:
+        raise UnsupportedLabtyp(f"unterminated raw text at {pos}")
+    return end + n
+
+
+def _string(text: str, pos: int) -> tuple[str, int]:
+    """*pos* is at ``"``; return the string value and the position after it."""
+    out = []
+    i = pos + 1
+    while i < len(text):
+        run = _STRING_RUN.match(text, i)
+        if run:
+            out.append(run.group())
+            i = run.end()
+            continue
+        c = text[i]
+        if c == '"':
+            return "".join(out), i + 1
+        if c == "\\":
+            nxt = text[i + 1 : i + 2]
+            if nxt in _STRING_ESCAPES:
+                out.append(_STRING_ESCAPES[nxt])
+                i += 2
+                continue
+            m = _UNICODE_ESCAPE.match(text, i + 1)
+            if m is None:
+                raise UnsupportedLabtyp(f"unknown string escape at {i}")
+            out.append(chr(int(m.group(1), 16)))
+            i = m.end()
+    raise UnsupportedLabtyp(f"unterminated string at {pos}")
+
+
+def _skip_space(text: str, pos: int) -> int:
+    while pos < len(text):
+        if text[pos].isspace():
+            pos += 1
+        elif text.startswith("//", pos):
+            pos = _line_end(text, pos)
+        elif text.startswith("/*", pos):
+            pos = _skip_block_comment(text, pos + 2)
+        else:
+            break
+    return pos
+
+
+def _value(text: str, pos: int) -> tuple[object, int]:
+    """Parse a literal (string, number, bool, none, array or dictionary)."""
+    pos = _skip_space(text, pos)
+    c = text[pos : pos + 1]
+    if c == '"':
+        return _string(text, pos)
+    if c == "(":
+        args, kwargs, end = _arguments(text, pos)
+        if args and kwargs:
+            raise UnsupportedLabtyp(f"mixed array/dictionary at {pos}")
+        if kwargs or text[pos:end].replace(" ", "") == "(:)":
+            return kwargs, end
+        return args, end
+    m = _NUMBER.match(text, pos)
+    if m:
+        number = m.group()
+        return (float(number) if m.group(1) or m.group(2) else int(number)), m.end()
+    m = _IDENT.match(text, pos)
+    if m and m.group() in {"true", "false", "none"}:
+        return {"true": True, "false": False, "none": None}[m.group()], m.end()
+    raise UnsupportedLabtyp(f"non-literal argument at {pos}")
+
+
+def _arguments(text: str, pos: int) -> tuple[list, dict, int]:
+    """*pos* is at ``(``; parse ``(a, b, name: c)`` of literals."""
+    args: list = []
+    kwargs: dict = {}
+    pos += 1
+    while True:
+        pos = _skip_space(text, pos)
+        if text.startswith(")", pos):
+            return args, kwargs, pos + 1
+        if text.startswith(":", pos):  # the empty dictionary (:)
+            pos += 1
+            continue
+        m = _IDENT.match(text, pos)
+        after = _skip_space(text, m.end()) if m else pos
+        if m and text.startswith(":", after):
+            kwargs[m.group()], pos = _value(text, after + 1)
+        else:
+            value, pos = _value(text, pos)
+            args.append(value)
+        pos = _skip_space(text, pos)
+        if text.startswith(",", pos):
+            pos += 1
+        elif not text.startswith(")", pos):
+            raise UnsupportedLabtyp(f"unexpected {text[pos : pos + 1]!r} at {pos}")
+
+
+def _skip_call(text: str, pos: int) -> int:
+    """*pos* is at ``(`` of some other function; skip its balanced arguments."""
+    depth = 0
+    while pos < len(text):
+        c = text[pos]
+        if c == '"':
+            pos = _string(text, pos)[1]
+            continue
+        if text.startswith("//", pos) or text.startswith("/*", pos):
+            pos = _skip_space(text, pos)
+            continue
+        if c in "([{":
+            depth += 1
+        elif c in ")]}":
+            depth -= 1
+            if not depth:
+                return pos + 1
+        else:
+            m = _IDENT.match(text, pos)
+            if m:
+                if m.group() in {"lab", "mset"} | _UNSUPPORTED:
+                    raise UnsupportedLabtyp(f"{m.group()} inside code at {pos}")
+                pos = m.end()
+                continue
+        pos += 1
+    raise UnsupportedLabtyp("unbalanced parentheses")
+
+
+def _hash(text: str, pos: int, events: list) -> int:
+    """*pos* is just past ``#``; handle the expression and return where it ends."""
+    m = _IDENT.match(text, pos)
+    if m is None:
+        if text.startswith(("{", "("), pos):
+            raise UnsupportedLabtyp(f"code block at {pos - 1}")
+        return pos
+    name, pos = m.group(), m.end()
+    if name in _UNSUPPORTED:
+        raise UnsupportedLabtyp(f"#{name} at {m.start() - 1}")
+    if name == "import":
+        path, end = _value(text, pos)
+        if not (isinstance(path, str) and path.startswith(LABTYP_PACKAGE)):
+            raise UnsupportedLabtyp(f"import of {path!r}")
+        return _line_end(text, end)
+    if name in {"lab", "mset"}:
+        if not text.startswith("(", pos):
+            raise UnsupportedLabtyp(f"#{name} without arguments at {m.start() - 1}")
+        start = m.start() - 1
+        args, kwargs, pos = _arguments(text, pos)
+        if text.startswith("[", pos):
+            raise UnsupportedLabtyp(f"content argument to #{name} at {pos}")
+        if name == "lab":
+            if kwargs or len(args) != 3 or not all(isinstance(a, str) for a in args):
+                raise UnsupportedLabtyp(f"#lab needs three strings at {start}")
+            events.append((start, "lab", tuple(args)))
+        else:
+            values = kwargs.get("values")
+            if args or set(kwargs) != {"values"} or not isinstance(values, dict):
+                raise UnsupportedLabtyp(f"#mset needs values: (..) at {start}")
+            events.append((start, "mset", values))
+        return pos
+    # Some other function or variable: skip arguments and method chains.
+    while True:
+        if text.startswith("(", pos):
+            pos = _skip_call(text, pos)
+        elif text.startswith(".", pos) and (m := _IDENT.match(text, pos + 1)):
+            pos = m.end()
+        else:
+            return pos
+
+
+def _scan(
+    text: str,
+    pos: int,
+    events: list,
+    checkpoints: list[int],
+    resync: tuple[int, set[int]] | None = None,
+) -> int | None:
+    """Scan markup from the top-level position *pos* to the end of *text*.
+
+    With *resync* ``(from_pos, positions)``, stop at the first top-level line
+    start at or after *from_pos* that is in *positions*, and return it.
+    """
+    n = len(text)
+    while True:
+        m = _MARKUP.search(text, pos)
+        if m is None:
+            return None
+        pos = m.start()
+        c = text[pos]
+        if c == "\n":
+            pos += 1
+            checkpoints.append(pos)
+            if resync and pos >= resync[0] and pos in resync[1]:
+                return pos
+        elif c == "\\":
+            pos += 2
+        elif c == "`":
+            pos = _skip_raw(text, pos)
+        elif c == "#":
+            pos = _hash(text, pos + 1, events)
+        elif text.startswith("//", pos):
+            # A URL in markup (https://…) is a link, not a comment.
+            line_start = text.rfind("\n", 0, pos) + 1
+            if re.search(r"https?:$", text[line_start:pos]):
+                pos += 2
+            else:
+                pos = _line_end(text, pos)
+        elif text.startswith("/*", pos):
+            pos = _skip_block_comment(text, pos + 2)
+        else:
+            pos += 1
+        if pos >= n:
+            return None
+
+
+def _common_prefix(a: str, b: str) -> int:
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix(a: str, b: str, limit: int) -> int:
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid :] == b[len(b) - mid :]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def parse_labels(text: str, previous: LabelParse | None = None) -> LabelParse:
+    """Parse *text*; with *previous* (a parse of an earlier version), only the
+    region around the edit is scanned again.
+
+    Raises :class:`UnsupportedLabtyp` for documents outside the subset.
+    """
+    if previous is None or not previous.checkpoints:
+        events: list = []
+        checkpoints: list[int] = []
+        _scan(text, 0, events, checkpoints)
+        return LabelParse(text, events, checkpoints, len(text))
+
+    old = previous.text
+    if old == text:
+        return previous
+    prefix = _common_prefix(old, text)
+    suffix = _common_suffix(old, text, min(len(old), len(text)) - prefix)
+    delta = len(text) - len(old)
+
+    # Restart at the last top-level line start at or before the first change.
+    i = bisect.bisect_right(previous.checkpoints, prefix)
+    start = previous.checkpoints[i - 1] if i else 0
+    events = [e for e in previous.events if e[0] < start]
+    checkpoints = previous.checkpoints[:i]
+    old_checkpoints = previous.checkpoints[i:]
+    resync_at = _scan(
+        text,
+        start,
+        events,
+        checkpoints,
+        resync=(len(text) - suffix, {c + delta for c in old_checkpoints}),
+    )
+    if resync_at is None:
+        return LabelParse(text, events, checkpoints, len(text) - start)
+
+    # Back in step: the rest parses exactly as before, shifted by delta.
+    old_at = resync_at - delta
+    events.extend(
+        (pos + delta, kind, payload)
+        for pos, kind, payload in previous.events
+        if pos >= old_at
+    )
+    checkpoints.extend(c + delta for c in old_checkpoints if c > old_at)
+    return LabelParse(text, events, checkpoints, resync_at - start)
+
+
+# ── file cache ────────────────────────────────────────────────────────────────
+
+_cache: OrderedDict[Path, LabelParse] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def extract_labels(typ_file: Path) -> list[dict]:
+    """The ``typst query <lab>`` items of *typ_file*, parsed in-process.
+
+    The last parse of each recently seen file is kept, so re-extracting after
+    an edit only re-reads the edited region.
+    """
+    path = Path(typ_file).resolve()
+    text = path.read_text(encoding="utf-8")
+    with _cache_lock:
+        previous = _cache.get(path)
+    parse = parse_labels(text, previous)
+    with _cache_lock:
+        _cache[path] = parse
+        _cache.move_to_end(path)
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return parse.items()
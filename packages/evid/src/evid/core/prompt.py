@@ -1,5 +1,6 @@
 """Prompt generation utilities."""
 
+import functools
 import json
 import logging
 from pathlib import Path
@@ -11,8 +12,29 @@ from evid.core.models import InfoModel
 logger = logging.getLogger(__name__)
 
 
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def _doc_chapter(workdir: Path) -> str | None:
-    """Build the markdown chapter for one doc workdir, or None if it has no labels."""
+    """Markdown chapter for one doc workdir, or None if it has no labels.
+
+    Chapters are cached on the ``label.json`` / ``info.yml`` stats, so clicking
+    back and forth between documents does not re-parse them.
+    """
+    return _build_chapter(
+        workdir,
+        _stat_key(workdir / "label.json"),
+        _stat_key(workdir / "info.yml"),
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _build_chapter(workdir: Path, _json_stat, _info_stat) -> str | None:
     json_file = workdir / "label.json"
     info_file = workdir / "info.yml"
 
@@ -16,18 +16,25 @@ directory — the only Hayagriva-format, citable output.
 Document metadata (title/author/date/url) comes from the doc's ``info.yml``; the
 caller never passes it. ``evid set gather`` merges ``machine.hayagriva`` into its
 exports.
+
+:func:`extract_quotes_batch` quotes many documents in one call (``evid set
+quote``): documents are independent — each owns its ``machine.hayagriva`` — so
+they run in a process pool, and each file is still written exactly once.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import multiprocessing as mp
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import date as _date
 from pathlib import Path
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, RootModel
 
 from evid.core.bibtex_utils import (
     load_authors,
@@ -36,7 +43,7 @@ from evid.core.bibtex_utils import (
     load_url,
     load_uuid_prefix,
 )
-from evid.core.quote_match import fuzzy_locate
+from evid.core.quote_match import QuoteIndex, fuzzy_locate
 from evid.core.text_cleaning import _dehyphenate
 
 logger = logging.getLogger(__name__)
@@ -63,21 +70,36 @@ class QuotesFile(BaseModel):
     quotes: list[QuoteCandidate] = Field(default_factory=list)
 
 
-def load_quotes_json(path: Path) -> QuotesFile:
-    """Load and validate a ``quotes.json`` candidate file.
+class BatchQuotesFile(RootModel[dict[str, list[QuoteCandidate]]]):
+    """Schema of a batch candidate file: ``{"<uuid>": [{"candidate": ...}, ...]}``."""
 
-    Strictly JSON: a YAML / Hayagriva file fails to parse here, which is the
-    point — the non-citable boundary between paraphrased input and verbatim
-    output is structural, not just by convention.
-    """
+
+def _read_json(path: Path):
     try:
-        raw = json.loads(path.read_text(encoding="utf-8"))
+        return json.loads(path.read_text(encoding="utf-8"))
     except json.JSONDecodeError as exc:
         raise ValueError(
             f"{path} is not valid JSON. The candidate file must be JSON "
             "(not YAML/Hayagriva) so it can never be cited as a bibliography."
         ) from exc
-    return QuotesFile(**raw)
+
+
+def load_quotes_json(path: Path) -> QuotesFile:
+    """Load and validate a ``quotes.json`` candidate file.
+
+    Strictly JSON: a YAML / Hayagriva file fails to parse here, which is the
+    point — the non-citable boundary between paraphrased input and verbatim
+    output is structural, not just by convention.
+    """
+    return QuotesFile(**_read_json(path))
+
+
+def load_batch_quotes_json(path: Path) -> dict[str, list[QuoteCandidate]]:
+    """Load a batch candidate file mapping document UUIDs to candidates.
+
+    Same JSON-only rule as :func:`load_quotes_json`.
+    """
+    return BatchQuotesFile(_read_json(path)).root
 
 
 @dataclass
@@ -112,6 +134,24 @@ def candidates_from_search(results, uuid: str, n: int) -> list[QuoteCandidate]:
     return out
 
 
+def candidates_by_document(results, n: int) -> dict[str, list[QuoteCandidate]]:
+    """Group set-wide vector-search results into up to ``n`` candidates per doc.
+
+    The batch counterpart of :func:`candidates_from_search`: documents appear in
+    the order of their best-ranked chunk.
+    """
+    out: dict[str, list[QuoteCandidate]] = {}
+    for r in results:
+        uuid = getattr(r.doc, "uuid", None)
+        text = (r.chunk_text or "").strip()
+        if not uuid or not text:
+            continue
+        cands = out.setdefault(uuid, [])
+        if len(cands) < n:
+            cands.append(QuoteCandidate(candidate=text))
+    return out
+
+
 # ── document plain text ──────────────────────────────────────────────────────
 
 
@@ -303,11 +343,15 @@ def extract_quotes(
     bib_path = doc_dir / MACHINE_FILE
     bib_text = bib_path.read_text(encoding="utf-8") if bib_path.exists() else ""
 
+    index = QuoteIndex(full_text)
+    # Scan the existing file once; keys then come from a running counter.
+    next_q = find_next_q(bib_text, prefix)
+    main_written = has_main(bib_text, prefix)
     results: list[QuoteResult] = []
     appended = ""
     for cand in candidates:
         ratio = cand.min_ratio if cand.min_ratio is not None else min_ratio
-        match = fuzzy_locate(cand.candidate, full_text, ratio)
+        match = fuzzy_locate(cand.candidate, full_text, ratio, index=index)
         if not match.match_found:
             logger.warning(
                 "Skipping low-confidence candidate (score %.2f < %.2f): %.60s",
@@ -320,15 +364,14 @@ def extract_quotes(
             )
             continue
 
-        current = bib_text + appended
-        if not has_main(current, prefix):
+        if not main_written:
             appended += (
                 build_main_entry(prefix, source_type, url, author, date, title) + "\n"
             )
-            current = bib_text + appended
+            main_written = True
 
-        n = find_next_q(current, prefix)
-        key = f"{prefix}:q{n}"
+        key = f"{prefix}:q{next_q}"
+        next_q += 1
         page = _page_for_offset(match.match_start, page_index)
         entry = build_quote_entry(
             key=key,
@@ -362,3 +405,46 @@ def extract_quotes(
         bib_path.write_text(bib_text + appended, encoding="utf-8")
 
     return results
+
+
+def _extract_quotes_job(
+    doc_dir: Path,
+    candidates: list[QuoteCandidate],
+    min_ratio: float,
+    refresh: bool,
+    source_type: str,
+) -> list[QuoteResult] | Exception:
+    """Pool worker: a failure becomes the doc's result instead of aborting the batch."""
+    try:
+        return extract_quotes(doc_dir, candidates, min_ratio, refresh, source_type)
+    except Exception as exc:  # e.g. yaml.YAMLError/TypeError from a broken info.yml
+        return exc
+
+
+def extract_quotes_batch(
+    docs: dict[Path, list[QuoteCandidate]],
+    min_ratio: float = 0.78,
+    refresh: bool = False,
+    source_type: str = "article",
+    jobs: int | None = None,
+) -> dict[Path, list[QuoteResult] | Exception]:
+    """Run :func:`extract_quotes` for many documents, in parallel.
+
+    *docs* maps document directories to their candidates. Each document is
+    handled by one worker process (``jobs``, default one per CPU), which reads
+    its text once and writes its ``machine.hayagriva`` once. Returns results per
+    document in input order; a document that failed (missing source, bad
+    ``info.yml``) maps to the exception instead.
+    """
+    items = [(d, c) for d, c in docs.items() if c]
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(items) or 1))
+    args = [(d, c, min_ratio, refresh, source_type) for d, c in items]
+    if jobs == 1:
+        outcomes = [_extract_quotes_job(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(jobs, mp_context=mp.get_context("spawn")) as pool:
+            outcomes = list(pool.map(_extract_quotes_job, *zip(*args, strict=True)))
+    for (doc_dir, _), outcome in zip(items, outcomes, strict=True):
+        if isinstance(outcome, Exception):
+            logger.warning("Quoting %s failed: %s", doc_dir.name, outcome)
+    return {d: o for (d, _), o in zip(items, outcomes, strict=True)}
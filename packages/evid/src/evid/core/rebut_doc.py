@@ -100,7 +100,7 @@ def rebut_doc(workdir: Path):
         write_rebuttal(rebut_body, rebut_file)
 
         if rebut_file.exists():
-            subprocess.run([EvidConfig.load().editor, str(rebut_file)], check=True)
+            subprocess.run([EvidConfig.cached().editor, str(rebut_file)], check=True)
         else:
             logger.warning(f"Rebuttal file {rebut_file} was not generated")
             raise RuntimeError("Rebuttal file was not generated")
@@ -0,0 +1,297 @@
+"""Memory-mapped per-set store of document text.
+
+Chunk offsets from the vector index (``char_start``) point into a document's
+``label.typ``. Readers that only need a few hundred characters around such an
+offset — MCP chunk fetches, search previews — should not read and decode the
+whole file for it. :class:`TextStore` keeps every document's text of a set in
+one UTF-8 file, ``<set>/textstore/text.bin``, which is memory-mapped, and an
+offset table ``index.json`` with per document:
+
+* ``offset`` / ``nbytes`` — where its text sits in ``text.bin``;
+* ``nchars`` — its length in characters;
+* ``marks`` — the byte position of every ``stride``-th character, so a
+  character range maps to a byte range without decoding from the start;
+* ``mtime_ns`` / ``size`` — the ``label.typ`` stat it was built from.
+
+The store is filled incrementally: a document is appended the first time it
+is read, and re-appended when its ``label.typ`` changes (one ``stat`` per
+read). Superseded bytes stay in ``text.bin`` as dead space until they outweigh
+the live text, at which point the file is compacted.
+
+Several processes (GUI, MCP server) may share a store. Appends go to the end
+of the file as it is on disk, and a process that finds ``text.bin`` replaced by
+another's compaction reloads before writing. Its worst case is a lost index
+update, which only makes a document get appended again.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+STORE_DIR = "textstore"
+STRIDE = 1024  # characters between char -> byte checkpoints
+_COMPACT_MIN_DEAD = 1 << 20  # never compact for less than 1 MiB of dead bytes
+
+_STORES: dict[Path, TextStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def open_store(set_path: Path) -> TextStore:
+    """Shared :class:`TextStore` for *set_path* (one per set per process)."""
+    key = Path(set_path).resolve()
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            store = _STORES[key] = TextStore(key)
+        return store
+
+
+def _marks(text: str, stride: int) -> tuple[list[int], int]:
+    """Byte offset of every *stride*-th character, and the total byte length."""
+    marks: list[int] = []
+    pos = 0
+    for i in range(0, len(text), stride):
+        marks.append(pos)
+        pos += len(text[i : i + stride].encode("utf-8"))
+    return marks, pos
+
+
+class TextStore:
+    """Character-range access to a set's ``label.typ`` texts via one mmap."""
+
+    def __init__(self, set_path: Path) -> None:
+        self.set_path = Path(set_path)
+        self.dir = self.set_path / STORE_DIR
+        self._lock = threading.Lock()
+        self._docs: dict[str, dict] | None = None
+        self._dead = 0  # bytes in text.bin no entry points to
+        self._stride = STRIDE
+        self._map: mmap.mmap | bytes = b""
+        self._file = None
+        self._ino: int | None = None
+
+    # ── reading ───────────────────────────────────────────────────────────────
+
+    def slice(self, uuid: str, start: int, end: int) -> str:
+        """Characters ``[start, end)`` of document *uuid*'s text (clamped).
+
+        Raises ``KeyError`` if the document has no ``label.typ``.
+        """
+        with self._lock:
+            entry = self._entry(uuid)
+            start = max(0, start)
+            end = min(entry["nchars"], end)
+            if start >= end:
+                return ""
+            marks = entry["marks"]
+            i = start // self._stride
+            j = (end - 1) // self._stride + 1
+            lo = entry["offset"] + marks[i]
+            hi = entry["offset"] + (marks[j] if j < len(marks) else entry["nbytes"])
+            block = self._map[lo:hi].decode("utf-8")
+            base = i * self._stride
+            return block[start - base : end - base]
+
+    def length(self, uuid: str) -> int:
+        """Length in characters of document *uuid*'s text."""
+        with self._lock:
+            return self._entry(uuid)["nchars"]
+
+    def text(self, uuid: str) -> str:
+        """Whole text of document *uuid*."""
+        return self.slice(uuid, 0, self.length(uuid))
+
+    def chunk_span(self, uuid: str, start: int, chunk: str) -> tuple[int, int]:
+        """Source ``(start, end)`` of an indexed *chunk* starting at *start*.
+
+        Chunks are fragments re-joined with single newlines (see
+        :mod:`evid.vec.chunking`), so they can be shorter than the text they
+        cover; the end is found by matching *chunk*'s non-whitespace characters
+        against the source. Falls back to ``start + len(chunk)``.
+        """
+        window = self.slice(uuid, start, start + 2 * len(chunk) + 256)
+        i = 0
+        for ch in chunk:
+            if ch.isspace():
+                continue
+            while i < len(window) and window[i].isspace():
+                i += 1
+            if i >= len(window) or window[i] != ch:
+                return start, start + len(chunk)
+            i += 1
+        return start, start + i
+
+    # ── maintenance ───────────────────────────────────────────────────────────
+
+    def refresh(self) -> int:
+        """Bring every document up to date; returns how many were (re)added."""
+        docs_dir = self.set_path / "docs"
+        if not docs_dir.exists():
+            return 0
+        with self._lock:
+            self._ensure_open()
+            changed = 0
+            for doc_dir in sorted(d for d in docs_dir.iterdir() if d.is_dir()):
+                if self._stale(doc_dir.name):
+                    changed += self._add(doc_dir.name)
+            if changed:
+                self._save_index()
+                self._maybe_compact()
+            return changed
+
+    def compact(self) -> None:
+        """Rewrite ``text.bin`` with only the live text."""
+        with self._lock:
+            self._ensure_open()
+            self._compact()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_map()
+            self._docs = None
+
+    # ── internal ──────────────────────────────────────────────────────────────
+
+    def _source(self, uuid: str) -> Path:
+        return self.set_path / "docs" / uuid / "label.typ"
+
+    def _stale(self, uuid: str) -> bool:
+        """Whether *uuid*'s entry is missing or older than its ``label.typ``."""
+        try:
+            st = self._source(uuid).stat()
+        except OSError:
+            return False
+        entry = self._docs.get(uuid)
+        return entry is None or (entry["mtime_ns"], entry["size"]) != (
+            st.st_mtime_ns,
+            st.st_size,
+        )
+
+    def _entry(self, uuid: str) -> dict:
+        """Index entry for *uuid*, (re)adding it first if missing or stale."""
+        if not self._source(uuid).is_file():
+            gone = self._docs.pop(uuid, None) if self._docs is not None else None
+            if gone is not None:
+                self._dead += gone["nbytes"]
+                logger.debug("Text store: %s has no label.typ any more", uuid)
+            raise KeyError(uuid)
+        self._ensure_open()
+        if self._stale(uuid):
+            if not self._add(uuid):
+                raise KeyError(uuid)
+            self._save_index()
+            self._maybe_compact()
+        return self._docs[uuid]
+
+    def _add(self, uuid: str) -> bool:
+        """Append *uuid*'s current text to ``text.bin``; False if unreadable."""
+        path = self._source(uuid)
+        try:
+            st = path.stat()
+            text = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            logger.debug("Text store could not read %s", path, exc_info=True)
+            return False
+        if self._replaced():
+            self._load()  # another process compacted; our offsets are stale
+        marks, nbytes = _marks(text, self._stride)
+        with (self.dir / "text.bin").open("ab") as out:
+            offset = out.seek(0, os.SEEK_END)
+            out.write(text.encode("utf-8"))
+        old = self._docs.get(uuid)
+        if old is not None:
+            self._dead += old["nbytes"]
+        self._docs[uuid] = {
+            "offset": offset,
+            "nbytes": nbytes,
+            "nchars": len(text),
+            "marks": marks,
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+        }
+        self._map_file()
+        return True
+
+    def _replaced(self) -> bool:
+        try:
+            return (self.dir / "text.bin").stat().st_ino != self._ino
+        except OSError:
+            return True
+
+    def _ensure_open(self) -> None:
+        if self._docs is None:
+            self._load()
+
+    def _load(self) -> None:
+        """Read the index and map ``text.bin``, starting empty if there is none."""
+        self.dir.mkdir(exist_ok=True)
+        (self.dir / "text.bin").touch()
+        try:
+            data = json.loads((self.dir / "index.json").read_text(encoding="utf-8"))
+            docs, dead, stride = data["docs"], data["dead"], data["stride"]
+        except (OSError, ValueError, KeyError, TypeError):
+            docs, dead, stride = {}, 0, STRIDE
+        self._map_file()
+        # Entries past the end of the file belong to a text.bin we no longer
+        # have (e.g. an interrupted compaction); those documents are re-added.
+        size = len(self._map)
+        self._docs = {
+            u: e for u, e in docs.items() if e["offset"] + e["nbytes"] <= size
+        }
+        self._dead, self._stride = dead, stride
+
+    def _save_index(self) -> None:
+        data = {"stride": self._stride, "dead": self._dead, "docs": self._docs}
+        tmp = self.dir / f"index.json.{os.getpid()}.tmp"
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        tmp.replace(self.dir / "index.json")
+
+    def _map_file(self) -> None:
+        self._close_map()
+        self._file = (self.dir / "text.bin").open("rb")
+        st = os.fstat(self._file.fileno())
+        self._ino = st.st_ino
+        if st.st_size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:  # mmap cannot map an empty file
+            self._map = b""
+
+    def _close_map(self) -> None:
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._map = b""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _maybe_compact(self) -> None:
+        live = sum(e["nbytes"] for e in self._docs.values())
+        if self._dead > max(live, _COMPACT_MIN_DEAD):
+            self._compact()
+
+    def _compact(self) -> None:
+        tmp = self.dir / f"text.bin.{os.getpid()}.tmp"
+        docs: dict[str, dict] = {}
+        offset = 0
+        with tmp.open("wb") as out:
+            for uuid, entry in sorted(self._docs.items()):
+                start = entry["offset"]
+                out.write(self._map[start : start + entry["nbytes"]])
+                docs[uuid] = {**entry, "offset": offset}
+                offset += entry["nbytes"]
+        tmp.replace(self.dir / "text.bin")
+        logger.debug(
+            "Compacted text store for %s: dropped %d dead bytes",
+            self.set_path.name,
+            self._dead,
+        )
+        self._docs, self._dead = docs, 0
+        self._save_index()
+        self._map_file()
@@ -5,6 +5,7 @@ from pathlib import Path
 
 import yaml
 
+from evid import tracing
 from evid.core.models import InfoModel
 from evid.core.text_cleaning import clean_text_for_typst
 
@@ -118,10 +119,12 @@ def web_to_pdf(url: str, output_dir: Path, html: str = None) -> tuple:
     pdf_path = output_dir / f"{stem}.pdf"
     typ_path.write_text(typst_content, encoding="utf-8")
 
-    result = subprocess.run(
-        ["typst", "compile", str(typ_path), str(pdf_path)],
-        capture_output=True,
-    )
+    tracing.count("subprocesses")
+    with tracing.span("typst.compile"):
+        result = subprocess.run(
+            ["typst", "compile", str(typ_path), str(pdf_path)],
+            capture_output=True,
+        )
     if result.returncode != 0:
         raise RuntimeError(f"typst compile failed: {result.stderr.decode()}")
 
@@ -12,7 +12,10 @@ Workflow
    ``TypGenWorker`` generates it; on completion the file is opened and
    watched.
 4. Every time the watched file is saved, ``LabelWorker`` runs
-   ``generate_bib_from_typ`` in a background thread.
+   ``generate_bib_from_typ`` in a background thread. Labels are re-parsed
+   in-process and incrementally (only around the edit), so the keys update
+   right after the save; only files outside the labtyp subset go through
+   ``typst query``.
 5. ``label_updated(uuid)`` is emitted on success; ``label_error(msg)``
    on failure.  Tabs connect to these signals to do tab-specific
    post-processing (refresh tables, show status bar, etc.).
@@ -183,30 +183,33 @@ class EvidWindow(QMainWindow):
             self._tab_bar.addTab(label)
             self._stack.addWidget(widget)
 
-        self._signals.copy_doc_to_set.connect(self._on_copy_doc_to_set)
+        self._signals.copy_docs_to_set.connect(self._on_copy_docs_to_set)
         self._signals.doc_navigate.connect(self._on_doc_navigate)
+        self._signals.doc_find_similar.connect(self._on_doc_find_similar)
         self._signals.doc_ingested.connect(self._on_doc_ingested)
         self._signals.labels_updated.connect(self._on_labels_updated)
         self._signals.ingestion_error.connect(self._on_ingestion_error)
 
-    def _on_copy_doc_to_set(self, src_slug: str, doc_uuid: str, dest_slug: str) -> None:
+    def _on_copy_docs_to_set(
+        self, src_slug: str, doc_uuids: list, dest_slug: str
+    ) -> None:
         try:
             src_set = self._set_manager.load_set(src_slug)
             dest_set = self._set_manager.load_set(dest_slug)
-            src_doc_dir = src_set.path / "docs" / doc_uuid
-            if not src_doc_dir.exists():
-                logger.warning(
-                    "Copy requested but src doc dir missing: %s", src_doc_dir
-                )
-                return
-            self._docs_tab.start_copy_doc(src_doc_dir, dest_set)
+            self._docs_tab.start_copy_docs(src_set, doc_uuids, dest_set)
         except Exception:
-            logger.exception("Failed to start copy of %s → %s", doc_uuid, dest_slug)
+            logger.exception(
+                "Failed to start copy of %d doc(s) → %s", len(doc_uuids), dest_slug
+            )
 
     def _on_doc_navigate(self, uuid: str) -> None:
         self._tab_bar.setCurrentIndex(0)  # Docs tab
         self._docs_tab.navigate_to_doc(uuid)
 
+    def _on_doc_find_similar(self, uuid: str) -> None:
+        self._tab_bar.setCurrentIndex(1)  # Search tab
+        self._search_tab.show_similar(uuid)
+
     def _on_doc_ingested(self, set_slug: str, doc_uuid: str) -> None:
         if self._sidebar.active_set() and self._sidebar.active_set().slug == set_slug:
             self._docs_tab.reload_current_set()
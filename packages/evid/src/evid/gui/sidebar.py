@@ -235,13 +235,13 @@ class Sidebar(QWidget):
                     try:
                         payload = json.loads(raw)
                         src_slug = payload["src_slug"]
-                        doc_uuid = payload["doc_uuid"]
+                        doc_uuids = payload.get("doc_uuids") or [payload["doc_uuid"]]
                     except Exception:
                         event.ignore()
                         return True
                     if dest_slug != src_slug:
-                        self._signals.copy_doc_to_set.emit(
-                            src_slug, doc_uuid, dest_slug
+                        self._signals.copy_docs_to_set.emit(
+                            src_slug, doc_uuids, dest_slug
                         )
                 self._restore_active_selection()
                 event.acceptProposedAction()
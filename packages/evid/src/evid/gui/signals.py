@@ -11,5 +11,6 @@ class AppSignals(QObject):
     doc_indexed = Signal(str, str)  # set_slug, doc_uuid
     ingestion_error = Signal(str)  # error message
     labels_updated = Signal(str, str)  # set_slug, doc_uuid
-    copy_doc_to_set = Signal(str, str, str)  # src_slug, doc_uuid, dest_slug
+    copy_docs_to_set = Signal(str, list, str)  # src_slug, doc_uuids, dest_slug
     doc_navigate = Signal(str)  # doc UUID — switch to Docs tab and select it
+    doc_find_similar = Signal(str)  # doc UUID — list similar docs in Search tab
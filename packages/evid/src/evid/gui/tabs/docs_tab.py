@@ -7,6 +7,7 @@ import json
 import logging
 import shutil
 import subprocess
+from collections import Counter
 from datetime import UTC
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -564,7 +565,7 @@ class DocsTab(QWidget):
         self._evidence_set: EvidenceSet | None = None
         self._docs: list[Document] = []
         self._workers: list = []
-        # Long-lived serialized background vecdb index queue (created lazily).
+        # Long-lived background vecdb index queue (created lazily).
         self._index_queue: object = None
         self._current_yaml_path: Path | None = None
         # Active progress dialogs (one per operation type; only one of each runs at a time)
@@ -947,9 +948,12 @@ class DocsTab(QWidget):
             act_open_pdf.setEnabled(resolve_doc_pdf(doc.path) is not None)
             act_open_url = menu.addAction("Open URL")
             act_open_url.setEnabled(bool(doc.source_url))
+            act_similar = menu.addAction("Find similar documents")
+            act_similar.setEnabled(doc.indexed)
             menu.addSeparator()
         else:
             act_label = act_open_dir = act_open_pdf = act_open_url = None
+            act_similar = None
 
         act_tag = menu.addAction(f"Tag {len(docs)} selected\u2026")
         all_tags = sorted({t for d in docs for t in d.tags})
@@ -994,6 +998,8 @@ class DocsTab(QWidget):
             from PySide6.QtGui import QDesktopServices
 
             QDesktopServices.openUrl(QUrl(doc.source_url))
+        elif action is act_similar and doc:
+            self._signals.doc_find_similar.emit(doc.uuid)
         elif action is act_tag:
             if not self._evidence_set:
                 return
@@ -1055,14 +1061,33 @@ class DocsTab(QWidget):
             )
             if reply != QMessageBox.StandardButton.Yes:
                 return
+            deleted = []
             for d in docs:
+                if self._index_queue is not None and self._evidence_set:
+                    self._index_queue.cancel(d.uuid, self._evidence_set.slug)
                 try:
                     shutil.rmtree(d.path)
                 except Exception:
                     logger.exception("Failed to delete doc %s", d.uuid)
+                else:
+                    deleted.append(d.uuid)
+            # A doc whose directory survived keeps its chunks.
+            if self._evidence_set and deleted:
+                try:
+                    self._vec_service.remove_documents(deleted, self._evidence_set)
+                except Exception:
+                    logger.exception(
+                        "Failed to remove deleted documents from the vector index; "
+                        "`evid set vacuum` removes them later"
+                    )
+                # Release the client again, as before queueing index jobs.
+                self._vec_service.close(self._evidence_set.slug)
             self._reload_preserving_selection()
             self.window().statusBar().showMessage(
-                f"Deleted {len(docs)} document(s)", 3000
+                f"Deleted {len(deleted)} of {len(docs)} document(s)"
+                if len(deleted) < len(docs)
+                else f"Deleted {len(docs)} document(s)",
+                3000,
             )
 
     def _ask_tag_name(self) -> str:
@@ -1111,6 +1136,9 @@ class DocsTab(QWidget):
             with info_path.open("r", encoding="utf-8") as f:
                 info = yaml.safe_load(f) or {}
         meta = read_meta(doc.path)
+        if not meta.get("indexed") and self._index_queue is not None:
+            # The user is looking at it — index it ahead of the bulk backlog.
+            self._index_queue.prioritize(doc.uuid)
 
         # Compact UUID display
         self._detail_uuid_full = doc.uuid
@@ -1309,7 +1337,7 @@ class DocsTab(QWidget):
             self.window().statusBar().showMessage(msg, timeout)
 
     def _ensure_index_queue(self):
-        """Lazily create and start the single background index queue worker."""
+        """Lazily create and start the background index queue worker."""
         if self._index_queue is None:
             from evid.gui.workers import IndexQueueWorker
 
@@ -1382,6 +1410,8 @@ class DocsTab(QWidget):
         q = self._index_queue
         if q is not None:
             try:
+                # Unstarted jobs stay indexed=False and can be re-queued later.
+                q.cancel_all()
                 q.stop()
                 q.wait(5000)
             except Exception:
@@ -1400,7 +1430,7 @@ class DocsTab(QWidget):
             )
             return
 
-        # Route through the serialized background queue so the GUI stays usable.
+        # Route through the background queue so the GUI stays usable.
         # Release the main client so the indexing subprocesses own the vecdb.
         self._vec_service.close(self._evidence_set.slug)
         q = self._ensure_index_queue()
@@ -1691,13 +1721,21 @@ class DocsTab(QWidget):
             return
         from PySide6.QtGui import QPainter, QPixmap
 
+        # Drag the whole selection; the dragged row goes first.
+        uuids = [doc.uuid] + [
+            d.uuid for d in self._selected_docs() if d.uuid != doc.uuid
+        ]
         mime = QMimeData()
         payload = json.dumps(
-            {"doc_uuid": doc.uuid, "src_slug": self._evidence_set.slug}
+            {
+                "doc_uuid": doc.uuid,
+                "doc_uuids": uuids,
+                "src_slug": self._evidence_set.slug,
+            }
         )
         mime.setData(_DOC_MIME_TYPE, payload.encode("utf-8"))
 
-        label_text = doc.label[:50]
+        label_text = doc.label[:50] if len(uuids) == 1 else f"{len(uuids)} documents"
         fm = self._table.fontMetrics()
         pix = QPixmap(fm.horizontalAdvance(label_text) + 16, fm.height() + 8)
         pix.fill(Qt.GlobalColor.white)
@@ -1737,20 +1775,23 @@ class DocsTab(QWidget):
         if not _select_row(uuid):
             logger.warning("navigate_to_doc: UUID %s not found in current set", uuid)
 
-    def start_copy_doc(self, src_doc_dir: Path, dest_set: object) -> None:
-        """Copy *src_doc_dir* into *dest_set* and re-index into its vecdb."""
-        from evid.gui.workers import CopyDocWorker
+    def start_copy_docs(
+        self, src_set: object, doc_uuids: list[str], dest_set: object
+    ) -> None:
+        """Copy *doc_uuids* of *src_set* into *dest_set* with their vectors."""
+        from evid.gui.workers import CopyDocsWorker
         from evid.services.vec_service import VecService
 
-        progress_dlg = QProgressDialog(
-            f"Copying {src_doc_dir.name[:8]}…", None, 0, 3, self
+        what = (
+            doc_uuids[0][:8] + "…" if len(doc_uuids) == 1 else f"{len(doc_uuids)} docs"
         )
-        progress_dlg.setWindowTitle("Copy document")
+        progress_dlg = QProgressDialog(f"Copying {what}", None, 0, len(doc_uuids), self)
+        progress_dlg.setWindowTitle("Copy documents")
         progress_dlg.setWindowModality(Qt.WindowModality.WindowModal)
         progress_dlg.show()
 
         worker_vec = VecService()
-        worker = CopyDocWorker(src_doc_dir, dest_set, vec_service=worker_vec)
+        worker = CopyDocsWorker(src_set, doc_uuids, dest_set, vec_service=worker_vec)
 
         def _on_copy_progress(step: int, total: int, msg: str) -> None:
             progress_dlg.setMaximum(total)
@@ -1765,14 +1806,20 @@ class DocsTab(QWidget):
         self._workers.append(worker)
         worker.start()
 
-    def _on_copy_done(self, doc_uuid: str, dest_slug: str) -> None:
+    def _on_copy_done(self, outcome: dict, dest_slug: str) -> None:
         try:
-            self._signals.doc_ingested.emit(dest_slug, doc_uuid)
+            tally = Counter(outcome.values())
+            copied = [
+                u for u, how in outcome.items() if how not in ("present", "missing")
+            ]
+            if copied:
+                self._signals.doc_ingested.emit(dest_slug, copied[0])
+            details = ", ".join(f"{n} {how}" for how, n in sorted(tally.items()))
             self.window().statusBar().showMessage(
-                f"Copied {doc_uuid[:8]}… to '{dest_slug}'", 4000
+                f"Copied {len(copied)} doc(s) to '{dest_slug}' ({details})", 6000
             )
         except Exception:
-            logger.exception("Error completing copy of %s to %s", doc_uuid, dest_slug)
+            logger.exception("Error completing copy to %s", dest_slug)
 
     def _on_copy_error(self, msg: str) -> None:
         try:
@@ -1788,6 +1835,9 @@ class DocsTab(QWidget):
             self._refresh_table(self._get_filtered_docs())
             self._pill_pool.rebuild(self._docs)
             self._pill_pool.set_active_tags(self._active_tag_filter)
+            doc = self._selected_doc()
+            if doc and doc.uuid == doc_uuid:
+                self._load_label_keys(doc)
             if self._evidence_set:
                 self._signals.labels_updated.emit(self._evidence_set.slug, doc_uuid)
             self.window().statusBar().showMessage("Labels updated", 2000)
@@ -58,6 +58,7 @@ class SearchTab(QWidget):
         self._evidence_set: EvidenceSet | None = None
         self._results: list[VecResult] = []
         self._meta_docs: list[Document] = []
+        self._doc_scores: dict[str, float] = {}  # "similar documents" scores
         self._text_hits: list = []  # list[TextHit]
         self._workers: list = []
         self._search_busy = False
@@ -337,6 +338,33 @@ class SearchTab(QWidget):
             self._set_search_busy(False)
             self._run_pending_search()
 
+    def show_similar(self, doc_uuid: str) -> None:
+        """List the documents most like *doc_uuid* (document-level vectors)."""
+        if not self._evidence_set:
+            return
+        if self._search_busy:
+            self._pending_search = lambda: self.show_similar(doc_uuid)
+            return
+        from evid.gui.workers import SimilarDocsWorker
+
+        self._set_search_busy(True)
+        worker = SimilarDocsWorker(
+            self._vec_service, self._evidence_set, doc_uuid, self._n_spin.value()
+        )
+        worker.finished.connect(self._on_similar_done)
+        worker.error.connect(self._on_search_error)
+        self._workers.append(worker)
+        worker.start()
+
+    def _on_similar_done(self, results: list) -> None:
+        try:
+            self._fill_table_from_docs(
+                [doc for doc, _ in results], scores=[score for _, score in results]
+            )
+        finally:
+            self._set_search_busy(False)
+            self._run_pending_search()
+
     def _run_text_search(self) -> None:
         if not self._evidence_set:
             QMessageBox.warning(self, "No set", "Select an evidence set first.")
@@ -390,10 +418,15 @@ class SearchTab(QWidget):
         self._vec_search_btn.setEnabled(not busy)
         self._text_search_btn.setEnabled(not busy)
 
-    def _fill_table_from_docs(self, docs: list[Document]) -> None:
+    def _fill_table_from_docs(
+        self, docs: list[Document], scores: list[float] | None = None
+    ) -> None:
         self._results = []
         self._text_hits = []
         self._meta_docs = list(docs)
+        self._doc_scores = (
+            {d.uuid: s for d, s in zip(docs, scores, strict=True)} if scores else {}
+        )
         self._table.setRowCount(0)
         if not docs:
             self._table.insertRow(0)
@@ -405,7 +438,10 @@ class SearchTab(QWidget):
         for doc in docs:
             row = self._table.rowCount()
             self._table.insertRow(row)
-            self._table.setItem(row, 0, QTableWidgetItem("—"))
+            score = self._doc_scores.get(doc.uuid)
+            self._table.setItem(
+                row, 0, QTableWidgetItem("—" if score is None else f"{score:.3f}")
+            )
             self._table.setItem(row, 1, QTableWidgetItem(doc.label))
             self._table.setItem(row, 2, QTableWidgetItem(""))
             self._table.setItem(row, 3, QTableWidgetItem(doc.uuid))
@@ -413,6 +449,7 @@ class SearchTab(QWidget):
 
     def _fill_table_from_vec_results(self, results: list[VecResult]) -> None:
         self._meta_docs = []
+        self._doc_scores = {}
         self._text_hits = []
         self._table.setRowCount(0)
         if not results:
@@ -435,6 +472,7 @@ class SearchTab(QWidget):
     def _fill_table_from_text_hits(self, hits: list) -> None:
         self._results = []
         self._meta_docs = []
+        self._doc_scores = {}
         self._text_hits = list(hits)
         self._table.setRowCount(0)
         if not hits:
@@ -490,10 +528,11 @@ class SearchTab(QWidget):
             self._prev_show_in_docs_btn.setEnabled(True)
         elif row >= 0 and row < len(self._meta_docs):
             doc = self._meta_docs[row]
+            score = self._doc_scores.get(doc.uuid)
             self._prev_tags.setText(", ".join(doc.tags) if doc.tags else "—")
             self._prev_label.setText(doc.label)
             self._prev_label.setToolTip(doc.label)
-            self._prev_score.setText("")
+            self._prev_score.setText("" if score is None else f"{score:.3f}")
             short_uuid = (
                 doc.uuid[:8] + "\u2026" + doc.uuid[-8:]
                 if len(doc.uuid) > 16
@@ -528,29 +567,37 @@ class SearchTab(QWidget):
     def _vec_preview_html(self, res: VecResult) -> str | None:
         """Context window (±_CONTEXT_CHARS) around the matched chunk in the doc's
         label.typ, with the matched span highlighted. Returns None if the file is
-        missing/unreadable so the caller can fall back to the plain chunk."""
+        missing/unreadable so the caller can fall back to the plain chunk.
+
+        Reads only the window from the set's memory-mapped text store, so
+        stepping through hits in a large document does not re-read the file."""
         if not self._evidence_set:
             return None
-        typ_path = self._evidence_set.path / "docs" / res.doc.uuid / "label.typ"
+        from evid.core.text_store import open_store
+
+        store = open_store(self._evidence_set.path)
+        uuid = res.doc.uuid
         try:
-            text = typ_path.read_text(encoding="utf-8")
-        except Exception:
-            logger.debug("Preview: could not read %s", typ_path, exc_info=True)
-            return None
-        if not text:
+            n = store.length(uuid)
+            if not n:
+                return None
+            start = max(0, min(res.char_start, n))
+            start, end = store.chunk_span(uuid, start, res.chunk_text)
+            end = min(end, n)
+            win_start = max(0, start - _CONTEXT_CHARS)
+            win_end = min(n, end + _CONTEXT_CHARS)
+            window = store.slice(uuid, win_start, win_end)
+        except (KeyError, OSError):
+            logger.debug("Preview: no text for %s", uuid, exc_info=True)
             return None
 
         import html as _html
 
-        start = max(0, min(res.char_start, len(text)))
-        end = min(len(text), start + len(res.chunk_text))
-        win_start = max(0, start - _CONTEXT_CHARS)
-        win_end = min(len(text), end + _CONTEXT_CHARS)
-        before = _html.escape(text[win_start:start])
-        match = _html.escape(text[start:end])
-        after = _html.escape(text[end:win_end])
+        before = _html.escape(window[: start - win_start])
+        match = _html.escape(window[start - win_start : end - win_start])
+        after = _html.escape(window[end - win_start :])
         lead = "…" if win_start > 0 else ""
-        trail = "…" if win_end < len(text) else ""
+        trail = "…" if win_end < n else ""
         body = (
             f"{lead}{before}"
             f"<mark style='background:#ffe08a;color:#1a1a1a;font-weight:bold'>{match}</mark>"
@@ -664,9 +711,11 @@ class SearchTab(QWidget):
             )
             act_open_url = menu.addAction("Open URL")
             act_open_url.setEnabled(bool(doc0 and getattr(doc0, "source_url", "")))
+            act_similar = menu.addAction("Find similar documents")
             menu.addSeparator()
         else:
             act_label = act_open_dir = act_open_pdf = act_open_url = None
+            act_similar = None
 
         uuids = [u for u, _ in sel]
         act_tag = menu.addAction(f"Tag {len(uuids)} selected\u2026")
@@ -705,6 +754,8 @@ class SearchTab(QWidget):
                 subprocess.Popen(["xdg-open", str(pdf)])
         elif action is act_open_url and doc0:
             QDesktopServices.openUrl(QUrl(doc0.source_url))
+        elif action is act_similar:
+            self.show_similar(uuid0)
         elif action is act_tag:
             if not self._evidence_set:
                 return
@@ -70,67 +70,85 @@ class IngestWorker(QThread):
 
 
 class IndexQueueWorker(QThread):
-    """Serialized background vecdb indexing queue.
-
-    A single long-lived thread that indexes documents one at a time, so only one
-    ChromaDB-writing subprocess ever touches a given set's vecdb at a moment —
-    no file-lock contention. Submit jobs with ``enqueue(doc_dir, evidence_set)``
-    from the GUI thread; stop cleanly with ``stop()``.
+    """Background vecdb indexing queue.
+
+    A thin Qt shell around :class:`evid.services.index_queue.IndexScheduler`:
+    sets index in parallel on a pool of warm indexer processes, while jobs for
+    the same set are serialized (and batched) so only one writer ever touches a
+    set's vecdb at a moment — no file-lock contention. Submit jobs with
+    ``enqueue(doc_dir, evidence_set)`` from the GUI thread; stop cleanly with
+    ``stop()``.
     """
 
     item_done = Signal(str, str, bool)  # set_slug, doc_uuid, ok
-    queue_changed = Signal(int)  # jobs still pending (incl. the in-flight one)
+    queue_changed = Signal(int)  # jobs still pending (incl. in-flight ones)
     idle = Signal()  # emitted when the queue drains
 
-    def __init__(self) -> None:
+    def __init__(self, workers: int | None = None) -> None:
         super().__init__()
-        import queue as _queue
         import threading
 
-        self._queue: _queue.Queue = _queue.Queue()
-        self._lock = threading.Lock()
-        self._pending = 0
+        from evid.services.index_queue import IndexScheduler
+
+        if workers is None:
+            from evid.config import EvidConfig
+
+            workers = EvidConfig.cached().index_workers
+        self._ingester_lock = threading.Lock()
+        self._ingester = None
+        self._scheduler = IndexScheduler(
+            self._run_batch,
+            workers=workers,
+            on_done=self.item_done.emit,
+            on_pending=self.queue_changed.emit,
+            on_idle=self.idle.emit,
+        )
 
-    def enqueue(self, doc_dir: Path, evidence_set: EvidenceSet) -> None:
-        with self._lock:
-            self._pending += 1
-            pending = self._pending
-        self._queue.put((doc_dir, evidence_set))
-        self.queue_changed.emit(pending)
+    def enqueue(
+        self, doc_dir: Path, evidence_set: EvidenceSet, priority: int | None = None
+    ) -> None:
+        from evid.services.index_queue import PRIORITY_NORMAL
+
+        self._scheduler.submit(
+            doc_dir,
+            evidence_set,
+            PRIORITY_NORMAL if priority is None else priority,
+        )
+
+    def prioritize(self, doc_uuid: str) -> bool:
+        """Index *doc_uuid* next if it is still queued (e.g. the user opened it)."""
+        return self._scheduler.prioritize(doc_uuid)
+
+    def cancel(self, doc_uuid: str, slug: str | None = None) -> bool:
+        """Drop a queued (not yet running) job."""
+        return self._scheduler.cancel(doc_uuid, slug)
+
+    def cancel_all(self) -> int:
+        """Drop every queued job; in-flight batches still finish."""
+        return self._scheduler.cancel_all()
 
     def stop(self) -> None:
-        """Ask the worker to exit after finishing any in-flight job."""
-        self._queue.put(None)
+        """Ask the worker to exit once the queued jobs have finished."""
+        self._scheduler.stop()
 
-    def run(self) -> None:
+    def _run_batch(self, evidence_set: EvidenceSet, doc_dirs: list[Path]) -> list:
+        with self._ingester_lock:
+            if self._ingester is None:
+                from evid.services.doc_ingester import DocIngester
+                from evid.services.vec_service import VecService
+
+                self._ingester = DocIngester(vec_service=VecService())
+            ingester = self._ingester
         import logging
 
-        from evid.services.doc_ingester import DocIngester
-        from evid.services.vec_service import VecService
+        logging.getLogger(__name__).info(
+            "Background indexing %d doc(s) into '%s'", len(doc_dirs), evidence_set.slug
+        )
+        return ingester.index_existing_many(doc_dirs, evidence_set)
 
-        _log = logging.getLogger(__name__)
-        ingester = DocIngester(vec_service=VecService())
-        while True:
-            job = self._queue.get()
-            if job is None:
-                break
-            doc_dir, evidence_set = job
-            doc_uuid = doc_dir.name
-            ok = False
-            try:
-                _log.info(
-                    "Background indexing %s into '%s'", doc_uuid, evidence_set.slug
-                )
-                ok = bool(ingester.index_existing(doc_dir, evidence_set))
-            except Exception as exc:
-                _log.exception("Background index failed for %s: %s", doc_uuid, exc)
-            with self._lock:
-                self._pending = max(0, self._pending - 1)
-                pending = self._pending
-            self.item_done.emit(evidence_set.slug, doc_uuid, ok)
-            self.queue_changed.emit(pending)
-            if pending == 0:
-                self.idle.emit()
+    def run(self) -> None:
+        self._scheduler.start()
+        self._scheduler.join()
 
 
 class UrlFetchWorker(QThread):
@@ -272,114 +290,47 @@ class TypGenWorker(QThread):
             self.error.emit(str(exc))
 
 
-class CopyDocWorker(QThread):
-    """Copy a document directory to another evidence set and re-index into its vecdb."""
+class CopyDocsWorker(QThread):
+    """Copy documents to another evidence set, carrying their vectors over.
+
+    Vectors are transferred from the source set's index; only documents
+    without usable vectors are embedded (see ``DocIngester.copy_documents``).
+    """
 
     progress = Signal(int, int, str)
-    finished = Signal(str, str)  # doc_uuid, dest_slug
+    finished = Signal(object, str)  # {doc_uuid: outcome}, dest_slug
     error = Signal(str)
 
     def __init__(
         self,
-        src_doc_dir: Path,
+        src_set: EvidenceSet,
+        doc_uuids: list[str],
         dest_set: EvidenceSet,
         vec_service=None,
     ) -> None:
         super().__init__()
-        self._src_doc_dir = src_doc_dir
+        self._src_set = src_set
+        self._doc_uuids = doc_uuids
         self._dest_set = dest_set
         self._vec_service = vec_service
 
     def run(self) -> None:
         import logging
-        import shutil
 
-        import yaml
+        from evid.services.doc_ingester import DocIngester
 
-        _log = logging.getLogger(__name__)
-        doc_uuid = self._src_doc_dir.name
-        dest_doc_dir = self._dest_set.path / "docs" / doc_uuid
         try:
-            self.progress.emit(
-                1, 3, f"Copying {doc_uuid[:8]}… to '{self._dest_set.name}'"
+            ingester = DocIngester(
+                vec_service=self._vec_service, progress=self.progress.emit
             )
-            if dest_doc_dir.exists():
-                _log.info(
-                    "Doc %s already present in '%s' — skipping copy",
-                    doc_uuid,
-                    self._dest_set.slug,
-                )
-                self.finished.emit(doc_uuid, self._dest_set.slug)
-                return
-            shutil.copytree(str(self._src_doc_dir), str(dest_doc_dir))
-            _log.debug("Copied %s → %s", self._src_doc_dir, dest_doc_dir)
-
-            self.progress.emit(2, 3, "Updating metadata…")
-            meta = {"notes": "", "indexed": False}
-            from evid.core.evid_meta import write_meta
-
-            write_meta(dest_doc_dir, meta)
-
-            self.progress.emit(3, 3, "Indexing into vector store…")
-            if self._vec_service is not None:
-                try:
-                    from datetime import UTC, datetime
-
-                    from evid.models import Document
-
-                    info: dict = {}
-                    info_path = dest_doc_dir / "info.yml"
-                    if info_path.exists():
-                        with info_path.open(encoding="utf-8") as fh:
-                            info = yaml.safe_load(fh) or {}
-                    tags_raw = info.get("tags", "")
-                    tags = (
-                        [t.strip() for t in tags_raw.split(",") if t.strip()]
-                        if isinstance(tags_raw, str)
-                        else [str(t).strip() for t in tags_raw if str(t).strip()]
-                    )
-                    doc = Document(
-                        uuid=doc_uuid,
-                        path=dest_doc_dir,
-                        label=info.get("label", doc_uuid),
-                        tags=tags,
-                        added=datetime.now(tz=UTC),
-                        indexed=False,
-                    )
-                    typ_path = dest_doc_dir / "label.typ"
-                    typ_text = (
-                        typ_path.read_text(encoding="utf-8")
-                        if typ_path.exists()
-                        else ""
-                    )
-                    ok, msg = self._vec_service.index_document_isolated(
-                        doc, typ_text, self._dest_set
-                    )
-                    if ok:
-                        meta["indexed"] = True
-                        from evid.core.evid_meta import write_meta
-
-                        write_meta(dest_doc_dir, meta)
-                        _log.info(
-                            "Re-indexed %s into '%s'", doc_uuid, self._dest_set.slug
-                        )
-                    else:
-                        _log.warning(
-                            "Vec re-index for %s in '%s' skipped: %s",
-                            doc_uuid,
-                            self._dest_set.slug,
-                            msg,
-                        )
-                except Exception:
-                    _log.exception(
-                        "Vec re-index failed for %s in '%s'",
-                        doc_uuid,
-                        self._dest_set.slug,
-                    )
-
-            self.finished.emit(doc_uuid, self._dest_set.slug)
+            outcome = ingester.copy_documents(
+                self._src_set, self._doc_uuids, self._dest_set
+            )
+            self.finished.emit(outcome, self._dest_set.slug)
         except Exception as exc:
-            _log.exception("CopyDocWorker failed for %s", doc_uuid)
+            logging.getLogger(__name__).exception(
+                "CopyDocsWorker failed for %d doc(s)", len(self._doc_uuids)
+            )
             self.error.emit(str(exc))
 
 
@@ -429,6 +380,33 @@ class VectorSearchWorker(QThread):
             self.error.emit(str(exc))
 
 
+class SimilarDocsWorker(QThread):
+    """Find the documents most like one document in a background thread."""
+
+    finished = Signal(list)  # list[tuple[Document, float]]
+    error = Signal(str)
+
+    def __init__(
+        self, vec_service, evidence_set: EvidenceSet, doc_uuid: str, n_results: int
+    ):
+        super().__init__()
+        self._vec_service = vec_service
+        self._evidence_set = evidence_set
+        self._doc_uuid = doc_uuid
+        self._n_results = n_results
+
+    def run(self) -> None:
+        try:
+            results = self._vec_service.similar(
+                self._evidence_set, self._doc_uuid, n_results=self._n_results
+            )
+            self.finished.emit(results)
+        except KeyError:
+            self.error.emit(f"Document {self._doc_uuid} is not indexed yet.")
+        except Exception as exc:
+            self.error.emit(str(exc))
+
+
 class FullTextSearchWorker(QThread):
     """Run full-text (substring/regex) body search in a background thread."""
 
@@ -10,6 +10,26 @@ set and every tool operates only on it — there is no `list_sets` and no
 `dataset` parameter. An attached agent therefore cannot discover or reach other
 (possibly private) sets in the same data directory.
 
+**Concurrent.** Tools are async and run their blocking work (inference, Chroma
+and ripgrep I/O, info.yml parsing) on a bounded thread pool, so parallel tool
+calls from an agent overlap instead of queueing on the event loop. Concurrent
+`search_vec` calls share one batched forward pass rather than waiting for each
+other's embedding. Results of `search_vec`, `search_meta` and `list_docs` are
+LRU-cached per set generation (see :mod:`evid.core.generation`), so a repeated
+query is free until something in the set is written. `search_text` is not
+cached: it reads `label.typ` bodies, which are edited outside evid.
+
+**Batched and paged.** `search_vec_batch` answers many queries with one
+embedding pass and one multi-query Chroma request. Search and listing tools
+return `{results, next_cursor}` pages; `get_chunk` returns a hit's full text
+plus surrounding context, read from the set's memory-mapped text store
+(:mod:`evid.core.text_store`) instead of whole `label.typ` files.
+`similar_docs` ("more like this") is one lookup in the set's document-level
+vectors (:mod:`evid.vec.docvecs`).
+
+At startup the server warms up in the background: it opens the collection and
+loads the embedding model before the first query needs them.
+
 Run it (pointed at a database, scoped to one set) with:
 
     evid -d ./evid mcp my-case
@@ -19,16 +39,39 @@ and register that command as a stdio MCP server in your agent.
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import binascii
+import functools
+import hashlib
 import json
 import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from evid import tracing
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 logger = logging.getLogger(__name__)
 
+MAX_WORKERS = 4  # tool calls running at once; the rest wait for a thread
+CACHE_SIZE = 256  # cached results per tool
+PAGE_SIZE = 100  # list_docs / search_meta entries per page
+_DEPTH_STEP = 50  # search_vec fetches in multiples of this, so pages share cache
+
 # Resolved once in build_server(); shared so the embedding model and Chroma
 # clients stay warm across calls. The server only ever touches _SET.
 _SET = None  # EvidenceSet the server is bound to
 _VEC = None  # VecService
+_POOL: ThreadPoolExecutor | None = None  # runs the tools' blocking work
+_BATCHER = None  # _QueryBatcher
+_VEC_CACHE = None  # LRU-wrapped _search_vec, per server
+_META_CACHE = None  # LRU-wrapped _search_meta, per server
 
 
 def _vec_service():
@@ -40,6 +83,268 @@ def _vec_service():
     return _VEC
 
 
+def _text_store():
+    from evid.core.text_store import open_store
+
+    return open_store(_SET.path)
+
+
+# ── pagination ────────────────────────────────────────────────────────────────
+#
+# Paged tools return {"results": [...], "next_cursor": str | null}. A cursor is
+# an opaque token carrying the next offset and a fingerprint of the query it
+# belongs to, so it cannot silently be replayed against a different query.
+
+
+def _fingerprint(key: tuple) -> str:
+    return hashlib.sha1(json.dumps(key).encode()).hexdigest()[:12]  # noqa: S324
+
+
+def _encode_cursor(key: tuple, offset: int) -> str:
+    raw = json.dumps({"k": _fingerprint(key), "o": offset})
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str, key: tuple) -> int:
+    """Offset encoded in *cursor* (0 for none); ValueError if it is not *key*'s."""
+    if not cursor:
+        return 0
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        offset = int(data["o"])
+    except (ValueError, KeyError, TypeError, binascii.Error):
+        msg = "Invalid cursor."
+        raise ValueError(msg) from None
+    if data.get("k") != _fingerprint(key):
+        msg = "Cursor belongs to a different query; start again without one."
+        raise ValueError(msg)
+    return offset
+
+
+def _page(rows: list, offset: int, limit: int, key: tuple) -> dict:
+    more = len(rows) > offset + limit
+    return {
+        "results": rows[offset : offset + limit],
+        "next_cursor": _encode_cursor(key, offset + limit) if more else None,
+    }
+
+
+class _QueryBatcher:
+    """Coalesce concurrent query embeddings into one forward pass.
+
+    The first caller to arrive becomes the leader and embeds every query that
+    is pending; queries submitted while it runs are picked up in its next
+    round. Callers never wait for more than one batch ahead of their own, and
+    the model (whose tokenizer is not safe to share between threads) only ever
+    runs on one thread at a time.
+    """
+
+    def __init__(self, embed: Callable[[list[str]], object]) -> None:
+        self._embed = embed
+        self._lock = threading.Lock()
+        self._pending: list[tuple[str, Future]] = []
+        self._busy = False
+
+    def embed(self, text: str):
+        return self.embed_many([text])[0]
+
+    def embed_many(self, texts: list[str]) -> list:
+        futs: list[Future] = [Future() for _ in texts]
+        with self._lock:
+            self._pending.extend(zip(texts, futs, strict=True))
+            lead = not self._busy
+            self._busy = True
+        if lead:
+            self._drain()
+        return [fut.result() for fut in futs]
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                batch, self._pending = self._pending, []
+                if not batch:
+                    self._busy = False
+                    return
+            try:
+                vecs = self._embed([text for text, _ in batch])
+            except BaseException as exc:  # handed to every waiter
+                for _, fut in batch:
+                    fut.set_exception(exc)
+                continue
+            for (_, fut), vec in zip(batch, vecs, strict=True):
+                fut.set_result(vec)
+
+
+def _embed_queries(texts: list[str]):
+    from evid.vec.embeddings import embed_queries
+
+    return embed_queries(texts)
+
+
+def _traced_call(fn: Callable, *args):
+    with tracing.span(f"mcp.{getattr(fn, '__name__', 'tool').lstrip('_')}"):
+        return fn(*args)
+
+
+async def _run(fn: Callable, *args):
+    """Run blocking *fn(*args)* on the server's pool without blocking the loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_POOL, functools.partial(_traced_call, fn, *args))
+
+
+def _current_generation():
+    from evid.core.generation import set_generation
+
+    return set_generation(_SET.path)
+
+
+def warm_up() -> None:
+    """Load the embedding model and open (and query once) the set's collection."""
+    t0 = time.perf_counter()
+    try:
+        _vec_service().query(
+            _SET, "warm-up", n_results=1, embedding=_BATCHER.embed("warm-up")
+        )
+    except Exception:
+        logger.exception("MCP warm-up failed; the first query will load lazily")
+        return
+    logger.info("MCP server warm in %.1f s", time.perf_counter() - t0)
+
+
+def _vec_row(r) -> dict:
+    return {
+        "score": round(float(r.score), 4),
+        "label": r.doc.label,
+        "uuid": r.doc.uuid,
+        "chunk_idx": r.chunk_idx,
+        "char_start": r.char_start,
+        "preview": r.chunk_text[:400],
+    }
+
+
+def _search_vec(query: str, depth: int, tag: str, _generation) -> list[dict]:
+    results = _vec_service().query(
+        _SET,
+        query,
+        n_results=depth,
+        filter_tags=[tag] if tag else None,
+        embedding=_BATCHER.embed(query),
+    )
+    return [_vec_row(r) for r in results]
+
+
+def _search_vec_batch(queries: list[str], n: int, tag: str) -> str:
+    # n + 1 rows per query tell whether a next page exists
+    results = _vec_service().query_many(
+        _SET,
+        queries,
+        n_results=n + 1,
+        filter_tags=[tag] if tag else None,
+        embeddings=_BATCHER.embed_many(queries),
+    )
+    out = [
+        {
+            "query": q,
+            **_page([_vec_row(r) for r in rs], 0, n, ("search_vec", q, tag)),
+        }
+        for q, rs in zip(queries, results, strict=True)
+    ]
+    return json.dumps(out, ensure_ascii=False)
+
+
+def _get_chunk(uuid: str, chunk_idx: int, context: int) -> str:
+    got = _vec_service().get_chunk(_SET, uuid, chunk_idx)
+    if got is None:
+        msg = f"No chunk {chunk_idx} for document {uuid} in this dataset."
+        raise ValueError(msg)
+    chunk, start = got
+    out = {"uuid": uuid, "chunk_idx": chunk_idx, "char_start": start}
+    store = _text_store()
+    try:
+        start, end = store.chunk_span(uuid, start, chunk)
+        out |= {
+            "char_end": end,
+            "before": store.slice(uuid, start - context, start),
+            "text": store.slice(uuid, start, end),
+            "after": store.slice(uuid, end, end + context),
+        }
+    except KeyError:  # no label.typ any more: serve the indexed chunk as-is
+        out |= {
+            "char_end": start + len(chunk),
+            "before": "",
+            "text": chunk,
+            "after": "",
+        }
+    return json.dumps(out, ensure_ascii=False)
+
+
+def _similar_docs(uuid: str, n: int) -> str:
+    try:
+        hits = _vec_service().similar(_SET, uuid, n_results=n)
+    except KeyError:
+        msg = f"Document {uuid} is not indexed in this dataset."
+        raise ValueError(msg) from None
+    rows = [
+        {
+            "score": round(score, 4),
+            "label": doc.label,
+            "uuid": doc.uuid,
+            "tags": doc.tags,
+        }
+        for doc, score in hits
+    ]
+    return json.dumps(rows, ensure_ascii=False)
+
+
+def _search_meta(pattern: str, _generation) -> list[dict]:
+    from evid.core.doc_loader import search_meta_documents
+
+    docs = search_meta_documents(_SET.path, pattern)
+    return [{"uuid": d.uuid, "label": d.label, "tags": d.tags} for d in docs]
+
+
+def _search_text(query: str, regex: bool, n: int, cursor: str) -> str:
+    from evid.core.fulltext import search_fulltext
+
+    key = ("search_text", query, regex)
+    offset = _decode_cursor(cursor, key)
+    hits = search_fulltext(_SET.path, query, regex=regex, n=offset + n + 1)
+    rows = [
+        {
+            "uuid": h.uuid,
+            "label": h.label,
+            "page": h.page,
+            "char_start": h.char_start,
+            "score": h.score,
+            "snippet": h.snippet,
+        }
+        for h in hits
+    ]
+    return json.dumps(_page(rows, offset, n, key), ensure_ascii=False)
+
+
+def _doc_quotes(uuid: str) -> str:
+    from evid.core.prompt import quotes_markdown
+
+    md = quotes_markdown([_SET.path / "docs" / uuid])
+    return md or "(no citations — document not yet labelled)"
+
+
+def _paged_search_vec(query: str, n: int, tag: str, cursor: str) -> str:
+    key = ("search_vec", query, tag)
+    offset = _decode_cursor(cursor, key)
+    depth = -(-(offset + n + 1) // _DEPTH_STEP) * _DEPTH_STEP
+    rows = _VEC_CACHE(query, depth, tag, _current_generation())
+    return json.dumps(_page(rows, offset, n, key), ensure_ascii=False)
+
+
+def _paged_search_meta(pattern: str, cursor: str, limit: int) -> str:
+    key = ("search_meta", pattern)
+    offset = _decode_cursor(cursor, key)
+    rows = _META_CACHE(pattern, _current_generation())
+    return json.dumps(_page(rows, offset, limit, key), ensure_ascii=False)
+
+
 def _resolve_set(data_dir: Path, dataset: str):
     """Resolve one set by slug, falling back to a case-insensitive name match."""
     from evid.services.set_manager import SetManager
@@ -57,86 +362,98 @@ def _resolve_set(data_dir: Path, dataset: str):
     raise ValueError(msg)
 
 
-def build_server(data_dir: Path, dataset: str):
-    """Construct the FastMCP server bound to a single *dataset* in *data_dir*."""
-    global _SET
+def build_server(
+    data_dir: Path,
+    dataset: str,
+    workers: int = MAX_WORKERS,
+    cache_size: int = CACHE_SIZE,
+):
+    """Construct the FastMCP server bound to a single *dataset* in *data_dir*.
+
+    Tool calls run on a pool of *workers* threads; each cached tool keeps its
+    last *cache_size* results.
+    """
+    global _SET, _POOL, _BATCHER, _VEC_CACHE, _META_CACHE
     _SET = _resolve_set(Path(data_dir), dataset)
+    if _POOL is not None:
+        _POOL.shutdown(wait=False)
+    _POOL = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="evid-mcp")
+    _BATCHER = _QueryBatcher(_embed_queries)
 
     from mcp.server.fastmcp import FastMCP
 
     mcp = FastMCP(f"evid:{_SET.slug}")
 
+    # The generation is only part of the cache key: a write to the set bumps
+    # it, so stale entries are never hit again and age out of the LRU.
+    _VEC_CACHE = functools.lru_cache(maxsize=cache_size)(_search_vec)
+    _META_CACHE = functools.lru_cache(maxsize=cache_size)(_search_meta)
+
     @mcp.tool()
-    def search_vec(query: str, n: int = 10, tag: str = "") -> str:
-        """Semantic vector search over this server's dataset. Returns the top-n
-        matching chunks as JSON: score (cosine, higher=better), label, uuid,
-        chunk_idx, char_start, preview. Primary discovery tool; the model stays
-        warm across calls in this session."""
-        results = _vec_service().query(
-            _SET, query, n_results=n, filter_tags=[tag] if tag else None
-        )
-        out = [
-            {
-                "score": round(float(r.score), 4),
-                "label": r.doc.label,
-                "uuid": r.doc.uuid,
-                "chunk_idx": r.chunk_idx,
-                "char_start": r.char_start,
-                "preview": r.chunk_text[:400],
-            }
-            for r in results
-        ]
-        return json.dumps(out, ensure_ascii=False)
+    async def search_vec(
+        query: str, n: int = 10, tag: str = "", cursor: str = ""
+    ) -> str:
+        """Semantic vector search over this server's dataset. Returns JSON
+        {results, next_cursor}; each result has score (cosine, higher=better),
+        label, uuid, chunk_idx, char_start and a 400-char preview (use
+        get_chunk for the full text). Pass next_cursor back to get the next n
+        results. Primary discovery tool; the model stays warm across calls."""
+        return await _run(_paged_search_vec, query, max(1, n), tag, cursor)
 
     @mcp.tool()
-    def search_text(query: str, regex: bool = False, n: int = 10) -> str:
+    async def search_vec_batch(queries: list[str], n: int = 10, tag: str = "") -> str:
+        """Run several semantic searches at once (one embedding pass, one index
+        request). Returns a JSON list with one {query, results, next_cursor}
+        per query, in order; continue any of them with
+        search_vec(query, cursor=next_cursor)."""
+        return await _run(_search_vec_batch, list(queries), max(1, n), tag)
+
+    @mcp.tool()
+    async def get_chunk(uuid: str, chunk_idx: int, context: int = 0) -> str:
+        """Full text of one search hit (uuid + chunk_idx from search_vec), with
+        up to *context* characters of the surrounding document before and
+        after. Returns JSON: uuid, chunk_idx, char_start, char_end, before,
+        text, after."""
+        return await _run(_get_chunk, uuid, chunk_idx, max(0, context))
+
+    @mcp.tool()
+    async def similar_docs(uuid: str, n: int = 10) -> str:
+        """Documents most like the document *uuid* ("more like this"), ranked
+        by the cosine similarity of their document-level vectors (the mean
+        of each document's chunk embeddings). One index lookup, no query
+        text needed. Returns a JSON list of {score, label, uuid, tags}."""
+        return await _run(_similar_docs, uuid, n)
+
+    @mcp.tool()
+    async def search_text(
+        query: str, regex: bool = False, n: int = 10, cursor: str = ""
+    ) -> str:
         """Full-text search over document *bodies* in this dataset. Default is a
         fuzzy (rapidfuzz) match ranked per document; set regex=True to return
-        every regex match. Returns JSON: uuid, label, page, char_start, score
-        (fuzzy ratio or null), snippet."""
-        from evid.core.fulltext import search_fulltext
-
-        hits = search_fulltext(_SET.path, query, regex=regex, n=n)
-        out = [
-            {
-                "uuid": h.uuid,
-                "label": h.label,
-                "page": h.page,
-                "char_start": h.char_start,
-                "score": h.score,
-                "snippet": h.snippet,
-            }
-            for h in hits
-        ]
-        return json.dumps(out, ensure_ascii=False)
+        every regex match. Returns JSON {results, next_cursor}; each result has
+        uuid, label, page, char_start, score (fuzzy ratio or null), snippet."""
+        return await _run(_search_text, query, regex, max(1, n), cursor)
 
     @mcp.tool()
-    def search_meta(pattern: str) -> str:
+    async def search_meta(
+        pattern: str, cursor: str = "", limit: int = PAGE_SIZE
+    ) -> str:
         """Regex/substring search over document metadata (info.yml fields) in
-        this dataset. Returns JSON: uuid, label, tags."""
-        from evid.core.doc_loader import search_meta_documents
-
-        docs = search_meta_documents(_SET.path, pattern)
-        out = [{"uuid": d.uuid, "label": d.label, "tags": d.tags} for d in docs]
-        return json.dumps(out, ensure_ascii=False)
+        this dataset. Returns JSON {results, next_cursor}; each result has uuid,
+        label, tags."""
+        return await _run(_paged_search_meta, pattern, cursor, max(1, limit))
 
     @mcp.tool()
-    def list_docs() -> str:
-        """List documents in this dataset as JSON: uuid, label, tags."""
-        from evid.core.doc_loader import search_meta_documents
-
-        docs = search_meta_documents(_SET.path, "")
-        out = [{"uuid": d.uuid, "label": d.label, "tags": d.tags} for d in docs]
-        return json.dumps(out, ensure_ascii=False)
+    async def list_docs(cursor: str = "", limit: int = PAGE_SIZE) -> str:
+        """List documents in this dataset. Returns JSON {results, next_cursor};
+        each result has uuid, label, tags."""
+        return await _run(_paged_search_meta, "", cursor, max(1, limit))
 
     @mcp.tool()
-    def doc_quotes(uuid: str) -> str:
+    async def doc_quotes(uuid: str) -> str:
         """Return a document's labelled citations (`#lab` spans) rendered as
         Markdown, or a note if the document has no labels yet."""
-        from evid.core.prompt import quotes_markdown
-
-        md = quotes_markdown([_SET.path / "docs" / uuid])
-        return md or "(no citations — document not yet labelled)"
+        return await _run(_doc_quotes, uuid)
 
     return mcp
 
@@ -145,4 +462,5 @@ def serve(data_dir: Path, dataset: str) -> None:
     """Run the evid MCP server on stdio for one *dataset* (blocks)."""
     server = build_server(data_dir, dataset)
     logger.info("Starting evid MCP server for set '%s' on %s", _SET.slug, data_dir)
+    _POOL.submit(warm_up)
     server.run(transport="stdio")
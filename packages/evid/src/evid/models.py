@@ -56,3 +56,15 @@ class VecResult:
     score: float
     chunk_idx: int
     char_start: int
+
+
+@dataclass
+class VacuumReport:
+    chunks: int  # chunks in the index before the sweep
+    orphan_docs: list[str] = field(default_factory=list)  # no directory on disk
+    orphan_chunks: int = 0
+    flagged_indexed: list[str] = field(default_factory=list)  # flag was False
+    flagged_unindexed: list[str] = field(default_factory=list)  # flag was True
+    dead_fraction: float | None = None  # before compaction; None = unknown
+    compacted: bool = False
+    bytes_freed: int = 0
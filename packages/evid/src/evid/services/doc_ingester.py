@@ -14,6 +14,8 @@ from typing import TYPE_CHECKING
 import arrow
 import yaml
 
+from evid import tracing
+
 if TYPE_CHECKING:
     from evid.models import Document, EvidenceSet
 
@@ -40,6 +42,7 @@ class DocIngester:
         self.vec_service = vec_service
         self.progress = progress
 
+    @tracing.traced("ingest")
     def ingest(
         self,
         pdf_path: Path,
@@ -103,9 +106,10 @@ class DocIngester:
         from evid.core.models import InfoModel
         from evid.core.pdf_metadata import extract_pdf_metadata
 
-        auto_title, auto_authors, auto_date = extract_pdf_metadata(
-            original_pdf, pdf_path.name
-        )
+        with tracing.span("ingest.metadata"):
+            auto_title, auto_authors, auto_date = extract_pdf_metadata(
+                original_pdf, pdf_path.name
+            )
         logger.debug(
             "Auto-extracted: title=%r authors=%r date=%r",
             auto_title,
@@ -156,7 +160,8 @@ class DocIngester:
         try:
             from evid.core.typst_generation import textpdf_to_typst
 
-            textpdf_to_typst(original_pdf, typ_path)
+            with tracing.span("ingest.typst_text"):
+                textpdf_to_typst(original_pdf, typ_path)
             logger.debug(
                 "Generated label.typ (%d bytes)",
                 typ_path.stat().st_size if typ_path.exists() else 0,
@@ -169,7 +174,8 @@ class DocIngester:
         try:
             from evid.core.bibtex import generate_bib_from_typ
 
-            ok, msg = generate_bib_from_typ(typ_path)
+            with tracing.span("ingest.typst_query"):
+                ok, msg = generate_bib_from_typ(typ_path)
             if ok:
                 logger.debug("BibTeX generation succeeded for %s", doc_uuid)
             else:
@@ -190,9 +196,10 @@ class DocIngester:
                 logger.debug("Embedding %d chars for %s", len(typ_text), doc_uuid)
                 # Run in a subprocess: a native crash in chromadb /
                 # sentence-transformers must not take down the host app.
-                ok, msg = self.vec_service.index_document_isolated(
-                    doc, typ_text, evidence_set
-                )
+                with tracing.span("ingest.index"):
+                    ok, msg = self.vec_service.index_document_isolated(
+                        doc, typ_text, evidence_set
+                    )
                 if ok:
                     meta["indexed"] = True
                     logger.info("Vector index updated for %s", doc_uuid)
@@ -225,7 +232,140 @@ class DocIngester:
             logger.warning("No VecService configured; cannot index %s", doc_dir.name)
             return False
 
-        # Load the document
+        doc, typ_text = self._index_payload(doc_dir)
+
+        logger.info(
+            "Indexing existing doc %s into '%s'", doc_dir.name, evidence_set.slug
+        )
+        try:
+            ok, msg = self.vec_service.index_document_isolated(
+                doc, typ_text, evidence_set
+            )
+            if not ok:
+                logger.warning("Isolated index failed for %s: %s", doc_dir.name, msg)
+                return False
+        except Exception:
+            logger.exception("VecService.index_document failed for %s", doc_dir.name)
+            return False
+
+        self._mark_indexed(doc_dir)
+        logger.info(
+            "Indexed existing doc %s into set '%s'", doc_dir.name, evidence_set.slug
+        )
+        return True
+
+    def index_existing_many(
+        self,
+        doc_dirs: list[Path],
+        evidence_set: EvidenceSet,
+    ) -> list[bool]:
+        """Index several already-imported documents of one set in one job.
+
+        The documents are embedded and written together by the warm indexer. If
+        that batch fails, each document is retried on its own so one bad
+        document cannot fail its neighbours. Returns per-document success in
+        *doc_dirs* order.
+        """
+        if self.vec_service is None:
+            logger.warning(
+                "No VecService configured; cannot index %d doc(s)", len(doc_dirs)
+            )
+            return [False] * len(doc_dirs)
+        if len(doc_dirs) <= 1:
+            return [self.index_existing(d, evidence_set) for d in doc_dirs]
+
+        items = [self._index_payload(d) for d in doc_dirs]
+        logger.info(
+            "Indexing %d existing docs into '%s'", len(items), evidence_set.slug
+        )
+        try:
+            ok, msg = self.vec_service.index_documents_isolated(items, evidence_set)
+        except Exception as exc:
+            ok, msg = False, str(exc)
+        if ok:
+            for doc_dir in doc_dirs:
+                self._mark_indexed(doc_dir)
+            return [True] * len(doc_dirs)
+
+        logger.warning(
+            "Batch index of %d docs in '%s' failed (%s); retrying one by one",
+            len(doc_dirs),
+            evidence_set.slug,
+            msg,
+        )
+        return [self.index_existing(d, evidence_set) for d in doc_dirs]
+
+    def copy_documents(
+        self,
+        source: EvidenceSet,
+        doc_uuids: list[str],
+        dest: EvidenceSet,
+    ) -> dict[str, str]:
+        """Copy documents of *source* into *dest*, carrying their vectors over.
+
+        The document directories are copied first (documents already in
+        *dest* are left alone). Their chunks are then transferred from the
+        source index in one batch (see ``VecService.transfer_documents``);
+        only documents without usable vectors are embedded again. Returns
+        ``{doc_uuid: outcome}`` with outcome ``"transferred"``, ``"embedded"``,
+        ``"unindexed"`` (embedding failed), ``"present"`` or ``"missing"``.
+        """
+        from evid.core.evid_meta import write_meta
+
+        outcome: dict[str, str] = {}
+        copied: list[str] = []
+        for i, doc_uuid in enumerate(doc_uuids, 1):
+            self.progress(i, len(doc_uuids), f"Copying {doc_uuid[:8]}…")
+            src_dir = source.path / "docs" / doc_uuid
+            dest_dir = dest.path / "docs" / doc_uuid
+            if dest_dir.exists():
+                outcome[doc_uuid] = "present"
+            elif not src_dir.is_dir():
+                outcome[doc_uuid] = "missing"
+            else:
+                shutil.copytree(src_dir, dest_dir)
+                write_meta(dest_dir, {"notes": "", "indexed": False})
+                copied.append(doc_uuid)
+        if not copied or self.vec_service is None:
+            return outcome | dict.fromkeys(copied, "unindexed")
+
+        self.progress(0, len(copied), "Transferring vectors…")
+        try:
+            counts = self.vec_service.transfer_documents(
+                source,
+                dest,
+                copied,
+                progress=lambda done, total: self.progress(
+                    done, total, "Transferring vectors…"
+                ),
+            )
+        except Exception:
+            logger.exception(
+                "Vector transfer '%s' → '%s' failed; embedding instead",
+                source.slug,
+                dest.slug,
+            )
+            counts = {}
+        for doc_uuid in counts:
+            self._mark_indexed(dest.path / "docs" / doc_uuid)
+            outcome[doc_uuid] = "transferred"
+
+        rest = [u for u in copied if u not in counts]
+        if rest:
+            # The indexer subprocess writes the destination next.
+            self.vec_service.close(dest.slug)
+            self.progress(0, len(rest), f"Embedding {len(rest)} document(s)…")
+            dirs = [dest.path / "docs" / u for u in rest]
+            for doc_uuid, ok in zip(
+                rest, self.index_existing_many(dirs, dest), strict=True
+            ):
+                outcome[doc_uuid] = "embedded" if ok else "unindexed"
+        return outcome
+
+    # ── helpers ───────────────────────────────────────────────────────────────
+
+    def _index_payload(self, doc_dir: Path) -> tuple[Document, str]:
+        """Load an existing doc and the Typst text to index for it."""
         doc = self._load_existing(doc_dir, doc_dir.name)
 
         # Find the typ file (evid uses label.typ; fallback to any *.typ)
@@ -243,34 +383,16 @@ class DocIngester:
             logger.debug(
                 "Embedding %d chars for existing doc %s", len(typ_text), doc_dir.name
             )
+        return doc, typ_text
 
-        logger.info(
-            "Indexing existing doc %s into '%s'", doc_dir.name, evidence_set.slug
-        )
-        try:
-            ok, msg = self.vec_service.index_document_isolated(
-                doc, typ_text, evidence_set
-            )
-            if not ok:
-                logger.warning("Isolated index failed for %s: %s", doc_dir.name, msg)
-                return False
-        except Exception:
-            logger.exception("VecService.index_document failed for %s", doc_dir.name)
-            return False
-
+    @staticmethod
+    def _mark_indexed(doc_dir: Path) -> None:
         from evid.core.evid_meta import read_meta, write_meta
 
         meta = read_meta(doc_dir)
         meta["indexed"] = True
         write_meta(doc_dir, meta)
 
-        logger.info(
-            "Indexed existing doc %s into set '%s'", doc_dir.name, evidence_set.slug
-        )
-        return True
-
-    # ── helpers ───────────────────────────────────────────────────────────────
-
     def _make_document(
         self,
         doc_dir: Path,
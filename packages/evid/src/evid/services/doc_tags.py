@@ -7,6 +7,7 @@ from pathlib import Path
 
 import yaml
 
+from evid.core.generation import bump_doc_generation
 from evid.models import TagItem
 from evid.services.tag_service import TagService
 
@@ -65,6 +66,7 @@ def _write_info_tags(info_path: Path, tags: list[str]) -> None:
     info["tags"] = format_tags_field(tags)
     with info_path.open("w", encoding="utf-8") as f:
         yaml.safe_dump(info, f, allow_unicode=True)
+    bump_doc_generation(info_path.parent)
 
 
 def assign_doc_tag(
@@ -11,6 +11,10 @@ An evid directory has the layout:
 evidmgr adds:
     evidmgr_meta.yml    # notes, indexed
     set.yml             # top-level set metadata (created once per dataset)
+
+A dataset directory may also hold ``vecindex.npz``, written by
+``evid set export-index``. When its embedding model is the active one, the
+imported documents take their vectors from it instead of being re-embedded.
 """
 
 from __future__ import annotations
@@ -163,24 +167,69 @@ def _import_dataset(
 
     docs_dir = evidence_set.path / "docs"
     total_docs = len(uuid_dirs)
+    imported: set[str] = set()
 
     for doc_idx, src_uuid_dir in enumerate(uuid_dirs, 1):
         progress(doc_idx, total_docs, f"Importing {src_uuid_dir.name}")
         try:
-            _import_doc(src_uuid_dir, docs_dir)
+            if _import_doc(src_uuid_dir, docs_dir):
+                imported.add(src_uuid_dir.name)
         except Exception:
             logger.exception("Failed to import doc %s", src_uuid_dir.name)
 
+    from evid.vec.snapshot import SNAPSHOT_FILE
+
+    snapshot = uuid_dirs[0].parent / SNAPSHOT_FILE
+    if imported and snapshot.exists():
+        _import_vectors(snapshot, evidence_set, imported, progress)
     return evidence_set
 
 
-def _import_doc(src_dir: Path, dest_docs_dir: Path) -> None:
-    """Copy one evid UUID directory into dest_docs_dir and add evidmgr_meta.yml."""
+def _import_vectors(
+    snapshot: Path,
+    evidence_set: EvidenceSet,
+    doc_uuids: set[str],
+    progress: ProgressCallback,
+) -> None:
+    """Load the imported documents' vectors from the dataset's index snapshot."""
+    from evid.services.vec_service import VecService
+
+    svc = VecService()
+    try:
+        counts = svc.import_index(
+            evidence_set,
+            snapshot,
+            doc_uuids=doc_uuids,
+            progress=lambda done, total: progress(
+                done, total, f"Importing vectors from {snapshot.name}"
+            ),
+        )
+    except ValueError as exc:
+        logger.warning("Not using %s: %s", snapshot, exc)
+        return
+    except Exception:
+        logger.exception("Failed to import vectors from %s", snapshot)
+        return
+    finally:
+        svc.close(evidence_set.slug)
+    logger.info(
+        "Took vectors for %d of %d imported docs from %s",
+        len(counts),
+        len(doc_uuids),
+        snapshot,
+    )
+
+
+def _import_doc(src_dir: Path, dest_docs_dir: Path) -> bool:
+    """Copy one evid UUID directory into dest_docs_dir and add evidmgr_meta.yml.
+
+    Returns False if the document was already there.
+    """
     dest_dir = dest_docs_dir / src_dir.name
 
     if dest_dir.exists():
         logger.debug("Doc %s already imported, skipping", src_dir.name)
-        return
+        return False
 
     # Copy the whole UUID dir (info.yml, original file, label.* if present)
     shutil.copytree(src_dir, dest_dir)
@@ -192,3 +241,4 @@ def _import_doc(src_dir: Path, dest_docs_dir: Path) -> None:
         write_meta(dest_dir, dict(_DEFAULT_META))
 
     logger.debug("Imported doc %s", src_dir.name)
+    return True
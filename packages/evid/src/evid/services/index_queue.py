@@ -0,0 +1,233 @@
+"""IndexScheduler — prioritised background indexing, serialised per set.
+
+Jobs for *different* sets run in parallel (one worker thread per warm indexer
+process, see :mod:`evid.vec.safe_index`); jobs for the *same* set never overlap,
+so only one writer touches a set's vecdb at a time. Queued jobs for the same set
+and priority are handed to the runner together, so dropping 200 PDFs costs a
+handful of embed + write passes rather than 200 separate jobs.
+
+Qt-free so the CLI can use it too; the GUI wraps it in ``IndexQueueWorker``.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from evid.models import EvidenceSet
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_VISIBLE = 0  # the document the user is looking at
+PRIORITY_NORMAL = 10  # everything else, in submission order
+
+DEFAULT_BATCH_SIZE = 16
+
+# Runner: (evidence_set, doc_dirs) -> per-doc success, in doc_dirs order.
+BatchRunner = Callable[["EvidenceSet", list[Path]], list[bool]]
+# on_done(set_slug, doc_uuid, ok); on_pending(n); on_idle()
+DoneCallback = Callable[[str, str, bool], None]
+PendingCallback = Callable[[int], None]
+IdleCallback = Callable[[], None]
+
+
+@dataclass
+class _Job:
+    priority: int
+    seq: int
+    doc_dir: Path
+    evidence_set: EvidenceSet
+
+    @property
+    def slug(self) -> str:
+        return self.evidence_set.slug
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return self.evidence_set.slug, self.doc_dir.name
+
+
+def _noop(*_args: object) -> None:
+    return None
+
+
+class IndexScheduler:
+    """Run *runner* over queued documents on *workers* threads.
+
+    A document queued twice is indexed once (at the better of the two
+    priorities). ``stop()`` lets the queue drain and then ends the threads;
+    ``cancel()`` drops queued (not in-flight) jobs.
+    """
+
+    def __init__(
+        self,
+        runner: BatchRunner,
+        *,
+        workers: int = 2,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        on_done: DoneCallback = _noop,
+        on_pending: PendingCallback = _noop,
+        on_idle: IdleCallback = _noop,
+    ) -> None:
+        self._runner = runner
+        self._n_workers = max(1, workers)
+        self._batch_size = max(1, batch_size)
+        self._on_done = on_done
+        self._on_pending = on_pending
+        self._on_idle = on_idle
+        self._cond = threading.Condition()
+        self._jobs: dict[tuple[str, str], _Job] = {}  # queued, by (slug, uuid)
+        self._busy: set[str] = set()  # slugs with a batch in flight
+        self._in_flight = 0
+        self._seq = itertools.count()
+        self._stopping = False
+        self._threads: list[threading.Thread] = []
+
+    # ── public API ────────────────────────────────────────────────────────────
+
+    @property
+    def pending(self) -> int:
+        """Jobs queued or in flight."""
+        with self._cond:
+            return len(self._jobs) + self._in_flight
+
+    def submit(
+        self,
+        doc_dir: Path,
+        evidence_set: EvidenceSet,
+        priority: int = PRIORITY_NORMAL,
+    ) -> None:
+        """Queue *doc_dir* for indexing into *evidence_set*."""
+        with self._cond:
+            job = _Job(priority, next(self._seq), doc_dir, evidence_set)
+            queued = self._jobs.get(job.key)
+            if queued is None:
+                self._jobs[job.key] = job
+            else:
+                queued.priority = min(queued.priority, priority)
+            pending = len(self._jobs) + self._in_flight
+            self._cond.notify_all()
+        self._on_pending(pending)
+
+    def prioritize(self, doc_uuid: str, priority: int = PRIORITY_VISIBLE) -> bool:
+        """Move a queued document ahead of the rest. False if not queued."""
+        with self._cond:
+            found = False
+            for job in self._jobs.values():
+                if job.doc_dir.name == doc_uuid:
+                    job.priority = min(job.priority, priority)
+                    found = True
+            return found
+
+    def cancel(self, doc_uuid: str, slug: str | None = None) -> bool:
+        """Drop a queued document (in any set, or only *slug*'s)."""
+        with self._cond:
+            keys = [
+                k
+                for k in self._jobs
+                if k[1] == doc_uuid and (slug is None or k[0] == slug)
+            ]
+            for k in keys:
+                del self._jobs[k]
+            pending = len(self._jobs) + self._in_flight
+        if keys:
+            self._on_pending(pending)
+            if pending == 0:
+                self._on_idle()
+        return bool(keys)
+
+    def cancel_all(self) -> int:
+        """Drop every queued job; returns how many were dropped."""
+        with self._cond:
+            dropped = len(self._jobs)
+            self._jobs.clear()
+            pending = self._in_flight
+        if dropped:
+            self._on_pending(pending)
+            if pending == 0:
+                self._on_idle()
+        return dropped
+
+    def start(self) -> None:
+        for i in range(self._n_workers):
+            t = threading.Thread(
+                target=self._work, name=f"index-queue-{i + 1}", daemon=True
+            )
+            t.start()
+            self._threads.append(t)
+
+    def stop(self) -> None:
+        """Finish the queued jobs, then let the worker threads exit."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+
+    def join(self, timeout: float | None = None) -> None:
+        for t in self._threads:
+            t.join(timeout)
+
+    # ── workers ───────────────────────────────────────────────────────────────
+
+    def _take_batch(self) -> list[_Job]:
+        """Pop the best runnable job plus same-set, same-priority followers.
+
+        Called with the lock held; returns [] when every queued job belongs to
+        a set that is already being written.
+        """
+        runnable = [j for j in self._jobs.values() if j.slug not in self._busy]
+        if not runnable:
+            return []
+        head = min(runnable, key=lambda j: (j.priority, j.seq))
+        batch = sorted(
+            (
+                j
+                for j in runnable
+                if j.slug == head.slug and j.priority == head.priority
+            ),
+            key=lambda j: j.seq,
+        )[: self._batch_size]
+        for j in batch:
+            del self._jobs[j.key]
+        self._busy.add(head.slug)
+        self._in_flight += len(batch)
+        return batch
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                batch = self._take_batch()
+                while not batch:
+                    if self._stopping and not self._jobs:
+                        return
+                    self._cond.wait()
+                    batch = self._take_batch()
+
+            evidence_set = batch[0].evidence_set
+            try:
+                results = list(self._runner(evidence_set, [j.doc_dir for j in batch]))
+            except Exception:
+                logger.exception(
+                    "Background index of %d doc(s) in '%s' failed",
+                    len(batch),
+                    evidence_set.slug,
+                )
+                results = []
+            results += [False] * (len(batch) - len(results))
+
+            with self._cond:
+                self._busy.discard(evidence_set.slug)
+                self._in_flight -= len(batch)
+                pending = len(self._jobs) + self._in_flight
+                self._cond.notify_all()
+
+            for job, ok in zip(batch, results, strict=False):
+                self._on_done(job.slug, job.doc_dir.name, bool(ok))
+            self._on_pending(pending)
+            if pending == 0:
+                self._on_idle()
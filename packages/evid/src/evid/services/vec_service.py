@@ -1,4 +1,4 @@
-"""VecService — per-set ChromaDB client wrapping vecdb."""
+"""VecService — per-set vector store (ChromaDB or NumPy) wrapping vecdb."""
 
 from __future__ import annotations
 
@@ -7,39 +7,253 @@ from datetime import UTC
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from evid import tracing
+from evid.core.generation import bump_generation
+
 if TYPE_CHECKING:
-    from evid.models import Document, EvidenceSet, VecResult
+    import numpy as np
+
+    from evid.models import Document, EvidenceSet, VacuumReport, VecResult
 
 logger = logging.getLogger(__name__)
 
-_COLLECTION_NAME = "docs"
+_TRANSFER_DOCS = 100  # documents read per transfer batch
+_ADD_BATCH = 2000  # records per collection.add
+_DELETE_DOCS = 500  # documents per collection.delete
+_COMPACT_AT = 0.1  # dead share of the store that triggers compaction in vacuum
 
 
 class VecService:
-    """One ChromaDB PersistentClient per EvidenceSet, opened lazily."""
+    """One vector-store client per EvidenceSet, opened lazily.
+
+    The client is a ChromaDB ``PersistentClient`` or a
+    :class:`~evid.vec.npstore.NumpyStore`, whichever the set's ``vecdb/``
+    holds (see :func:`evid.vec.db.vector_backend`).
+    """
 
     def __init__(self) -> None:
-        self._clients: dict[str, object] = {}  # slug → chromadb.PersistentClient
+        self._clients: dict[str, object] = {}  # slug → PersistentClient/NumpyStore
+        self._warned_space: set[str] = set()
 
     def _client(self, evidence_set: EvidenceSet) -> object:
         slug = evidence_set.slug
         if slug not in self._clients:
-            from evid.vec.db import get_client
+            from evid.vec.db import open_client
 
             vecdb_dir = evidence_set.path / "vecdb"
             vecdb_dir.mkdir(exist_ok=True)
-            self._clients[slug] = get_client(str(vecdb_dir))
+            self._clients[slug] = open_client(vecdb_dir)
         return self._clients[slug]
 
     def _collection(self, evidence_set: EvidenceSet) -> object:
-        client = self._client(evidence_set)
-        try:
-            return client.get_collection(_COLLECTION_NAME)
-        except Exception:
-            return client.create_collection(_COLLECTION_NAME)
+        from evid.vec.db import open_collection
+
+        return open_collection(self._client(evidence_set))
+
+    def needs_migration(self, evidence_set: EvidenceSet) -> bool:
+        """True if the set's index differs from the configured HNSW settings."""
+        from evid.vec.db import needs_migration
+
+        return needs_migration(self._collection(evidence_set))
+
+    def migrate(self, evidence_set: EvidenceSet, progress=None) -> int:
+        """Rebuild the set's collection with the configured HNSW settings.
+
+        Copies the stored vectors (no re-embedding); see
+        :func:`evid.vec.db.migrate_collection`. Returns the number copied.
+        """
+        from evid.vec.db import migrate_collection
+
+        with tracing.span("index.migrate", set=evidence_set.slug):
+            n = migrate_collection(self._client(evidence_set), progress=progress)
+        bump_generation(evidence_set.path)
+        return n
+
+    def backend(self, evidence_set: EvidenceSet) -> str:
+        """``"chroma"`` or ``"numpy"``: the set's vector backend."""
+        from evid.vec.db import vector_backend
+
+        return vector_backend(evidence_set.path / "vecdb")
+
+    def convert(
+        self,
+        evidence_set: EvidenceSet,
+        backend: str,
+        dtype: str = "float32",
+        progress=None,
+    ) -> int:
+        """Move the set's index to *backend*, copying the stored vectors.
+
+        See :func:`evid.vec.db.convert_backend`. Returns the number copied.
+        """
+        from evid.vec.db import convert_backend
+
+        self.close(evidence_set.slug)
+        vecdb_dir = evidence_set.path / "vecdb"
+        vecdb_dir.mkdir(exist_ok=True)
+        with tracing.span("index.convert", set=evidence_set.slug, backend=backend):
+            n = convert_backend(vecdb_dir, backend, dtype=dtype, progress=progress)
+        bump_generation(evidence_set.path)
+        return n
+
+    def export_index(
+        self,
+        evidence_set: EvidenceSet,
+        path: Path,
+        dtype: str = "float32",
+        progress=None,
+    ) -> int:
+        """Write the set's chunks and embeddings to a snapshot file.
+
+        See :mod:`evid.vec.snapshot`. Returns the number of chunks written.
+        """
+        from evid.vec.snapshot import write_snapshot
+
+        with tracing.span("index.export", set=evidence_set.slug):
+            return write_snapshot(
+                self._collection(evidence_set), path, dtype=dtype, progress=progress
+            )
+
+    def import_index(
+        self,
+        evidence_set: EvidenceSet,
+        path: Path,
+        doc_uuids: set[str] | None = None,
+        progress=None,
+    ) -> dict[str, int]:
+        """Load a snapshot's vectors into the set, without re-embedding.
+
+        Only documents present in the set's ``docs/`` (and in *doc_uuids*, if
+        given) are imported; their existing chunks are replaced and they are
+        marked indexed. Raises ValueError if the snapshot was made with
+        another embedding model. *progress* is called with ``(done, total)``
+        chunks. Returns ``{doc_uuid: n_chunks}``.
+        """
+        from collections import Counter
+
+        import numpy as np
+
+        from evid.core.evid_meta import read_meta, write_meta
+        from evid.vec.docvecs import CentroidSums, write_centroids
+        from evid.vec.embeddings import model_name
+        from evid.vec.snapshot import Snapshot
+
+        snapshot = Snapshot(path)
+        snapshot.check_model(model_name())
+        docs_dir = evidence_set.path / "docs"
+        present = {
+            u
+            for u in set(snapshot.doc_uuids)
+            if (docs_dir / u).is_dir() and (doc_uuids is None or u in doc_uuids)
+        }
+        rows = np.flatnonzero([u in present for u in snapshot.doc_uuids])
+        counts = dict(Counter(snapshot.doc_uuids[i] for i in rows))
+        if not counts:
+            return counts
+
+        collection = self._collection(evidence_set)
+        with tracing.span("index.import", set=evidence_set.slug, chunks=len(rows)):
+            collection.modify(metadata={"embedding_model": model_name()})
+            uuids = sorted(counts)
+            for start in range(0, len(uuids), 500):
+                collection.delete(
+                    where={"doc_uuid": {"$in": uuids[start : start + 500]}}
+                )
+            done = 0
+            sums = CentroidSums()
+            for batch in snapshot.batches(rows):
+                collection.add(**batch)
+                sums.add(batch["metadatas"], batch["embeddings"])
+                done += len(batch["ids"])
+                if progress:
+                    progress(done, len(rows))
+        write_centroids(evidence_set.path, sums, model_name())
+        for u in uuids:
+            meta = read_meta(docs_dir / u)
+            if not meta.get("indexed"):
+                meta["indexed"] = True
+                write_meta(docs_dir / u, meta)
+        bump_generation(evidence_set.path)
+        logger.info(
+            "Imported %d chunks of %d documents into '%s'",
+            len(rows),
+            len(counts),
+            evidence_set.slug,
+        )
+        return counts
+
+    def transfer_documents(
+        self,
+        source: EvidenceSet,
+        dest: EvidenceSet,
+        doc_uuids: list[str],
+        progress=None,
+    ) -> dict[str, int]:
+        """Copy the stored chunks of *doc_uuids* from *source* into *dest*.
+
+        Embeddings, texts and metadata are read from the source collection
+        and written as they are, replacing any chunks the documents already
+        have in *dest*. Nothing is transferred if the source was indexed with
+        another embedding model than the active one. *progress* is called
+        with ``(done, total)`` documents. Returns ``{doc_uuid: n_chunks}``;
+        documents missing from it have no usable vectors and must be embedded.
+        """
+        from evid.vec.docvecs import CentroidSums, write_centroids
+        from evid.vec.embeddings import model_name
+
+        counts: dict[str, int] = {}
+        src = self._collection(source)
+        indexed_model = (src.metadata or {}).get("embedding_model")
+        current_model = model_name()
+        if indexed_model != current_model:
+            logger.info(
+                "Set '%s' was indexed with '%s', not '%s'; not transferring vectors",
+                source.slug,
+                indexed_model,
+                current_model,
+            )
+            return counts
+
+        dst = self._collection(dest)
+        dst.modify(metadata={"embedding_model": current_model})
+        sums = CentroidSums()
+        with tracing.span("index.transfer", docs=len(doc_uuids), dest=dest.slug):
+            for start in range(0, len(doc_uuids), _TRANSFER_DOCS):
+                uuids = doc_uuids[start : start + _TRANSFER_DOCS]
+                got = src.get(
+                    where={"doc_uuid": {"$in": uuids}},
+                    include=["embeddings", "documents", "metadatas"],
+                )
+                dst.delete(where={"doc_uuid": {"$in": uuids}})
+                for i in range(0, len(got["ids"]), _ADD_BATCH):
+                    part = slice(i, i + _ADD_BATCH)
+                    dst.add(
+                        ids=got["ids"][part],
+                        embeddings=got["embeddings"][part],
+                        documents=got["documents"][part],
+                        metadatas=got["metadatas"][part],
+                    )
+                sums.add(got["metadatas"], got["embeddings"])
+                for meta in got["metadatas"]:
+                    counts[meta["doc_uuid"]] = counts.get(meta["doc_uuid"], 0) + 1
+                if progress:
+                    progress(
+                        min(start + _TRANSFER_DOCS, len(doc_uuids)), len(doc_uuids)
+                    )
+        write_centroids(dest.path, sums, current_model)
+        if counts:
+            bump_generation(dest.path)
+        logger.info(
+            "Transferred %d chunks of %d documents from '%s' to '%s'",
+            sum(counts.values()),
+            len(counts),
+            source.slug,
+            dest.slug,
+        )
+        return counts
 
     def close(self, slug: str) -> None:
-        """Release the ChromaDB client for a set (frees file lock)."""
+        """Release the vector-store client for a set (frees file lock)."""
         self._clients.pop(slug, None)
 
     # ── indexing ──────────────────────────────────────────────────────────────
@@ -48,10 +262,12 @@ class VecService:
         self, doc: Document, typ_text: str, evidence_set: EvidenceSet
     ) -> None:
         """Chunk *typ_text* and upsert into the set's ChromaDB collection."""
-        from evid.vec.chunking import chunk_text
+        from evid.vec.chunking import chunk_for_embedding
+        from evid.vec.docvecs import CentroidSums, write_centroids
         from evid.vec.embeddings import embed_documents, model_name
 
-        pairs = chunk_text(typ_text)
+        with tracing.span("index.chunk"):
+            pairs = chunk_for_embedding(typ_text)
         if not pairs:
             logger.warning("No chunks for document %s", doc.uuid)
             return
@@ -77,24 +293,27 @@ class VecService:
             for i in range(len(chunks))
         ]
 
-        # Delete any existing chunks for this doc before re-indexing
-        try:
-            collection.delete(where={"doc_uuid": doc.uuid})
-        except Exception:
-            pass  # collection may be empty
+        # Delete any existing chunks for this doc before re-indexing. Errors
+        # propagate: add() does not overwrite ids, so the old chunks would stay.
+        collection.delete(where={"doc_uuid": doc.uuid})
 
         embeddings = embed_documents(chunks)
 
         # ChromaDB has a max batch size (~5461); add in batches to be safe.
         _BATCH = 2000
-        for start in range(0, len(chunks), _BATCH):
-            end = start + _BATCH
-            collection.add(
-                documents=chunks[start:end],
-                embeddings=embeddings[start:end],
-                ids=ids[start:end],
-                metadatas=metadatas[start:end],
-            )
+        with tracing.span("index.chroma_write", chunks=len(chunks)):
+            for start in range(0, len(chunks), _BATCH):
+                end = start + _BATCH
+                collection.add(
+                    documents=chunks[start:end],
+                    embeddings=embeddings[start:end],
+                    ids=ids[start:end],
+                    metadatas=metadatas[start:end],
+                )
+        sums = CentroidSums()
+        sums.add(metadatas, embeddings)
+        write_centroids(evidence_set.path, sums, model_name())
+        bump_generation(evidence_set.path)
         logger.info(
             "Indexed %d chunks for %s in set '%s'",
             len(chunks),
@@ -107,43 +326,155 @@ class VecService:
         doc: Document,
         typ_text: str,
         evidence_set: EvidenceSet,
-        timeout: float = 600.0,
+        timeout: float = 300.0,
     ) -> tuple[bool, str]:
-        """Index *doc* in a spawned subprocess.
+        """Index *doc* in an isolated indexer subprocess.
 
         ChromaDB / sentence-transformers / onnxruntime occasionally crash
         natively (SIGSEGV) on some Linux setups. Running indexing in a child
         process means such a crash kills the child, not the GUI. Returns
         ``(ok, message)``.
         """
-        from evid.vec.safe_index import index_in_subprocess
+        return self.index_documents_isolated(
+            [(doc, typ_text)], evidence_set, timeout=timeout
+        )
+
+    def index_documents_isolated(
+        self,
+        items: list[tuple[Document, str]],
+        evidence_set: EvidenceSet,
+        timeout: float = 300.0,
+    ) -> tuple[bool, str]:
+        """Index several ``(doc, typ_text)`` pairs of one set as a single job.
+
+        The batch runs in a warm, pooled indexer subprocess (see
+        :mod:`evid.vec.safe_index`) and succeeds or fails as a whole. The job
+        is only cut off when the indexer makes no progress for *timeout*
+        seconds, so large batches are not penalised. Returns ``(ok, message)``.
+        """
+        from evid.vec.safe_index import index_batch_in_subprocess
 
         vecdb_dir = evidence_set.path / "vecdb"
-        ok, msg = index_in_subprocess(
-            vecdb_dir,
-            doc.uuid,
-            doc.label,
-            list(doc.tags),
-            typ_text,
-            timeout=timeout,
-        )
+        docs = [
+            {"uuid": d.uuid, "label": d.label, "tags": list(d.tags), "text": text}
+            for d, text in items
+        ]
+        ok, msg = index_batch_in_subprocess(vecdb_dir, docs, stall_timeout=timeout)
+        uuids = ", ".join(d.uuid for d, _ in items)
         if ok:
-            logger.info("Indexed %s in '%s' (isolated)", doc.uuid, evidence_set.slug)
+            bump_generation(evidence_set.path)
+            logger.info("Indexed %s in '%s' (isolated)", uuids, evidence_set.slug)
         else:
             logger.warning(
                 "Isolated indexing for %s in '%s' failed: %s",
-                doc.uuid,
+                uuids,
                 evidence_set.slug,
                 msg,
             )
         return ok, msg
 
     def remove_document(self, doc_uuid: str, evidence_set: EvidenceSet) -> None:
+        self.remove_documents([doc_uuid], evidence_set)
+
+    def remove_documents(self, doc_uuids: list[str], evidence_set: EvidenceSet) -> int:
+        """Delete every chunk of *doc_uuids*; return the number deleted.
+
+        Errors propagate; chunks a failed call leaves behind are swept up by
+        :meth:`vacuum`.
+        """
+        from evid.vec.docvecs import remove_centroids
+
         collection = self._collection(evidence_set)
-        try:
-            collection.delete(where={"doc_uuid": doc_uuid})
-        except Exception:
-            logger.exception("Failed to remove %s from vecdb", doc_uuid)
+        before = collection.count()
+        for start in range(0, len(doc_uuids), _DELETE_DOCS):
+            batch = list(doc_uuids[start : start + _DELETE_DOCS])
+            collection.delete(where={"doc_uuid": {"$in": batch}})
+        remove_centroids(evidence_set.path, doc_uuids)
+        bump_generation(evidence_set.path)
+        return before - collection.count()
+
+    def vacuum(
+        self,
+        evidence_set: EvidenceSet,
+        dry_run: bool = False,
+        compact: bool | None = None,
+        progress=None,
+    ) -> VacuumReport:
+        """Reconcile the set's index with its documents on disk.
+
+        Chunks of documents whose directory is gone are deleted, the
+        ``indexed`` flag of every document is set to whether it has chunks,
+        and the store is compacted when deleted records take up at least
+        :data:`_COMPACT_AT` of it (*compact* True/False forces/forbids this).
+        With *dry_run* nothing is changed and the report says what would be.
+        *progress* is passed on to the compaction, ``(copied, total)``.
+        """
+        from evid.core.evid_meta import read_meta, write_meta
+        from evid.models import VacuumReport
+        from evid.vec import docvecs
+        from evid.vec.db import compact_store, dead_fraction, stored_doc_uuids
+
+        vecdb_dir = evidence_set.path / "vecdb"
+        collection = self._collection(evidence_set)
+        stored = stored_doc_uuids(collection)
+        docs_dir = evidence_set.path / "docs"
+        on_disk = (
+            {d.name for d in docs_dir.iterdir() if d.is_dir()}
+            if docs_dir.is_dir()
+            else set()
+        )
+        orphans = sorted(set(stored) - on_disk)
+        report = VacuumReport(
+            chunks=collection.count(),
+            orphan_docs=orphans,
+            orphan_chunks=sum(stored[u] for u in orphans),
+        )
+        flags = {}
+        for doc_uuid in sorted(on_disk):
+            meta = read_meta(docs_dir / doc_uuid)
+            has_chunks = doc_uuid in stored
+            if bool(meta.get("indexed")) != has_chunks:
+                flags[doc_uuid] = meta
+                if has_chunks:
+                    report.flagged_indexed.append(doc_uuid)
+                else:
+                    report.flagged_unindexed.append(doc_uuid)
+        if dry_run:
+            report.dead_fraction = _dead_after(
+                dead_fraction(vecdb_dir, collection),
+                report.chunks,
+                report.orphan_chunks,
+            )
+            return report
+
+        with tracing.span("index.vacuum", set=evidence_set.slug):
+            if orphans:
+                self.remove_documents(orphans, evidence_set)
+            for doc_uuid, meta in flags.items():
+                write_meta(docs_dir / doc_uuid, {**meta, "indexed": doc_uuid in stored})
+            report.dead_fraction = dead_fraction(vecdb_dir, collection)
+            if compact or (
+                compact is None and (report.dead_fraction or 0.0) >= _COMPACT_AT
+            ):
+                self.close(evidence_set.slug)
+                del collection
+                report.bytes_freed = compact_store(vecdb_dir, progress=progress)
+                report.compacted = True
+                collection = self._collection(evidence_set)
+            if (evidence_set.path / docvecs.DOCVEC_DIR).exists():
+                docvecs.ensure_current(evidence_set.path, collection)
+                report.bytes_freed += docvecs.open_doc_store(
+                    evidence_set.path
+                ).compact()
+        bump_generation(evidence_set.path)
+        logger.info(
+            "Vacuumed '%s': %d orphan chunks, %d flags repaired, %d bytes freed",
+            evidence_set.slug,
+            report.orphan_chunks,
+            len(flags),
+            report.bytes_freed,
+        )
+        return report
 
     # ── querying ──────────────────────────────────────────────────────────────
 
@@ -153,10 +484,40 @@ class VecService:
         query_text: str,
         n_results: int = 10,
         filter_tags: list[str] | None = None,
+        embedding: np.ndarray | None = None,
     ) -> list[VecResult]:
+        """Top *n_results* chunks for *query_text*.
+
+        Pass *embedding* to reuse a query vector computed elsewhere (e.g. one
+        row of a batched :func:`evid.vec.embeddings.embed_queries` call).
+        """
+        return self.query_many(
+            evidence_set,
+            [query_text],
+            n_results,
+            filter_tags,
+            None if embedding is None else [embedding],
+        )[0]
+
+    def query_many(
+        self,
+        evidence_set: EvidenceSet,
+        query_texts: list[str],
+        n_results: int = 10,
+        filter_tags: list[str] | None = None,
+        embeddings: list[np.ndarray] | np.ndarray | None = None,
+    ) -> list[list[VecResult]]:
+        """Top *n_results* chunks for each of *query_texts*, in order.
+
+        All queries are embedded in one forward pass (unless *embeddings* are
+        given) and sent to Chroma as one multi-query request.
+        """
         from evid.models import VecResult
-        from evid.vec.embeddings import embed_query, model_name
+        from evid.vec.db import collection_space, similarity
+        from evid.vec.embeddings import embed_queries, model_name
 
+        if not query_texts:
+            return []
         collection = self._collection(evidence_set)
 
         # ChromaDB raises if n_results > collection count; cap it.
@@ -169,7 +530,7 @@ class VecService:
                 "Vector collection for '%s' is empty — index docs first",
                 evidence_set.slug,
             )
-            return []
+            return [[] for _ in query_texts]
 
         # Warn if the index was built with a different embedding model.
         indexed_model = (collection.metadata or {}).get("embedding_model")
@@ -183,52 +544,109 @@ class VecService:
                 current_model,
                 evidence_set.slug,
             )
+        space = collection_space(collection)
+        if space != "cosine" and evidence_set.slug not in self._warned_space:
+            self._warned_space.add(evidence_set.slug)
+            logger.warning(
+                "Set '%s' has an %s-space vector index; scores are converted, "
+                "but run `evid set migrate-index -s %s` to rebuild it in cosine "
+                "space with the configured HNSW settings.",
+                evidence_set.slug,
+                space,
+                evidence_set.slug,
+            )
         n_results = min(n_results, count)
         logger.debug(
-            "Vector query on '%s': %d chunks available, n_results=%d",
+            "Vector query on '%s': %d chunks available, %d queries, n_results=%d",
             evidence_set.slug,
             count,
+            len(query_texts),
             n_results,
         )
 
         where: dict | None = None
-        embedding = embed_query(query_text)
-        results = collection.query(
-            query_embeddings=[embedding],
-            n_results=n_results,
-            where=where,
-        )
+        if embeddings is None:
+            embeddings = embed_queries(list(query_texts))
+        with tracing.span("search.vec.chroma", queries=len(query_texts)):
+            results = collection.query(
+                query_embeddings=list(embeddings),
+                n_results=n_results,
+                where=where,
+            )
 
-        vec_results = []
         docs_cache: dict[str, Document] = {}
-        for i, _doc_id in enumerate(results["ids"][0]):
-            meta = results["metadatas"][0][i]
-            distance = results["distances"][0][i]
-            chunk_text = results["documents"][0][i]
-            doc_uuid = meta["doc_uuid"]
-
-            # Tag filter is applied client-side (ChromaDB doesn't support array contains)
-            if filter_tags:
-                doc_tags = {
-                    t.strip() for t in meta.get("tags", "").split(",") if t.strip()
-                }
-                if not doc_tags.issuperset(filter_tags):
-                    continue
-
-            if doc_uuid not in docs_cache:
-                doc_dir = evidence_set.path / "docs" / doc_uuid
-                docs_cache[doc_uuid] = self._load_document(doc_dir, doc_uuid)
-
-            vec_results.append(
-                VecResult(
-                    doc=docs_cache[doc_uuid],
-                    chunk_text=chunk_text,
-                    score=1.0 - distance,  # cosine distance → similarity
-                    chunk_idx=meta.get("chunk_idx", 0),
-                    char_start=meta.get("char_start", 0),
+        out: list[list[VecResult]] = []
+        for q in range(len(query_texts)):
+            vec_results = []
+            for i, _doc_id in enumerate(results["ids"][q]):
+                meta = results["metadatas"][q][i]
+                distance = results["distances"][q][i]
+                chunk_text = results["documents"][q][i]
+                doc_uuid = meta["doc_uuid"]
+
+                # Tag filter is applied client-side (ChromaDB doesn't support
+                # array contains)
+                if filter_tags:
+                    doc_tags = {
+                        t.strip() for t in meta.get("tags", "").split(",") if t.strip()
+                    }
+                    if not doc_tags.issuperset(filter_tags):
+                        continue
+
+                if doc_uuid not in docs_cache:
+                    doc_dir = evidence_set.path / "docs" / doc_uuid
+                    docs_cache[doc_uuid] = self._load_document(doc_dir, doc_uuid)
+
+                vec_results.append(
+                    VecResult(
+                        doc=docs_cache[doc_uuid],
+                        chunk_text=chunk_text,
+                        score=similarity(distance, space),
+                        chunk_idx=meta.get("chunk_idx", 0),
+                        char_start=meta.get("char_start", 0),
+                    )
                 )
+            out.append(vec_results)
+        return out
+
+    def similar(
+        self, evidence_set: EvidenceSet, doc_uuid: str, n_results: int = 10
+    ) -> list[tuple[Document, float]]:
+        """The *n_results* documents most like *doc_uuid*, with cosine scores.
+
+        One lookup in the set's document-level index (see
+        :mod:`evid.vec.docvecs`), built from the chunk vectors first if it is
+        missing or out of date. Documents no longer on disk are skipped.
+        Raises KeyError if *doc_uuid* has no indexed chunks.
+        """
+        from evid.vec.docvecs import similar_documents
+
+        docs_dir = evidence_set.path / "docs"
+        with tracing.span("search.similar", set=evidence_set.slug):
+            # Ask for a few extra in case some indexed documents were deleted.
+            hits = similar_documents(
+                evidence_set.path,
+                self._collection(evidence_set),
+                doc_uuid,
+                n_results + 10,
             )
-        return vec_results
+        return [
+            (self._load_document(docs_dir / u, u), score)
+            for u, score in hits
+            if (docs_dir / u).is_dir()
+        ][:n_results]
+
+    def get_chunk(
+        self, evidence_set: EvidenceSet, doc_uuid: str, chunk_idx: int
+    ) -> tuple[str, int] | None:
+        """``(chunk_text, char_start)`` of one indexed chunk, or None."""
+        collection = self._collection(evidence_set)
+        got = collection.get(
+            ids=[f"{doc_uuid}:{chunk_idx}"], include=["documents", "metadatas"]
+        )
+        if not got["ids"]:
+            return None
+        return got["documents"][0], (got["metadatas"][0] or {}).get("char_start", 0)
 
     # ── internal ──────────────────────────────────────────────────────────────
 
@@ -269,3 +687,11 @@ class VecService:
             notes=meta.get("notes", ""),
             source_url=info.get("url", ""),
         )
+
+
+def _dead_after(dead: float | None, chunks: int, removed: int) -> float | None:
+    """Dead share of a store of *chunks* live records after deleting *removed*."""
+    if dead is None or not chunks:
+        return dead
+    total = chunks / (1 - dead) if dead < 1 else chunks
+    return 1 - (chunks - removed) / total
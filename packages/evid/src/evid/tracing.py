@@ -0,0 +1,193 @@
+"""Timing spans and counters for evid's hot paths.
+
+Logging says *what* happened; this says *where the time went*. Stages of
+ingest, indexing, search, gather and the MCP tools run inside
+:func:`span` blocks, and cheap events — chunks embedded, files read,
+subprocesses spawned — are tallied with :func:`count`::
+
+    with tracing.span("ingest.typst_query"):
+        generate_bib_from_typ(typ_path)
+    tracing.count("subprocesses")
+
+Tracing is off by default, and then a span costs one dict lookup. ``evid
+--profile`` turns it on and prints a per-stage breakdown when the command
+exits; ``--trace-file PATH`` (or ``EVID_TRACE_FILE``, handy for the MCP server
+and GUI) also appends every finished span to *PATH* as one JSON object per
+line, followed by the counters when the process exits.
+
+Spans nest per thread/task; each record names its parent span. Work done in
+child processes (isolated indexing) is timed as one span in the parent.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Self
+
+_lock = threading.Lock()
+_state: dict = {"enabled": False, "sink": None}
+# span name -> [calls, total seconds, max seconds]
+_spans: dict[str, list] = {}
+_counters: dict[str, int] = {}
+_parent: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "evid_span", default=None
+)
+_NULL = contextlib.nullcontext()
+
+
+def enable(trace_file: Path | str | None = None) -> None:
+    """Start recording; with *trace_file*, also append spans to it as JSON lines."""
+    with _lock:
+        _state["enabled"] = True
+        if trace_file and _state["sink"] is None:
+            path = Path(trace_file).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _state["sink"] = path.open("a", encoding="utf-8", buffering=1)
+            atexit.register(disable)
+
+
+def disable() -> None:
+    """Stop recording; write the counters to the trace file and close it."""
+    with _lock:
+        _state["enabled"] = False
+        sink, _state["sink"] = _state["sink"], None
+        if sink is not None:
+            for name, value in sorted(_counters.items()):
+                _write(sink, {"type": "counter", "name": name, "value": value})
+            sink.close()
+
+
+def enabled() -> bool:
+    return _state["enabled"]
+
+
+def reset() -> None:
+    """Forget everything recorded so far."""
+    with _lock:
+        _spans.clear()
+        _counters.clear()
+
+
+def _write(sink, record: dict) -> None:
+    record["pid"] = os.getpid()
+    sink.write(json.dumps(record, default=str) + "\n")
+
+
+class _Span:
+    __slots__ = ("attrs", "name", "parent", "start", "token", "wall")
+
+    def __init__(self, name: str, attrs: dict) -> None:
+        self.name = name
+        self.attrs = attrs
+
+    def __enter__(self) -> Self:
+        self.parent = _parent.get()
+        self.token = _parent.set(self.name)
+        self.wall = time.time()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        elapsed = time.perf_counter() - self.start
+        _parent.reset(self.token)
+        with _lock:
+            stat = _spans.setdefault(self.name, [0, 0.0, 0.0])
+            stat[0] += 1
+            stat[1] += elapsed
+            stat[2] = max(stat[2], elapsed)
+            sink = _state["sink"]
+            if sink is not None:
+                _write(
+                    sink,
+                    {
+                        "type": "span",
+                        "name": self.name,
+                        "parent": self.parent,
+                        "start": round(self.wall, 6),
+                        "ms": round(elapsed * 1000, 3),
+                        "thread": threading.current_thread().name,
+                        "error": exc[0].__name__ if exc[0] else None,
+                        **self.attrs,
+                    },
+                )
+
+
+def span(name: str, **attrs):
+    """Context manager timing the enclosed block as stage *name*.
+
+    *attrs* (sizes, ids) go into the JSON-lines record only.
+    """
+    return _Span(name, attrs) if _state["enabled"] else _NULL
+
+
+def traced(name: str):
+    """Decorator: run the function inside ``span(name)``."""
+
+    def wrap(fn):
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            with span(name):
+                return fn(*args, **kwargs)
+
+        return inner
+
+    return wrap
+
+
+def count(name: str, n: int = 1) -> None:
+    """Add *n* to counter *name* (no-op while tracing is off)."""
+    if _state["enabled"]:
+        with _lock:
+            _counters[name] = _counters.get(name, 0) + n
+
+
+def snapshot() -> dict:
+    """``{"spans": {name: {calls, total_ms, mean_ms, max_ms}}, "counters": {...}}``."""
+    with _lock:
+        spans = {
+            name: {
+                "calls": calls,
+                "total_ms": round(total * 1000, 3),
+                "mean_ms": round(total * 1000 / calls, 3),
+                "max_ms": round(peak * 1000, 3),
+            }
+            for name, (calls, total, peak) in _spans.items()
+        }
+        return {"spans": spans, "counters": dict(_counters)}
+
+
+def print_report(console=None) -> None:
+    """Print the per-stage breakdown (slowest total first) and the counters."""
+    from rich.console import Console
+    from rich.table import Table
+
+    console = console or Console(stderr=True)
+    data = snapshot()
+    table = Table(title="Profile", title_justify="left")
+    table.add_column("Stage")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total ms", justify="right")
+    table.add_column("Mean ms", justify="right")
+    table.add_column("Max ms", justify="right")
+    rows = sorted(data["spans"].items(), key=lambda kv: -kv[1]["total_ms"])
+    for name, s in rows:
+        table.add_row(
+            name,
+            str(s["calls"]),
+            f"{s['total_ms']:.1f}",
+            f"{s['mean_ms']:.1f}",
+            f"{s['max_ms']:.1f}",
+        )
+    console.print(table)
+    if data["counters"]:
+        console.print(
+            "  ".join(f"{k}={v}" for k, v in sorted(data["counters"].items()))
+        )
@@ -5,36 +5,171 @@ its own line into a one-word chunk, which then embeds and surfaces as a
 context-free top hit. `chunk_text` merges sub-`MIN_CHARS` fragments into a
 neighbour so only substantial passages are indexed.
 
+The embedding model silently truncates anything past its window (512 tokens
+for e5), so a long paragraph used to cost a full forward pass while only its
+opening was ever searchable. Given a token budget, `chunk_text` also splits
+oversized chunks on sentence boundaries (falling back to word boundaries for a
+single runaway sentence), optionally carrying a few sentences of overlap into
+the next piece. `chunk_for_embedding` takes the budget from the active model's
+tokenizer.
+
 Both `evid.services.vec_service` and `evid.vec.safe_index` use this so the two
 indexing paths stay in sync.
 """
 
 from __future__ import annotations
 
+import re
+from collections.abc import Callable
+
 MIN_CHARS = 80  # fragments shorter than this are merged into a neighbour
+# Bump when chunk boundaries change for the same text and settings; index
+# snapshots (evid.vec.snapshot) record it.
+CHUNKER_VERSION = 1
 _JOIN = "\n"
 
+# Sentence ends: terminator run (plus closing quotes/brackets) before
+# whitespace, or a line break.
+_SENTENCE_END = re.compile("[.!?]+[\"'\u201d\u2019)\\]]*(?=\\s)|\n")
+_WORD = re.compile(r"\S+")
+
+# count_tokens(texts) -> token count per text
+TokenCounter = Callable[[list[str]], list[int]]
+
+
+def approx_tokens(texts: list[str]) -> list[int]:
+    """Cheap token estimate (~4 characters per token) when no tokenizer is at hand."""
+    return [len(t) // 4 + 1 for t in texts]
+
 
 def _fragments(text: str) -> list[tuple[str, int]]:
     """Split on blank lines, returning (fragment, char_start) for each non-empty
     fragment. char_start is the offset of the fragment's first character in the
-    original *text*, found with a forward-advancing scan."""
+    original *text*, computed from the split lengths — no rescanning."""
     frags: list[tuple[str, int]] = []
     pos = 0
     for raw in text.split("\n\n"):
         frag = raw.strip()
-        if not frag:
-            continue
-        idx = text.find(frag, pos)
-        start = idx if idx >= 0 else pos
-        frags.append((frag, start))
-        if idx >= 0:
-            pos = idx + len(frag)
+        if frag:
+            frags.append((frag, pos + len(raw) - len(raw.lstrip())))
+        pos += len(raw) + 2
     return frags
 
 
-def chunk_text(text: str) -> list[tuple[str, int]]:
-    """Split *text* on blank lines, then merge short fragments into a neighbour.
+def _merge_short(frags: list[tuple[str, int]]) -> list[list[tuple[str, int]]]:
+    """Group fragments so that no group's joined text is under ``MIN_CHARS``.
+
+    A fragment shorter than ``MIN_CHARS`` is appended to the previous group; a
+    leading short fragment (e.g. a heading with no preceding chunk) is held and
+    prepended to the next one.
+    """
+    groups: list[list[tuple[str, int]]] = []
+    pending: list[tuple[str, int]] = []
+    for frag in frags:
+        cur = [*pending, frag]
+        pending = []
+        size = sum(len(f) for f, _ in cur) + len(_JOIN) * (len(cur) - 1)
+        if size < MIN_CHARS:
+            if groups:
+                groups[-1].extend(cur)
+            else:
+                pending = cur
+        else:
+            groups.append(cur)
+    if pending:
+        if groups:
+            groups[-1].extend(pending)
+        else:
+            groups.append(pending)
+    return groups
+
+
+def _sentences(frag: str, start: int) -> list[tuple[int, int]]:
+    """Absolute ``(start, end)`` spans of the sentences in *frag*."""
+    spans: list[tuple[int, int]] = []
+    lo = 0
+    for m in _SENTENCE_END.finditer(frag):
+        piece = frag[lo : m.end()]
+        if piece.strip():
+            lead = len(piece) - len(piece.lstrip())
+            spans.append((start + lo + lead, start + lo + len(piece.rstrip())))
+        lo = m.end()
+    tail = frag[lo:]
+    if tail.strip():
+        lead = len(tail) - len(tail.lstrip())
+        spans.append((start + lo + lead, start + lo + len(tail.rstrip())))
+    return spans
+
+
+def _render(text: str, units: list[tuple[int, int, int]]) -> str:
+    """Chunk text for *units*: verbatim within a fragment, ``_JOIN`` between."""
+    parts: list[str] = []
+    i = 0
+    while i < len(units):
+        j = i
+        while j + 1 < len(units) and units[j + 1][2] == units[i][2]:
+            j += 1
+        parts.append(text[units[i][0] : units[j][1]])
+        i = j + 1
+    return _JOIN.join(parts)
+
+
+def _split_group(
+    text: str,
+    group: list[tuple[str, int]],
+    max_tokens: int,
+    overlap: int,
+    count_tokens: TokenCounter,
+) -> list[tuple[str, int]]:
+    """Pack a merged group's sentences into pieces of at most *max_tokens*."""
+    # units: (start, end, fragment index); sentence level, word level if needed
+    sents = [
+        (s, e, k)
+        for k, (frag, fstart) in enumerate(group)
+        for s, e in _sentences(frag, fstart)
+    ]
+    counts = count_tokens([text[s:e] for s, e, _ in sents])
+    units: list[tuple[int, int, int]] = []
+    tokens: list[int] = []
+    for (s, e, k), n in zip(sents, counts, strict=True):
+        if n <= max_tokens:
+            units.append((s, e, k))
+            tokens.append(n)
+            continue
+        words = [(s + m.start(), s + m.end(), k) for m in _WORD.finditer(text[s:e])]
+        per_word = count_tokens([text[ws:we] for ws, we, _ in words])
+        units.extend(words)
+        tokens.extend(per_word)
+
+    pieces: list[tuple[str, int]] = []
+    cur: list[int] = []  # unit indices
+    cur_tokens = 0
+    for i, n in enumerate(tokens):
+        if cur and cur_tokens + n > max_tokens:
+            pieces.append((_render(text, [units[u] for u in cur]), units[cur[0]][0]))
+            # carry trailing units (up to *overlap* tokens) into the next piece
+            keep: list[int] = []
+            kept = 0
+            for u in reversed(cur):
+                if kept + tokens[u] > overlap or kept + tokens[u] + n > max_tokens:
+                    break
+                keep.insert(0, u)
+                kept += tokens[u]
+            cur, cur_tokens = keep, kept
+        cur.append(i)
+        cur_tokens += n
+    if cur:
+        pieces.append((_render(text, [units[u] for u in cur]), units[cur[0]][0]))
+    return pieces
+
+
+def chunk_text(
+    text: str,
+    max_tokens: int | None = None,
+    overlap: int = 0,
+    count_tokens: TokenCounter | None = None,
+) -> list[tuple[str, int]]:
+    """Split *text* on blank lines, merge short fragments, cap chunk size.
 
     Returns a list of ``(chunk, char_start)`` where char_start is the offset of
     the chunk's first character in the original *text*. A fragment shorter than
@@ -42,32 +177,39 @@ def chunk_text(text: str) -> list[tuple[str, int]]:
     fragment (e.g. a heading with no preceding chunk) is held and prepended to
     the next chunk. A document of only short fragments collapses to one chunk;
     a single fragment ``>= MIN_CHARS`` passes through unchanged.
+
+    With *max_tokens*, a chunk whose token count (per *count_tokens*, default
+    :func:`approx_tokens`) exceeds the budget is split on sentence boundaries
+    into pieces that fit, each starting with up to *overlap* tokens of the
+    previous piece's closing sentences.
     """
-    frags = _fragments(text)
-    if not frags:
-        return []
-
-    chunks: list[list] = []  # [chunk_text, char_start]
-    pending: tuple[str, int] | None = None  # leading short fragment held over
-
-    for frag, start in frags:
-        cur_frag, cur_start = frag, start
-        if pending is not None:
-            cur_frag = pending[0] + _JOIN + cur_frag
-            cur_start = pending[1]
-            pending = None
-        if len(cur_frag) < MIN_CHARS:
-            if chunks:
-                chunks[-1][0] = chunks[-1][0] + _JOIN + cur_frag
-            else:
-                pending = (cur_frag, cur_start)
-        else:
-            chunks.append([cur_frag, cur_start])
+    groups = _merge_short(_fragments(text))
+    if max_tokens is None:
+        return [(_JOIN.join(f for f, _ in g), g[0][1]) for g in groups]
 
-    if pending is not None:
-        if chunks:
-            chunks[-1][0] = chunks[-1][0] + _JOIN + pending[0]
+    count_tokens = count_tokens or approx_tokens
+    joined = [_JOIN.join(f for f, _ in g) for g in groups]
+    totals = count_tokens(joined)
+    pairs: list[tuple[str, int]] = []
+    for group, chunk, n in zip(groups, joined, totals, strict=True):
+        if n <= max_tokens:
+            pairs.append((chunk, group[0][1]))
         else:
-            chunks.append([pending[0], pending[1]])
+            pairs.extend(_split_group(text, group, max_tokens, overlap, count_tokens))
+    return pairs
+
+
+def chunk_for_embedding(text: str, overlap: int | None = None) -> list[tuple[str, int]]:
+    """`chunk_text` sized to the active embedding model's window.
+
+    Loads the model (which the caller is about to embed with anyway) for its
+    tokenizer; *overlap* defaults to ``EvidConfig.chunk_overlap_tokens``.
+    """
+    from evid.vec.embeddings import token_budget
+
+    max_tokens, count_tokens = token_budget()
+    if overlap is None:
+        from evid.config import EvidConfig
 
-    return [(c, s) for c, s in chunks]
+        overlap = EvidConfig.cached().chunk_overlap_tokens
+    return chunk_text(text, max_tokens, overlap, count_tokens)
@@ -1,4 +1,49 @@
-"""ChromaDB client helper."""
+"""Vector-store clients and set-collection helpers.
+
+Every set keeps its chunks in one collection, ``docs``. Embeddings are
+normalised, so the collection is built in cosine space, with the HNSW
+parameters from :class:`~evid.config.EvidConfig`:
+
+* ``hnsw_max_neighbors`` (M) and ``hnsw_ef_construction`` shape the graph and
+  are fixed when the collection is built; :func:`migrate_collection` rebuilds
+  an existing one (Chroma's default L2 space, or other values) from its stored
+  vectors, without re-embedding.
+* ``hnsw_ef_search`` is the search-time candidate list. It is written to
+  existing collections when they are opened; Chroma reads it when it loads
+  the index, so a change takes effect in processes started afterwards.
+
+``python -m benchmarks.hnsw`` measures recall against query latency for
+candidate values.
+
+A set's ``vecdb/`` may instead hold a :class:`~evid.vec.npstore.NumpyStore`,
+which stands in for the ``docs`` collection. :func:`vector_backend` tells the
+two apart, :func:`open_client` opens either, and :func:`convert_backend`
+moves a set from one to the other.
+
+Deleting records frees no space in either backend: Chroma's HNSW segment
+keeps deleted elements and its old segment directories outlive the
+collections they belonged to, and a NumpyStore only tombstones rows.
+:func:`dead_fraction` estimates the waste and :func:`compact_store` reclaims
+it (``evid set vacuum``).
+"""
+
+from __future__ import annotations
+
+import logging
+import shutil
+import sqlite3
+import uuid
+from collections import Counter
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+COLLECTION = "docs"
+BACKENDS = ("chroma", "numpy")
+_MIGRATING = "docs_migrating"
+_CONVERTING = ".converting"
+_COPY_BATCH = 2000
+_SQLITE = "chroma.sqlite3"
 
 
 def get_client(persist_directory: str):
@@ -9,3 +54,366 @@ def get_client(persist_directory: str):
     return chromadb.PersistentClient(
         path=persist_directory, settings=Settings(anonymized_telemetry=False)
     )
+
+
+def vector_backend(vecdb_dir: str | Path, config=None) -> str:
+    """``"numpy"`` or ``"chroma"``: what *vecdb_dir* holds, else the default."""
+    from evid.vec.npstore import NumpyStore
+
+    vecdb_dir = Path(vecdb_dir)
+    if NumpyStore.exists(vecdb_dir):
+        return "numpy"
+    if (vecdb_dir / "chroma.sqlite3").exists():
+        return "chroma"
+    if config is None:
+        from evid.config import EvidConfig
+
+        config = EvidConfig.cached()
+    return config.vector_backend
+
+
+def open_client(vecdb_dir: str | Path, config=None):
+    """A Chroma client or a :class:`NumpyStore`, per :func:`vector_backend`."""
+    if vector_backend(vecdb_dir, config) == "numpy":
+        from evid.vec.npstore import NumpyStore
+
+        return NumpyStore(vecdb_dir, config=config)
+    return get_client(str(vecdb_dir))
+
+
+def _is_numpy(handle) -> bool:
+    from evid.vec.npstore import NumpyStore
+
+    return isinstance(handle, NumpyStore)
+
+
+def hnsw_configuration(config=None) -> dict:
+    """The ``hnsw`` configuration new set collections are created with."""
+    if config is None:
+        from evid.config import EvidConfig
+
+        config = EvidConfig.cached()
+    return {
+        "space": "cosine",
+        "max_neighbors": config.hnsw_max_neighbors,
+        "ef_construction": config.hnsw_ef_construction,
+        "ef_search": config.hnsw_ef_search,
+    }
+
+
+def hnsw_settings(collection) -> dict:
+    """The collection's current ``hnsw`` configuration (``{}`` if unknown)."""
+    try:
+        return dict((collection.configuration or {}).get("hnsw") or {})
+    except Exception:
+        return {}
+
+
+def open_collection(client, config=None):
+    """The set's ``docs`` collection, created if missing.
+
+    New collections get :func:`hnsw_configuration`; existing ones keep their
+    build parameters but take the configured ``ef_search``. A
+    :class:`NumpyStore` is its own collection.
+    """
+    if _is_numpy(client):
+        return client
+    wanted = hnsw_configuration(config)
+    try:
+        collection = client.get_collection(COLLECTION)
+    except Exception:
+        collection = _finish_interrupted_migration(client)
+        if collection is None:
+            return client.create_collection(COLLECTION, configuration={"hnsw": wanted})
+    ef_search = wanted["ef_search"]
+    if hnsw_settings(collection).get("ef_search", ef_search) != ef_search:
+        try:
+            collection.modify(configuration={"hnsw": {"ef_search": ef_search}})
+        except Exception:
+            logger.debug("Could not update ef_search on collection")
+    return collection
+
+
+def collection_space(collection) -> str:
+    """Distance space of *collection*; Chroma's default is ``"l2"``."""
+    return getattr(collection, "space", None) or hnsw_settings(collection).get(
+        "space", "l2"
+    )
+
+
+def similarity(distance: float, space: str) -> float:
+    """Cosine similarity of two unit vectors from their Chroma *distance*.
+
+    Cosine and inner-product distances are ``1 - cos``; squared L2 (Chroma's
+    default space, used by sets built before cosine collections) is
+    ``2 - 2 cos``.
+    """
+    if space == "l2":
+        return 1.0 - distance / 2.0
+    return 1.0 - distance
+
+
+def needs_migration(collection, config=None) -> bool:
+    """True if *collection* was built in another space or with other M/ef_c."""
+    if _is_numpy(collection):
+        return False
+    have = hnsw_settings(collection)
+    wanted = hnsw_configuration(config)
+    return any(
+        have.get(key) != wanted[key]
+        for key in ("space", "max_neighbors", "ef_construction")
+    )
+
+
+def migrate_collection(client, config=None, progress=None) -> int:
+    """Rebuild the ``docs`` collection with the configured HNSW settings.
+
+    Vectors, documents and metadata are copied as stored, in batches, into a
+    new collection that then replaces the old one; nothing is re-embedded.
+    A migration interrupted before the swap is started over; one interrupted
+    during the swap is completed by the next :func:`open_collection`.
+    *progress* is called with ``(copied, total)``. Returns the record count.
+    """
+    if _is_numpy(client):
+        raise ValueError("NumPy-backed sets have no HNSW index to migrate")
+    collection = open_collection(client, config)
+    try:
+        client.delete_collection(_MIGRATING)  # leftover of an interrupted copy
+    except Exception:
+        pass
+    target = client.create_collection(
+        _MIGRATING,
+        configuration={"hnsw": hnsw_configuration(config)},
+        metadata=collection.metadata or None,
+    )
+    total = _copy_records(collection, target, progress)
+    client.delete_collection(COLLECTION)
+    target.modify(name=COLLECTION)
+    logger.info(f"Migrated {total} vectors to {hnsw_configuration(config)}")
+    return total
+
+
+def _finish_interrupted_migration(client):
+    """Rename a fully copied migration target left without its ``docs``."""
+    try:
+        collection = client.get_collection(_MIGRATING)
+    except Exception:
+        return None
+    collection.modify(name=COLLECTION)
+    logger.warning("Completed an interrupted vector index migration")
+    return client.get_collection(COLLECTION)
+
+
+def _copy_records(source, target, progress=None) -> int:
+    """Copy every record of *source* into *target*, in batches."""
+    total = source.count()
+    for offset in range(0, total, _COPY_BATCH):
+        got = source.get(
+            include=["embeddings", "documents", "metadatas"],
+            limit=_COPY_BATCH,
+            offset=offset,
+        )
+        if got["ids"]:
+            target.add(
+                ids=got["ids"],
+                embeddings=got["embeddings"],
+                documents=got["documents"],
+                metadatas=got["metadatas"],
+            )
+        if progress:
+            progress(min(offset + _COPY_BATCH, total), total)
+    return total
+
+
+def convert_backend(
+    vecdb_dir: str | Path,
+    backend: str,
+    config=None,
+    dtype: str = "float32",
+    progress=None,
+) -> int:
+    """Move the set at *vecdb_dir* to *backend* (``"chroma"`` or ``"numpy"``).
+
+    Records are copied as stored (nothing is re-embedded) into a new store
+    under ``vecdb/.converting``, whose files are then moved in. The new
+    backend takes over in one step, when the NumPy manifest appears or goes,
+    and only then are the old backend's files deleted, so an interrupted
+    conversion leaves the set on its old backend. *dtype* is the NumPy
+    store's element type. The caller must have closed its clients of the set.
+    Returns the number of records.
+    """
+    from evid.vec.npstore import NumpyStore
+
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown vector backend {backend!r}; use one of {BACKENDS}")
+    vecdb_dir = Path(vecdb_dir)
+    staging = vecdb_dir / _CONVERTING
+    shutil.rmtree(staging, ignore_errors=True)
+    source = open_collection(open_client(vecdb_dir, config), config)
+    if vector_backend(vecdb_dir, config) == backend:
+        return source.count()
+
+    if backend == "numpy":
+        target = NumpyStore(staging, dtype=dtype, config=config)
+    else:
+        target = open_collection(get_client(str(staging)), config)
+    if source.metadata:
+        target.modify(metadata=dict(source.metadata))
+    total = _copy_records(source, target, progress)
+    del source, target
+    _release_chroma()
+
+    if backend == "numpy":
+        NumpyStore(staging, config=config).compact()  # builds IVF for big sets
+    _swap_in(staging, vecdb_dir, backend)
+    shutil.rmtree(staging, ignore_errors=True)
+    logger.info(f"Converted {total} vectors in {vecdb_dir} to the {backend} backend")
+    return total
+
+
+def _swap_in(staging: Path, vecdb_dir: Path, backend: str) -> None:
+    """Move the converted store from *staging* into *vecdb_dir*."""
+    from evid.vec.npstore import MANIFEST, store_files
+
+    if backend == "numpy":
+        for f in store_files(staging):  # manifest last: the switch
+            f.replace(vecdb_dir / f.name)
+        for f in _chroma_files(vecdb_dir):
+            _remove(f)
+    else:
+        for f in _chroma_files(vecdb_dir):  # left over, shadowed by the manifest
+            _remove(f)
+        for f in _chroma_files(staging):
+            f.replace(vecdb_dir / f.name)
+        (vecdb_dir / MANIFEST).unlink()  # the switch
+        for f in store_files(vecdb_dir):
+            f.unlink()
+
+
+def _chroma_files(vecdb_dir: Path) -> list[Path]:
+    """Chroma's SQLite database and segment directories in *vecdb_dir*."""
+    return [
+        f
+        for f in vecdb_dir.iterdir()
+        if f.name.startswith("chroma.sqlite3") or (f.is_dir() and f.name != _CONVERTING)
+    ]
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path)
+    else:
+        path.unlink()
+
+
+def _release_chroma() -> None:
+    """Drop Chroma's cached systems so their files can be moved or deleted."""
+    try:
+        from chromadb.api.client import SharedSystemClient
+    except ImportError:
+        return
+    SharedSystemClient.clear_system_cache()
+
+
+# ── maintenance ───────────────────────────────────────────────────────────────
+
+
+def store_bytes(vecdb_dir: str | Path) -> int:
+    """Bytes the vector store in *vecdb_dir* takes up on disk."""
+    return sum(f.stat().st_size for f in Path(vecdb_dir).rglob("*") if f.is_file())
+
+
+def stored_doc_uuids(collection) -> Counter:
+    """Number of chunks per ``doc_uuid`` in *collection*, read in one call."""
+    got = collection.get(include=["metadatas"])
+    return Counter((m or {}).get("doc_uuid", "") for m in got["metadatas"])
+
+
+def _segments(vecdb_dir: Path) -> dict[str, tuple[str, str]]:
+    """Chroma segment id → ``(scope, collection name)``, read from SQLite."""
+    path = vecdb_dir / _SQLITE
+    if not path.exists():
+        return {}
+    con = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        rows = con.execute(
+            "SELECT s.id, s.scope, c.name FROM segments s "
+            "LEFT JOIN collections c ON c.id = s.collection"
+        ).fetchall()
+    finally:
+        con.close()
+    return {sid: (scope, name) for sid, scope, name in rows}
+
+
+def stale_segment_dirs(vecdb_dir: str | Path) -> list[Path]:
+    """Chroma segment directories that no collection refers to any more.
+
+    Chroma does not remove a collection's HNSW directory when the collection
+    is deleted, so every migration or rebuild leaves the old one behind.
+    """
+    vecdb_dir = Path(vecdb_dir)
+    if not (vecdb_dir / _SQLITE).exists():
+        return []
+    live = _segments(vecdb_dir)
+    stale = []
+    for d in vecdb_dir.iterdir():
+        if not d.is_dir() or d.name in live:
+            continue
+        try:
+            uuid.UUID(d.name)
+        except ValueError:
+            continue  # not a segment directory (e.g. .converting)
+        stale.append(d)
+    return stale
+
+
+def dead_fraction(vecdb_dir: str | Path, collection) -> float | None:
+    """Share of the stored vectors that were deleted but still take up space.
+
+    A NumpyStore counts its tombstoned rows. For Chroma it is estimated from
+    the HNSW segment, whose ``length.bin`` holds 4 bytes per element ever
+    added; the estimate is low until Chroma has persisted recent writes.
+    None if it cannot be told.
+    """
+    if _is_numpy(collection):
+        total = len(collection.ids)
+        return 1 - collection.count() / total if total else 0.0
+    vecdb_dir = Path(vecdb_dir)
+    elements = 0
+    for sid, (scope, name) in _segments(vecdb_dir).items():
+        length = vecdb_dir / sid / "length.bin"
+        if scope == "VECTOR" and name == COLLECTION and length.exists():
+            elements += length.stat().st_size // 4
+    if not elements:
+        return None
+    return max(0.0, 1 - collection.count() / elements)
+
+
+def compact_store(vecdb_dir: str | Path, config=None, progress=None) -> int:
+    """Reclaim the space of deleted records in *vecdb_dir*; return bytes freed.
+
+    A NumpyStore is rewritten without its dead rows. A Chroma collection is
+    rebuilt from its live records (:func:`migrate_collection`, so it also
+    takes the configured HNSW settings), then segment directories nothing
+    refers to are removed and the SQLite file is vacuumed. The caller must
+    have closed its clients of the set.
+    """
+    vecdb_dir = Path(vecdb_dir)
+    before = store_bytes(vecdb_dir)
+    client = open_client(vecdb_dir, config)
+    if _is_numpy(client):
+        client.compact()
+        return before - store_bytes(vecdb_dir)
+    migrate_collection(client, config, progress)
+    del client
+    _release_chroma()
+    for d in stale_segment_dirs(vecdb_dir):
+        shutil.rmtree(d)
+    con = sqlite3.connect(vecdb_dir / _SQLITE)
+    try:
+        con.execute("VACUUM")
+    finally:
+        con.close()
+    freed = before - store_bytes(vecdb_dir)
+    logger.info(f"Compacted {vecdb_dir}: {freed} bytes freed")
+    return freed
@@ -0,0 +1,197 @@
+"""Document-level embeddings: one vector per document, for "more like this".
+
+The chunk index answers text queries, but finding the documents most like a
+given one would take a query per chunk. ``<set>/docvecs/`` keeps one row per
+document instead, the normalised mean of its chunk embeddings, in a
+:class:`~evid.vec.npstore.NumpyStore`, so :func:`similar_documents` is a single
+k-NN lookup: an exact scan of a ``(documents, dim)`` matrix.
+
+Centroids are computed from the chunk vectors whenever chunks are written (the
+indexer, snapshot import, document transfer) and dropped with the document.
+Each row records how many chunks it averages; when those counts no longer add
+up to the chunk index's size (sets indexed before document vectors existed, a
+failed update), :func:`ensure_current` rebuilds the store from the chunk
+vectors in one pass.
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DOCVEC_DIR = "docvecs"
+_PAGE = 5000  # chunk rows read per page when rebuilding
+_STORES: dict[Path, object] = {}  # docvecs dir → open NumpyStore
+
+
+class CentroidSums:
+    """Per-document sums of chunk embeddings, fed one batch at a time."""
+
+    def __init__(self) -> None:
+        self._sums: dict[str, np.ndarray] = {}
+        self._counts: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._sums)
+
+    @property
+    def doc_uuids(self) -> set[str]:
+        return set(self._sums)
+
+    def add(self, metadatas: list[dict], embeddings) -> None:
+        """Add chunk rows: their ``metadatas`` name the ``doc_uuid``."""
+        if not len(metadatas):
+            return
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        uuids, inverse = np.unique(
+            [m["doc_uuid"] for m in metadatas], return_inverse=True
+        )
+        sums = np.zeros((len(uuids), vectors.shape[1]), dtype=np.float32)
+        np.add.at(sums, inverse, vectors)
+        for doc_uuid, total, n in zip(
+            uuids.tolist(), sums, np.bincount(inverse).tolist(), strict=True
+        ):
+            if doc_uuid in self._sums:
+                self._sums[doc_uuid] += total
+                self._counts[doc_uuid] += n
+            else:
+                self._sums[doc_uuid] = total
+                self._counts[doc_uuid] = n
+
+    def write(self, store) -> None:
+        """Upsert one row per document into *store* (normalised on write)."""
+        if not self._sums:
+            return
+        uuids = list(self._sums)
+        store.add(
+            ids=uuids,
+            embeddings=np.stack([self._sums[u] for u in uuids]),
+            metadatas=[{"doc_uuid": u, "chunks": self._counts[u]} for u in uuids],
+        )
+
+
+def open_doc_store(set_dir: Path):
+    """The set's document-vector store (created empty if missing).
+
+    Opened stores are kept per path: they pick up other processes' writes
+    themselves, and reopening would re-read the whole row table.
+    """
+    from evid.vec.npstore import NumpyStore
+
+    path = Path(set_dir) / DOCVEC_DIR
+    store = _STORES.get(path)
+    if store is None or not NumpyStore.exists(path):
+        store = _STORES[path] = NumpyStore(path)
+    return store
+
+
+def _store_for(set_dir: Path, model: str | None):
+    """The set's store, emptied first if it holds another model's vectors."""
+    from evid.vec.npstore import store_files
+
+    store = open_doc_store(set_dir)
+    if store.metadata.get("embedding_model") != model:
+        if store.count():
+            for path in store_files(store.path):
+                path.unlink(missing_ok=True)
+            store = open_doc_store(set_dir)  # reopened: the manifest is gone
+        store.modify(metadata={"embedding_model": model})
+    return store
+
+
+def write_centroids(set_dir: Path, sums: CentroidSums, model: str | None) -> None:
+    """Replace the vectors of the documents in *sums* (their complete chunks).
+
+    Never raises: the document index is derived data, and a failed update is
+    caught up by :func:`ensure_current`.
+    """
+    if not len(sums):
+        return
+    try:
+        sums.write(_store_for(set_dir, model))
+    except Exception:
+        logger.warning(
+            "Could not update document vectors in %s", set_dir, exc_info=True
+        )
+
+
+def remove_centroids(set_dir: Path, doc_uuids: list[str]) -> None:
+    """Drop the vectors of *doc_uuids*, if the set has a document index."""
+    from evid.vec.npstore import NumpyStore
+
+    if not NumpyStore.exists(Path(set_dir) / DOCVEC_DIR):
+        return
+    try:
+        open_doc_store(set_dir).delete(ids=list(doc_uuids))
+    except Exception:
+        logger.warning(
+            "Could not remove document vectors in %s", set_dir, exc_info=True
+        )
+
+
+def is_current(store, collection) -> bool:
+    """True if *store* averages exactly the chunks *collection* holds."""
+    model = (collection.metadata or {}).get("embedding_model")
+    if store.metadata.get("embedding_model") != model:
+        return False
+    counted = sum((m or {}).get("chunks", 0) for m in store.get()["metadatas"])
+    return counted == collection.count()
+
+
+def rebuild(set_dir: Path, collection, progress=None) -> int:
+    """Recompute every document vector from *collection*'s chunk vectors.
+
+    *progress* is called with ``(read, total)`` chunks. Returns the number of
+    documents written.
+    """
+    total = collection.count()
+    sums = CentroidSums()
+    for offset in range(0, total, _PAGE):
+        got = collection.get(
+            include=["embeddings", "metadatas"], limit=_PAGE, offset=offset
+        )
+        if not got["ids"]:
+            break
+        sums.add(got["metadatas"], got["embeddings"])
+        if progress:
+            progress(min(offset + _PAGE, total), total)
+    store = _store_for(set_dir, (collection.metadata or {}).get("embedding_model"))
+    sums.write(store)
+    # Documents with no chunks left are dropped after the upsert, so readers
+    # never see a half-empty store.
+    stale = set(store.get(include=[])["ids"]) - sums.doc_uuids
+    if stale:
+        store.delete(ids=sorted(stale))
+    logger.info("Built document vectors for %d documents in %s", len(sums), set_dir)
+    return len(sums)
+
+
+def ensure_current(set_dir: Path, collection):
+    """The set's document-vector store, rebuilt first if it is out of date."""
+    store = open_doc_store(set_dir)
+    if not is_current(store, collection):
+        rebuild(set_dir, collection)
+    return store
+
+
+def similar_documents(
+    set_dir: Path, collection, doc_uuid: str, n: int = 10
+) -> list[tuple[str, float]]:
+    """The *n* documents closest to *doc_uuid*: ``[(uuid, cosine), ...]``.
+
+    Raises KeyError if the document has no indexed chunks.
+    """
+    store = ensure_current(set_dir, collection)
+    got = store.get(ids=[doc_uuid], include=["embeddings"])
+    if not got["ids"]:
+        raise KeyError(doc_uuid)
+    hits = store.query(got["embeddings"], n_results=n + 1, include=["distances"])
+    return [
+        (u, 1.0 - d)
+        for u, d in zip(hits["ids"][0], hits["distances"][0], strict=True)
+        if u != doc_uuid
+    ][:n]
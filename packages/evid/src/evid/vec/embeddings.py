@@ -13,18 +13,50 @@ apply the right prefix for the active model (and no prefix for non-e5 models).
 Switching models invalidates existing vector indexes (embeddings from two
 models are not comparable). After changing the model, run ``evid set reindex``
 on each set.
+
+**Backends.** ``EvidConfig.embedding_backend`` (or ``EVID_EMBEDDING_BACKEND``)
+picks how the model runs:
+
+* ``torch`` — full-precision sentence-transformers on torch (default).
+* ``torch-int8`` — the same weights with dynamic int8 quantization of the
+  linear layers; no extra dependencies.
+* ``onnx`` — ONNX Runtime; needs ``pip install 'evid[onnx]'``.
+* ``onnx-int8`` — ONNX Runtime with dynamically int8-quantized weights,
+  exported once into ``<data_dir>/models/`` and reused after that.
+
+**Batching.** ``embed_documents`` does not hand every chunk to the model at
+once: it groups chunks of similar token length (see :mod:`evid.vec.batching`)
+under ``EvidConfig.embed_token_budget`` padded tokens per call and restores the
+caller's order afterwards.
+
+The backends embed into the same vector space, so changing backend does not
+require a reindex. Quantized vectors differ slightly from full precision;
+``scripts/bench_embeddings.py`` measures speed and retrieval agreement.
 """
 
 from __future__ import annotations
 
+import logging
 import os
+import platform
+import threading
+from collections.abc import Callable
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+from evid import tracing
+
 if TYPE_CHECKING:
     import numpy as np
 
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("torch", "torch-int8", "onnx", "onnx-int8")
+
 _model = None
 _loaded_name: str | None = None
+_loaded_backend: str | None = None
+_model_lock = threading.Lock()  # concurrent callers (MCP tools) load once
 
 
 def model_name() -> str:
@@ -34,19 +66,94 @@ def model_name() -> str:
         return env
     from evid.config import EvidConfig
 
-    return EvidConfig.load().embedding_model
+    return EvidConfig.cached().embedding_model
 
 
-def _load_model():
-    """Load (and cache) the active model, reloading if the name changed."""
-    global _model, _loaded_name
-    name = model_name()
-    if _model is None or _loaded_name != name:
-        from sentence_transformers import SentenceTransformer
+def backend_name() -> str:
+    """Active embedding backend (env var wins over config)."""
+    backend = os.environ.get("EVID_EMBEDDING_BACKEND")
+    if not backend:
+        from evid.config import EvidConfig
+
+        backend = EvidConfig.cached().embedding_backend
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"Unknown embedding backend {backend!r}; choose one of {', '.join(BACKENDS)}"
+        )
+    return backend
+
+
+def _quantization_target() -> str:
+    """ONNX Runtime int8 kernel set for this CPU."""
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        return "arm64"
+    return "avx2"  # runs on every x86-64 CPU from the last decade
+
 
-        _model = SentenceTransformer(name)
-        _loaded_name = name
-    return _model
+def _quantized_dir(name: str) -> Path:
+    from evid.config import EvidConfig
+
+    return EvidConfig.cached().data_dir / "models" / name.replace("/", "__")
+
+
+def _load_onnx_int8(name: str):
+    """Load *name* with int8 ONNX weights, exporting them on first use."""
+    from sentence_transformers import SentenceTransformer
+    from sentence_transformers.backend import export_dynamic_quantized_onnx_model
+
+    target = _quantization_target()
+    file_name = f"onnx/model_qint8_{target}.onnx"
+    local = _quantized_dir(name)
+    if not (local / file_name).exists():
+        logger.info("Exporting int8 ONNX weights for %s to %s", name, local)
+        model = SentenceTransformer(name, backend="onnx")
+        model.save(str(local))
+        export_dynamic_quantized_onnx_model(model, target, str(local))
+    return SentenceTransformer(
+        str(local), backend="onnx", model_kwargs={"file_name": file_name}
+    )
+
+
+def _build_model(name: str, backend: str):
+    from sentence_transformers import SentenceTransformer
+
+    if backend == "onnx":
+        return SentenceTransformer(name, backend="onnx")
+    if backend == "onnx-int8":
+        return _load_onnx_int8(name)
+    model = SentenceTransformer(name, device="cpu" if backend == "torch-int8" else None)
+    if backend == "torch-int8":
+        import warnings
+
+        import torch
+
+        with warnings.catch_warnings():
+            # Eager-mode quantization is deprecated in favour of torchao, which
+            # is not a dependency; the API still works on every torch we support.
+            warnings.simplefilter("ignore")
+            torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+            )
+    return model
+
+
+def _load_model():
+    """Load (and cache) the active model, reloading if name or backend changed."""
+    global _model, _loaded_name, _loaded_backend
+    name, backend = model_name(), backend_name()
+    with _model_lock:
+        if _model is None or (_loaded_name, _loaded_backend) != (name, backend):
+            try:
+                with tracing.span("embed.load_model", model=name, backend=backend):
+                    _model = _build_model(name, backend)
+            except ImportError as exc:
+                raise ImportError(
+                    f"Embedding backend {backend!r} needs extra packages: "
+                    f"pip install 'evid[onnx]' ({exc})"
+                ) from exc
+            _loaded_name, _loaded_backend = name, backend
+            logger.debug("Loaded embedding model %s (%s backend)", name, backend)
+        return _model
 
 
 def _is_e5(name: str) -> bool:
@@ -61,18 +168,108 @@ def _doc_prefix(name: str) -> str:
     return "passage: " if _is_e5(name) else ""
 
 
-def embed_documents(texts: list[str]) -> np.ndarray:
-    """Embed indexed document chunks (applies the document prefix)."""
+def _token_lengths(model, texts: list[str]) -> list[int]:
+    """Token count per text, capped at the model's max sequence length."""
+    cap = getattr(model, "max_seq_length", None) or 512
+    tokenizer = getattr(model, "tokenizer", None)
+    if tokenizer is None:
+        return [min(cap, len(t) // 4 + 2) for t in texts]  # ~4 chars per token
+    encoded = tokenizer(texts, truncation=True, max_length=cap)["input_ids"]
+    return [len(ids) for ids in encoded]
+
+
+def token_budget() -> tuple[int, Callable[[list[str]], list[int]]]:
+    """``(max_tokens, count_tokens)`` for chunking to the active model's window.
+
+    *max_tokens* is the model's max sequence length minus the document prefix
+    and the special tokens, i.e. the text that is actually embedded.
+    """
     model = _load_model()
+    cap = getattr(model, "max_seq_length", None) or 512
+    tokenizer = getattr(model, "tokenizer", None)
+    if tokenizer is None:
+        from evid.vec.chunking import approx_tokens
+
+        return cap - 8, approx_tokens
+
+    def count_tokens(texts: list[str]) -> list[int]:
+        if not texts:
+            return []
+        encoded = tokenizer(texts, add_special_tokens=False)["input_ids"]
+        return [len(ids) for ids in encoded]
+
     prefix = _doc_prefix(_loaded_name)
-    payload = [prefix + t for t in texts] if prefix else texts
-    return model.encode(payload, show_progress_bar=False, normalize_embeddings=True)
+    reserved = (count_tokens([prefix])[0] if prefix else 0) + 2  # <s> ... </s>
+    return cap - reserved, count_tokens
+
+
+def embed_documents(
+    texts: list[str],
+    progress: Callable[[int, int], None] | None = None,
+    token_budget: int | None = None,
+) -> np.ndarray:
+    """Embed indexed document chunks (applies the document prefix).
+
+    Chunks are encoded in length-sorted batches of at most *token_budget*
+    padded tokens (default from ``EvidConfig.embed_token_budget``) and returned
+    in input order. *progress(done, total)* is called after each batch.
+    """
+    import numpy as np
+
+    from evid.vec.batching import DEFAULT_MAX_BATCH, plan_batches
+
+    model = _load_model()
+    prefix = _doc_prefix(_loaded_name)
+    payload = [prefix + t for t in texts] if prefix else list(texts)
+    if not payload:
+        return np.zeros((0, model.get_sentence_embedding_dimension()), "float32")
+    if token_budget is None:
+        from evid.config import EvidConfig
+
+        token_budget = EvidConfig.cached().embed_token_budget
+
+    out = None
+    done = 0
+    tracing.count("chunks_embedded", len(payload))
+    with tracing.span("embed.documents", chunks=len(payload)):
+        for batch in plan_batches(
+            _token_lengths(model, payload), token_budget, DEFAULT_MAX_BATCH
+        ):
+            vecs = model.encode(
+                [payload[i] for i in batch],
+                batch_size=len(batch),
+                show_progress_bar=False,
+                normalize_embeddings=True,
+            )
+            if out is None:
+                out = np.empty((len(payload), vecs.shape[1]), dtype=vecs.dtype)
+            out[batch] = vecs
+            done += len(batch)
+            if progress is not None:
+                progress(done, len(payload))
+    return out
 
 
 def embed_query(text: str) -> np.ndarray:
     """Embed a single search query (applies the query prefix)."""
     model = _load_model()
     prefix = _query_prefix(_loaded_name)
-    return model.encode(
-        prefix + text, show_progress_bar=False, normalize_embeddings=True
-    )
+    tracing.count("queries_embedded")
+    with tracing.span("embed.queries"):
+        return model.encode(
+            prefix + text, show_progress_bar=False, normalize_embeddings=True
+        )
+
+
+def embed_queries(texts: list[str]) -> np.ndarray:
+    """Embed several search queries in one forward pass (one row per query)."""
+    model = _load_model()
+    prefix = _query_prefix(_loaded_name)
+    tracing.count("queries_embedded", len(texts))
+    with tracing.span("embed.queries"):
+        return model.encode(
+            [prefix + t for t in texts],
+            batch_size=max(1, len(texts)),
+            show_progress_bar=False,
+            normalize_embeddings=True,
+        )
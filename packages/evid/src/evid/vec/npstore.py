@@ -0,0 +1,492 @@
+"""Chroma-free vector store: a memory-mapped embedding matrix and a row table.
+
+For small or read-only sets, opening a Chroma ``PersistentClient`` (SQLite,
+HNSW segments, the native code :mod:`evid.vec.safe_index` guards against) costs
+more than the search itself. A :class:`NumpyStore` keeps a set's chunks in
+plain files under ``vecdb/`` instead:
+
+* ``npstore.json`` — manifest: dimension, dtype, the current generation *g*,
+  collection metadata (``embedding_model``) and IVF bookkeeping.
+* ``vectors.<g>.bin`` — normalised embeddings as raw ``float32`` rows (or
+  ``float16``: half the size, but every scan converts), memory-mapped for
+  queries and appended to on writes.
+* ``rows.<g>.jsonl`` — one line per matrix row (``id``, ``document``,
+  ``metadata``), plus ``{"deleted": [row, ...]}`` tombstones.
+* ``ivf.<g>.npz`` — optional inverted-file index (k-means centroids and row
+  assignments) for sets of ``vector_ivf_min_rows`` chunks or more.
+
+Queries are exact brute-force cosine top-k over the live rows (one pass over
+the matrix for a whole batch of queries), or over the ``vector_ivf_nprobe``
+closest IVF lists plus the rows added since the index was built. Writes append; when dead rows outnumber live ones the store is
+compacted into a new generation, and the manifest switch makes that atomic.
+A torn append (crash mid-write) is cut off the next time the store is written.
+
+The class mirrors the small part of Chroma's ``Collection`` API evid uses
+(``add``, ``delete``, ``query``, ``get``, ``count``, ``metadata``,
+``modify``), so :class:`~evid.services.vec_service.VecService` and the indexer
+treat both backends alike; :func:`evid.vec.db.open_client` picks one per set.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MANIFEST = "npstore.json"
+_BLOCK = 32768  # rows scored per matrix product
+
+
+class NumpyStore:
+    """One set's chunks, as a ``docs``-collection stand-in."""
+
+    space = "cosine"
+
+    def __init__(self, path: str | Path, dtype: str = "float32", config=None) -> None:
+        self.path = Path(path)
+        self._config = config
+        self._stamp: tuple | None = None
+        if not (self.path / MANIFEST).exists():
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._manifest = {
+                "format": 1,
+                "dim": None,
+                "dtype": np.dtype(dtype).name,
+                "generation": 0,
+                "metadata": {},
+                "ivf_rows": 0,
+            }
+            self._write_manifest()
+        self._load()
+
+    @staticmethod
+    def exists(path: str | Path) -> bool:
+        return (Path(path) / MANIFEST).exists()
+
+    # ── files ─────────────────────────────────────────────────────────────────
+
+    def _file(self, kind: str, generation: int | None = None) -> Path:
+        g = self._manifest["generation"] if generation is None else generation
+        ext = {"vectors": "bin", "rows": "jsonl", "ivf": "npz"}[kind]
+        return self.path / f"{kind}.{g}.{ext}"
+
+    def _write_manifest(self) -> None:
+        tmp = self.path / f"{MANIFEST}.tmp"
+        tmp.write_text(json.dumps(self._manifest, indent=2), encoding="utf-8")
+        tmp.replace(self.path / MANIFEST)
+
+    def _current_stamp(self) -> tuple:
+        stamp = []
+        for f in (self.path / MANIFEST, self._file("rows")):
+            try:
+                st = f.stat()
+                stamp.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def _load(self) -> None:
+        """(Re)read the manifest and row table and map the matrix."""
+        self._manifest = json.loads((self.path / MANIFEST).read_text("utf-8"))
+        self.ids: list[str] = []
+        self.documents: list[str | None] = []
+        self.metadatas: list[dict | None] = []
+        dead: list[int] = []
+        self._rows_end = 0  # byte offset after the last complete line
+        rows_file = self._file("rows")
+        if rows_file.exists():
+            with rows_file.open("rb") as fh:
+                for line in fh:
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:
+                        break
+                    self._rows_end += len(line)
+                    if "deleted" in rec:
+                        dead.extend(rec["deleted"])
+                        continue
+                    self.ids.append(rec["id"])
+                    self.documents.append(rec.get("document"))
+                    self.metadatas.append(rec.get("metadata"))
+        n = len(self.ids)
+        dim = self._manifest["dim"]
+        vec_file = self._file("vectors")
+        if dim and vec_file.exists():
+            have = vec_file.stat().st_size // (dim * self._dtype.itemsize)
+            n = min(n, have)
+        del self.ids[n:], self.documents[n:], self.metadatas[n:]
+        self.alive = np.ones(n, dtype=bool)
+        self.alive[[r for r in dead if r < n]] = False
+        self._index = {
+            i: r for r, i in enumerate(self.ids) if self.alive[r]
+        }  # live id → row
+        self._vectors = (
+            np.memmap(vec_file, dtype=self._dtype, mode="r", shape=(n, dim))
+            if n
+            else np.zeros((0, dim or 0), dtype=self._dtype)
+        )
+        self._ivf = None
+        if self._manifest.get("ivf_rows") and self._file("ivf").exists():
+            with np.load(self._file("ivf")) as z:
+                self._ivf = (z["centroids"], z["order"], z["offsets"])
+        self._stamp = self._current_stamp()
+
+    def _refresh(self) -> None:
+        """Pick up writes made by another process (e.g. the indexer)."""
+        if self._current_stamp() != self._stamp:
+            self._load()
+
+    @property
+    def _settings(self):
+        if self._config is None:
+            from evid.config import EvidConfig
+
+            return EvidConfig.cached()
+        return self._config
+
+    @property
+    def _dtype(self) -> np.dtype:
+        return np.dtype(self._manifest["dtype"])
+
+    # ── Collection API ────────────────────────────────────────────────────────
+
+    @property
+    def metadata(self) -> dict:
+        self._refresh()
+        return dict(self._manifest.get("metadata") or {})
+
+    def modify(self, metadata: dict | None = None, **_kw) -> None:
+        self._refresh()
+        if metadata is not None and metadata != self._manifest.get("metadata"):
+            self._manifest["metadata"] = dict(metadata)
+            self._write_manifest()
+            self._stamp = self._current_stamp()
+
+    def count(self) -> int:
+        self._refresh()
+        return len(self._index)
+
+    def add(
+        self,
+        ids: list[str],
+        embeddings,
+        documents: list[str] | None = None,
+        metadatas: list[dict] | None = None,
+    ) -> None:
+        """Append rows; ids already present are replaced.
+
+        Like Chroma, an id repeated within *ids* is rejected (``ValueError``).
+        """
+        if not len(ids):
+            return
+        if len(set(ids)) != len(ids):
+            dupes = sorted(i for i, k in Counter(ids).items() if k > 1)
+            raise ValueError(f"Expected unique ids, found duplicates of: {dupes}")
+        self._refresh()
+        vectors = _normalise(embeddings)
+        if self._manifest["dim"] is None:
+            self._manifest["dim"] = int(vectors.shape[1])
+            self._write_manifest()
+        elif vectors.shape[1] != self._manifest["dim"]:
+            raise ValueError(
+                f"Embedding dimension {vectors.shape[1]} does not match the "
+                f"store's {self._manifest['dim']}"
+            )
+        self._truncate_torn_tail()
+        replaced = [self._index[i] for i in ids if i in self._index]
+        with self._file("vectors").open("ab") as fh:
+            fh.write(vectors.astype(self._dtype).tobytes())
+        lines = [
+            {"id": i, "document": d, "metadata": m}
+            for i, d, m in zip(
+                ids,
+                documents or [None] * len(ids),
+                metadatas or [None] * len(ids),
+                strict=True,
+            )
+        ]
+        if replaced:
+            lines.append({"deleted": replaced})
+        self._append_rows(lines)
+        self._maybe_compact()
+
+    def delete(self, ids: list[str] | None = None, where: dict | None = None) -> None:
+        """Drop rows by id, or by ``{"doc_uuid": uuid}`` / ``{"$in": [...]}``."""
+        self._refresh()
+        rows = [self._index[i] for i in ids or [] if i in self._index]
+        if where:
+            rows += self._matching(where)
+        if not rows:
+            return
+        self._truncate_torn_tail()
+        self._append_rows([{"deleted": sorted(set(rows))}])
+        self._maybe_compact()
+
+    def get(
+        self,
+        ids: list[str] | None = None,
+        include: list[str] | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        where: dict | None = None,
+    ) -> dict:
+        """Live rows by id, by ``where``, or a page of all of them in row order."""
+        self._refresh()
+        if ids is not None:
+            rows = [self._index[i] for i in ids if i in self._index]
+        elif where:
+            rows = self._matching(where)
+        else:
+            rows = np.flatnonzero(self.alive).tolist()
+            start = offset or 0
+            rows = rows[start : None if limit is None else start + limit]
+        return self._result(rows, include or ["documents", "metadatas"])
+
+    def query(
+        self,
+        query_embeddings,
+        n_results: int = 10,
+        where: dict | None = None,
+        include: list[str] | None = None,
+    ) -> dict:
+        """Nearest rows by cosine distance (``1 - cos``) for each query."""
+        self._refresh()
+        include = (
+            ["documents", "metadatas", "distances"] if include is None else include
+        )
+        queries = _normalise(query_embeddings)
+        allowed = self.alive.copy()
+        if where:
+            allowed[:] = False
+            allowed[self._matching(where)] = True
+        out: dict[str, list] = {"ids": []}
+        for key in ("documents", "metadatas", "distances"):
+            if key in include:
+                out[key] = []
+        if self._ivf is None:
+            hits = self._exact_top_k(queries, n_results, allowed)
+        else:
+            hits = [self._ivf_top_k(q, n_results, allowed) for q in queries]
+        for rows, scores in hits:
+            res = self._result(rows.tolist(), include)
+            out["ids"].append(res["ids"])
+            for key in ("documents", "metadatas"):
+                if key in out:
+                    out[key].append(res[key])
+            if "distances" in out:
+                out["distances"].append((1.0 - scores).tolist())
+        return out
+
+    # ── search ────────────────────────────────────────────────────────────────
+
+    def _exact_top_k(
+        self, queries: np.ndarray, k: int, allowed: np.ndarray
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Best rows for every query, scanning the matrix once for all of them."""
+        best = [
+            (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32))
+            for _ in queries
+        ]
+        for start in range(0, len(self._vectors), _BLOCK):
+            block = np.asarray(self._vectors[start : start + _BLOCK], np.float32)
+            scores = block @ queries.T
+            scores[~allowed[start : start + len(block)]] = -np.inf
+            rows = np.arange(start, start + len(block))
+            for i, (best_rows, best_scores) in enumerate(best):
+                top_rows, top_scores = _best(rows, scores[:, i], k)
+                best[i] = _best(
+                    np.concatenate([best_rows, top_rows]),
+                    np.concatenate([best_scores, top_scores]),
+                    k,
+                )
+        return [(rows[np.isfinite(s)], s[np.isfinite(s)]) for rows, s in best]
+
+    def _ivf_top_k(
+        self, q: np.ndarray, k: int, allowed: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Best rows among the closest IVF lists and the rows added since."""
+        centroids, order, offsets = self._ivf
+        nprobe = min(self._settings.vector_ivf_nprobe, len(centroids))
+        lists = np.argpartition(-(centroids @ q), nprobe - 1)[:nprobe]
+        covered = int(self._manifest["ivf_rows"])
+        rows = np.concatenate(
+            [order[offsets[c] : offsets[c + 1]] for c in lists]
+            + [np.arange(covered, len(self._vectors))]
+        )
+        rows = np.sort(rows[allowed[rows]])
+        scores = np.asarray(self._vectors[rows], np.float32) @ q
+        return _best(rows, scores, k)
+
+    # ── helpers ───────────────────────────────────────────────────────────────
+
+    def _matching(self, where: dict) -> list[int]:
+        (field, cond), *rest = where.items()
+        if rest:
+            raise ValueError(f"Unsupported filter {where!r}")
+        wanted = set(cond["$in"]) if isinstance(cond, dict) else {cond}
+        return [
+            r
+            for r in self._index.values()
+            if (self.metadatas[r] or {}).get(field) in wanted
+        ]
+
+    def _result(self, rows: list[int], include: list[str]) -> dict:
+        res: dict = {"ids": [self.ids[r] for r in rows]}
+        if "documents" in include:
+            res["documents"] = [self.documents[r] for r in rows]
+        if "metadatas" in include:
+            res["metadatas"] = [self.metadatas[r] for r in rows]
+        if "embeddings" in include:
+            res["embeddings"] = np.asarray(self._vectors[rows], dtype=np.float32)
+        return res
+
+    def _truncate_torn_tail(self) -> None:
+        """Cut off a row line or matrix rows left by an interrupted append."""
+        rows_file, vec_file = self._file("rows"), self._file("vectors")
+        if rows_file.exists() and rows_file.stat().st_size != self._rows_end:
+            os.truncate(rows_file, self._rows_end)
+        dim = self._manifest["dim"] or 0
+        size = len(self.ids) * dim * self._dtype.itemsize
+        if vec_file.exists() and vec_file.stat().st_size != size:
+            os.truncate(vec_file, size)
+
+    def _append_rows(self, lines: list[dict]) -> None:
+        data = "".join(json.dumps(rec, ensure_ascii=False) + "\n" for rec in lines)
+        with self._file("rows").open("ab") as fh:
+            fh.write(data.encode("utf-8"))
+        self._load()
+
+    def _maybe_compact(self) -> None:
+        live = len(self._index)
+        dead = len(self.ids) - live
+        min_rows = self._settings.vector_ivf_min_rows
+        covered = int(self._manifest.get("ivf_rows") or 0)
+        wants_ivf = bool(min_rows) and live >= min_rows
+        stale_ivf = wants_ivf and len(self.ids) - covered > max(covered // 2, 1000)
+        if (dead > 1000 and dead > live) or (wants_ivf and not covered) or stale_ivf:
+            self.compact()
+
+    def compact(self) -> int:
+        """Rewrite the live rows into a new generation; return bytes freed.
+
+        Builds the IVF index when the set has ``vector_ivf_min_rows`` rows.
+        """
+        self._refresh()
+        before = self.disk_bytes()
+        old = self._manifest["generation"]
+        new = old + 1
+        rows = np.flatnonzero(self.alive)
+        with self._file("vectors", new).open("wb") as fh:
+            for start in range(0, len(rows), _BLOCK):
+                fh.write(
+                    np.asarray(self._vectors[rows[start : start + _BLOCK]]).tobytes()
+                )
+        with self._file("rows", new).open("w", encoding="utf-8") as fh:
+            for r in rows:
+                rec = {
+                    "id": self.ids[r],
+                    "document": self.documents[r],
+                    "metadata": self.metadatas[r],
+                }
+                fh.write(json.dumps(rec, ensure_ascii=False) + "\n")
+
+        ivf_rows = 0
+        min_rows = self._settings.vector_ivf_min_rows
+        if min_rows and len(rows) >= min_rows:
+            vectors = np.memmap(
+                self._file("vectors", new),
+                dtype=self._dtype,
+                mode="r",
+                shape=(len(rows), self._manifest["dim"]),
+            )
+            centroids, order, offsets = build_ivf(vectors)
+            np.savez(
+                self._file("ivf", new),
+                centroids=centroids,
+                order=order,
+                offsets=offsets,
+            )
+            ivf_rows = len(rows)
+
+        self._manifest["generation"] = new
+        self._manifest["ivf_rows"] = ivf_rows
+        self._write_manifest()
+        for kind in ("vectors", "rows", "ivf"):
+            self._file(kind, old).unlink(missing_ok=True)
+        self._load()
+        ivf = " with an IVF index" if ivf_rows else ""
+        logger.info(f"Compacted {self.path} to {len(rows)} rows{ivf}")
+        return before - self.disk_bytes()
+
+    def disk_bytes(self) -> int:
+        return sum(f.stat().st_size for f in self.path.iterdir() if f.is_file())
+
+
+def store_files(path: str | Path) -> list[Path]:
+    """The files of the store in *path*, manifest last."""
+    path = Path(path)
+    data = [
+        f
+        for pattern in ("vectors.*.bin", "rows.*.jsonl", "ivf.*.npz")
+        for f in sorted(path.glob(pattern))
+    ]
+    return data + [f for f in (path / MANIFEST,) if f.exists()]
+
+
+def _normalise(vectors) -> np.ndarray:
+    arr = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    norms = np.linalg.norm(arr, axis=1, keepdims=True)
+    return arr / np.maximum(norms, 1e-12)
+
+
+def _best(
+    rows: np.ndarray, scores: np.ndarray, k: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """The *k* highest *scores* (and their rows), best first."""
+    if len(scores) > k:
+        top = np.argpartition(-scores, k - 1)[:k]
+        rows, scores = rows[top], scores[top]
+    order = np.argsort(-scores, kind="stable")
+    return rows[order], scores[order]
+
+
+def build_ivf(
+    vectors: np.ndarray, n_lists: int | None = None, iterations: int = 10, seed: int = 0
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Spherical k-means over *vectors*: ``(centroids, order, offsets)``.
+
+    ``order[offsets[c]:offsets[c + 1]]`` are the rows assigned to list *c*.
+    Centroids are trained on a sample of about 64 rows per list.
+    """
+    n = len(vectors)
+    n_lists = n_lists or max(1, int(4 * np.sqrt(n)))
+    rng = np.random.default_rng(seed)
+    sample = np.sort(rng.choice(n, size=min(n, n_lists * 64), replace=False))
+    train = np.asarray(vectors[sample], dtype=np.float32)
+    centroids = train[rng.choice(len(train), size=n_lists, replace=False)].copy()
+    for _ in range(iterations):
+        assign = np.argmax(train @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, train)
+        filled = np.linalg.norm(sums, axis=1) > 0
+        centroids[filled] = _normalise(sums[filled])
+    assign = np.concatenate(
+        [
+            np.argmax(
+                np.asarray(vectors[s : s + _BLOCK], dtype=np.float32) @ centroids.T,
+                axis=1,
+            )
+            for s in range(0, n, _BLOCK)
+        ]
+    )
+    order = np.argsort(assign, kind="stable").astype(np.int64)
+    offsets = np.searchsorted(assign[order], np.arange(n_lists + 1))
+    return centroids, order, offsets
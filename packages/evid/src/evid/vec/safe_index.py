@@ -3,86 +3,407 @@
 ChromaDB initialization and sentence-transformers / onnxruntime can crash
 natively (SIGSEGV) on some Linux setups. Running the indexing in a spawned
 child process means a native crash kills the child, not the GUI.
+
+Spawning a fresh child per document pays interpreter start-up, the chromadb /
+torch imports and a model load every time (~10 s). Indexing therefore goes
+through :class:`IndexerProcess` — a long-lived child that keeps the model warm
+across jobs and is respawned after it dies — handed out to concurrent callers
+by :class:`IndexerPool`.
+
+**Job protocol.** Parent and child exchange JSON objects over a pipe, one per
+message, each with a ``type``:
+
+* parent → child: ``job`` (``id``, ``vecdb_dir``, ``docs``) or ``shutdown``.
+* child → parent: ``ready`` (``pid``) once at start-up; ``heartbeat`` (``id``,
+  ``progress``, ``stage``) every :data:`HEARTBEAT_INTERVAL` seconds while a job
+  runs; ``result`` (``id``, ``ok`` and ``counts`` or ``error``/``traceback``).
+
+A child that stops sending heartbeats for :data:`HEARTBEAT_TIMEOUT` seconds is
+hung (e.g. stopped, or stuck in native code holding the GIL); one whose
+heartbeats report no progress for the stall window is stuck inside a job.
+Either way it is killed and respawned for the next job, so a slow but
+progressing job is never cut off by a blanket deadline.
 """
 
 from __future__ import annotations
 
+import atexit
+import json
 import logging
 import multiprocessing as mp
-import sys
+import os
+import threading
+import time
 import traceback
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
+from evid import tracing
+
 logger = logging.getLogger(__name__)
 
+HEARTBEAT_INTERVAL = 2.0  # seconds between child heartbeats during a job
+HEARTBEAT_TIMEOUT = 60.0  # silence after which the child counts as hung
+STALL_TIMEOUT = 300.0  # heartbeats without progress after which a job is stuck
+
+# progress(stage) — called by job handlers at each unit of work.
+ProgressCallback = Callable[[str], None]
 
-def _index_worker(
-    vecdb_dir: str,
-    doc_uuid: str,
-    doc_label: str,
-    doc_tags: list[str],
-    typ_text: str,
-) -> None:
-    """Run inside the spawned child. Exit non-zero on Python-level failure;
-    a native crash here cannot escape to the parent."""
-    try:
-        from evid.vec.chunking import chunk_text
-        from evid.vec.db import get_client
-        from evid.vec.embeddings import embed_documents, model_name
 
-        pairs = chunk_text(typ_text)
+def _no_progress(_stage: str) -> None:
+    return None
+
+
+def _index_docs(
+    vecdb_dir: str, docs: list[dict], progress: ProgressCallback = _no_progress
+) -> dict[str, int]:
+    """Chunk, embed and write *docs* into the set's ``docs`` collection.
+
+    Each doc is a dict with ``uuid``, ``label``, ``tags`` and ``text``. All
+    chunks of the batch share one embedding call and one delete/add pass; the
+    documents' centroids go to :mod:`evid.vec.docvecs`.
+    Returns ``{uuid: n_chunks}``. Runs inside the child process.
+    """
+    from evid.vec.chunking import chunk_for_embedding
+    from evid.vec.db import open_client, open_collection
+    from evid.vec.docvecs import CentroidSums, write_centroids
+    from evid.vec.embeddings import embed_documents, model_name
+
+    counts: dict[str, int] = {}
+    chunks: list[str] = []
+    ids: list[str] = []
+    metadatas: list[dict] = []
+    indexed_uuids: list[str] = []
+    for doc in docs:
+        doc_uuid = doc["uuid"]
+        pairs = chunk_for_embedding(doc["text"])
+        counts[doc_uuid] = len(pairs)
+        progress("chunk")
         if not pairs:
-            print(f"[safe_index] No chunks for {doc_uuid}", file=sys.stderr)
-            return
-        chunks = [c for c, _ in pairs]
-        char_starts = [s for _, s in pairs]
+            continue
+        indexed_uuids.append(doc_uuid)
+        for i, (chunk, char_start) in enumerate(pairs):
+            chunks.append(chunk)
+            ids.append(f"{doc_uuid}:{i}")
+            metadatas.append(
+                {
+                    "doc_uuid": doc_uuid,
+                    "label": doc["label"],
+                    "tags": ",".join(doc["tags"]),
+                    "chunk_idx": i,
+                    "char_start": char_start,
+                }
+            )
+    if not chunks:
+        return counts
+
+    collection = open_collection(open_client(vecdb_dir))
+    try:
+        collection.modify(metadata={"embedding_model": model_name()})
+    except Exception:
+        pass
+
+    # A failed delete must fail the batch: add() does not overwrite existing
+    # ids, so indexing on would keep the old chunks.
+    collection.delete(where={"doc_uuid": {"$in": indexed_uuids}})
+    progress("open")
 
-        client = get_client(vecdb_dir)
+    embeddings = embed_documents(
+        chunks, progress=lambda _done, _total: progress("embed")
+    )
+    batch = 2000
+    for start in range(0, len(chunks), batch):
+        end = start + batch
+        collection.add(
+            documents=chunks[start:end],
+            embeddings=embeddings[start:end],
+            ids=ids[start:end],
+            metadatas=metadatas[start:end],
+        )
+        progress("write")
+    sums = CentroidSums()
+    sums.add(metadatas, embeddings)
+    write_centroids(Path(vecdb_dir).parent, sums, model_name())
+    return counts
+
+
+class _Channel:
+    """One end of the pipe, speaking JSON messages; sends are thread-safe."""
+
+    def __init__(self, conn) -> None:
+        self.conn = conn
+        self._lock = threading.Lock()
+
+    def send(self, **msg: object) -> None:
+        data = json.dumps(msg, ensure_ascii=False).encode("utf-8")
+        with self._lock:
+            self.conn.send_bytes(data)
+
+    def recv(self) -> dict:
+        return json.loads(self.conn.recv_bytes())
+
+    def poll(self, timeout: float) -> bool:
+        return self.conn.poll(timeout)
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def _heartbeat(chan: _Channel, job_id: int, state: dict, stop: threading.Event):
+    while not stop.wait(HEARTBEAT_INTERVAL):
         try:
-            collection = client.get_collection("docs")
-        except Exception:
-            collection = client.create_collection("docs")
+            chan.send(
+                type="heartbeat",
+                id=job_id,
+                progress=state["progress"],
+                stage=state["stage"],
+            )
+        except OSError:
+            return
+
+
+def _serve(conn, handler=_index_docs) -> None:
+    """Child main loop: run *handler* for each ``job`` message in turn.
+
+    Heartbeats are sent from a side thread while the handler runs; the handler
+    reports progress through the callback it is given. A native crash here
+    cannot escape to the parent, which sees the pipe close and respawns.
+    """
+    chan = _Channel(conn)
+    chan.send(type="ready", pid=os.getpid())
+    while True:
         try:
-            collection.modify(metadata={"embedding_model": model_name()})
-        except Exception:
-            pass
+            msg = chan.recv()
+        except (EOFError, OSError):
+            return
+        if msg.get("type") != "job":
+            return
+        job_id = msg["id"]
+        state = {"progress": 0, "stage": "start"}
+
+        def report(stage: str, state: dict = state) -> None:
+            state["stage"] = stage
+            state["progress"] += 1
 
-        ids = [f"{doc_uuid}:{i}" for i in range(len(chunks))]
-        metadatas = [
-            {
-                "doc_uuid": doc_uuid,
-                "label": doc_label,
-                "tags": ",".join(doc_tags),
-                "chunk_idx": i,
-                "char_start": char_starts[i],
+        stop = threading.Event()
+        beat = threading.Thread(
+            target=_heartbeat, args=(chan, job_id, state, stop), daemon=True
+        )
+        beat.start()
+        try:
+            counts = handler(msg["vecdb_dir"], msg["docs"], report)
+            result = {"ok": True, "counts": counts}
+        except Exception as exc:
+            result = {
+                "ok": False,
+                "error": f"{type(exc).__name__}: {exc}",
+                "traceback": traceback.format_exc(),
             }
-            for i in range(len(chunks))
-        ]
+        finally:
+            stop.set()
+            beat.join()
+        chan.send(type="result", id=job_id, **result)
+
+
+def _exit_message(code: int | None) -> str:
+    if code is not None and code < 0:
+        return f"subprocess killed by signal {-code}"
+    return f"subprocess exited with code {code}"
+
+
+class IndexerProcess:
+    """A long-lived spawned indexing child that keeps the embedding model warm.
+
+    Jobs are sent over a pipe and run one at a time. If the child dies (native
+    crash) or is killed as hung, the job in flight fails and the next job
+    transparently spawns a fresh child. Not thread-safe — one caller at a time,
+    which :class:`IndexerPool` guarantees.
+
+    *handler* is the job function run in the child, called as
+    ``handler(vecdb_dir, docs, progress)``; it must be importable by qualified
+    name (``spawn`` start method).
+    """
+
+    def __init__(self, name: str = "vec-indexer", handler=_index_docs) -> None:
+        self.name = name
+        self._handler = handler
+        self._proc = None
+        self._chan: _Channel | None = None
+        self._job_id = 0
 
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.is_alive()
+
+    @property
+    def pid(self) -> int | None:
+        return self._proc.pid if self._proc is not None else None
+
+    def _spawn(self) -> None:
+        ctx = mp.get_context("spawn")
+        parent_conn, child_conn = ctx.Pipe()
+        proc = ctx.Process(
+            target=_serve,
+            args=(child_conn, self._handler),
+            name=self.name,
+            daemon=True,
+        )
+        proc.start()
+        tracing.count("subprocesses")
+        child_conn.close()
+        self._proc, self._chan = proc, _Channel(parent_conn)
+        logger.debug("Spawned indexer %s (pid %s)", self.name, proc.pid)
+
+    def _reap(self, grace: float = 5.0) -> str:
+        """Tear down a dead or hung child; return why it went away."""
+        proc = self._proc
+        self._proc = None
+        if self._chan is not None:
+            self._chan.close()
+            self._chan = None
+        if proc is None:
+            return "subprocess not running"
+        proc.join(grace)
+        if proc.is_alive():
+            proc.terminate()
+            proc.join(grace)
+        if proc.is_alive():
+            proc.kill()
+            proc.join(grace)
+        return _exit_message(proc.exitcode)
+
+    def _kill_hung(self, reason: str) -> tuple[bool, str]:
+        if self._proc is not None:
+            self._proc.kill()
+        self._reap()
+        msg = f"indexer hung ({reason}); killed"
+        logger.warning("Indexer %s %s", self.name, msg)
+        return False, msg
+
+    def run(
+        self,
+        vecdb_dir: str,
+        docs: list[dict],
+        stall_timeout: float = STALL_TIMEOUT,
+        heartbeat_timeout: float = HEARTBEAT_TIMEOUT,
+    ) -> tuple[bool, str]:
+        """Index *docs* into *vecdb_dir* in the child, returning ``(ok, message)``."""
+        if not self.alive:
+            if self._proc is not None:
+                self._reap(grace=0)
+            self._spawn()
+        self._job_id += 1
+        try:
+            with tracing.span("index.job", docs=len(docs)):
+                self._chan.send(
+                    type="job", id=self._job_id, vecdb_dir=vecdb_dir, docs=docs
+                )
+                return self._await_result(
+                    self._job_id, stall_timeout, heartbeat_timeout
+                )
+        except (EOFError, OSError):
+            msg = self._reap()
+            logger.warning("Indexer %s died: %s", self.name, msg)
+            return False, msg
+
+    def _await_result(
+        self, job_id: int, stall_timeout: float, heartbeat_timeout: float
+    ) -> tuple[bool, str]:
+        last_msg = last_progress_at = time.monotonic()
+        progress = None
+        while True:
+            if not self._chan.poll(min(HEARTBEAT_INTERVAL, heartbeat_timeout)):
+                if time.monotonic() - last_msg > heartbeat_timeout:
+                    return self._kill_hung(f"no heartbeat for {heartbeat_timeout:g}s")
+                continue
+            msg = self._chan.recv()
+            now = last_msg = time.monotonic()
+            kind = msg.get("type")
+            if kind == "heartbeat" and msg.get("id") == job_id:
+                if msg.get("progress") != progress:
+                    progress, last_progress_at = msg.get("progress"), now
+                elif now - last_progress_at > stall_timeout:
+                    return self._kill_hung(
+                        f"no progress for {stall_timeout:g}s in {msg.get('stage')}"
+                    )
+            elif kind == "result" and msg.get("id") == job_id:
+                if msg.get("ok"):
+                    counts = msg.get("counts") or {}
+                    tracing.count("chunks_embedded", sum(counts.values()))
+                    logger.debug(
+                        "Indexer %s: %d chunk(s) for %d doc(s)",
+                        self.name,
+                        sum(counts.values()),
+                        len(counts),
+                    )
+                    return True, "ok"
+                logger.debug("Indexer traceback:\n%s", msg.get("traceback", ""))
+                return False, str(msg.get("error", "indexing failed"))
+            # "ready" and stale heartbeats need no action.
+
+    def close(self) -> None:
+        """Ask the child to exit and wait for it."""
+        if self._proc is None:
+            return
         try:
-            collection.delete(where={"doc_uuid": doc_uuid})
-        except Exception:
+            self._chan.send(type="shutdown")
+        except (OSError, ValueError):
             pass
+        self._reap()
 
-        embeddings = embed_documents(chunks)
-        batch = 2000
-        for start in range(0, len(chunks), batch):
-            end = start + batch
-            collection.add(
-                documents=chunks[start:end],
-                embeddings=embeddings[start:end],
-                ids=ids[start:end],
-                metadatas=metadatas[start:end],
-            )
 
-        print(
-            f"[safe_index] Indexed {len(chunks)} chunks for {doc_uuid}",
-            file=sys.stderr,
-        )
-    except BaseException as exc:
-        traceback.print_exc()
-        print(f"[safe_index] FAILED for {doc_uuid}: {exc}", file=sys.stderr)
-        sys.exit(2)
+class IndexerPool:
+    """Up to *size* warm :class:`IndexerProcess` children shared by threads.
+
+    ``acquire()`` blocks until a child is free, so at most *size* indexing jobs
+    run at once; children are kept (model loaded) between jobs.
+    """
+
+    def __init__(self, size: int = 2) -> None:
+        self.size = max(1, size)
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+        self._idle: list[IndexerProcess] = []
+        self._all: list[IndexerProcess] = []
+
+    @contextmanager
+    def acquire(self) -> Iterator[IndexerProcess]:
+        with self._slots:
+            with self._lock:
+                if self._idle:
+                    proc = self._idle.pop()
+                else:
+                    proc = IndexerProcess(name=f"vec-indexer-{len(self._all) + 1}")
+                    self._all.append(proc)
+            try:
+                yield proc
+            finally:
+                with self._lock:
+                    self._idle.append(proc)
+
+    def shutdown(self) -> None:
+        """Stop every child (called at interpreter exit)."""
+        with self._lock:
+            procs, self._all, self._idle = self._all, [], []
+        for proc in procs:
+            proc.close()
+
+
+_pool: IndexerPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> IndexerPool:
+    """The process-wide indexer pool, sized by ``EvidConfig.index_workers``."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            from evid.config import EvidConfig
+
+            _pool = IndexerPool(EvidConfig.cached().index_workers)
+            atexit.register(_pool.shutdown)
+        return _pool
 
 
 def run_in_subprocess(
@@ -95,8 +416,10 @@ def run_in_subprocess(
     """
     ctx = mp.get_context("spawn")
     proc = ctx.Process(target=target, args=args, name=name)
-    proc.start()
-    proc.join(timeout=timeout)
+    tracing.count("subprocesses")
+    with tracing.span("index.subprocess"):
+        proc.start()
+        proc.join(timeout=timeout)
 
     if proc.is_alive():
         proc.terminate()
@@ -106,9 +429,32 @@ def run_in_subprocess(
     code = proc.exitcode
     if code == 0:
         return True, "ok"
-    if code is not None and code < 0:
-        return False, f"subprocess killed by signal {-code}"
-    return False, f"subprocess exited with code {code}"
+    return False, _exit_message(code)
+
+
+def index_batch_in_subprocess(
+    vecdb_dir: str | Path,
+    docs: list[dict],
+    stall_timeout: float = STALL_TIMEOUT,
+) -> tuple[bool, str]:
+    """Index several docs of one set in a warm pooled indexer process.
+
+    *docs* are dicts with ``uuid``, ``label``, ``tags`` and ``text``. The batch
+    succeeds or fails as a whole; it is cut off only if the indexer hangs or
+    makes no progress for *stall_timeout* seconds.
+    """
+    Path(vecdb_dir).mkdir(parents=True, exist_ok=True)
+    payload = [
+        {
+            "uuid": d["uuid"],
+            "label": d["label"],
+            "tags": list(d["tags"]),
+            "text": d["text"],
+        }
+        for d in docs
+    ]
+    with get_pool().acquire() as proc:
+        return proc.run(str(vecdb_dir), payload, stall_timeout=stall_timeout)
 
 
 def index_in_subprocess(
@@ -117,13 +463,11 @@ def index_in_subprocess(
     doc_label: str,
     doc_tags: list[str],
     typ_text: str,
-    timeout: float = 600.0,
+    stall_timeout: float = STALL_TIMEOUT,
 ) -> tuple[bool, str]:
-    """Run :func:`_index_worker` in a spawned subprocess."""
-    Path(vecdb_dir).mkdir(parents=True, exist_ok=True)
-    return run_in_subprocess(
-        _index_worker,
-        (str(vecdb_dir), doc_uuid, doc_label, list(doc_tags), typ_text),
-        timeout=timeout,
-        name=f"vec-index-{doc_uuid[:8]}",
+    """Index one document in a warm pooled indexer process."""
+    return index_batch_in_subprocess(
+        vecdb_dir,
+        [{"uuid": doc_uuid, "label": doc_label, "tags": doc_tags, "text": typ_text}],
+        stall_timeout=stall_timeout,
     )
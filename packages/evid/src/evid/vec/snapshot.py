@@ -0,0 +1,232 @@
+"""Portable vector-index snapshots: a set's chunks and embeddings in one file.
+
+Moving a set to another machine used to mean ``evid set reindex``, embedding
+every chunk again. A snapshot carries the index itself. It is an ``.npz``
+archive (a zip of ``.npy`` columns, readable with :func:`numpy.load`), one row
+per chunk:
+
+* ``embeddings`` — ``(rows, dim)`` ``float32`` (or ``float16``) matrix, stored
+  uncompressed and streamed in and out in batches;
+* ``chunk_idx``, ``char_start`` — ``int64`` columns;
+* ``ids``, ``doc_uuid``, ``label``, ``tags``, ``documents`` — UTF-8 string
+  columns, each a byte blob (``<col>``, deflated) plus ``<col>_offsets``;
+* ``meta`` — JSON header: format version, ``embedding_model``,
+  ``chunker_version``, ``chunk_overlap_tokens``, ``dim`` and ``rows``.
+
+Vectors are only usable with the model that made them, so
+:meth:`Snapshot.check_model` refuses other models; a different chunker only
+means later reindexing may split documents differently, and is logged.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import zipfile
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from itertools import pairwise
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILE = "vecindex.npz"  # picked up from evid dataset directories on import
+FORMAT = "evid-vecindex"
+VERSION = 1
+_BATCH = 2000
+_STRINGS = ("ids", "doc_uuid", "label", "tags", "documents")
+_INTS = ("chunk_idx", "char_start")
+
+
+def write_snapshot(
+    collection, path: Path, dtype: str = "float32", progress=None
+) -> int:
+    """Write every record of *collection* to a snapshot at *path*.
+
+    *collection* is a set's ``docs`` collection (Chroma or
+    :class:`~evid.vec.npstore.NumpyStore`). *progress* is called with
+    ``(written, total)``. Returns the number of rows.
+    """
+    from evid.config import EvidConfig
+    from evid.vec.chunking import CHUNKER_VERSION
+
+    total = collection.count()
+    columns: dict[str, list] = {name: [] for name in _STRINGS + _INTS}
+    dim = None
+    tmp = path.with_name(path.name + ".tmp")
+    with zipfile.ZipFile(tmp, "w", allowZip64=True) as zf:
+        out = None
+        written = 0
+        for offset in range(0, total, _BATCH):
+            got = collection.get(
+                include=["embeddings", "documents", "metadatas"],
+                limit=_BATCH,
+                offset=offset,
+            )
+            if not got["ids"]:
+                break
+            vectors = np.asarray(got["embeddings"], dtype=dtype)
+            if out is None:
+                dim = vectors.shape[1]
+                out = zf.open("embeddings.npy", "w", force_zip64=True)
+                np.lib.format.write_array_header_1_0(
+                    out,
+                    {
+                        "descr": np.lib.format.dtype_to_descr(vectors.dtype),
+                        "fortran_order": False,
+                        "shape": (total, dim),
+                    },
+                )
+            out.write(np.ascontiguousarray(vectors).tobytes())
+            for stored, doc in zip(got["metadatas"], got["documents"], strict=True):
+                meta = stored or {}
+                columns["doc_uuid"].append(meta.get("doc_uuid", ""))
+                columns["label"].append(meta.get("label", ""))
+                columns["tags"].append(meta.get("tags", ""))
+                columns["chunk_idx"].append(meta.get("chunk_idx", 0))
+                columns["char_start"].append(meta.get("char_start", 0))
+                columns["documents"].append(doc or "")
+            columns["ids"].extend(got["ids"])
+            written += len(got["ids"])
+            if progress:
+                progress(written, total)
+        if out is None:
+            _put(zf, "embeddings", np.zeros((0, 0), dtype=dtype))
+        else:
+            out.close()
+        if written != total:
+            raise RuntimeError(
+                f"Index changed while exporting: expected {total} rows, read {written}"
+            )
+
+        for name in _INTS:
+            _put(zf, name, np.asarray(columns[name], dtype=np.int64))
+        for name in _STRINGS:
+            blob, offsets = _pack(columns[name])
+            _put(zf, name, blob, compress=True)
+            _put(zf, f"{name}_offsets", offsets)
+        config = EvidConfig.cached()
+        info = {
+            "format": FORMAT,
+            "version": VERSION,
+            "embedding_model": (collection.metadata or {}).get("embedding_model"),
+            "chunker_version": CHUNKER_VERSION,
+            "chunk_overlap_tokens": config.chunk_overlap_tokens,
+            "dim": dim,
+            "rows": total,
+            "created": datetime.now(tz=UTC).isoformat(timespec="seconds"),
+        }
+        _put(zf, "meta", np.frombuffer(json.dumps(info).encode("utf-8"), np.uint8))
+    tmp.replace(path)
+    logger.info(f"Exported {total} vectors to {path}")
+    return total
+
+
+class Snapshot:
+    """A snapshot file opened for import; the columns except vectors are loaded."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with np.load(self.path) as z:
+            self.info = json.loads(z["meta"].tobytes())
+            if self.info.get("format") != FORMAT:
+                raise ValueError(f"{self.path} is not an evid index snapshot")
+            if self.info.get("version", 0) > VERSION:
+                raise ValueError(
+                    f"{self.path} is a version {self.info['version']} snapshot; "
+                    "upgrade evid to read it"
+                )
+            self._ints = {name: z[name] for name in _INTS}
+            self._strings = {
+                name: _unpack(z[name], z[f"{name}_offsets"]) for name in _STRINGS
+            }
+
+    def __len__(self) -> int:
+        return len(self._strings["ids"])
+
+    @property
+    def doc_uuids(self) -> list[str]:
+        """Document UUID of every row."""
+        return self._strings["doc_uuid"]
+
+    def check_model(self, model: str) -> None:
+        """Raise ValueError unless the vectors were made by *model*."""
+        from evid.vec.chunking import CHUNKER_VERSION
+
+        made_with = self.info.get("embedding_model")
+        if made_with != model:
+            raise ValueError(
+                f"{self.path.name} was embedded with '{made_with}' but the active "
+                f"model is '{model}'; import the documents and run "
+                "`evid set reindex` instead"
+            )
+        if self.info.get("chunker_version") != CHUNKER_VERSION:
+            logger.warning(
+                f"{self.path.name} was chunked by chunker version "
+                f"{self.info.get('chunker_version')} (this evid: {CHUNKER_VERSION}); "
+                "reindexed documents may be split differently"
+            )
+
+    def batches(
+        self, rows: np.ndarray | None = None, size: int = _BATCH
+    ) -> Iterator[dict]:
+        """``collection.add`` keyword arguments for *rows* (default all), in order.
+
+        The embedding matrix is read sequentially, *size* rows at a time.
+        """
+        wanted = np.ones(len(self), dtype=bool)
+        if rows is not None:
+            wanted[:] = False
+            wanted[rows] = True
+        with zipfile.ZipFile(self.path) as zf, zf.open("embeddings.npy") as fh:
+            if np.lib.format.read_magic(fh) == (1, 0):
+                shape, _fortran, dtype = np.lib.format.read_array_header_1_0(fh)
+            else:
+                shape, _fortran, dtype = np.lib.format.read_array_header_2_0(fh)
+            row_bytes = shape[1] * dtype.itemsize
+            for start in range(0, shape[0], size):
+                n = min(size, shape[0] - start)
+                block = np.frombuffer(fh.read(n * row_bytes), dtype=dtype)
+                keep = np.flatnonzero(wanted[start : start + n])
+                if not len(keep):
+                    continue
+                vectors = block.reshape(n, shape[1])[keep].astype(np.float32)
+                idx = keep + start
+                yield {
+                    "ids": [self._strings["ids"][i] for i in idx],
+                    "embeddings": vectors,
+                    "documents": [self._strings["documents"][i] for i in idx],
+                    "metadatas": [self._metadata(i) for i in idx],
+                }
+
+    def _metadata(self, i: int) -> dict:
+        return {
+            "doc_uuid": self._strings["doc_uuid"][i],
+            "label": self._strings["label"][i],
+            "tags": self._strings["tags"][i],
+            "chunk_idx": int(self._ints["chunk_idx"][i]),
+            "char_start": int(self._ints["char_start"][i]),
+        }
+
+
+def _put(zf: zipfile.ZipFile, name: str, array: np.ndarray, compress=False) -> None:
+    info = zipfile.ZipInfo(f"{name}.npy")
+    info.compress_type = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    with zf.open(info, "w", force_zip64=True) as fh:
+        np.lib.format.write_array(fh, array, allow_pickle=False)
+
+
+def _pack(strings: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """UTF-8 blob of *strings* and the ``len + 1`` byte offsets into it."""
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _unpack(blob: np.ndarray, offsets: np.ndarray) -> list[str]:
+    data = blob.tobytes()
+    bounds = offsets.tolist()
+    return [data[a:b].decode("utf-8") for a, b in pairwise(bounds)]
@@ -0,0 +1,35 @@
+"""Fixtures and helpers shared by the vector-store tests."""
+
+from datetime import UTC, datetime
+
+import numpy as np
+import pytest
+from evid.config import EvidConfig
+from evid.models import EvidenceSet, SetType
+
+
+@pytest.fixture
+def numpy_backend(monkeypatch):
+    """Make new sets use the NumPy vector backend."""
+    config = EvidConfig(vector_backend="numpy")
+    monkeypatch.setattr(EvidConfig, "cached", lambda *_a: config)
+
+
+def unit_vectors(n=40, dim=16, seed=0):
+    """*n* random unit vectors of *dim* dimensions (``float32``)."""
+    v = np.random.default_rng(seed).normal(size=(n, dim)).astype("float32")
+    return v / np.linalg.norm(v, axis=1, keepdims=True)
+
+
+def make_set(root, uuids=()):
+    """An EvidenceSet at *root* with a document directory per UUID.
+
+    The slug is the directory name, so sets in one test get their own
+    VecService clients.
+    """
+    (root / "docs").mkdir(parents=True, exist_ok=True)
+    for u in uuids:
+        (root / "docs" / u).mkdir()
+        (root / "docs" / u / "info.yml").write_text(f"uuid: {u}\nlabel: {u[:1]}\n")
+    (root / "vecdb").mkdir(exist_ok=True)
+    return EvidenceSet(root.name, root.name, root, SetType.NORMAL, datetime.now(tz=UTC))
@@ -0,0 +1,66 @@
+"""Tests for length-bucketed embedding batches (no real model load)."""
+
+import numpy as np
+from evid.vec import embeddings
+from evid.vec.batching import plan_batches
+
+
+def test_every_index_once():
+    lengths = [5, 300, 12, 12, 90, 1, 512, 40]
+    batches = plan_batches(lengths, token_budget=600, max_batch=3)
+    assert sorted(i for b in batches for i in b) == list(range(len(lengths)))
+
+
+def test_padded_tokens_stay_under_budget():
+    lengths = [(i * 37) % 200 + 1 for i in range(500)]
+    for batch in plan_batches(lengths, token_budget=1000, max_batch=64):
+        width = max(lengths[i] for i in batch)
+        assert len(batch) * width <= 1000 or len(batch) == 1
+        assert len(batch) <= 64
+
+
+def test_similar_lengths_share_a_batch():
+    lengths = [500, 10, 480, 12, 11, 490]
+    batches = plan_batches(lengths, token_budget=1500, max_batch=8)
+    assert batches == [[0, 5, 2], [3, 4, 1]]
+
+
+def test_oversized_item_gets_own_batch():
+    assert plan_batches([2000, 5], token_budget=100) == [[0], [1]]
+
+
+def test_empty():
+    assert plan_batches([]) == []
+
+
+class _FakeModel:
+    """Encodes each text as [len(text), 1]; records batch sizes."""
+
+    max_seq_length = 512
+    tokenizer = None
+
+    def __init__(self):
+        self.calls = []
+
+    def get_sentence_embedding_dimension(self):
+        return 2
+
+    def encode(self, texts, batch_size, **_kw):
+        self.calls.append(len(texts))
+        return np.array([[len(t), 1.0] for t in texts], dtype="float32")
+
+
+def test_embed_documents_restores_order(monkeypatch):
+    model = _FakeModel()
+    monkeypatch.setattr(embeddings, "_load_model", lambda: model)
+    monkeypatch.setattr(embeddings, "_loaded_name", "plain-model")
+    texts = ["a" * n for n in (400, 8, 4000, 40, 800, 4)]
+    seen = []
+
+    vecs = embeddings.embed_documents(
+        texts, progress=lambda done, total: seen.append((done, total)), token_budget=300
+    )
+
+    assert vecs[:, 0].tolist() == [len(t) for t in texts]
+    assert len(model.calls) > 1
+    assert seen[-1] == (len(texts), len(texts))
@@ -0,0 +1,57 @@
+"""Smoke test: the benchmark suite still runs against the current code."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+
+
+def _bench(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-m", "benchmarks", "--docs", "4", "--repeat", "1", *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def test_benchmarks_run_and_compare(tmp_path):
+    out = tmp_path / "base.json"
+    cases = ("-k", "text.", "-k", "search.", "-k", "tags.", "-k", "gather.json")
+    proc = _bench(*cases, "--json", str(out))
+    assert proc.returncode == 0, proc.stderr
+    results = json.loads(out.read_text(encoding="utf-8"))["results"]
+    assert {"text.chunk", "search.fulltext_regex", "tags.list", "gather.json"} <= set(
+        results
+    )
+    assert all(r["median"] > 0 for r in results.values())
+
+    proc = _bench(*cases, "--compare", str(out), "--tolerance", "1000")
+    assert proc.returncode == 0, proc.stderr
+    assert "ratio" in proc.stdout
+
+
+def test_hnsw_harness_reports_recall(tmp_path):
+    out = tmp_path / "hnsw.json"
+    proc = subprocess.run(
+        [
+            *(sys.executable, "-m", "benchmarks.hnsw", "--chunks", "300"),
+            *("--dim", "16", "--queries", "10", "--m", "8"),
+            *("--ef-construction", "32", "--ef-search", "10,64", "--nprobe", "4"),
+            *("--json", str(out)),
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert proc.returncode == 0, proc.stderr
+    rows = json.loads(out.read_text(encoding="utf-8"))
+    assert [r.get("ef_search") for r in rows] == [10, 64, None, None]
+    assert all(0 < r["recall"] <= 1 for r in rows)
+    exact, ivf = rows[2:]
+    assert (exact["backend"], exact["recall"]) == ("numpy-exact", 1)
+    assert (ivf["backend"], ivf["nprobe"]) == ("numpy-ivf", 4)
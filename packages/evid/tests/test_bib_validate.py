@@ -0,0 +1,148 @@
+"""Tests for single-pass BibTeX validation and the gather compile fallback."""
+
+import re
+import subprocess
+from pathlib import Path
+
+import pytest
+from evid.core import gather
+from evid.core.bib_validate import comment_out, find_invalid
+
+GOOD = """\
+@article{ab:main,
+ date = {2023-01-01},
+ title = {A {nested} title}
+}
+"""
+
+
+@pytest.mark.parametrize(
+    ("entry", "problem"),
+    [
+        ("@article{ab:x,\n title = {open { brace},\n}\n", "unbalanced braces"),
+        ("@comment{@article{ ab:x ,\n title = {open {},\n }}\n", "unbalanced braces"),
+        ("@article{ab:my key,\n title = {x},\n}\n", "invalid key"),
+        ("@article{ab:main,\n title = {again},\n}\n", "duplicate key"),
+        ("@article{ab:x,\n title {x},\n}\n", "expected '='"),
+        ('@article{ab:x,\n title = "no end,\n}\n', "unterminated quote"),
+    ],
+)
+def test_finds_structurally_broken_entries(entry, problem):
+    text = GOOD + entry + "@article{ab:after,\n title = {fine},\n}\n"
+    bad = find_invalid(text)
+    assert len(bad) == 1
+    assert problem in bad[0].problem
+    fixed = comment_out(text, [(bad[0].start, bad[0].end)])
+    assert find_invalid(fixed) == []
+    assert "@article{ab:after," in fixed.splitlines()
+
+
+def test_valid_entries_pass():
+    text = (
+        GOOD
+        + '@string{pub = "Publisher"}\n'
+        + '@article{ab:y,\n title = "q {x}" # pub,\n month = jan,\n year = 2020,\n'
+        + " date = {2020-05/2021},\n}\n"
+        + "% @article{ab:gone,\n% title = {open {,\n"
+    )
+    assert find_invalid(text) == []
+
+
+@pytest.mark.parametrize(
+    "field",
+    [
+        "urldate = {May 2023}",
+        "date = {2023-05-01T10:00:00}",
+        "date = {2023-02-30}",
+        "title = notamacro",
+    ],
+)
+def test_field_values_are_left_to_typst(field):
+    assert find_invalid(f"{GOOD}@article{{ab:x,\n {field},\n}}\n") == []
+
+
+def _fake_typst(calls):
+    """A `typst compile` stand-in that fails on uncommented POISON entries, or
+    on uses of the ``pub`` macro without its ``@string``, with an error that
+    names no key."""
+
+    def run(args, cwd, **_kw):
+        calls.append(args)
+        typ = Path(args[2])
+        bib_name = re.search(r'bibliography\("([^"]+)"', typ.read_text()).group(1)
+        bib = (Path(cwd) / bib_name).read_text(encoding="utf-8")
+        live = [line for line in bib.splitlines() if not line.startswith("%")]
+        failed = any("POISON" in line for line in live) or (
+            any("# pub" in line for line in live)
+            and not any(line.startswith("@string{pub") for line in live)
+        )
+        stderr = "error: failed to parse BibLaTeX file\n" if failed else ""
+        return subprocess.CompletedProcess(args, int(failed), "", stderr)
+
+    return run
+
+
+def _entries(n, poisoned=()):
+    return "".join(
+        f"@article{{ab:e{i},\n title = {{{'POISON' if i in poisoned else 'ok'}}},\n}}\n"
+        for i in range(n)
+    )
+
+
+def test_bisection_comments_out_unnamed_failures(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(gather.subprocess, "run", _fake_typst(calls))
+    bib = tmp_path / "out.bib"
+    bib.write_text(_entries(32, poisoned={5, 20}), encoding="utf-8")
+    typ = tmp_path / "out.typ"
+    typ.write_text(gather._TYPST_BIBLIO_TEMPLATE.replace("BIBNAME", bib.name))
+
+    assert gather._compile_with_fix(typ, bib)
+    commented = [line for line in bib.read_text().splitlines() if line.startswith("%")]
+    assert "% @article{ab:e5," in commented
+    assert "% @article{ab:e20," in commented
+    assert len(commented) == 2 * 3
+    assert len(calls) < 25  # vs. 32 entry-by-entry compiles
+
+
+def test_bisection_keeps_macros_in_every_probe(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(gather.subprocess, "run", _fake_typst(calls))
+    bib = tmp_path / "out.bib"
+    bib.write_text(
+        '@string{pub = "Publisher"}\n'
+        + _entries(8, poisoned={6})
+        + '@article{ab:user,\n title = "T" # pub,\n}\n',
+        encoding="utf-8",
+    )
+    typ = tmp_path / "out.typ"
+    typ.write_text(gather._TYPST_BIBLIO_TEMPLATE.replace("BIBNAME", bib.name))
+
+    assert gather._compile_with_fix(typ, bib)
+    commented = [line for line in bib.read_text().splitlines() if line.startswith("%")]
+    assert commented[0] == "% @article{ab:e6,"
+    assert len(commented) == 3
+    assert "@article{ab:user," in bib.read_text().splitlines()
+
+
+def test_typ_gather_needs_one_compile(tmp_path, monkeypatch):
+    docs = tmp_path / "sets" / "demo" / "docs"
+    for uuid, extra in (
+        ("aaaa1111", "@article{ aaaa:bad ,\n title = {open { brace},\n }\n"),
+        ("bbbb2222", "@article{ bbbb:date ,\n date = {2023-13-01},\n }\n"),
+    ):
+        (docs / uuid).mkdir(parents=True)
+        (docs / uuid / "info.yml").write_text(f"uuid: {uuid}\ntitle: T\n")
+        (docs / uuid / "label.bib").write_text(
+            f"@article{{ {uuid[:4]}:main ,\n title = {{T}},\n }}\n{extra}"
+        )
+    calls = []
+    monkeypatch.setattr(gather.subprocess, "run", _fake_typst(calls))
+    out = tmp_path / "out.typ"
+    gather.gather_dataset(tmp_path, "demo", out, regen=False)
+
+    assert len(calls) == 1
+    bib = out.with_suffix(".bib").read_text(encoding="utf-8")
+    assert find_invalid(bib) == []
+    assert "@article{aaaa:main," in bib
+    assert "@article{bbbb:date," in bib.splitlines()  # dates are typst's call
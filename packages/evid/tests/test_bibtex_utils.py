@@ -0,0 +1,120 @@
+"""Tests for the label.json → label.bib converter."""
+
+import json
+
+import pytest
+import yaml
+from evid.core import bibtex_utils
+from evid.core.bibtex_utils import json_to_bib
+
+INFO = """\
+uuid: 3f2a9c1e-0000
+title: Afgørelse \\textbf{om} aktindsigt_2023
+authors:
+  - Ankestyrelsen
+  - Jens Hansen
+dates: '2023-05-04'
+url: https://example.org/doc
+"""
+
+LABELS = [
+    {"key": "intro", "text": "Before   any page", "title": "NAME", "date": "DATE"},
+    {
+        "key": " klage ",
+        "text": "Klagen over \\emph{afslaget} 😀 blev_afvist",
+        "title": "Afgørelse {x}.06em",
+        "date": "2023-05-04",
+        "opage": 2,
+        "note": "central",
+    },
+    {
+        "key": "frist",
+        "text": "Fristen er 4 uger",
+        "title": "Afgørelse",
+        "date": "2023-02-30",
+        "opage": 3,
+        "note": "",
+    },
+]
+
+# Written by the pandas-based converter this one replaced.
+EXPECTED = """\
+@article{ 3f2a:main  ,
+    title = {Afgørelse aktindsigt 2023},
+    author = {Ankestyrelsen, Jens Hansen},
+    date = {2023-05-04},
+    url = {https://example.org/doc},
+    }
+@article{ 3f2a:intro  ,
+    title = {Before any page},
+    author = {Ankestyrelsen, Jens Hansen},
+    url = {https://example.org/doc},
+    }
+@article{ 3f2a:klage  ,
+    nonote = {central},
+    title = {Klagen over (emoji) blev afvist},
+    journal = {Afgørelse },
+    author = {Ankestyrelsen, Jens Hansen},
+    date = {2023-05-04},
+    pages = {2},
+    url = {https://example.org/doc},
+    }
+@article{ 3f2a:frist  ,
+    title = {Fristen er 4 uger},
+    journal = {Afgørelse},
+    author = {Ankestyrelsen, Jens Hansen},
+    pages = {3},
+    url = {https://example.org/doc},
+    }
+"""
+
+
+def _write(doc_dir, labels):
+    (doc_dir / "info.yml").write_text(INFO, encoding="utf-8")
+    items = [{"func": "metadata", "value": v} for v in labels]
+    (doc_dir / "label.json").write_text(json.dumps(items), encoding="utf-8")
+    return doc_dir / "label.json"
+
+
+@pytest.mark.parametrize("exclude_note", [True, False])
+def test_output_matches_previous_converter(tmp_path, exclude_note):
+    json_file = _write(tmp_path, LABELS)
+    json_to_bib(json_file, tmp_path / "label.bib", exclude_note)
+    expected = EXPECTED if exclude_note else EXPECTED.replace("nonote", "note")
+    assert (tmp_path / "label.bib").read_bytes() == expected.encode("utf-8")
+
+
+def test_info_yml_read_once(tmp_path, monkeypatch):
+    json_file = _write(tmp_path, LABELS * 20)
+    calls = []
+    real = yaml.safe_load
+    monkeypatch.setattr(
+        bibtex_utils.yaml, "safe_load", lambda f: calls.append(1) or real(f)
+    )
+    json_to_bib(json_file, tmp_path / "label.bib", True)
+    assert len(calls) == 1
+
+
+def test_unusual_dates_parse_as_pandas_did(tmp_path):
+    labels = [
+        {"key": "a", "text": "x", "date": "05/01/2023"},
+        {"key": "b", "text": "y", "date": "2023-01-05"},
+    ]
+    json_to_bib(_write(tmp_path, labels), tmp_path / "label.bib", True)
+    dates = [
+        line
+        for line in (tmp_path / "label.bib").read_text("utf-8").splitlines()
+        if "date =" in line
+    ]
+    # Format inferred from the first value (month first); the second misses it.
+    assert dates == ["    date = {2023-05-04},", "    date = {2023-05-01},"]
+
+
+@pytest.mark.parametrize(
+    "content", ["[]", '[{"value": {}}]', '[{"value": {"text": "no key"}}]']
+)
+def test_unusable_json_raises(tmp_path, content):
+    (tmp_path / "label.json").write_text(content, encoding="utf-8")
+    with pytest.raises(ValueError, match="Error processing JSON"):
+        json_to_bib(tmp_path / "label.json", tmp_path / "label.bib", True)
+    assert not (tmp_path / "label.bib").exists()
@@ -1,6 +1,8 @@
-"""Tests for evid.vec.chunking.chunk_text — small-fragment merging."""
+"""Tests for evid.vec.chunking.chunk_text — small-fragment merging and token caps."""
 
-from evid.vec.chunking import MIN_CHARS, chunk_text
+import itertools
+
+from evid.vec.chunking import MIN_CHARS, approx_tokens, chunk_text
 
 LONG = "x" * (MIN_CHARS + 10)  # a fragment that passes through unchanged
 LONG2 = "y" * (MIN_CHARS + 10)
@@ -70,3 +72,57 @@ def test_no_one_word_chunks_surface_alone():
     pairs = chunk_text(text)
     for chunk, _ in pairs:
         assert len(chunk) >= MIN_CHARS
+
+
+def _words(texts):
+    return [len(t.split()) for t in texts]
+
+
+SENTS = [f"Sentence number {i} has exactly seven words." for i in range(12)]
+PARA = " ".join(SENTS)
+
+
+def test_offsets_exact_with_indented_fragments():
+    text = f"  {LONG}\n\n\n   {LONG2}  \n\n"
+    pairs = chunk_text(text)
+    assert [text[s : s + len(c)] for c, s in pairs] == [LONG, LONG2]
+
+
+def test_under_budget_is_unchanged():
+    text = f"{SHORT}\n\n{LONG}\n\n{LONG2}"
+    assert chunk_text(text, max_tokens=10_000) == chunk_text(text)
+
+
+def test_long_paragraph_split_on_sentences():
+    text = f"{SHORT}\n\n{PARA}"
+    pairs = chunk_text(text, max_tokens=20, count_tokens=_words)
+    assert len(pairs) > 1
+    assert pairs[0][0].startswith(SHORT)  # heading stays with its text
+    for chunk, start in pairs:
+        assert sum(_words([chunk])) <= 20
+        first = chunk.split("\n")[-1][:20]
+        assert first in text[start:]
+        assert text[start : start + 8] == chunk[:8]
+    body = [c.split("\n")[-1] for c, _ in pairs]
+    assert " ".join(body) == PARA
+
+
+def test_overlap_repeats_trailing_sentence():
+    pairs = chunk_text(PARA, max_tokens=21, overlap=7, count_tokens=_words)
+    for (prev, _), (nxt, _) in itertools.pairwise(pairs):
+        last = prev.rsplit(". ", 1)[-1]
+        assert nxt.startswith(last.rstrip("."))
+
+
+def test_runaway_sentence_split_on_words():
+    text = " ".join(f"w{i}" for i in range(100))
+    pairs = chunk_text(text, max_tokens=30, count_tokens=_words)
+    assert all(len(c.split()) <= 30 for c, _ in pairs)
+    assert " ".join(c for c, _ in pairs) == text
+    assert all(text[s : s + len(c)] == c for c, s in pairs)
+
+
+def test_approx_tokens_default_counter():
+    pairs = chunk_text("Ab. " * 400, max_tokens=50)
+    assert len(pairs) > 1
+    assert all(approx_tokens([c])[0] <= 50 for c, _ in pairs)
@@ -0,0 +1,50 @@
+"""Import budget for the CLI entry point.
+
+Every ``evid`` invocation — including ``--help`` and shell completion — pays
+for whatever ``evid.cli.main`` imports. Heavy dependencies belong inside the
+commands that use them.
+"""
+
+import subprocess
+import sys
+
+HEAVY = (
+    "pandas",
+    "fitz",
+    "pypdf",
+    "demoji",
+    "chromadb",
+    "sentence_transformers",
+    "torch",
+    "bibtexparser",
+    "requests",
+    "git",
+    "PySide6",
+)
+
+# Generous: a cold import is ~0.25 s here, the heavy chain added ~0.5 s more.
+BUDGET_US = 1_500_000
+
+
+def _import_times() -> dict[str, int]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import evid.cli.main"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_cli_main_skips_heavy_dependencies():
+    times = _import_times()
+    loaded = {name.split(".")[0] for name in times}
+    assert not loaded & set(HEAVY), sorted(loaded & set(HEAVY))
+    assert times["evid.cli.main"] < BUDGET_US
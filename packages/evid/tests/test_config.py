@@ -0,0 +1,43 @@
+"""Tests for the process-wide EvidConfig cache."""
+
+from __future__ import annotations
+
+import os
+
+import yaml
+from evid.config import EvidConfig, reload_config
+
+
+def _write(path, **data):
+    path.write_text(yaml.safe_dump(data), encoding="utf-8")
+
+
+def test_cached_reuses_instance_until_file_changes(tmp_path):
+    cfg = tmp_path / "evid.yml"
+    _write(cfg, data_dir=str(tmp_path), editor="vim")
+    first = EvidConfig.cached(cfg)
+    assert first.editor == "vim"
+    assert EvidConfig.cached(cfg) is first
+
+    _write(cfg, data_dir=str(tmp_path), editor="nano")
+    st = cfg.stat()
+    os.utime(cfg, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert EvidConfig.cached(cfg).editor == "nano"
+
+
+def test_reload_hook_forces_reread(tmp_path):
+    cfg = tmp_path / "evid.yml"
+    _write(cfg, data_dir=str(tmp_path), editor="vim")
+    first = EvidConfig.cached(cfg)
+    reload_config()
+    assert EvidConfig.cached(cfg) is not first
+
+
+def test_save_invalidates_cache(tmp_path):
+    cfg = tmp_path / "evid.yml"
+    _write(cfg, data_dir=str(tmp_path), editor="vim")
+    first = EvidConfig.cached(cfg)
+    EvidConfig(data_dir=tmp_path, editor="emacs", index_workers=3).save(cfg)
+    again = EvidConfig.cached(cfg)
+    assert again is not first
+    assert (again.editor, again.index_workers) == ("emacs", 3)
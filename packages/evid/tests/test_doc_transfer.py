@@ -0,0 +1,70 @@
+"""Tests for copying documents between sets with their stored vectors."""
+
+import numpy as np
+import pytest
+from evid.core.evid_meta import read_meta
+from evid.services.doc_ingester import DocIngester
+from evid.services.vec_service import VecService
+from evid.vec.embeddings import model_name
+from evid.vec.npstore import NumpyStore
+
+from .conftest import make_set, unit_vectors
+
+UUIDS = ["a" * 32, "b" * 32, "c" * 32]
+
+
+def _source(tmp_path, model=None):
+    source = make_set(tmp_path / "src", UUIDS)
+    store = NumpyStore(source.path / "vecdb")
+    store.modify(metadata={"embedding_model": model or model_name()})
+    store.add(
+        ids=[f"{UUIDS[i % 3]}:{i // 3}" for i in range(6)],
+        embeddings=unit_vectors(6, dim=8),
+        documents=[f"chunk {i}" for i in range(6)],
+        metadatas=[
+            {"doc_uuid": UUIDS[i % 3], "chunk_idx": i // 3, "char_start": 0}
+            for i in range(6)
+        ],
+    )
+    return source, store
+
+
+def test_copy_transfers_vectors_without_embedding(tmp_path, numpy_backend):
+    source, store = _source(tmp_path)
+    dest = make_set(tmp_path / "dest", [UUIDS[2]])
+    ingester = DocIngester(vec_service=VecService())
+    ingester.index_existing_many = pytest.fail  # nothing may be re-embedded
+
+    outcome = ingester.copy_documents(source, [*UUIDS, "d" * 32], dest)
+    assert outcome == {
+        UUIDS[0]: "transferred",
+        UUIDS[1]: "transferred",
+        UUIDS[2]: "present",
+        "d" * 32: "missing",
+    }
+    target = NumpyStore(dest.path / "vecdb")
+    assert target.count() == 4
+    assert target.metadata["embedding_model"] == model_name()
+    got = target.get(ids=[f"{UUIDS[1]}:1"], include=["embeddings", "documents"])
+    expected = store.get(ids=[f"{UUIDS[1]}:1"], include=["embeddings"])
+    np.testing.assert_allclose(got["embeddings"], expected["embeddings"])
+    assert got["documents"] == ["chunk 4"]
+    assert read_meta(dest.path / "docs" / UUIDS[0]) == {"notes": "", "indexed": True}
+    assert (dest.path / "docs" / UUIDS[0] / "info.yml").exists()
+
+
+def test_other_model_falls_back_to_embedding(tmp_path, numpy_backend):
+    source, _ = _source(tmp_path, model="some/other-model")
+    dest = make_set(tmp_path / "dest")
+    ingester = DocIngester(vec_service=VecService())
+    embedded = []
+
+    def _index(dirs, evidence_set):
+        embedded.extend(d.name for d in dirs)
+        return [True] * len(dirs)
+
+    ingester.index_existing_many = _index
+    outcome = ingester.copy_documents(source, UUIDS[:2], dest)
+    assert outcome == dict.fromkeys(UUIDS[:2], "embedded")
+    assert embedded == UUIDS[:2]
+    assert NumpyStore(dest.path / "vecdb").count() == 0
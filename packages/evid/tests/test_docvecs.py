@@ -0,0 +1,102 @@
+"""Tests for document-level vectors and "more like this" search."""
+
+import numpy as np
+import pytest
+from evid.services.vec_service import VecService
+from evid.vec import docvecs
+from evid.vec.embeddings import model_name
+from evid.vec.npstore import NumpyStore
+
+from .conftest import make_set
+
+UUIDS = ["a" * 32, "b" * 32, "c" * 32, "d" * 32]
+
+
+def _unit(v):
+    v = np.asarray(v, dtype="float32")
+    return v / np.linalg.norm(v, axis=-1, keepdims=True)
+
+
+def _chunks(seed=0, dim=8):
+    """Three chunks per document; documents 0 and 1 lean the same way."""
+    rng = np.random.default_rng(seed)
+    base = {u: rng.normal(size=dim) for u in UUIDS}
+    base[UUIDS[1]] = base[UUIDS[0]] + 0.3 * rng.normal(size=dim)
+    rows = [(u, i) for u in UUIDS for i in range(3)]
+    vectors = _unit([base[u] + 0.5 * rng.normal(size=dim) for u, _ in rows])
+    metadatas = [{"doc_uuid": u, "chunk_idx": i, "char_start": 0} for u, i in rows]
+    return [f"{u}:{i}" for u, i in rows], vectors, metadatas
+
+
+def _collection(path, model="m"):
+    ids, vectors, metadatas = _chunks()
+    store = NumpyStore(path)
+    store.modify(metadata={"embedding_model": model})
+    store.add(ids=ids, embeddings=vectors, metadatas=metadatas)
+    return store, vectors
+
+
+def test_centroids_accumulate_across_batches():
+    _ids, vectors, metadatas = _chunks()
+    sums = docvecs.CentroidSums()
+    sums.add(metadatas[:4], vectors[:4])  # document 1 split over two batches
+    sums.add(metadatas[4:], vectors[4:])
+    assert sums.doc_uuids == set(UUIDS)
+    sums.write(store := _FakeStore())
+    got = dict(zip(store.ids, store.embeddings, strict=True))
+    np.testing.assert_allclose(got[UUIDS[1]], vectors[3:6].sum(axis=0), rtol=1e-5)
+    assert store.metadatas[1] == {"doc_uuid": UUIDS[1], "chunks": 3}
+
+
+class _FakeStore:
+    def add(self, ids, embeddings, metadatas):
+        self.ids, self.embeddings, self.metadatas = ids, embeddings, metadatas
+
+
+def test_similar_builds_index_and_ranks_by_centroid(tmp_path):
+    collection, vectors = _collection(tmp_path / "vecdb")
+    hits = docvecs.similar_documents(tmp_path, collection, UUIDS[0], n=2)
+    assert hits[0][0] == UUIDS[1]
+    assert UUIDS[0] not in [u for u, _ in hits]
+    centroids = {
+        u: _unit(vectors[3 * i : 3 * i + 3].mean(axis=0)) for i, u in enumerate(UUIDS)
+    }
+    assert hits[0][1] == pytest.approx(
+        float(centroids[UUIDS[0]] @ centroids[UUIDS[1]]), abs=1e-5
+    )
+    with pytest.raises(KeyError):
+        docvecs.similar_documents(tmp_path, collection, "e" * 32)
+
+
+def test_stale_index_is_rebuilt(tmp_path):
+    collection, _ = _collection(tmp_path / "vecdb")
+    store = docvecs.ensure_current(tmp_path, collection)
+    assert store.count() == 4
+    collection.delete(where={"doc_uuid": UUIDS[2]})  # behind the index's back
+    assert not docvecs.is_current(store, collection)
+    assert docvecs.ensure_current(tmp_path, collection).count() == 3
+
+    # Another embedding model (and dimension) replaces the store outright.
+    other = NumpyStore(tmp_path / "other")
+    other.modify(metadata={"embedding_model": "m2"})
+    other.add(
+        ids=["x:0"], embeddings=_unit(np.ones((1, 4))), metadatas=[{"doc_uuid": "x"}]
+    )
+    assert docvecs.ensure_current(tmp_path, other).get(include=[])["ids"] == ["x"]
+
+
+def test_service_keeps_index_current(tmp_path, numpy_backend):
+    source = make_set(tmp_path / "src", UUIDS)
+    _collection(source.path / "vecdb", model=model_name())
+    dest = make_set(tmp_path / "dest", UUIDS)
+
+    svc = VecService()
+    svc.transfer_documents(source, dest, UUIDS)
+    store = docvecs.open_doc_store(dest.path)
+    assert docvecs.is_current(store, NumpyStore(dest.path / "vecdb"))
+    svc.remove_document(UUIDS[3], dest)
+    assert docvecs.is_current(store, NumpyStore(dest.path / "vecdb"))
+
+    results = svc.similar(dest, UUIDS[0], n_results=5)
+    assert [doc.uuid for doc, _ in results] == [UUIDS[1], UUIDS[2]]
+    assert results[0][1] > results[1][1]
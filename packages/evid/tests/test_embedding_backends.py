@@ -0,0 +1,55 @@
+"""Tests for embedding backend selection (no real model download)."""
+
+import pytest
+import torch
+from evid.vec import embeddings
+
+
+class _FakeST(torch.nn.Sequential):
+    """Stands in for SentenceTransformer: a tiny module with a Linear layer."""
+
+    def __init__(self, name, backend="torch", device=None, model_kwargs=None):
+        super().__init__(torch.nn.Linear(8, 4))
+        self.name = name
+        self.backend = backend
+
+
+@pytest.fixture
+def fake_st(monkeypatch):
+    import sentence_transformers
+
+    monkeypatch.setattr(sentence_transformers, "SentenceTransformer", _FakeST)
+    monkeypatch.setattr(embeddings, "_model", None)
+    monkeypatch.setenv("EVID_EMBEDDING_MODEL", "some/model")
+
+
+def test_default_backend_is_torch(monkeypatch):
+    monkeypatch.delenv("EVID_EMBEDDING_BACKEND", raising=False)
+    assert embeddings.backend_name() == "torch"
+
+
+def test_env_var_selects_backend(monkeypatch):
+    monkeypatch.setenv("EVID_EMBEDDING_BACKEND", "onnx-int8")
+    assert embeddings.backend_name() == "onnx-int8"
+
+
+def test_unknown_backend_is_rejected(monkeypatch):
+    monkeypatch.setenv("EVID_EMBEDDING_BACKEND", "tensorrt")
+    with pytest.raises(ValueError, match="tensorrt"):
+        embeddings.backend_name()
+
+
+def test_torch_int8_quantizes_linear_layers(fake_st, monkeypatch):
+    monkeypatch.setenv("EVID_EMBEDDING_BACKEND", "torch-int8")
+    model = embeddings._load_model()
+    assert "quantized" in type(model[0]).__module__
+
+
+def test_backend_change_reloads_model(fake_st, monkeypatch):
+    monkeypatch.setenv("EVID_EMBEDDING_BACKEND", "torch")
+    first = embeddings._load_model()
+    assert embeddings._load_model() is first
+    monkeypatch.setenv("EVID_EMBEDDING_BACKEND", "onnx")
+    second = embeddings._load_model()
+    assert second is not first
+    assert second.backend == "onnx"
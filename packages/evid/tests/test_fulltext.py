@@ -136,3 +136,10 @@ def test_docs_without_label_typ_are_skipped(tmp_path):
 
 def test_empty_set(tmp_path):
     assert search_fulltext(tmp_path / "set", "anything") == []
+
+
+def test_regex_hits_report_their_own_page(tmp_path):
+    sp = tmp_path / "set"
+    _doc(sp, "u1", ["Claim A here.", "Nothing.", "Claim B here. Claim C too."])
+    hits = search_fulltext(sp, r"Claim \w", regex=True, n=10)
+    assert [h.page for h in hits] == [1, 3, 3]
@@ -0,0 +1,92 @@
+"""Tests for the streamed gather exports (.md, .json, .jsonl, .yaml)."""
+
+import json
+
+import pytest
+import yaml
+from evid.core import gather
+from evid.core.gather import _map_ordered, gather_dataset
+
+
+def _make_dataset(tmp_path, n=5):
+    docs = tmp_path / "sets" / "demo" / "docs"
+    for i in range(n):
+        uuid = f"{i:04d}beef"
+        doc = docs / uuid
+        doc.mkdir(parents=True)
+        info = {"uuid": uuid, "title": f"Doc {i}: ø", "authors": "Court", "url": ""}
+        (doc / "info.yml").write_text(yaml.safe_dump(info), encoding="utf-8")
+        (doc / "label.bib").write_text(
+            f"@article{{ {uuid[:4]}:main ,\n  title = {{Doc {i}}},\n}}\n"
+            f'@article{{{uuid[:4]}:s1,\n  title = {{line one\nline "two"}},\n'
+            f"  pages = {{{i}}}\n}}\n"
+            # a key repeated in every document
+            "@article{shared:key,\n  title = {again},\n}\n",
+            encoding="utf-8",
+        )
+    return tmp_path
+
+
+def test_json_matches_whole_document_dump(tmp_path):
+    root = _make_dataset(tmp_path)
+    gather_dataset(root, "demo", tmp_path / "out.json", regen=False)
+    gather_dataset(root, "demo", tmp_path / "out.jsonl", regen=False)
+
+    text = (tmp_path / "out.json").read_text(encoding="utf-8")
+    data = json.loads(text)
+    assert text == json.dumps(data, indent=2, ensure_ascii=False)
+    assert list(data) == [f"{i:04d}beef" for i in range(5)]
+    assert data["0002beef"]["snippets"]["0002:s1"]["pageno"] == "2"
+
+    lines = (tmp_path / "out.jsonl").read_text(encoding="utf-8").splitlines()
+    records = [json.loads(line) for line in lines]
+    assert {r.pop("uuid"): r for r in records} == data
+
+
+def test_json_without_documents_is_empty_object(tmp_path):
+    out = tmp_path / "out.json"
+    with out.open("w", encoding="utf-8") as fh:
+        gather._write_json(fh, iter([]))
+    assert json.loads(out.read_text(encoding="utf-8")) == {}
+
+
+def test_hayagriva_renames_keys_repeated_across_documents(tmp_path):
+    root = _make_dataset(tmp_path)
+    out = tmp_path / "out.yaml"
+    gather_dataset(root, "demo", out, regen=False)
+    data = yaml.safe_load(out.read_text(encoding="utf-8"))
+    assert {"shared:key", "shared:key_2", "shared:key_5"} <= set(data)
+    assert data["0001:s1"]["title"] == 'line one line "two"'
+
+
+def test_markdown_header_counts_streamed_sections(tmp_path):
+    root = _make_dataset(tmp_path)
+    out = tmp_path / "out.md"
+    gather_dataset(root, "demo", out, regen=False, include_keys=True)
+    text = out.read_text(encoding="utf-8")
+    assert "- **Documents**: 5\n- **Snippets**: 10\n" in text
+    assert text.index("## Doc 0") < text.index("## Doc 4")
+    assert '  ### s1\n  - p. 3: line one\n    line "two"' in text
+
+
+def test_jobs_give_the_same_output(tmp_path):
+    root = _make_dataset(tmp_path)
+    gather_dataset(root, "demo", tmp_path / "one.md", regen=False)
+    gather_dataset(root, "demo", tmp_path / "two.md", regen=False, jobs=2)
+    assert (tmp_path / "one.md").read_text("utf-8") == (tmp_path / "two.md").read_text(
+        "utf-8"
+    )
+
+
+def test_map_ordered_keeps_input_order():
+    items = [-5, 3, -1, 4, -2, 0, 7]
+    assert list(_map_ordered(abs, items, jobs=2)) == [abs(i) for i in items]
+
+
+def test_unsupported_format_exits_before_collecting(tmp_path, monkeypatch):
+    root = _make_dataset(tmp_path)
+    monkeypatch.setattr(
+        gather, "_collect_bibs_regen", lambda *_a: pytest.fail("collected")
+    )
+    with pytest.raises(SystemExit, match="Unsupported output format"):
+        gather_dataset(root, "demo", tmp_path / "out.csv")
@@ -0,0 +1,43 @@
+"""Tests for the per-set generation counter."""
+
+from __future__ import annotations
+
+from evid.core.evid_meta import write_meta
+from evid.core.generation import bump_doc_generation, bump_generation, set_generation
+from evid.services.set_manager import SetManager
+
+
+def test_bump_changes_generation(tmp_path):
+    s = SetManager(tmp_path).create_set("Case")
+    before = set_generation(s.path)
+    assert bump_generation(s.path) == 1
+    assert bump_generation(s.path) == 2
+    after = set_generation(s.path)
+    assert after[0] == 2
+    assert after != before
+
+
+def test_doc_writes_bump_their_set(tmp_path):
+    s = SetManager(tmp_path).create_set("Case")
+    doc_dir = s.path / "docs" / "u1"
+    doc_dir.mkdir()
+    before = set_generation(s.path)
+    write_meta(doc_dir, {"indexed": True})
+    assert set_generation(s.path)[0] == before[0] + 1
+
+
+def test_adding_a_document_changes_generation(tmp_path):
+    s = SetManager(tmp_path).create_set("Case")
+    before = set_generation(s.path)
+    (s.path / "docs" / "u2").mkdir()
+    # same counter, but docs/ changed
+    assert set_generation(s.path)[0] == before[0]
+    assert set_generation(s.path) != before
+
+
+def test_doc_outside_a_set_is_ignored(tmp_path):
+    doc_dir = tmp_path / "loose" / "u1"
+    doc_dir.mkdir(parents=True)
+    bump_doc_generation(doc_dir)
+    assert not (tmp_path / "loose" / ".generation").exists()
+    assert not (doc_dir.parent / ".generation").exists()
@@ -1,4 +1,4 @@
-"""Tests for IndexQueueWorker — the serialized background vecdb index queue."""
+"""Tests for IndexQueueWorker — the background vecdb index queue."""
 
 from __future__ import annotations
 
@@ -45,15 +45,15 @@ def test_queue_processes_jobs_in_order(qapp, tmp_path, monkeypatch):
         def __init__(self, *_a, **_k):
             pass
 
-        def index_existing(self, doc_dir, _evidence_set):
-            calls.append(doc_dir.name)
-            return True
+        def index_existing_many(self, doc_dirs, _evidence_set):
+            calls.extend(d.name for d in doc_dirs)
+            return [True] * len(doc_dirs)
 
     _patch_ingester(monkeypatch, _Recorder)
 
     es = _ES()
     done: list[tuple[str, str, bool]] = []
-    worker = IndexQueueWorker()
+    worker = IndexQueueWorker(workers=1)
     worker.item_done.connect(
         lambda s, u, ok: done.append((s, u, ok)), Qt.ConnectionType.DirectConnection
     )
@@ -72,23 +72,23 @@ def test_queue_processes_jobs_in_order(qapp, tmp_path, monkeypatch):
 
 
 def test_queue_reports_failure(qapp, tmp_path, monkeypatch):
-    """A raising index_existing yields item_done(..., ok=False) and keeps going."""
+    """A failed doc yields item_done(..., ok=False) and the queue keeps going."""
     from evid.gui.workers import IndexQueueWorker
 
     class _Recorder:
         def __init__(self, *_a, **_k):
             pass
 
-        def index_existing(self, doc_dir, _evidence_set):
-            if doc_dir.name.startswith("a"):
+        def index_existing_many(self, doc_dirs, _evidence_set):
+            if any(d.name.startswith("a") for d in doc_dirs) and len(doc_dirs) == 1:
                 raise RuntimeError("boom")
-            return True
+            return [not d.name.startswith("a") for d in doc_dirs]
 
     _patch_ingester(monkeypatch, _Recorder)
 
     es = _ES()
     done: list[tuple[str, str, bool]] = []
-    worker = IndexQueueWorker()
+    worker = IndexQueueWorker(workers=1)
     worker.item_done.connect(
         lambda s, u, ok: done.append((s, u, ok)), Qt.ConnectionType.DirectConnection
     )
@@ -114,14 +114,14 @@ def test_queue_emits_idle_when_drained(qapp, tmp_path, monkeypatch):
         def __init__(self, *_a, **_k):
             pass
 
-        def index_existing(self, _doc_dir, _evidence_set):
-            return True
+        def index_existing_many(self, doc_dirs, _evidence_set):
+            return [True] * len(doc_dirs)
 
     _patch_ingester(monkeypatch, _Recorder)
 
     es = _ES()
     idle_count: list[int] = []
-    worker = IndexQueueWorker()
+    worker = IndexQueueWorker(workers=1)
     worker.idle.connect(
         lambda: idle_count.append(1), Qt.ConnectionType.DirectConnection
     )
@@ -0,0 +1,158 @@
+"""Tests for IndexScheduler — per-set serialization, priorities, batching, cancel."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+from evid.services.index_queue import (
+    PRIORITY_VISIBLE,
+    IndexScheduler,
+)
+
+
+class _ES:
+    """Minimal stand-in for an EvidenceSet."""
+
+    def __init__(self, slug: str) -> None:
+        self.slug = slug
+
+
+def _dirs(*names: str) -> list[Path]:
+    return [Path("/sets/x/docs") / (n * 32) for n in names]
+
+
+def test_same_set_jobs_are_batched_in_order():
+    batches: list[list[str]] = []
+    sched = IndexScheduler(
+        lambda _es, dirs: (
+            batches.append([d.name[0] for d in dirs]) or [True] * len(dirs)
+        ),
+        workers=1,
+    )
+    es = _ES("a")
+    for d in _dirs("p", "q", "r"):
+        sched.submit(d, es)
+    sched.start()
+    sched.stop()
+    sched.join(5)
+    assert batches == [["p", "q", "r"]]
+
+
+def test_batch_size_caps_each_batch():
+    batches: list[int] = []
+    sched = IndexScheduler(
+        lambda _es, dirs: batches.append(len(dirs)) or [True] * len(dirs),
+        workers=1,
+        batch_size=2,
+    )
+    es = _ES("a")
+    for d in _dirs("p", "q", "r", "s", "t"):
+        sched.submit(d, es)
+    sched.start()
+    sched.stop()
+    sched.join(5)
+    assert batches == [2, 2, 1]
+
+
+def test_visible_doc_runs_first():
+    order: list[str] = []
+    sched = IndexScheduler(
+        lambda _es, dirs: order.extend(d.name[0] for d in dirs) or [True] * len(dirs),
+        workers=1,
+        batch_size=1,
+    )
+    es = _ES("a")
+    for d in _dirs("p", "q", "r"):
+        sched.submit(d, es)
+    assert sched.prioritize("r" * 32, PRIORITY_VISIBLE)
+    sched.start()
+    sched.stop()
+    sched.join(5)
+    assert order == ["r", "p", "q"]
+
+
+def test_same_set_never_overlaps_but_sets_run_in_parallel():
+    lock = threading.Lock()
+    active: dict[str, int] = {}
+    max_same = 0
+    max_total = 0
+
+    def runner(es, dirs):
+        nonlocal max_same, max_total
+        with lock:
+            active[es.slug] = active.get(es.slug, 0) + 1
+            max_same = max(max_same, active[es.slug])
+            max_total = max(max_total, sum(active.values()))
+        time.sleep(0.05)
+        with lock:
+            active[es.slug] -= 1
+        return [True] * len(dirs)
+
+    sched = IndexScheduler(runner, workers=4, batch_size=1)
+    sets = [_ES("a"), _ES("b")]
+    for i, d in enumerate(_dirs("p", "q", "r", "s", "t", "u")):
+        sched.submit(d, sets[i % 2])
+    sched.start()
+    sched.stop()
+    sched.join(5)
+    assert max_same == 1
+    assert max_total == 2
+
+
+def test_cancel_drops_queued_job():
+    done: list[str] = []
+    sched = IndexScheduler(
+        lambda _es, dirs: [True] * len(dirs),
+        workers=1,
+        on_done=lambda _s, u, _ok: done.append(u[0]),
+    )
+    es = _ES("a")
+    for d in _dirs("p", "q"):
+        sched.submit(d, es)
+    assert sched.cancel("q" * 32)
+    assert not sched.cancel("z" * 32)
+    sched.start()
+    sched.stop()
+    sched.join(5)
+    assert done == ["p"]
+
+
+def test_runner_exception_marks_batch_failed_and_idles():
+    done: list[bool] = []
+    idle: list[int] = []
+
+    def runner(_es, _dirs):
+        raise RuntimeError("boom")
+
+    sched = IndexScheduler(
+        runner,
+        workers=1,
+        on_done=lambda _s, _u, ok: done.append(ok),
+        on_idle=lambda: idle.append(1),
+    )
+    for d in _dirs("p", "q"):
+        sched.submit(d, _ES("a"))
+    sched.start()
+    sched.stop()
+    sched.join(5)
+    assert done == [False, False]
+    assert idle
+    assert sched.pending == 0
+
+
+def test_duplicate_submit_indexes_once():
+    seen: list[str] = []
+    sched = IndexScheduler(
+        lambda _es, dirs: seen.extend(d.name for d in dirs) or [True] * len(dirs),
+        workers=1,
+    )
+    es = _ES("a")
+    (d,) = _dirs("p")
+    sched.submit(d, es)
+    sched.submit(d, es)
+    sched.start()
+    sched.stop()
+    sched.join(5)
+    assert seen == [d.name]
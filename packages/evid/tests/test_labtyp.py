@@ -0,0 +1,161 @@
+"""Tests for the in-process labtyp label parser."""
+
+import json
+import random
+
+import pytest
+from evid.core import bibtex
+from evid.core.labtyp import UnsupportedLabtyp, extract_labels, parse_labels
+
+DOC = r"""#import "@preview/labtyp:0.1.0": lablist, lab, mset
+
+#mset(values: (
+  title: "Afgørelse",
+  date: "2023-05-04"))
+
+= Afgørelse
+
+#mset(values: (opage: 1))
+== Page 1
+See https://example.org/a for details. \#lab("escaped", "no", "")
+#lab("first", "Quote with \"quotes\" and // slashes", "a note")
+
+// #lab("commented", "no", "")
+/* #lab("block", "no", "") /* nested */ still comment */
+`#lab("raw", "no", "")`
+#strong[#lab("nested", "in content", "")]
+
+#mset(values: (opage: 2))
+== Page 2
+#lab("second", "Line\nbreak \u{e6}", "")
+
+= List of Labels
+#lablist()
+"""
+
+
+def _values(items):
+    assert all(i["func"] == "metadata" and i["label"] == "<lab>" for i in items)
+    return [i["value"] for i in items]
+
+
+def test_parses_labels_with_state():
+    assert _values(parse_labels(DOC).items()) == [
+        {
+            "key": "first",
+            "text": 'Quote with "quotes" and // slashes',
+            "note": "a note",
+            "title": "Afgørelse",
+            "date": "2023-05-04",
+            "opage": 1,
+        },
+        {
+            "key": "nested",
+            "text": "in content",
+            "note": "",
+            "title": "Afgørelse",
+            "date": "2023-05-04",
+            "opage": 1,
+        },
+        {
+            "key": "second",
+            "text": "Line\nbreak æ",
+            "note": "",
+            "title": "Afgørelse",
+            "date": "2023-05-04",
+            "opage": 2,
+        },
+    ]
+
+
+@pytest.mark.parametrize(
+    "snippet",
+    [
+        '#let lab2(k) = lab(k, "t", "")\n',
+        '#include "more.typ"\n',
+        '#import "other.typ": lab\n',
+        '#lab("k", "t")\n',
+        '#lab("k", text, "")\n',
+        '#lab("k", "t", "")[extra]\n',
+        '#box(lab("k", "t", ""))\n',
+        '#{ lab("k", "t", "") }\n',
+        "#mset(values: (opage: 1cm))\n",
+        '#lab("k", "unterminated, "")\n',
+    ],
+)
+def test_unsupported_constructs_raise(snippet):
+    with pytest.raises(UnsupportedLabtyp):
+        parse_labels(DOC + snippet)
+
+
+def test_incremental_reparse_matches_full_parse():
+    rng = random.Random(0)
+    pages = "".join(
+        f"#mset(values: (opage: {p}))\n== Page {p}\n"
+        + "".join(f'#lab("l{p}_{i}", "text {i}", "")\n\nfiller\n' for i in range(5))
+        for p in range(1, 40)
+    )
+    text = DOC + pages
+    parse = clean = parse_labels(text)
+    snippets = [
+        '#lab("new", "x", "")\n',
+        "words ",
+        "\n",
+        "// note\n",
+        "#mset(values: (opage: 0))\n",
+    ]
+    for _ in range(300):
+        pos = rng.randrange(len(text) + 1)
+        if rng.random() < 0.5:
+            new = text[:pos] + rng.choice(snippets) + text[pos:]
+        else:
+            new = text[:pos] + text[pos + rng.randint(1, 30) :]
+        try:
+            full = parse_labels(new)
+        except UnsupportedLabtyp:
+            continue
+        incremental = parse_labels(new, parse)
+        assert incremental.events == full.events
+        parse, text = incremental, new
+
+    # A one-line edit rescans about one line, not the document.
+    edited = clean.text.replace('"l20_2"', '"l20_2b"')
+    reparsed = parse_labels(edited, clean)
+    assert reparsed.scanned < 100 < len(edited)
+    assert "l20_2b" in [v["key"] for v in _values(reparsed.items())]
+
+
+def test_generate_bib_without_typst(tmp_path, monkeypatch):
+    typ = tmp_path / "label.typ"
+    typ.write_text(DOC, encoding="utf-8")
+    (tmp_path / "info.yml").write_text("uuid: abcd1234\n", encoding="utf-8")
+
+    def no_subprocess(*_a, **_kw):
+        raise AssertionError("typst query should not run")
+
+    monkeypatch.setattr(bibtex.subprocess, "run", no_subprocess)
+    ok, msg = bibtex.generate_bib_from_typ(typ)
+    assert ok, msg
+    items = json.loads((tmp_path / "label.json").read_text(encoding="utf-8"))
+    assert [v["key"] for v in _values(items)] == ["first", "nested", "second"]
+    assert "@article{ abcd:second  ," in (tmp_path / "label.bib").read_text("utf-8")
+
+    # Saving again after an edit picks up the new label.
+    typ.write_text(DOC.replace('"second"', '"renamed"'), encoding="utf-8")
+    assert [v["key"] for v in _values(extract_labels(typ))][-1] == "renamed"
+
+
+def test_unsupported_file_falls_back_to_typst_query(tmp_path, monkeypatch):
+    typ = tmp_path / "label.typ"
+    typ.write_text(DOC + '#include "more.typ"\n', encoding="utf-8")
+    calls = []
+
+    def fake_run(args, stdout, **_kw):
+        calls.append(args)
+        stdout.write("[]")
+        return bibtex.subprocess.CompletedProcess(args, 0, stderr=b"")
+
+    monkeypatch.setattr(bibtex.subprocess, "run", fake_run)
+    bibtex.generate_bib_from_typ(typ)
+    assert calls
+    assert calls[0][:2] == ["typst", "query"]
@@ -7,6 +7,7 @@ import json
 
 import pytest
 import yaml
+from evid.core.generation import bump_generation
 from evid.mcpserver import build_server
 from evid.services.set_manager import SetManager
 
@@ -16,6 +17,11 @@ def _text(call_result):
     return call_result[0][0].text
 
 
+def _results(call_result):
+    """Rows of a paged tool's {results, next_cursor} JSON."""
+    return json.loads(_text(call_result))["results"]
+
+
 def _seed(tmp_path):
     sm = SetManager(tmp_path)
     s = sm.create_set("My Case")
@@ -38,10 +44,13 @@ def test_tools_registered_no_list_sets(tmp_path):
     # Scoped server: no list_sets discovery tool.
     assert names == {
         "search_vec",
+        "search_vec_batch",
+        "get_chunk",
         "search_text",
         "search_meta",
         "list_docs",
         "doc_quotes",
+        "similar_docs",
     }
 
 
@@ -57,28 +66,24 @@ def test_tools_take_no_dataset_arg(tmp_path):
 def test_list_docs_scoped(tmp_path):
     _seed(tmp_path)
     m = build_server(tmp_path, "my-case")
-    docs = json.loads(_text(asyncio.run(m.call_tool("list_docs", {}))))
+    docs = _results(asyncio.run(m.call_tool("list_docs", {})))
     assert docs[0]["uuid"] == "u1"
 
 
 def test_search_meta_scoped(tmp_path):
     _seed(tmp_path)
     m = build_server(tmp_path, "my-case")
-    docs = json.loads(
-        _text(asyncio.run(m.call_tool("search_meta", {"pattern": "Judg"})))
-    )
+    docs = _results(asyncio.run(m.call_tool("search_meta", {"pattern": "Judg"})))
     assert docs[0]["label"] == "Judgment 2024"
 
 
 def test_search_text_scoped(tmp_path):
     _seed(tmp_path)
     m = build_server(tmp_path, "my-case")
-    hits = json.loads(
-        _text(
-            asyncio.run(
-                m.call_tool(
-                    "search_text", {"query": "responsible for the safety inspections"}
-                )
+    hits = _results(
+        asyncio.run(
+            m.call_tool(
+                "search_text", {"query": "responsible for the safety inspections"}
             )
         )
     )
@@ -90,7 +95,7 @@ def test_resolve_by_display_name(tmp_path):
     _seed(tmp_path)
     # bound by display name, not just slug
     m = build_server(tmp_path, "My Case")
-    docs = json.loads(_text(asyncio.run(m.call_tool("list_docs", {}))))
+    docs = _results(asyncio.run(m.call_tool("list_docs", {})))
     assert docs[0]["uuid"] == "u1"
 
 
@@ -98,3 +103,251 @@ def test_unknown_dataset_errors_at_startup(tmp_path):
     _seed(tmp_path)
     with pytest.raises(ValueError, match="not found"):
         build_server(tmp_path, "nope")
+
+
+def test_tools_are_async(tmp_path):
+    _seed(tmp_path)
+    m = build_server(tmp_path, "my-case")
+    for tool in m._tool_manager.list_tools():
+        assert tool.is_async, f"{tool.name} must not block the event loop"
+
+
+def test_list_docs_cached_until_set_is_written(tmp_path):
+    sm = _seed(tmp_path)
+    set_dir = sm.load_set("my-case").path
+    m = build_server(tmp_path, "my-case")
+    call = lambda: _results(asyncio.run(m.call_tool("list_docs", {})))  # noqa: E731
+    assert call()[0]["tags"] == ["priority"]
+
+    info = set_dir / "docs" / "u1" / "info.yml"
+    info.write_text(yaml.safe_dump({"uuid": "u1", "tags": "other"}), encoding="utf-8")
+    assert call()[0]["tags"] == ["priority"]  # served from cache
+    bump_generation(set_dir)
+    assert call()[0]["tags"] == ["other"]
+
+
+def test_search_vec_cache_and_concurrency(tmp_path, monkeypatch):
+    import numpy as np
+    from evid import mcpserver
+    from evid.models import Document, VecResult
+
+    _seed(tmp_path)
+    m = build_server(tmp_path, "my-case")
+    calls = []
+
+    class _Vec:
+        def query(self, es, q, n_results, filter_tags, embedding):
+            calls.append(q)
+            doc = Document("u1", es.path / "docs" / "u1", "Judgment 2024", [], None)
+            return [VecResult(doc, f"chunk for {q}", 0.9, 0, 0)]
+
+    monkeypatch.setattr(mcpserver, "_VEC", _Vec())
+    monkeypatch.setattr(
+        "evid.vec.embeddings.embed_queries", lambda texts: np.zeros((len(texts), 3))
+    )
+
+    async def many():
+        return await asyncio.gather(
+            *(m.call_tool("search_vec", {"query": f"q{i % 3}"}) for i in range(9))
+        )
+
+    results = [_results(r) for r in asyncio.run(many())]
+    assert [r[0]["preview"] for r in results[:3]] == [
+        "chunk for q0",
+        "chunk for q1",
+        "chunk for q2",
+    ]
+    assert sorted(set(calls)) == ["q0", "q1", "q2"]
+    n = len(calls)  # concurrent duplicates may race before the first result
+    asyncio.run(many())
+    assert len(calls) == n
+
+
+def test_query_batcher_coalesces_concurrent_queries():
+    import threading
+
+    from evid.mcpserver import _QueryBatcher
+
+    release = threading.Event()
+    batches: list[list[str]] = []
+
+    def embed(texts):
+        batches.append(texts)
+        if len(batches) == 1:
+            release.wait(5)
+        return [t.upper() for t in texts]
+
+    batcher = _QueryBatcher(embed)
+    out: dict[str, str] = {}
+    threads = [
+        threading.Thread(target=lambda t=t: out.__setitem__(t, batcher.embed(t)))
+        for t in ("a", "b", "c")
+    ]
+    threads[0].start()
+    while not batches:
+        pass
+    threads[1].start()
+    threads[2].start()
+    while len(batcher._pending) < 2:
+        pass
+    release.set()
+    for t in threads:
+        t.join(5)
+    assert out == {"a": "A", "b": "B", "c": "C"}
+    assert batches == [["a"], ["b", "c"]]
+
+
+def _add_doc(set_dir, uuid, title):
+    doc_dir = set_dir / "docs" / uuid
+    doc_dir.mkdir(parents=True)
+    (doc_dir / "info.yml").write_text(
+        yaml.safe_dump({"uuid": uuid, "title": title}), encoding="utf-8"
+    )
+
+
+def test_list_docs_pages_with_cursor(tmp_path):
+    sm = _seed(tmp_path)
+    set_dir = sm.load_set("my-case").path
+    for i in range(2, 6):
+        _add_doc(set_dir, f"u{i}", f"Doc {i}")
+    m = build_server(tmp_path, "my-case")
+
+    seen, cursor = [], ""
+    while True:
+        page = json.loads(
+            _text(asyncio.run(m.call_tool("list_docs", {"limit": 2, "cursor": cursor})))
+        )
+        assert len(page["results"]) <= 2
+        seen += [d["uuid"] for d in page["results"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert sorted(seen) == ["u1", "u2", "u3", "u4", "u5"]
+
+    # a cursor cannot be replayed against another query
+    first = json.loads(_text(asyncio.run(m.call_tool("list_docs", {"limit": 2}))))
+    with pytest.raises(Exception, match="different query"):
+        asyncio.run(
+            m.call_tool(
+                "search_meta",
+                {"pattern": "Doc", "cursor": first["next_cursor"]},
+            )
+        )
+
+
+def test_page_size_below_one_still_advances(tmp_path):
+    sm = _seed(tmp_path)
+    _add_doc(sm.load_set("my-case").path, "u2", "Doc 2")
+    m = build_server(tmp_path, "my-case")
+
+    for limit in (0, -3):
+        page = json.loads(
+            _text(asyncio.run(m.call_tool("list_docs", {"limit": limit})))
+        )
+        assert len(page["results"]) == 1
+        page = json.loads(
+            _text(
+                asyncio.run(
+                    m.call_tool(
+                        "list_docs", {"limit": limit, "cursor": page["next_cursor"]}
+                    )
+                )
+            )
+        )
+        assert len(page["results"]) == 1
+        assert page["next_cursor"] is None
+
+
+class _FakeVec:
+    """VecService stand-in: every query hits u1 with chunk 'hit <query>'."""
+
+    def __init__(self):
+        self.query_calls = 0
+
+    def _rows(self, es, q, n):
+        from evid.models import Document, VecResult
+
+        doc = Document("u1", es.path / "docs" / "u1", "Judgment 2024", [], None)
+        return [VecResult(doc, f"hit {q} {i}", 1.0 - i / 100, i, 0) for i in range(n)]
+
+    def query_many(self, es, queries, n_results, filter_tags, embeddings):
+        self.query_calls += 1
+        assert len(embeddings) == len(queries)
+        return [self._rows(es, q, min(n_results, 15)) for q in queries]
+
+    def query(self, es, q, n_results, filter_tags, embedding):
+        return self.query_many(es, [q], n_results, filter_tags, [embedding])[0]
+
+    def get_chunk(self, es, uuid, chunk_idx):
+        if chunk_idx != 0:
+            return None
+        return "The defendant was responsible\nfor the safety inspections.", 53
+
+
+@pytest.fixture
+def fake_vec(monkeypatch):
+    import numpy as np
+    from evid import mcpserver
+
+    vec = _FakeVec()
+    monkeypatch.setattr(mcpserver, "_VEC", vec)
+    monkeypatch.setattr(
+        "evid.vec.embeddings.embed_queries", lambda texts: np.zeros((len(texts), 3))
+    )
+    return vec
+
+
+def test_search_vec_batch_one_request_and_pages(tmp_path, fake_vec):
+    _seed(tmp_path)
+    m = build_server(tmp_path, "my-case")
+    out = json.loads(
+        _text(
+            asyncio.run(
+                m.call_tool("search_vec_batch", {"queries": ["a", "b", "c"], "n": 5})
+            )
+        )
+    )
+    assert fake_vec.query_calls == 1
+    assert [o["query"] for o in out] == ["a", "b", "c"]
+    assert [r["preview"] for r in out[1]["results"]] == [f"hit b {i}" for i in range(5)]
+
+    # continue query "b" where the batch left off
+    page = json.loads(
+        _text(
+            asyncio.run(
+                m.call_tool(
+                    "search_vec",
+                    {"query": "b", "n": 5, "cursor": out[1]["next_cursor"]},
+                )
+            )
+        )
+    )
+    assert [r["chunk_idx"] for r in page["results"]] == [5, 6, 7, 8, 9]
+    last = json.loads(
+        _text(
+            asyncio.run(
+                m.call_tool(
+                    "search_vec", {"query": "b", "n": 5, "cursor": page["next_cursor"]}
+                )
+            )
+        )
+    )
+    assert [r["chunk_idx"] for r in last["results"]] == [10, 11, 12, 13, 14]
+    assert last["next_cursor"] is None
+
+
+def test_get_chunk_reads_source_span_with_context(tmp_path, fake_vec):
+    _seed(tmp_path)
+    m = build_server(tmp_path, "my-case")
+    chunk = json.loads(
+        _text(
+            asyncio.run(
+                m.call_tool("get_chunk", {"uuid": "u1", "chunk_idx": 0, "context": 10})
+            )
+        )
+    )
+    assert chunk["text"] == "The defendant was responsible for the safety inspections."
+    assert chunk["before"] == "== Page 1\n"
+    assert chunk["after"] == "\n"
+    with pytest.raises(Exception, match="No chunk 3"):
+        asyncio.run(m.call_tool("get_chunk", {"uuid": "u1", "chunk_idx": 3}))
@@ -0,0 +1,164 @@
+"""Tests for the Chroma-free NumPy vector backend and backend conversion."""
+
+import numpy as np
+import pytest
+from evid.config import EvidConfig
+from evid.vec import db
+from evid.vec.npstore import NumpyStore, build_ivf
+
+from .conftest import make_set, unit_vectors
+
+EXACT = EvidConfig(vector_ivf_min_rows=0)
+
+
+def _fill(collection, vectors, start=0):
+    idx = range(start, start + len(vectors))
+    collection.add(
+        ids=[f"u{i % 4}:{i}" for i in idx],
+        embeddings=vectors,
+        documents=[f"chunk {i}" for i in idx],
+        metadatas=[
+            {"doc_uuid": f"u{i % 4}", "chunk_idx": i, "char_start": 0} for i in idx
+        ],
+    )
+
+
+def test_query_is_exact_cosine_top_k(tmp_path):
+    store = NumpyStore(tmp_path, config=EXACT)
+    vectors = unit_vectors()
+    _fill(store, vectors)
+    queries = unit_vectors(3, seed=1)
+
+    got = store.query(queries, n_results=5)
+    for q, ids, dists in zip(queries, got["ids"], got["distances"], strict=True):
+        order = np.argsort(-(vectors @ q))[:5]
+        assert ids == [f"u{i % 4}:{i}" for i in order]
+        np.testing.assert_allclose(dists, 1 - (vectors @ q)[order], atol=1e-5)
+    assert got["documents"][0][0].startswith("chunk ")
+
+
+def test_delete_and_upsert(tmp_path):
+    store = NumpyStore(tmp_path, config=EXACT)
+    vectors = unit_vectors()
+    _fill(store, vectors)
+    store.delete(where={"doc_uuid": {"$in": ["u1", "u2"]}})
+    assert store.count() == 20
+    assert not store.get(ids=["u1:5"])["ids"]
+
+    store.add(ids=["u0:0"], embeddings=vectors[5:6], documents=["moved"])
+    assert store.count() == 20
+    hit = store.query(vectors[5], n_results=1)
+    assert (hit["ids"][0], hit["documents"][0]) == (["u0:0"], ["moved"])
+
+    with pytest.raises(ValueError, match="duplicates of: \\['a'\\]"):
+        store.add(ids=["a", "a", "b"], embeddings=vectors[:3])
+    assert store.count() == 20
+
+
+def test_compact_and_reopen_keep_live_rows(tmp_path):
+    store = NumpyStore(tmp_path, dtype="float16", config=EXACT)
+    vectors = unit_vectors()
+    _fill(store, vectors)
+    store.modify(metadata={"embedding_model": "m"})
+    store.delete(where={"doc_uuid": "u3"})
+    assert store.compact() > 0
+
+    reopened = NumpyStore(tmp_path, config=EXACT)
+    assert reopened.count() == 30
+    assert reopened.metadata == {"embedding_model": "m"}
+    got = reopened.get(ids=["u1:5"], include=["embeddings", "metadatas"])
+    np.testing.assert_allclose(got["embeddings"][0], vectors[5], atol=1e-3)
+    assert sorted(f.name for f in tmp_path.iterdir()) == [
+        "npstore.json",
+        "rows.1.jsonl",
+        "vectors.1.bin",
+    ]
+
+
+def test_interrupted_append_is_cut_off(tmp_path):
+    store = NumpyStore(tmp_path, config=EXACT)
+    vectors = unit_vectors()
+    _fill(store, vectors[:10])
+    # A crash mid-append: matrix rows written, row line torn.
+    with (tmp_path / "vectors.0.bin").open("ab") as fh:
+        fh.write(vectors[10:12].tobytes())
+    with (tmp_path / "rows.0.jsonl").open("ab") as fh:
+        fh.write(b'{"id": "u2:1')
+
+    store = NumpyStore(tmp_path, config=EXACT)
+    assert store.count() == 10
+    _fill(store, vectors[10:20], start=10)
+    reopened = NumpyStore(tmp_path, config=EXACT)
+    assert reopened.count() == 20
+    assert reopened.query(vectors[15], n_results=1)["ids"] == [["u3:15"]]
+
+
+def test_other_instances_see_writes(tmp_path):
+    reader = NumpyStore(tmp_path, config=EXACT)
+    writer = NumpyStore(tmp_path, config=EXACT)
+    _fill(writer, unit_vectors())
+    assert reader.count() == 40
+
+
+def test_ivf_index_finds_clustered_neighbours(tmp_path):
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(20, 32))
+    data = centers[rng.integers(20, size=2000)] + rng.normal(scale=0.3, size=(2000, 32))
+    data = (data / np.linalg.norm(data, axis=1, keepdims=True)).astype("float32")
+    config = EvidConfig(vector_ivf_min_rows=1000, vector_ivf_nprobe=8)
+    store = NumpyStore(tmp_path, config=config)
+    store.add(ids=[str(i) for i in range(1500)], embeddings=data[:1500])
+    assert store._ivf is not None
+    store.add(ids=[str(i) for i in range(1500, 2000)], embeddings=data[1500:])
+
+    hits = 0
+    for i in range(0, 2000, 50):  # half the queries hit rows added after the build
+        exact = set(np.argsort(-(data @ data[i]))[:10])
+        got = store.query(data[i], n_results=10, include=[])["ids"][0]
+        hits += len(exact & {int(g) for g in got})
+    assert hits / 400 > 0.9
+
+
+def test_build_ivf_partitions_every_row():
+    centroids, order, offsets = build_ivf(unit_vectors(500), n_lists=8)
+    assert centroids.shape == (8, 16)
+    assert sorted(order.tolist()) == list(range(500))
+    assert (offsets[0], offsets[-1]) == (0, 500)
+
+
+def test_open_client_follows_vecdb_then_config(tmp_path):
+    numpy_default = EvidConfig(vector_backend="numpy")
+    assert db.vector_backend(tmp_path, numpy_default) == "numpy"
+    assert db.vector_backend(tmp_path, EXACT) == "chroma"
+    store = db.open_client(tmp_path, numpy_default)
+    assert isinstance(store, NumpyStore)
+    assert db.open_collection(store) is store
+    assert not db.needs_migration(store)
+    assert db.vector_backend(tmp_path, EXACT) == "numpy"
+
+
+def test_convert_both_ways_keeps_scores(tmp_path):
+    pytest.importorskip("chromadb")
+    from evid.services.vec_service import VecService
+
+    evidence_set = make_set(tmp_path)
+    vecdb = evidence_set.path / "vecdb"
+    vectors = unit_vectors()
+    chroma = db.open_collection(db.get_client(str(vecdb)))
+    chroma.modify(metadata={"embedding_model": "m"})
+    _fill(chroma, vectors)
+    query = vectors[3] + 0.5 * vectors[7]
+    query /= np.linalg.norm(query)
+    expected = np.sort(vectors @ query)[::-1][:5]
+
+    svc = VecService()
+    for backend in ("chroma", "numpy", "chroma"):
+        if svc.backend(evidence_set) != backend:
+            assert svc.convert(evidence_set, backend) == 40
+        assert svc.backend(evidence_set) == backend
+        hits = svc.query(evidence_set, "q", n_results=5, embedding=query)
+        np.testing.assert_allclose([h.score for h in hits], expected, atol=1e-4)
+        assert svc.get_chunk(evidence_set, "u1", 5) == ("chunk 5", 0)
+    assert sorted(f.name for f in vecdb.iterdir() if not f.is_dir()) == [
+        "chroma.sqlite3"
+    ]
@@ -132,3 +132,13 @@ def test_quotes_markdown_empty_when_no_label_json(tmp_path: Path) -> None:
     )
     # No label.json — unlabelled doc is skipped entirely.
     assert quotes_markdown([workdir]) == ""
+
+
+def test_quotes_markdown_picks_up_relabelled_doc(tmp_path: Path) -> None:
+    workdir = _make_doc(tmp_path, "case", "u1")
+    assert "Quoted passage." in quotes_markdown([workdir])
+    items = [{"value": {"key": "q1", "opage": 3, "text": "A new quote.", "note": ""}}]
+    (workdir / "label.json").write_text(json.dumps(items), encoding="utf-8")
+    md = quotes_markdown([workdir])
+    assert "A new quote." in md
+    assert "Quoted passage." not in md
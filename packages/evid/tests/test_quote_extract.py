@@ -7,9 +7,12 @@ import pytest
 import yaml
 from evid.core.quote_extract import (
     QuoteCandidate,
+    candidates_by_document,
     candidates_from_search,
     extract_document_text,
     extract_quotes,
+    extract_quotes_batch,
+    load_batch_quotes_json,
     load_quotes_json,
 )
 
@@ -146,3 +149,81 @@ def test_candidates_from_search_skips_empty_chunks():
     results = [_vr("AAAA", "   "), _vr("AAAA", "real chunk")]
     cands = candidates_from_search(results, "AAAA", n=5)
     assert [c.candidate for c in cands] == ["real chunk"]
+
+
+def test_batch_quotes_many_documents(tmp_path):
+    docs = {}
+    for i in range(3):
+        (tmp_path / f"d{i}").mkdir()
+        doc = _make_doc(tmp_path / f"d{i}")
+        docs[doc] = [
+            QuoteCandidate(candidate="the committee found the evidence conclusive"),
+            QuoteCandidate(candidate="the appeal was dismissed in its entirety"),
+            QuoteCandidate(candidate="zzzz qqqq xxxx wwww"),
+        ]
+    (tmp_path / "d1" / "1a2b3c4d5e6f" / "source.txt").unlink()
+
+    out = extract_quotes_batch(docs, min_ratio=0.6, jobs=2)
+
+    assert list(out) == list(docs)
+    bad = tmp_path / "d1" / "1a2b3c4d5e6f"
+    assert isinstance(out[bad], FileNotFoundError)
+    for doc, results in out.items():
+        if doc == bad:
+            continue
+        assert [r.key for r in results] == ["1a2b:q1", "1a2b:q2", None]
+        data = yaml.safe_load((doc / "machine.hayagriva").read_text())
+        assert sorted(data) == ["1a2b:main", "1a2b:q1", "1a2b:q2"]
+
+
+@pytest.mark.parametrize("info", ["title: [unclosed\n", ""])
+def test_batch_survives_broken_info_yml(tmp_path, info):
+    docs = {}
+    for i in range(2):
+        (tmp_path / f"d{i}").mkdir()
+        doc = _make_doc(tmp_path / f"d{i}")
+        docs[doc] = [QuoteCandidate(candidate="the appeal was dismissed")]
+    bad = tmp_path / "d0" / "1a2b3c4d5e6f"
+    (bad / "info.yml").write_text(info, encoding="utf-8")
+
+    out = extract_quotes_batch(docs, min_ratio=0.6, jobs=1)
+
+    assert isinstance(out[bad], Exception)
+    assert [r.key for r in out[tmp_path / "d1" / "1a2b3c4d5e6f"]] == ["1a2b:q1"]
+
+
+def test_key_counter_continues_existing_file(tmp_path):
+    doc = _make_doc(tmp_path)
+    (doc / "machine.hayagriva").write_text(
+        "1a2b:main:\n  type: article\n\n1a2b:q7:\n  type: article\n", encoding="utf-8"
+    )
+    cands = [QuoteCandidate(candidate="the appeal was dismissed")] * 3
+    results = extract_quotes(doc, cands, min_ratio=0.6)
+    assert [r.key for r in results] == ["1a2b:q8", "1a2b:q9", "1a2b:q10"]
+    text = (doc / "machine.hayagriva").read_text()
+    assert text.count(":main:") == 1
+
+
+def test_load_batch_quotes_json(tmp_path):
+    p = tmp_path / "batch.json"
+    p.write_text(
+        json.dumps({"aaaa": [{"candidate": "x"}], "bbbb": [{"candidate": "y"}]}),
+        encoding="utf-8",
+    )
+    batch = load_batch_quotes_json(p)
+    assert list(batch) == ["aaaa", "bbbb"]
+    assert batch["bbbb"][0].candidate == "y"
+    p.write_text("aaaa:\n  - candidate: x\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="not valid JSON"):
+        load_batch_quotes_json(p)
+
+
+def test_candidates_by_document_groups_and_caps():
+    hits = [
+        SimpleNamespace(doc=SimpleNamespace(uuid=u), chunk_text=t)
+        for u, t in [("a", "a1"), ("b", "b1"), ("a", "a2"), ("a", "a3"), ("b", " ")]
+    ]
+    out = candidates_by_document(hits, n=2)
+    assert list(out) == ["a", "b"]
+    assert [c.candidate for c in out["a"]] == ["a1", "a2"]
+    assert [c.candidate for c in out["b"]] == ["b1"]
@@ -1,6 +1,9 @@
 """Tests for the deterministic fuzzy quote matcher."""
 
-from evid.core.quote_match import fuzzy_locate, snap_to_sentence
+import random
+
+from evid.core import quote_match
+from evid.core.quote_match import QuoteIndex, fuzzy_locate, snap_to_sentence
 
 SOURCE = (
     "The court considered the matter at length. "
@@ -45,3 +48,78 @@ def test_fuzzy_locate_is_deterministic():
         b.score,
         b.match_start,
     )
+
+
+def _corpus(seed: int) -> tuple[str, list[str]]:
+    """A long, low-entropy text plus quotes cut from it with typos, and misses."""
+    rng = random.Random(seed)
+    words = [
+        "og",
+        "i",
+        "at",
+        "det",
+        "en",
+        "den",
+        "til",
+        "er",
+        "som",
+        "på",
+        "de",
+        "med",
+        "af",
+        "for",
+        "ikke",
+        "der",
+        "var",
+        "sig",
+        "men",
+        "har",
+        "om",
+        "vi",
+        "kommunen",
+        "borgeren",
+        "afgørelse",
+        "klage",
+        "sagen",
+        "frist",
+        "aktindsigt",
+    ]
+    text = "\n".join(
+        " ".join(rng.choice(words) for _ in range(rng.randint(8, 30))).capitalize()
+        + "."
+        for _ in range(1500)
+    )
+    candidates = []
+    for i in range(25):
+        size = rng.randrange(60, 600)
+        start = rng.randrange(0, len(text) - size)
+        chars = list(text[start : start + size])
+        for _ in range(rng.randrange(0, size // 6)):
+            at, edit = rng.randrange(len(chars)), rng.random()
+            if edit < 0.4:
+                chars.insert(at, rng.choice("xyz e"))
+            elif edit < 0.8:
+                del chars[at]
+            else:
+                chars[at] = rng.choice("xyz ")
+        candidates.append("".join(chars))
+        if i % 6 == 0:  # a paraphrase that should not match
+            candidates.append(" ".join(rng.choice(words) for _ in range(size // 5)))
+    return text, candidates
+
+
+def test_indexed_locate_matches_brute_force(monkeypatch):
+    monkeypatch.setattr(quote_match, "_FAST_MIN_CHARS", 0)
+    for seed in (1, 2, 3):
+        text, candidates = _corpus(seed)
+        index = QuoteIndex(text)
+        for cand in candidates:
+            assert fuzzy_locate(cand, text, index=index) == fuzzy_locate(cand, text)
+
+
+def test_index_for_other_text_is_ignored():
+    text, candidates = _corpus(3)
+    index = QuoteIndex(text[: len(text) // 2])
+    assert fuzzy_locate(candidates[0], text, index=index) == fuzzy_locate(
+        candidates[0], text
+    )
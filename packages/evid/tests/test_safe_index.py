@@ -7,7 +7,7 @@ import os
 import signal
 import time
 
-from evid.vec.safe_index import run_in_subprocess
+from evid.vec.safe_index import IndexerProcess, run_in_subprocess
 
 
 def _crash() -> None:
@@ -26,6 +26,40 @@ def _hang() -> None:
     time.sleep(60)
 
 
+def _echo_pid(_vecdb_dir, docs, _progress):
+    return {d["uuid"]: os.getpid() for d in docs}
+
+
+def _crash_on_boom(_vecdb_dir, docs, _progress):
+    if any(d["uuid"] == "boom" for d in docs):
+        os.kill(os.getpid(), signal.SIGSEGV)
+    return {d["uuid"]: 0 for d in docs}
+
+
+def _fail_job(_vecdb_dir, _docs, _progress):
+    raise ValueError("bad job")
+
+
+def _slow_but_progressing(_vecdb_dir, docs, progress):
+    for _ in range(4):
+        time.sleep(0.5)
+        progress("embed")
+    return {d["uuid"]: 0 for d in docs}
+
+
+def _stall_on_stuck(_vecdb_dir, docs, progress):
+    progress("embed")
+    if any(d["uuid"] == "stuck" for d in docs):
+        time.sleep(60)
+    return {d["uuid"]: 0 for d in docs}
+
+
+def _freeze_on_stop(_vecdb_dir, docs, _progress):
+    if any(d["uuid"] == "stop" for d in docs):
+        os.kill(os.getpid(), signal.SIGSTOP)
+    return {d["uuid"]: 0 for d in docs}
+
+
 def test_run_in_subprocess_survives_sigsegv():
     ok, msg = run_in_subprocess(_crash, (), timeout=30)
     assert ok is False
@@ -49,3 +83,69 @@ def test_run_in_subprocess_timeout():
     ok, msg = run_in_subprocess(_hang, (), timeout=2)
     assert ok is False
     assert "timed out" in msg.lower()
+
+
+def test_indexer_process_stays_warm_across_jobs():
+    proc = IndexerProcess(handler=_echo_pid)
+    try:
+        assert proc.run("", [{"uuid": "a"}], stall_timeout=30) == (True, "ok")
+        pid = proc.pid
+        assert proc.run("", [{"uuid": "b"}], stall_timeout=30) == (True, "ok")
+        assert proc.pid == pid
+    finally:
+        proc.close()
+    assert not proc.alive
+
+
+def test_indexer_process_respawns_after_sigsegv():
+    proc = IndexerProcess(handler=_crash_on_boom)
+    try:
+        ok, msg = proc.run("", [{"uuid": "boom"}], stall_timeout=30)
+        assert ok is False
+        assert "signal" in msg.lower()
+        assert proc.run("", [{"uuid": "fine"}], stall_timeout=30) == (True, "ok")
+    finally:
+        proc.close()
+
+
+def test_indexer_process_reports_python_error():
+    proc = IndexerProcess(handler=_fail_job)
+    try:
+        ok, msg = proc.run("", [], stall_timeout=30)
+        assert ok is False
+        assert "bad job" in msg
+        assert proc.alive
+    finally:
+        proc.close()
+
+
+def test_indexer_process_kills_stalled_job_and_respawns():
+    proc = IndexerProcess(handler=_stall_on_stuck)
+    try:
+        ok, msg = proc.run("", [{"uuid": "stuck"}], stall_timeout=2)
+        assert ok is False
+        assert "no progress" in msg
+        assert not proc.alive
+        assert proc.run("", [{"uuid": "fine"}], stall_timeout=30) == (True, "ok")
+    finally:
+        proc.close()
+
+
+def test_indexer_process_detects_missing_heartbeat():
+    proc = IndexerProcess(handler=_freeze_on_stop)
+    try:
+        ok, msg = proc.run("", [{"uuid": "stop"}], heartbeat_timeout=3)
+        assert ok is False
+        assert "no heartbeat" in msg
+        assert proc.run("", [{"uuid": "fine"}]) == (True, "ok")
+    finally:
+        proc.close()
+
+
+def test_indexer_process_lets_progressing_job_outlive_stall_window():
+    proc = IndexerProcess(handler=_slow_but_progressing)
+    try:
+        # 2 s of work with a 1 s stall window: progress keeps the job alive.
+        assert proc.run("", [{"uuid": "a"}], stall_timeout=1) == (True, "ok")
+    finally:
+        proc.close()
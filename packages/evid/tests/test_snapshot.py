@@ -0,0 +1,130 @@
+"""Tests for portable vector-index snapshots (export-index / import-index)."""
+
+import numpy as np
+import pytest
+import yaml
+from evid.core.evid_meta import read_meta, write_meta
+from evid.services.import_service import import_evid_dir
+from evid.services.set_manager import SetManager
+from evid.services.vec_service import VecService
+from evid.vec.embeddings import model_name
+from evid.vec.npstore import NumpyStore
+from evid.vec.snapshot import SNAPSHOT_FILE, Snapshot, write_snapshot
+
+from .conftest import make_set, unit_vectors
+
+UUIDS = ["a" * 32, "b" * 32, "c" * 32]
+
+
+def _source(path, model=None):
+    store = NumpyStore(path)
+    store.modify(metadata={"embedding_model": model or model_name()})
+    vectors = unit_vectors(9, dim=8)
+    store.add(
+        ids=[f"{UUIDS[i % 3]}:{i // 3}" for i in range(9)],
+        embeddings=vectors,
+        documents=[f"afsnit {i} — æøå" for i in range(9)],
+        metadatas=[
+            {
+                "doc_uuid": UUIDS[i % 3],
+                "label": f"L{i % 3}",
+                "tags": "x,y",
+                "chunk_idx": i // 3,
+                "char_start": 10 * i,
+            }
+            for i in range(9)
+        ],
+    )
+    return store, vectors
+
+
+def test_snapshot_round_trip(tmp_path):
+    store, vectors = _source(tmp_path / "src")
+    out = tmp_path / "index.npz"
+    assert write_snapshot(store, out) == 9
+
+    snap = Snapshot(out)
+    assert len(snap) == 9
+    assert snap.info["embedding_model"] == model_name()
+    assert snap.info["dim"] == 8
+    (batch,) = snap.batches()
+    assert batch["ids"] == store.get()["ids"]
+    assert batch["documents"][4] == "afsnit 4 — æøå"
+    assert batch["metadatas"][4] == {
+        "doc_uuid": UUIDS[1],
+        "label": "L1",
+        "tags": "x,y",
+        "chunk_idx": 1,
+        "char_start": 40,
+    }
+    np.testing.assert_allclose(batch["embeddings"], vectors, rtol=1e-6)
+    assert np.load(out)["embeddings"].shape == (9, 8)  # plain .npz
+
+
+def test_batches_select_rows_in_small_reads(tmp_path):
+    store, vectors = _source(tmp_path / "src")
+    out = tmp_path / "index.npz"
+    write_snapshot(store, out, dtype="float16")
+    got = list(Snapshot(out).batches(rows=np.array([1, 2, 7]), size=2))
+    assert [b["ids"] for b in got] == [
+        ["b" * 32 + ":0"],
+        ["c" * 32 + ":0"],
+        ["b" * 32 + ":2"],
+    ]
+    np.testing.assert_allclose(got[2]["embeddings"][0], vectors[7], atol=1e-3)
+
+
+def test_other_model_is_refused(tmp_path):
+    store, _ = _source(tmp_path / "src", model="some/other-model")
+    write_snapshot(store, tmp_path / "index.npz")
+    evidence_set = make_set(tmp_path / "set", UUIDS)
+    with pytest.raises(ValueError, match="other-model"):
+        VecService().import_index(evidence_set, tmp_path / "index.npz")
+
+
+def test_import_replaces_chunks_of_present_docs(tmp_path, numpy_backend):
+    store, vectors = _source(tmp_path / "src")
+    write_snapshot(store, tmp_path / "index.npz")
+    evidence_set = make_set(tmp_path / "set", UUIDS[:2])
+    target = NumpyStore(evidence_set.path / "vecdb")
+    target.add(
+        ids=[f"{UUIDS[0]}:7"],
+        embeddings=unit_vectors(1, dim=8, seed=3),
+        metadatas=[{"doc_uuid": UUIDS[0]}],
+    )
+    write_meta(
+        evidence_set.path / "docs" / UUIDS[1], {"notes": "keep", "indexed": False}
+    )
+
+    svc = VecService()
+    counts = svc.import_index(evidence_set, tmp_path / "index.npz")
+    assert counts == {UUIDS[0]: 3, UUIDS[1]: 3}
+    assert target.count() == 6
+    assert not target.get(ids=[f"{UUIDS[0]}:7"])["ids"]
+    assert read_meta(evidence_set.path / "docs" / UUIDS[1]) == {
+        "notes": "keep",
+        "indexed": True,
+    }
+    hits = svc.query(evidence_set, "q", n_results=1, embedding=vectors[4])
+    assert (hits[0].doc.uuid, hits[0].chunk_idx, hits[0].char_start) == (
+        UUIDS[1],
+        1,
+        40,
+    )
+
+
+def test_import_evid_dir_uses_snapshot(tmp_path, numpy_backend):
+    dataset = tmp_path / "evid_db" / "cases"
+    for u in UUIDS:
+        (dataset / u).mkdir(parents=True)
+        (dataset / u / "info.yml").write_text(
+            yaml.safe_dump({"uuid": u, "label": u[:1]})
+        )
+    store, _ = _source(tmp_path / "src")
+    write_snapshot(store, dataset / SNAPSHOT_FILE)
+
+    (evidence_set,) = import_evid_dir(
+        tmp_path / "evid_db", SetManager(tmp_path / "data")
+    )
+    assert NumpyStore(evidence_set.path / "vecdb").count() == 9
+    assert all(read_meta(evidence_set.path / "docs" / u)["indexed"] for u in UUIDS)
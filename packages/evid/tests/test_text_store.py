@@ -0,0 +1,131 @@
+"""Tests for the memory-mapped per-set text store."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+from evid.core import text_store
+from evid.core.text_store import TextStore
+
+
+def _doc(set_dir, uuid, text):
+    d = set_dir / "docs" / uuid
+    d.mkdir(parents=True, exist_ok=True)
+    (d / "label.typ").write_text(text, encoding="utf-8")
+    return d
+
+
+def test_slice_matches_python_slicing_across_strides(tmp_path, monkeypatch):
+    monkeypatch.setattr(text_store, "STRIDE", 7)
+    text = "Æbleskiver og rødgrød med fløde — ünïcödé ✓ " * 20
+    _doc(tmp_path, "a", text)
+    _doc(tmp_path, "b", "second document")
+    store = TextStore(tmp_path)
+    for start, end in [(0, 5), (3, 40), (6, 8), (100, 333), (0, len(text))]:
+        assert store.slice("a", start, end) == text[start:end]
+    assert store.slice("a", -5, 3) == text[:3]
+    assert store.slice("a", len(text) - 2, len(text) + 50) == text[-2:]
+    assert store.slice("a", 10, 10) == ""
+    assert store.text("b") == "second document"
+    assert store.length("a") == len(text)
+
+
+def test_store_persists_and_reopens(tmp_path):
+    _doc(tmp_path, "a", "hello world")
+    TextStore(tmp_path).slice("a", 0, 5)
+    assert (tmp_path / "textstore" / "text.bin").exists()
+    again = TextStore(tmp_path)
+    assert again.slice("a", 6, 11) == "world"
+
+
+def test_edited_document_is_rebuilt(tmp_path):
+    d = _doc(tmp_path, "a", "old text")
+    store = TextStore(tmp_path)
+    assert store.text("a") == "old text"
+    (d / "label.typ").write_text("brand new text", encoding="utf-8")
+    st = (d / "label.typ").stat()
+    os.utime(d / "label.typ", ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert store.text("a") == "brand new text"
+
+
+def test_missing_document_raises_keyerror(tmp_path):
+    _doc(tmp_path, "a", "x")
+    store = TextStore(tmp_path)
+    with pytest.raises(KeyError):
+        store.slice("nope", 0, 1)
+
+
+def test_chunk_span_covers_rejoined_fragments(tmp_path):
+    source = "= Title\n\nFirst paragraph here.\n\n  Second one.\nTail"
+    _doc(tmp_path, "a", source)
+    store = TextStore(tmp_path)
+    start = source.index("First")
+    chunk = "First paragraph here.\nSecond one."
+    s, e = store.chunk_span("a", start, chunk)
+    assert source[s:e] == "First paragraph here.\n\n  Second one."
+
+
+def _bin(set_dir):
+    return set_dir / "textstore" / "text.bin"
+
+
+def _touch_later(path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def test_documents_are_added_incrementally(tmp_path):
+    _doc(tmp_path, "a", "alpha text")
+    d = _doc(tmp_path, "b", "beta text")
+    store = TextStore(tmp_path)
+    assert store.text("a") == "alpha text"
+    assert _bin(tmp_path).read_bytes() == b"alpha text"  # b not read yet
+
+    assert store.text("b") == "beta text"
+    (d / "label.typ").write_text("beta, edited", encoding="utf-8")
+    _touch_later(d / "label.typ")
+    assert store.text("b") == "beta, edited"
+    # appended, not rewritten: a keeps its bytes, old b is dead space
+    assert _bin(tmp_path).read_bytes() == b"alpha textbeta textbeta, edited"
+    assert store.text("a") == "alpha text"
+
+
+def test_compaction_drops_dead_bytes(tmp_path, monkeypatch):
+    monkeypatch.setattr(text_store, "_COMPACT_MIN_DEAD", 0)
+    _doc(tmp_path, "a", "keep me")
+    d = _doc(tmp_path, "b", "x" * 50)
+    store = TextStore(tmp_path)
+    store.refresh()
+    (d / "label.typ").write_text("short", encoding="utf-8")
+    _touch_later(d / "label.typ")
+    assert store.text("b") == "short"  # dead (50) > live (12): compacted
+    assert _bin(tmp_path).read_bytes() == b"keep meshort"
+    assert TextStore(tmp_path).text("a") == "keep me"
+
+
+def test_refresh_adds_only_changed_documents(tmp_path):
+    _doc(tmp_path, "a", "one")
+    d = _doc(tmp_path, "b", "two")
+    store = TextStore(tmp_path)
+    assert store.refresh() == 2
+    assert store.refresh() == 0
+    (d / "label.typ").write_text("two!", encoding="utf-8")
+    assert store.refresh() == 1
+
+
+def test_other_process_compaction_is_noticed(tmp_path, monkeypatch):
+    monkeypatch.setattr(text_store, "_COMPACT_MIN_DEAD", 0)
+    _doc(tmp_path, "a", "aaaa")
+    d = _doc(tmp_path, "b", "b" * 40)
+    gui, mcp = TextStore(tmp_path), TextStore(tmp_path)
+    gui.refresh()
+    assert mcp.text("b") == "b" * 40
+    (d / "label.typ").write_text("bb", encoding="utf-8")
+    _touch_later(d / "label.typ")
+    assert gui.text("b") == "bb"  # gui compacts text.bin
+    c = _doc(tmp_path, "c", "new doc")
+    assert mcp.text("c") == "new doc"  # mcp reloads before appending
+    assert mcp.text("a") == "aaaa"
+    assert mcp.text("b") == "bb"
+    assert c.exists()
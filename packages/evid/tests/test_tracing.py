@@ -0,0 +1,111 @@
+"""Tests for the tracing spans, counters and JSON-lines export."""
+
+import io
+import json
+import subprocess
+import sys
+
+import pytest
+from evid import tracing
+from rich.console import Console
+
+
+@pytest.fixture(autouse=True)
+def _clean_tracing():
+    tracing.disable()
+    tracing.reset()
+    yield
+    tracing.disable()
+    tracing.reset()
+
+
+def test_disabled_records_nothing():
+    with tracing.span("stage"):
+        pass
+    tracing.count("files_read")
+    assert tracing.snapshot() == {"spans": {}, "counters": {}}
+
+
+def test_spans_and_counters_aggregate():
+    tracing.enable()
+    for _ in range(3):
+        with tracing.span("outer"), tracing.span("inner"):
+            tracing.count("files_read", 2)
+    snap = tracing.snapshot()
+    assert snap["spans"]["outer"]["calls"] == 3
+    assert snap["spans"]["inner"]["calls"] == 3
+    assert snap["spans"]["outer"]["total_ms"] >= snap["spans"]["inner"]["total_ms"]
+    assert snap["counters"] == {"files_read": 6}
+
+
+def test_traced_decorator_keeps_result_and_name():
+    tracing.enable()
+
+    @tracing.traced("work")
+    def work(x):
+        return x * 2
+
+    assert work(21) == 42
+    assert work.__name__ == "work"
+    assert tracing.snapshot()["spans"]["work"]["calls"] == 1
+
+
+def test_trace_file_gets_spans_then_counters(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    tracing.enable(path)
+    with tracing.span("outer", docs=2), tracing.span("inner"):
+        tracing.count("subprocesses")
+    with pytest.raises(ValueError), tracing.span("failing"):
+        raise ValueError
+    tracing.disable()
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    spans = {r["name"]: r for r in records if r["type"] == "span"}
+    assert spans["inner"]["parent"] == "outer"
+    assert spans["outer"]["parent"] is None
+    assert spans["outer"]["docs"] == 2
+    assert spans["failing"]["error"] == "ValueError"
+    assert records[-1] == {
+        "type": "counter",
+        "name": "subprocesses",
+        "value": 1,
+        "pid": records[0]["pid"],
+    }
+
+
+def test_print_report_lists_stages():
+    tracing.enable()
+    with tracing.span("gather.write"):
+        tracing.count("files_read", 4)
+    buf = io.StringIO()
+    tracing.print_report(Console(file=buf, width=120))
+    out = buf.getvalue()
+    assert "gather.write" in out
+    assert "files_read=4" in out
+
+
+def test_cli_profile_prints_breakdown(tmp_path):
+    docs = tmp_path / "sets" / "demo" / "docs" / "abcd"
+    docs.mkdir(parents=True)
+    (docs / "info.yml").write_text("uuid: abcd\ntitle: Demo\n", encoding="utf-8")
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from evid.cli.main import main; main()",
+            "--db",
+            str(tmp_path),
+            "--profile",
+            "search",
+            "meta",
+            "Demo",
+            "-s",
+            "demo",
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert "Profile" in proc.stderr
+    assert "search.meta" in proc.stderr
@@ -0,0 +1,81 @@
+"""Tests for `evid set vacuum`: orphan sweep, flag repair and compaction."""
+
+import pytest
+from evid.core.evid_meta import read_meta, write_meta
+from evid.services.vec_service import VecService
+from evid.vec import db
+from evid.vec.npstore import NumpyStore
+
+from .conftest import make_set, unit_vectors
+
+UUIDS = ["a" * 32, "b" * 32, "c" * 32, "d" * 32]
+
+
+def _fill(collection, uuids, per_doc):
+    rows = [(u, i) for u in uuids for i in range(per_doc)]
+    collection.add(
+        ids=[f"{u}:{i}" for u, i in rows],
+        embeddings=unit_vectors(len(rows), dim=8),
+        metadatas=[{"doc_uuid": u, "chunk_idx": i} for u, i in rows],
+    )
+
+
+def test_vacuum_sweeps_orphans_and_repairs_flags(tmp_path, numpy_backend):
+    # a: indexed, flag right. b: indexed, flag missing. c: flag set, no chunks.
+    # d: chunks but its directory is gone.
+    evidence_set = make_set(tmp_path / "s", UUIDS[:3])
+    docs = evidence_set.path / "docs"
+    write_meta(docs / UUIDS[0], {"notes": "", "indexed": True})
+    write_meta(docs / UUIDS[2], {"notes": "keep", "indexed": True})
+    store = NumpyStore(evidence_set.path / "vecdb")
+    _fill(store, [UUIDS[0], UUIDS[1], UUIDS[3]], per_doc=3)
+
+    svc = VecService()
+    dry = svc.vacuum(evidence_set, dry_run=True)
+    assert (dry.chunks, dry.orphan_docs, dry.orphan_chunks) == (9, [UUIDS[3]], 3)
+    assert dry.flagged_indexed == [UUIDS[1]]
+    assert dry.flagged_unindexed == [UUIDS[2]]
+    assert dry.dead_fraction == pytest.approx(1 / 3)
+    assert store.count() == 9
+    assert not read_meta(docs / UUIDS[1]).get("indexed")
+
+    report = svc.vacuum(evidence_set)
+    assert report.orphan_chunks == 3
+    assert report.compacted
+    assert report.bytes_freed > 0
+    assert NumpyStore(evidence_set.path / "vecdb").count() == 6
+    assert len(NumpyStore(evidence_set.path / "vecdb").ids) == 6  # no dead rows
+    assert read_meta(docs / UUIDS[1])["indexed"] is True
+    assert read_meta(docs / UUIDS[2]) == {"notes": "keep", "indexed": False}
+
+    again = svc.vacuum(evidence_set)
+    assert (again.orphan_docs, again.flagged_indexed, again.flagged_unindexed) == (
+        [],
+        [],
+        [],
+    )
+    assert not again.compacted
+
+
+def test_compact_chroma_drops_dead_vectors_and_stale_segments(tmp_path):
+    pytest.importorskip("chromadb")
+    evidence_set = make_set(tmp_path / "chroma_vacuum", UUIDS[:2])
+    vecdb_dir = evidence_set.path / "vecdb"
+    svc = VecService()
+    collection = svc._collection(evidence_set)
+    _fill(collection, UUIDS, per_doc=600)
+
+    assert svc.remove_documents(UUIDS[2:], evidence_set) == 1200
+    svc.close(evidence_set.slug)
+    del collection
+    db._release_chroma()
+    before = db.store_bytes(vecdb_dir)
+
+    freed = db.compact_store(vecdb_dir)
+    assert freed > 0
+    assert db.store_bytes(vecdb_dir) == before - freed
+    assert db.stale_segment_dirs(vecdb_dir) == []
+    collection = svc._collection(evidence_set)
+    assert collection.count() == 1200
+    assert db.stored_doc_uuids(collection) == dict.fromkeys(UUIDS[:2], 600)
+    assert db.dead_fraction(vecdb_dir, collection) == pytest.approx(0, abs=0.01)
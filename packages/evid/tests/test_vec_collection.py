@@ -0,0 +1,124 @@
+"""Tests for cosine-space, configurable HNSW set collections and their migration."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("chromadb")
+
+from evid.config import EvidConfig
+from evid.services.vec_service import VecService
+from evid.vec import db
+from evid.vec.db import (
+    get_client,
+    hnsw_settings,
+    migrate_collection,
+    needs_migration,
+    open_collection,
+)
+
+from .conftest import make_set, unit_vectors
+
+CONFIG = EvidConfig(hnsw_max_neighbors=8, hnsw_ef_construction=40, hnsw_ef_search=30)
+
+
+def _fill(collection, vectors):
+    collection.add(
+        ids=[f"u{i % 4}:{i}" for i in range(len(vectors))],
+        embeddings=vectors,
+        documents=[f"chunk {i}" for i in range(len(vectors))],
+        metadatas=[
+            {"doc_uuid": f"u{i % 4}", "chunk_idx": i, "char_start": 0}
+            for i in range(len(vectors))
+        ],
+    )
+
+
+def test_new_collection_uses_configured_hnsw(tmp_path):
+    client = get_client(str(tmp_path))
+    collection = open_collection(client, CONFIG)
+    settings = hnsw_settings(collection)
+    assert settings["space"] == "cosine"
+    assert (settings["max_neighbors"], settings["ef_construction"]) == (8, 40)
+    assert settings["ef_search"] == 30
+    assert not needs_migration(collection, CONFIG)
+
+    # ef_search is a search-time knob: it follows the config on the next open.
+    faster = CONFIG.model_copy(update={"hnsw_ef_search": 12})
+    assert hnsw_settings(open_collection(client, faster))["ef_search"] == 12
+    assert not needs_migration(client.get_collection("docs"), faster)
+
+
+def test_migrate_l2_collection_keeps_records(tmp_path):
+    client = get_client(str(tmp_path))
+    old = client.create_collection("docs", metadata={"embedding_model": "m"})
+    vectors = unit_vectors()
+    _fill(old, vectors)
+    assert needs_migration(old, CONFIG)
+
+    seen = []
+    assert migrate_collection(client, CONFIG, lambda *p: seen.append(p)) == 40
+    assert seen[-1] == (40, 40)
+
+    new = client.get_collection("docs")
+    assert [c.name for c in client.list_collections()] == ["docs"]
+    assert hnsw_settings(new)["space"] == "cosine"
+    assert new.metadata == {"embedding_model": "m"}
+    got = new.get(ids=["u1:5"], include=["embeddings", "documents", "metadatas"])
+    assert got["documents"] == ["chunk 5"]
+    assert got["metadatas"][0]["doc_uuid"] == "u1"
+    np.testing.assert_allclose(got["embeddings"][0], vectors[5], rtol=1e-6)
+
+
+def test_vec_service_scores_are_cosine_before_and_after_migration(tmp_path):
+    evidence_set = make_set(tmp_path)
+    vectors = unit_vectors()
+    _fill(get_client(str(tmp_path / "vecdb")).create_collection("docs"), vectors)
+    query = vectors[3] + 0.5 * vectors[7]
+    query /= np.linalg.norm(query)
+    expected = np.sort(vectors @ query)[::-1][:5]
+
+    svc = VecService()
+    for migrate in (False, True):
+        if migrate:
+            svc.migrate(evidence_set)
+        hits = svc.query(evidence_set, "q", n_results=5, embedding=query)
+        np.testing.assert_allclose([h.score for h in hits], expected, atol=1e-4)
+
+
+def test_interrupted_migration_is_recovered(tmp_path, monkeypatch):
+    client = get_client(str(tmp_path))
+    _fill(client.create_collection("docs"), unit_vectors())
+
+    # Copy finished, old collection dropped, crash before the rename.
+    real_delete = client.delete_collection
+
+    def crash_after_drop(name):
+        real_delete(name)
+        if name == "docs":
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(client, "delete_collection", crash_after_drop)
+    with pytest.raises(KeyboardInterrupt):
+        migrate_collection(client, CONFIG)
+    monkeypatch.undo()
+
+    collection = open_collection(client, CONFIG)
+    assert collection.count() == 40
+    assert not needs_migration(collection, CONFIG)
+    assert [c.name for c in client.list_collections()] == ["docs"]
+
+
+def test_partial_copy_is_started_over(tmp_path, monkeypatch):
+    client = get_client(str(tmp_path))
+    _fill(client.create_collection("docs"), unit_vectors())
+    monkeypatch.setattr(db, "_COPY_BATCH", 16)
+    partial = client.create_collection(db._MIGRATING)
+    _fill(partial, unit_vectors(3, seed=1))
+
+    assert migrate_collection(client, CONFIG) == 40
+    assert client.get_collection("docs").count() == 40
+
+
+def test_similarity_by_space():
+    assert db.similarity(0.25, "cosine") == 0.75
+    assert db.similarity(0.5, "l2") == 0.75
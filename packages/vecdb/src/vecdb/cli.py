@@ -7,8 +7,8 @@ from rich.logging import RichHandler
 from rich.table import Table
 from treeparse import cli, command, option
 
-from .core.db import bulk_add_documents, create_collection, get_client, query_collection
-from .utils.file_utils import get_documents_with_metadata, get_label_files
+from .core.db import create_collection, get_client, query_collection, stream_add
+from .utils.file_utils import iter_document_chunks, iter_label_files
 
 logging.basicConfig(
     level=logging.INFO,
@@ -26,17 +26,36 @@ def init(directory: str, collection: str = "default"):
     print(f"✅ Collection '{collection}' created in {directory}")
 
 
-def add(directory: str, target_dir: str, collection: str = "default"):
-    """Index label.typ files with metadata from info.yml."""
+def add(
+    directory: str,
+    target_dir: str,
+    collection: str = "default",
+    model: str | None = None,
+    batch_size: int = 256,
+):
+    """Index label.typ files with metadata from info.yml.
+
+    Files are read, embedded and upserted in a streaming pipeline, so rerunning
+    over the same directory updates chunks in place.
+    """
     client = get_client(directory)
-    documents, metadatas, ids = get_documents_with_metadata(target_dir)
-    num_files = len(get_label_files(target_dir))
-    logger.info(f"Found {num_files} label.typ files → {len(documents)} chunks")
-    if documents:
-        bulk_add_documents(client, collection, documents, ids, metadatas)
-        print(
-            f"✅ Added {len(documents)} chunks (with URL/title metadata) to '{collection}'"
-        )
+    files: list[str] = []
+
+    def discovered():
+        for path in iter_label_files(target_dir):
+            files.append(path)
+            yield path
+
+    count = stream_add(
+        client,
+        collection,
+        iter_document_chunks(discovered()),
+        batch_size=batch_size,
+        model=model,
+    )
+    logger.info(f"Found {len(files)} label.typ files → {count} chunks")
+    if count:
+        print(f"✅ Added {count} chunks (with URL/title metadata) to '{collection}'")
 
 
 def query(
@@ -45,10 +64,14 @@ def query(
     collection: str = "default",
     top_n: int = 5,
     full: bool = False,
+    *,
+    model: str | None = None,
 ):
     """Search and show rich results (Title + URL from info.yml)."""
     client = get_client(directory)
-    results = query_collection(client, collection, query_text, n_results=top_n)
+    results = query_collection(
+        client, collection, query_text, n_results=top_n, model=model
+    )
 
     console = Console()
     if not results or not results.get("ids") or not results["ids"][0]:
@@ -125,6 +148,18 @@ add_cmd = command(
             default="default",
             help="Collection",
         ),
+        option(
+            flags=["--model", "-m"],
+            arg_type=str,
+            default=None,
+            help="Embedding model (default: $VECDB_EMBEDDING_MODEL or all-MiniLM-L6-v2)",
+        ),
+        option(
+            flags=["--batch-size", "-b"],
+            arg_type=int,
+            default=256,
+            help="Chunks per embed/write batch",
+        ),
     ],
 )
 
@@ -153,6 +188,12 @@ query_cmd = command(
             default=False,
             help="Show full passages",
         ),
+        option(
+            flags=["--model", "-m"],
+            arg_type=str,
+            default=None,
+            help="Embedding model (default: the one the collection was built with)",
+        ),
     ],
 )
 
@@ -1,6 +1,12 @@
 """ChromaDB operations with metadata support."""
 
-from ..utils.embeddings import generate_embeddings
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from ..utils.embeddings import generate_embeddings, model_name
+
+MODEL_KEY = "embedding_model"
 
 
 def get_client(persist_directory: str):
@@ -18,6 +24,68 @@ def create_collection(client, collection_name: str = "default"):
     return client.create_collection(collection_name)
 
 
+def _collection_for(client, collection_name: str, model: str):
+    """Get or create the collection and pin it to *model*.
+
+    Vectors from different models are not comparable, so adding with another
+    model than the one the collection was built with is an error.
+    """
+    collection = client.get_or_create_collection(collection_name)
+    meta = dict(collection.metadata or {})
+    recorded = meta.get(MODEL_KEY)
+    if recorded is None:
+        meta[MODEL_KEY] = model
+        collection.modify(metadata=meta)
+    elif recorded != model:
+        raise ValueError(
+            f"Collection '{collection_name}' was built with '{recorded}', not '{model}'"
+        )
+    return collection
+
+
+def stream_add(
+    client,
+    collection_name: str,
+    chunks: Iterable[tuple[str, dict | None, str]],
+    *,
+    batch_size: int = 256,
+    model: str | None = None,
+    embed: Callable[[list[str]], object] | None = None,
+) -> int:
+    """Upsert ``(document, metadata, id)`` chunks in batches; return the count.
+
+    *chunks* is consumed lazily, so memory stays at about two batches however
+    large the input is: while batch N is written to Chroma on a background
+    thread, batch N+1 is read and embedded. Upsert makes re-adding the same
+    files safe (ids are stable per document and chunk). Chunks a shrunken
+    document no longer produces are left in place.
+    """
+    model = model_name(model)
+    embed = embed or (lambda texts: generate_embeddings(texts, model))
+    collection = _collection_for(client, collection_name, model)
+
+    total = 0
+    pending = None
+    it = iter(chunks)
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="vecdb-write") as pool:
+        while batch := list(islice(it, batch_size)):
+            documents, metadatas, ids = map(list, zip(*batch, strict=True))
+            embeddings = embed(documents)
+            if pending is not None:
+                pending.result()  # at most one write in flight
+            pending = pool.submit(
+                collection.upsert,
+                ids=ids,
+                documents=documents,
+                embeddings=embeddings,
+                metadatas=metadatas if any(metadatas) else None,
+            )
+            total += len(ids)
+        if pending is not None:
+            pending.result()
+    return total
+
+
 def add_document(
     client,
     collection_name: str,
@@ -37,25 +105,30 @@ def bulk_add_documents(
     documents: list[str],
     ids: list[str],
     metadatas: list[dict] | None = None,
+    *,
+    model: str | None = None,
 ):
     """Vectorized bulk add with full metadata (title, url, etc)."""
-    collection = client.get_collection(collection_name)
-    batch_size = 2000
-    for i in range(0, len(documents), batch_size):
-        batch_docs = documents[i : i + batch_size]
-        batch_ids = ids[i : i + batch_size]
-        batch_embeddings = generate_embeddings(batch_docs)
-        batch_metas = metadatas[i : i + batch_size] if metadatas else None
-        collection.add(
-            documents=batch_docs,
-            embeddings=batch_embeddings,
-            ids=batch_ids,
-            metadatas=batch_metas,
-        )
+    return stream_add(
+        client,
+        collection_name,
+        zip(documents, metadatas or [None] * len(documents), ids, strict=True),
+        model=model,
+    )
 
 
-def query_collection(client, collection_name: str, query_text: str, n_results: int = 5):
-    """Query (returns metadatas automatically)."""
-    embedding = generate_embeddings([query_text])[0]
+def query_collection(
+    client,
+    collection_name: str,
+    query_text: str,
+    n_results: int = 5,
+    model: str | None = None,
+):
+    """Query (returns metadatas automatically).
+
+    Uses the model the collection was built with unless *model* is given.
+    """
     collection = client.get_collection(collection_name)
+    model = model or (collection.metadata or {}).get(MODEL_KEY)
+    embedding = generate_embeddings([query_text], model)[0]
     return collection.query(query_embeddings=[embedding], n_results=n_results)
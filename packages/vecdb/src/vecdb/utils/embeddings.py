@@ -1,27 +1,38 @@
 """Utilities for generating embeddings."""
 
+import os
+
 import numpy as np
 
-model = None
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+
+_models: dict = {}
+
+
+def model_name(name: str | None = None) -> str:
+    """Resolve the model: explicit *name*, else ``$VECDB_EMBEDDING_MODEL``, else the default."""
+    return name or os.environ.get("VECDB_EMBEDDING_MODEL") or DEFAULT_MODEL
 
 
-def _load_model():
-    """Load the model lazily."""
-    global model
-    if model is None:
+def _load_model(name: str | None = None):
+    """Load the model lazily (one instance per model name)."""
+    name = model_name(name)
+    if name not in _models:
         from sentence_transformers import SentenceTransformer
 
-        model = SentenceTransformer("all-MiniLM-L6-v2")
-    return model
+        _models[name] = SentenceTransformer(name)
+    return _models[name]
 
 
-def generate_embedding(text: str) -> np.ndarray:
+def generate_embedding(text: str, model: str | None = None) -> np.ndarray:
     """Generate an embedding for the given text using the model."""
-    _load_model()
-    return model.encode(text)
+    return _load_model(model).encode(text, normalize_embeddings=True)
 
 
-def generate_embeddings(texts: list[str]) -> np.ndarray:
+def generate_embeddings(
+    texts: list[str], model: str | None = None, batch_size: int = 32
+) -> np.ndarray:
     """Generate embeddings for a list of texts using vectorized batch processing."""
-    _load_model()
-    return model.encode(texts)
+    return _load_model(model).encode(
+        texts, batch_size=batch_size, normalize_embeddings=True
+    )
@@ -1,15 +1,23 @@
 """Utilities for discovering label.typ files and loading metadata from info.yml."""
 
-import glob
 import os
+from collections.abc import Iterator
 from pathlib import Path
 
 from ..models.info import DocumentInfo
 
 
+def iter_label_files(directory: str) -> Iterator[str]:
+    """Yield label.typ files under *directory* as the walk finds them."""
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        if "label.typ" in files:
+            yield os.path.join(root, "label.typ")
+
+
 def get_label_files(directory: str) -> list[str]:
     """Return all label.typ files (as per current dataset assumption)."""
-    return glob.glob(os.path.join(directory, "**", "label.typ"), recursive=True)
+    return list(iter_label_files(directory))
 
 
 def load_info_yml(label_path: str) -> DocumentInfo:
@@ -34,23 +42,30 @@ def snippetize_document(file_path: str) -> list[str]:
     return [p.strip() for p in content.split("\n\n") if p.strip()]
 
 
+def iter_document_chunks(
+    label_files: Iterator[str] | list[str],
+) -> Iterator[tuple[str, dict, str]]:
+    """Yield ``(document, metadata, id)`` per chunk, reading one file at a time.
+
+    Ids are ``<uuid>_<chunk:04d>``, so re-adding a file maps onto the same ids.
+    """
+    for file_path in label_files:
+        info = load_info_yml(file_path)
+        base = info.model_dump(exclude_none=True)
+        source = os.path.relpath(file_path)
+        for i, chunk in enumerate(snippetize_document(file_path), 1):
+            yield chunk, {**base, "source": source, "chunk": i}, f"{info.uuid}_{i:04d}"
+
+
 def get_documents_with_metadata(
     target_dir: str,
 ) -> tuple[list[str], list[dict], list[str]]:
     """Helper: returns (documents, metadatas, ids) ready for bulk add."""
-    label_files = get_label_files(target_dir)
     documents = []
     metadatas = []
     ids = []
-    for file_path in label_files:
-        info = load_info_yml(file_path)
-        chunks = snippetize_document(file_path)
-        for i, chunk in enumerate(chunks, 1):
-            chunk_id = f"{info.uuid}_{i:04d}"
-            meta = info.model_dump(exclude_none=True)
-            meta["source"] = os.path.relpath(file_path)
-            meta["chunk"] = i
-            documents.append(chunk)
-            metadatas.append(meta)
-            ids.append(chunk_id)
+    for chunk, meta, chunk_id in iter_document_chunks(iter_label_files(target_dir)):
+        documents.append(chunk)
+        metadatas.append(meta)
+        ids.append(chunk_id)
     return documents, metadatas, ids
@@ -48,12 +48,7 @@ def test_query_command(temp_dir, mock_client, capsys):
 def test_add_command(temp_dir, mock_client, capsys):
     with (
         patch("vecdb.cli.get_client", return_value=mock_client),
-        patch(
-            "vecdb.cli.get_documents_with_metadata",
-            return_value=(["doc"], [{}], ["id1"]),
-        ),
-        patch("vecdb.cli.get_label_files", return_value=["label.typ"]),
-        patch("vecdb.cli.bulk_add_documents") as mock_add,
+        patch("vecdb.cli.stream_add", return_value=1) as mock_add,
     ):
         add(directory=temp_dir, target_dir=temp_dir, collection="test_collection")
         mock_add.assert_called_once()
@@ -0,0 +1,83 @@
+"""Tests for the streaming add pipeline (fake embedder, real Chroma)."""
+
+import os
+
+import numpy as np
+import pytest
+
+chromadb = pytest.importorskip("chromadb")
+
+from vecdb.core.db import get_client, stream_add
+from vecdb.utils.file_utils import iter_document_chunks, iter_label_files
+
+
+def fake_embed(texts):
+    return np.array([[len(t), t.count(" ") + 1, 1.0] for t in texts], dtype="float32")
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    for uuid, paras in (("aaa", 3), ("bbb", 2)):
+        doc = tmp_path / "docs" / uuid
+        doc.mkdir(parents=True)
+        (doc / "info.yml").write_text(f"uuid: {uuid}\ntitle: Doc {uuid}\n")
+        (doc / "label.typ").write_text(
+            "\n\n".join(f"Paragraph {i} of {uuid}" for i in range(paras))
+        )
+    return tmp_path
+
+
+def test_rerun_upserts_instead_of_failing(dataset, tmp_path):
+    client = get_client(str(tmp_path / "db"))
+    chunks = iter_document_chunks(iter_label_files(str(dataset)))
+    assert stream_add(client, "docs", chunks, batch_size=2, embed=fake_embed) == 5
+
+    chunks = iter_document_chunks(iter_label_files(str(dataset)))
+    assert stream_add(client, "docs", chunks, batch_size=2, embed=fake_embed) == 5
+
+    collection = client.get_collection("docs")
+    assert collection.count() == 5
+    got = collection.get(ids=["aaa_0002"])
+    assert got["documents"] == ["Paragraph 1 of aaa"]
+    assert got["metadatas"][0]["title"] == "Doc aaa"
+    assert got["metadatas"][0]["chunk"] == 2
+
+
+def test_collection_is_pinned_to_its_model(dataset, tmp_path):
+    client = get_client(str(tmp_path / "db"))
+    chunks = [("text", {"chunk": 1}, "x_0001")]
+    stream_add(client, "docs", chunks, model="model-a", embed=fake_embed)
+    assert client.get_collection("docs").metadata["embedding_model"] == "model-a"
+    with pytest.raises(ValueError, match="model-a"):
+        stream_add(client, "docs", chunks, model="model-b", embed=fake_embed)
+
+
+def test_chunks_are_consumed_lazily(tmp_path):
+    client = get_client(str(tmp_path / "db"))
+    produced = []
+
+    def chunks():
+        for i in range(10):
+            produced.append(i)
+            yield f"chunk {i}", {"chunk": i}, f"id_{i:04d}"
+
+    seen = []
+
+    def embed(texts):
+        # Only the current batch has been pulled from the generator.
+        seen.append(len(produced))
+        return fake_embed(texts)
+
+    assert stream_add(client, "docs", chunks(), batch_size=4, embed=embed) == 10
+    assert seen == [4, 8, 10]
+
+
+def test_iter_label_files_skips_hidden_dirs(dataset):
+    hidden = dataset / ".git" / "x"
+    hidden.mkdir(parents=True)
+    (hidden / "label.typ").write_text("ignored")
+    files = [os.path.relpath(f, dataset) for f in iter_label_files(str(dataset))]
+    assert files == [
+        os.path.join("docs", "aaa", "label.typ"),
+        os.path.join("docs", "bbb", "label.typ"),
+    ]
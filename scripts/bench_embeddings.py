@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Compare embedding backends: throughput, memory and retrieval quality.
+
+Usage:
+    uv run python scripts/bench_embeddings.py                       # all backends
+    uv run python scripts/bench_embeddings.py -b torch -b onnx-int8 --repeat 8
+
+Each backend runs in a fresh interpreter (so peak RSS is per backend) over a
+small fixture corpus of Danish and English passages with labelled queries. For
+every backend it reports chunks/s for ``embed_documents``, peak RSS, recall@3
+against the labels, and top-3 overlap with the full-precision ``torch``
+ranking (1.0 = identical retrieval).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "packages/evid/src"))
+
+BACKENDS = ("torch", "torch-int8", "onnx", "onnx-int8")
+K = 3
+
+PASSAGES = [
+    "Kommunen skal træffe afgørelse om hjælp til merudgifter inden for fire uger.",
+    "Borgeren har ret til aktindsigt i egen sag efter forvaltningslovens regler.",
+    "Klagen skal indgives skriftligt til Ankestyrelsen senest fire uger efter afgørelsen.",
+    "Udbetaling Danmark administrerer boligstøtte og folkepension.",
+    "Et barn under 18 år kan anbringes uden for hjemmet uden samtykke, hvis der er åbenbar risiko.",
+    "Arbejdsgiveren skal gennemføre en arbejdspladsvurdering mindst hvert tredje år.",
+    "The tenant must give three months' notice before terminating the lease.",
+    "Personal data may only be processed for specified, explicit and legitimate purposes.",
+    "The court dismissed the appeal because it was filed after the deadline.",
+    "Carbon emissions from shipping rose by four percent in the reporting period.",
+    "The committee recommends an independent audit of the procurement process.",
+    "Patients have the right to a second opinion before major surgery.",
+    "Sygedagpenge udbetales fra første fraværsdag, hvis arbejdsgiveren ikke betaler løn.",
+    "Skolen skal udarbejde en handleplan, når en elev har højt fravær.",
+    "The contract is void if either party was coerced into signing it.",
+    "Vindmøller skal placeres mindst fire gange totalhøjden fra nærmeste nabobolig.",
+]
+
+# (query, index of the relevant passage)
+QUERIES = [
+    ("Hvor lang tid har kommunen til at afgøre en sag om merudgifter?", 0),
+    ("Kan jeg se papirerne i min egen sag?", 1),
+    ("Frist for at klage til Ankestyrelsen", 2),
+    ("Hvem udbetaler folkepension?", 3),
+    ("tvangsanbringelse af børn", 4),
+    ("How much notice to end a rental agreement?", 6),
+    ("purpose limitation for personal data", 7),
+    ("appeal rejected as too late", 8),
+    ("emissions from ships", 9),
+    ("Hvornår får man sygedagpenge?", 12),
+    ("afstandskrav for vindmøller til naboer", 15),
+    ("contract signed under duress", 14),
+]
+
+
+def _worker(backend: str, repeat: int) -> dict:
+    import numpy as np
+
+    os.environ["EVID_EMBEDDING_BACKEND"] = backend
+    from evid.vec import embeddings
+
+    t0 = time.perf_counter()
+    embeddings.embed_query("warm-up")
+    load_s = time.perf_counter() - t0
+
+    corpus = PASSAGES * repeat
+    t0 = time.perf_counter()
+    embeddings.embed_documents(corpus)
+    embed_s = time.perf_counter() - t0
+
+    doc_vecs = embeddings.embed_documents(PASSAGES)
+    query_vecs = np.stack([embeddings.embed_query(q) for q, _ in QUERIES])
+    ranking = np.argsort(-(query_vecs @ doc_vecs.T), axis=1)[:, :K]
+    return {
+        "backend": backend,
+        "load_s": round(load_s, 2),
+        "chunks_per_s": round(len(corpus) / embed_s, 1),
+        "peak_rss_mb": round(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1
+        ),
+        "recall": float(
+            np.mean(
+                [rel in row for (_, rel), row in zip(QUERIES, ranking, strict=True)]
+            )
+        ),
+        "top_k": ranking.tolist(),
+    }
+
+
+def _run(backend: str, repeat: int) -> dict:
+    proc = subprocess.run(  # noqa: S603
+        [sys.executable, __file__, "--worker", backend, "--repeat", str(repeat)],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        err = (proc.stderr.strip().splitlines() or ["failed"])[-1]
+        return {"backend": backend, "error": err}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _overlap(a: list[list[int]], b: list[list[int]]) -> float:
+    return sum(len(set(x) & set(y)) for x, y in zip(a, b, strict=True)) / (K * len(a))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-b", "--backend", action="append", choices=BACKENDS)
+    parser.add_argument("--repeat", type=int, default=16, help="corpus copies")
+    parser.add_argument("--worker", choices=BACKENDS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(_worker(args.worker, args.repeat)))
+        return
+
+    results = [_run(b, args.repeat) for b in args.backend or BACKENDS]
+    baseline = next((r for r in results if r.get("backend") == "torch"), None)
+    print(
+        f"{'backend':<11} {'load s':>7} {'chunks/s':>9} {'rss MB':>8} "
+        f"{'recall@' + str(K):>9} {'vs torch':>9}"
+    )
+    for r in results:
+        if "error" in r:
+            print(f"{r['backend']:<11} error: {r['error']}")
+            continue
+        agree = (
+            f"{_overlap(r['top_k'], baseline['top_k']):.2f}"
+            if baseline and "top_k" in baseline
+            else "-"
+        )
+        print(
+            f"{r['backend']:<11} {r['load_s']:>7} {r['chunks_per_s']:>9} "
+            f"{r['peak_rss_mb']:>8} {r['recall']:>9.2f} {agree:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()